@@ -21,10 +21,23 @@ Each run produces a set of three files:
   dex-vault-<stamp>.sha256    checksums for both, so damage in storage is
                               detectable
 
+With `backup.mode: incremental` a run instead produces:
+  dex-vault-<stamp>.manifest.json  every kept path, its metadata, and the
+                                   content chunks that rebuild it
+  dex-vault-<stamp>.sha256         checksum of the manifest
+  chunks/<ab>/<sha256>             compressed content chunks, shared by
+                                   every set and named by their own hash,
+                                   so unchanged notes are never re-sent
+History is carried as a chain of git bundles, each holding only the commits
+since the previous set, stored as chunks like any other file.
+
 Retention is grandfather-father-son: keep the newest N daily, N weekly (one
 per ISO week), N monthly (one per month). The newest set is never deleted,
 and a file whose name the engine does not recognise is never deleted.
 Legacy retention_days config is still honoured if the new block is absent.
+After pruning, chunks no remaining manifest refers to are deleted. Runs on
+one vault hold System/.dex/backup.lock throughout, so a scheduled run and a
+manual one never prune underneath each other.
 
 Design requirement, paid for by a real failure: a scheduled backup on a
 production vault died silently for ten days and nothing noticed. So every
@@ -42,13 +55,24 @@ import io
 import json
 import os
 import shutil
+import stat
 import subprocess
 import sys
 import tarfile
 import tempfile
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from fnmatch import fnmatch
 from pathlib import Path, PurePosixPath
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, runs are not serialized
+    fcntl = None
 
 PREFIX = "dex-vault-"
 ARCNAME = "dex-vault"
@@ -63,6 +87,20 @@ ARCNAME = "dex-vault"
 RUNBOOK_SOURCE = "docs/backup-restore.md"
 RUNBOOK_IN_ARCHIVE = "System/backup/RESTORE.md"
 STAMP_FORMAT = "%Y%m%d-%H%M%S"
+ARCHIVE_SUFFIX = ".tar.gz"
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_FORMAT = 1
+CHUNK_DIR = "chunks"
+CHUNK_SIZE = 4 * 1024 * 1024
+# An incremental bundle needs every earlier link of its chain to restore, so
+# the chain restarts from a full bundle after this many links.
+MAX_BUNDLE_CHAIN = 30
+# A file rewritten within one timestamp tick of being backed up can keep its
+# size and mtime; only trust an unchanged (size, mtime) older than this. Kept
+# equal to core.utils.config_snapshot.RACY_WINDOW_NS by
+# test_backup_racy_window_matches_config_snapshot, but not imported from it:
+# this module stays stdlib-only.
+RACY_WINDOW_NS = 2_000_000_000
 
 # Secrets and generated credential config: never leaves the machine.
 # Matched against the exact vault-relative path.
@@ -133,6 +171,32 @@ def stamp_path(vault: Path) -> Path:
     return vault / "System" / ".dex" / "backup-last-run.json"
 
 
+def lock_path(vault: Path) -> Path:
+    return vault / "System" / ".dex" / "backup.lock"
+
+
+@contextmanager
+def run_lock(vault: Path) -> Iterator[None]:
+    """Hold the vault's backup lock, waiting for any run that already has it.
+
+    An incremental run reuses chunks it listed at the destination, and a
+    concurrent run's prune could collect one of them before this run's
+    manifest names it. One run per vault at a time closes that window.
+    """
+    if fcntl is None:
+        yield
+        return
+    target = lock_path(vault)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    descriptor = os.open(target, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(descriptor, fcntl.LOCK_EX)
+        yield
+    finally:
+        fcntl.flock(descriptor, fcntl.LOCK_UN)
+        os.close(descriptor)
+
+
 def log(vault: Path, line: str) -> None:
     target = log_path(vault)
     target.parent.mkdir(parents=True, exist_ok=True)
@@ -211,6 +275,7 @@ def load_config(vault: Path) -> dict:
     return {
         "enabled": _as_bool(raw.get("enabled", False)),
         "backend": str(raw.get("backend", "folder")),
+        "mode": str(raw.get("mode") or "full"),
         "destination": str(raw.get("destination") or ""),
         "remote": str(raw.get("remote") or ""),
         "retention": {
@@ -278,6 +343,13 @@ def _collecting_tar_filter(escaping: list[str]):
     return apply
 
 
+def _escaping_warning(escaping: list[str]) -> str:
+    shown = ", ".join(sorted(escaping)[:5])
+    return (f"{len(escaping)} linked file(s) in the vault point outside it and "
+            f"cannot be unpacked by the restore tool ({shown}); replace them "
+            "with real files or links inside the vault, then back up again")
+
+
 def file_digest(path: Path) -> str:
     """SHA-256 of a file, read in chunks.
 
@@ -335,11 +407,7 @@ def build_artifacts(vault: Path, workdir: Path, stamp: str,
         tar.add(vault, arcname=ARCNAME, filter=_collecting_tar_filter(escaping))
         _add_runbook(tar, vault, warnings)
     if escaping and warnings is not None:
-        shown = ", ".join(sorted(escaping)[:5])
-        warnings.append(
-            f"{len(escaping)} linked file(s) in the vault point outside it and "
-            f"cannot be unpacked by the restore tool ({shown}); replace them "
-            "with real files or links inside the vault, then back up again")
+        warnings.append(_escaping_warning(escaping))
     with tarfile.open(archive) as tar:  # integrity: must be listable
         tar.getmembers()
 
@@ -352,16 +420,11 @@ def build_artifacts(vault: Path, workdir: Path, stamp: str,
             subprocess.run(["git", "-C", str(vault), "bundle", "verify",
                             str(bundle)], check=True, capture_output=True)
         except (subprocess.CalledProcessError, OSError) as error:
-            detail = getattr(error, "stderr", b"") or b""
-            if isinstance(detail, bytes):
-                detail = detail.decode("utf-8", "replace")
-            reason = (detail.strip() or str(error)).splitlines()[-1][:200] \
-                if (detail.strip() or str(error)) else error.__class__.__name__
             bundle.unlink(missing_ok=True)  # never ship an unverified bundle
             if warnings is not None:
                 warnings.append(
                     "the vault's version history could not be bundled, so this "
-                    f"set holds the notes archive only: {reason}")
+                    f"set holds the notes archive only: {_failure_reason(error)}")
         else:
             artifacts.append(bundle)
 
@@ -372,6 +435,272 @@ def build_artifacts(vault: Path, workdir: Path, stamp: str,
     return artifacts
 
 
+def _failure_reason(error: Exception) -> str:
+    detail = getattr(error, "stderr", b"") or b""
+    if isinstance(detail, bytes):
+        detail = detail.decode("utf-8", "replace")
+    text = detail.strip() or str(error)
+    return text.splitlines()[-1][:200] if text else error.__class__.__name__
+
+
+# --- incremental sets ---------------------------------------------------------
+
+def chunk_relative(name: str) -> str:
+    """Where a chunk lives beneath the destination, fanned out by prefix."""
+    return f"{CHUNK_DIR}/{name[:2]}/{name}"
+
+
+def set_stamp(name: str) -> str | None:
+    """The stamp of a set's primary file (archive or manifest), else None."""
+    if not name.startswith(PREFIX):
+        return None
+    for suffix in (ARCHIVE_SUFFIX, MANIFEST_SUFFIX):
+        if name.endswith(suffix) and len(name) > len(PREFIX) + len(suffix):
+            return name[len(PREFIX):-len(suffix)]
+    return None
+
+
+def manifest_chunks(manifest: dict) -> set[str]:
+    """Every chunk a manifest needs, file content and history alike."""
+    needed = {name for entry in manifest.get("entries", [])
+              for name in entry.get("chunks", ())}
+    history = manifest.get("history") or {}
+    for bundle in history.get("bundles", ()):
+        needed.update(bundle["chunks"])
+    return needed
+
+
+def _write_chunk(data: bytes, target: Path, level: int) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(zlib.compress(data, level))
+
+
+class ChunkWriter:
+    """Split content into hashed chunks; compress the unseen ones in parallel.
+
+    zlib releases the GIL, so a small thread pool keeps every core busy while
+    the walk carries on hashing. At most two chunks per worker are held in
+    memory at once, however large the vault.
+    """
+
+    def __init__(self, workdir: Path, known: set[str], workers: int | None = None):
+        self.workdir = workdir
+        self.known = known
+        self.written: dict[str, Path] = {}
+        self.workers = workers or min(8, os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        self._in_flight: list[Future] = []
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        try:
+            for future in self._in_flight:
+                future.result()
+        finally:
+            self._in_flight.clear()
+            self._executor.shutdown(cancel_futures=True)
+
+    def add(self, handle, level: int = 6) -> tuple[list[str], int]:
+        """Chunk one stream; return its chunk names and byte count."""
+        names: list[str] = []
+        size = 0
+        for data in iter(lambda: handle.read(CHUNK_SIZE), b""):
+            name = hashlib.sha256(data).hexdigest()
+            names.append(name)
+            size += len(data)
+            if name in self.known or name in self.written:
+                continue
+            target = self.workdir / chunk_relative(name)
+            self.written[name] = target
+            while len(self._in_flight) >= 2 * self.workers:
+                self._in_flight.pop(0).result()
+            self._in_flight.append(
+                self._executor.submit(_write_chunk, data, target, level))
+        return names, size
+
+
+def _vault_entries(vault: Path):
+    """Yield (relative path, lstat) for everything the archive would keep."""
+    pending = [""]
+    while pending:
+        prefix = pending.pop()
+        with os.scandir(vault / prefix) as iterator:
+            children = sorted(iterator, key=lambda child: child.name)
+        subdirectories = []
+        for child in children:
+            relative = f"{prefix}/{child.name}" if prefix else child.name
+            if relative == RUNBOOK_IN_ARCHIVE or excluded(relative):
+                continue
+            metadata = child.stat(follow_symlinks=False)
+            yield relative, metadata
+            if stat.S_ISDIR(metadata.st_mode):
+                subdirectories.append(relative)
+        pending.extend(reversed(subdirectories))
+
+
+def _latest_manifest(backend) -> dict | None:
+    for stamp in backend.list_sets():
+        raw = backend.read(f"{PREFIX}{stamp}{MANIFEST_SUFFIX}")
+        if raw is None:
+            continue
+        try:
+            manifest = json.loads(raw)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            continue
+        if isinstance(manifest, dict) and manifest.get("format") == MANIFEST_FORMAT:
+            return manifest
+    return None
+
+
+def _git_refs(vault: Path) -> tuple[dict[str, str], str | None]:
+    listed = subprocess.run(
+        ["git", "-C", str(vault), "for-each-ref",
+         "--format=%(objectname) %(refname)"],
+        check=True, capture_output=True, text=True).stdout
+    refs = {}
+    for line in listed.splitlines():
+        object_id, _, name = line.partition(" ")
+        refs[name] = object_id
+    head = subprocess.run(["git", "-C", str(vault), "symbolic-ref", "-q", "HEAD"],
+                          capture_output=True, text=True).stdout.strip()
+    return refs, head or None
+
+
+def _create_bundle(vault: Path, bundle: Path, exclusions: list[str]) -> None:
+    bundle.unlink(missing_ok=True)
+    subprocess.run(["git", "-C", str(vault), "bundle", "create", str(bundle),
+                    "--all", *exclusions], check=True, capture_output=True)
+    subprocess.run(["git", "-C", str(vault), "bundle", "verify", str(bundle)],
+                   check=True, capture_output=True)
+
+
+def _incremental_history(vault: Path, workdir: Path, stamp: str,
+                         previous: dict | None, writer: ChunkWriter,
+                         warnings: list[str] | None) -> dict | None:
+    """Bundle only the commits since the previous set, as chunks.
+
+    Unchanged refs reuse the previous chain as-is. A chain that is too long,
+    or whose base no longer exists because history was rewritten, restarts
+    from a full bundle. As with full sets, a failure degrades to a notes-only
+    set with a warning, and an unverified bundle is never stored.
+    """
+    if not (vault / ".git").is_dir():
+        return None
+    prior = (previous or {}).get("history") or None
+    bundle = workdir / f"{PREFIX}{stamp}.bundle"
+    try:
+        refs, head = _git_refs(vault)
+        if prior and prior.get("refs") == refs:
+            return {"refs": refs, "head": head, "bundles": prior["bundles"]}
+        chain: list[dict] = []
+        if prior and refs and len(prior["bundles"]) < MAX_BUNDLE_CHAIN:
+            try:
+                _create_bundle(vault, bundle, sorted(
+                    {f"^{object_id}" for object_id in prior["refs"].values()}))
+                chain = list(prior["bundles"])
+            except subprocess.CalledProcessError:
+                chain = []
+        if not chain:
+            _create_bundle(vault, bundle, [])
+        digest = file_digest(bundle)
+        with bundle.open("rb") as handle:
+            # A bundle is already a compressed pack; spend little CPU on it.
+            names, size = writer.add(handle, level=1)
+        chain.append({"chunks": names, "size": size, "sha256": digest})
+        return {"refs": refs, "head": head, "bundles": chain}
+    except (subprocess.CalledProcessError, OSError) as error:
+        if warnings is not None:
+            warnings.append(
+                "the vault's version history could not be bundled, so this "
+                f"set holds the notes only: {_failure_reason(error)}")
+        return None
+    finally:
+        bundle.unlink(missing_ok=True)
+
+
+def build_incremental_artifacts(vault: Path, workdir: Path, stamp: str, backend,
+                                warnings: list[str] | None = None,
+                                ) -> tuple[list[Path], dict[str, Path]]:
+    """Build an incremental set: a manifest, its checksum, and any new chunks.
+
+    Files whose size and modification time match the previous manifest reuse
+    its chunks without being read again. Everything else is read once and
+    split into chunks, and only chunks the destination lacks are compressed
+    and returned for upload. The exclusions, the runbook copy and the
+    escaping-link warning match the full archive exactly, so a restored
+    vault is the same whichever mode took it.
+    """
+    previous = _latest_manifest(backend)
+    known = backend.list_chunks()
+    reusable: dict[str, dict] = {}
+    if previous:
+        checked_ns = int(previous.get("created_ns", 0))
+        for entry in previous.get("entries", []):
+            if (entry.get("type") == "file"
+                    and checked_ns - entry["mtime_ns"] > RACY_WINDOW_NS
+                    and all(name in known for name in entry["chunks"])):
+                reusable[entry["path"]] = entry
+
+    created_ns = time.time_ns()
+    entries: list[dict] = []
+    escaping: list[str] = []
+    with ChunkWriter(workdir, known) as writer:
+        for relative, metadata in _vault_entries(vault):
+            entry = {"path": relative, "mode": stat.S_IMODE(metadata.st_mode),
+                     "mtime": int(metadata.st_mtime)}
+            if stat.S_ISDIR(metadata.st_mode):
+                entry["type"] = "dir"
+            elif stat.S_ISLNK(metadata.st_mode):
+                link = os.readlink(vault / relative)
+                info = tarfile.TarInfo(f"{ARCNAME}/{relative}")
+                info.type, info.linkname = tarfile.SYMTYPE, link
+                if escapes_vault(info):
+                    escaping.append(relative)
+                entry.update(type="symlink", link=link)
+            elif stat.S_ISREG(metadata.st_mode):
+                prior = reusable.get(relative)
+                if prior and (prior["size"], prior["mtime_ns"]) == (
+                        metadata.st_size, metadata.st_mtime_ns):
+                    names, size = prior["chunks"], prior["size"]
+                else:
+                    with (vault / relative).open("rb") as handle:
+                        names, size = writer.add(handle)
+                entry.update(type="file", size=size,
+                             mtime_ns=metadata.st_mtime_ns, chunks=names)
+            else:
+                continue
+            entries.append(entry)
+
+        runbook = vault / RUNBOOK_SOURCE
+        try:
+            with runbook.open("rb") as handle:
+                names, size = writer.add(handle)
+            entries.append({"path": RUNBOOK_IN_ARCHIVE, "type": "file",
+                            "mode": 0o644, "mtime": int(runbook.stat().st_mtime),
+                            "size": size, "mtime_ns": 0, "chunks": names})
+        except OSError:
+            if warnings is not None:
+                warnings.append(
+                    f"this backup has no restore runbook inside it: {RUNBOOK_SOURCE} "
+                    "is missing from the vault, so the set carries the notes but "
+                    "not the instructions for rebuilding from them")
+        history = _incremental_history(vault, workdir, stamp, previous, writer,
+                                       warnings)
+    if escaping and warnings is not None:
+        warnings.append(_escaping_warning(escaping))
+
+    manifest = workdir / f"{PREFIX}{stamp}{MANIFEST_SUFFIX}"
+    manifest.write_text(json.dumps(
+        {"format": MANIFEST_FORMAT, "set": stamp, "created_ns": created_ns,
+         "entries": entries, "history": history},
+        sort_keys=True, separators=(",", ":")) + "\n")
+    sums = workdir / f"{PREFIX}{stamp}.sha256"
+    sums.write_text(f"{file_digest(manifest)}  {manifest.name}\n")
+    return [manifest, sums], writer.written
+
+
 # --- backends ---------------------------------------------------------------
 
 class FolderBackend:
@@ -410,15 +739,53 @@ class FolderBackend:
             partial.rename(final)
         return str(self.dest)
 
+    def names(self) -> list[str]:
+        return [p.name for p in self.dest.iterdir() if p.is_file()]
+
     def list_sets(self) -> list[str]:
-        stamps = {p.name[len(PREFIX):-len(".tar.gz")]
-                  for p in self.dest.glob(f"{PREFIX}*.tar.gz")}
-        return sorted(stamps, reverse=True)
+        return list_sets(self)
+
+    def read(self, name: str) -> bytes | None:
+        try:
+            return (self.dest / name).read_bytes()
+        except FileNotFoundError:
+            return None
 
     def delete_set(self, stamp: str) -> None:
         for p in self.dest.glob(f"{PREFIX}{stamp}.*"):
             p.unlink()
 
+    def list_chunks(self) -> set[str]:
+        return {p.name for p in (self.dest / CHUNK_DIR).glob("*/*")
+                if not p.name.endswith(".partial")}
+
+    def store_chunks(self, root: Path, names: list[str]) -> None:
+        """Publish each chunk under root via a .partial name, like store().
+
+        Chunks are content-addressed, so one that is already present (from a
+        concurrent or interrupted run) is the same bytes and is left alone.
+        """
+        for name in names:
+            final = self.dest / chunk_relative(name)
+            if final.exists():
+                continue
+            final.parent.mkdir(parents=True, exist_ok=True)
+            partial = final.with_name(name + ".partial")
+            try:
+                with (root / chunk_relative(name)).open("rb") as src, \
+                        partial.open("wb") as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+                    dst.flush()
+                    os.fsync(dst.fileno())
+            except BaseException:
+                partial.unlink(missing_ok=True)
+                raise
+            partial.rename(final)
+
+    def delete_chunks(self, names: set[str]) -> None:
+        for name in names:
+            (self.dest / chunk_relative(name)).unlink(missing_ok=True)
+
 
 class RcloneBackend:
     """Any rclone remote. Fails honestly when rclone is absent."""
@@ -441,24 +808,61 @@ class RcloneBackend:
                            check=True, capture_output=True)
         return self.remote
 
-    def list_sets(self) -> list[str]:
-        out = subprocess.run(["rclone", "lsf", self.remote],
+    def names(self) -> list[str]:
+        out = subprocess.run(["rclone", "lsf", "--files-only", self.remote],
                              check=True, capture_output=True, text=True).stdout
-        stamps = {line.strip()[len(PREFIX):-len(".tar.gz")]
-                  for line in out.splitlines()
-                  if line.strip().startswith(PREFIX)
-                  and line.strip().endswith(".tar.gz")}
-        return sorted(stamps, reverse=True)
+        return [line.strip() for line in out.splitlines() if line.strip()]
+
+    def list_sets(self) -> list[str]:
+        return list_sets(self)
+
+    def read(self, name: str) -> bytes | None:
+        result = subprocess.run(["rclone", "cat", f"{self.remote}/{name}"],
+                                capture_output=True)
+        return result.stdout if result.returncode == 0 else None
 
     def delete_set(self, stamp: str) -> None:
         subprocess.run(["rclone", "delete", self.remote,
                         "--include", f"{PREFIX}{stamp}.*"],
                        check=True, capture_output=True)
 
+    def list_chunks(self) -> set[str]:
+        # A remote that has never held a chunk has no chunks/ folder at all.
+        result = subprocess.run(
+            ["rclone", "lsf", "-R", "--files-only", f"{self.remote}/{CHUNK_DIR}"],
+            capture_output=True, text=True)
+        if result.returncode != 0:
+            return set()
+        return {PurePosixPath(line.strip()).name
+                for line in result.stdout.splitlines() if line.strip()}
+
+    def _with_file_list(self, names, command: list[str]) -> None:
+        with tempfile.NamedTemporaryFile("w", suffix=".txt") as listing:
+            listing.write("".join(f"{chunk_relative(n)}\n" for n in sorted(names)))
+            listing.flush()
+            subprocess.run([*command, "--files-from", listing.name],
+                           check=True, capture_output=True)
+
+    def store_chunks(self, root: Path, names: list[str]) -> None:
+        """One rclone copy for every new chunk, so transfers run in parallel."""
+        if names:
+            self._with_file_list(names, ["rclone", "copy", str(root), self.remote])
+
+    def delete_chunks(self, names: set[str]) -> None:
+        if names:
+            self._with_file_list(names, ["rclone", "delete", self.remote])
+
 
 BACKENDS = {"folder": FolderBackend, "rclone": RcloneBackend}
 
 
+def list_sets(backend) -> list[str]:
+    """Stamps of every archive or manifest set at the destination, newest first."""
+    stamps = {set_stamp(name) for name in backend.names()}
+    stamps.discard(None)
+    return sorted(stamps, reverse=True)
+
+
 # --- grandfather-father-son retention ---------------------------------------
 
 def prune(backend, retention: dict) -> list[str]:
@@ -496,9 +900,34 @@ def prune(backend, retention: dict) -> list[str]:
     pruned = [s for s in stamps if s not in keep]
     for stamp in pruned:
         backend.delete_set(stamp)
+    collect_chunks(backend)
     return pruned
 
 
+def collect_chunks(backend) -> set[str]:
+    """Delete chunks no remaining manifest refers to; return what went.
+
+    Runs after the new set is fully stored, so its chunks are already
+    referenced. If any manifest cannot be read, nothing is deleted: a chunk
+    is only garbage when every set has been seen not to need it.
+    """
+    stored = backend.list_chunks()
+    if not stored:
+        return set()
+    needed: set[str] = set()
+    for name in backend.names():
+        if not name.endswith(MANIFEST_SUFFIX) or set_stamp(name) is None:
+            continue
+        raw = backend.read(name)
+        try:
+            needed |= manifest_chunks(json.loads(raw))
+        except (TypeError, ValueError, KeyError, AttributeError):
+            return set()
+    unreferenced = stored - needed
+    backend.delete_chunks(unreferenced)
+    return unreferenced
+
+
 def write_stamp(vault: Path, ok: bool, detail: dict) -> None:
     """Record the outcome of every run, success or failure, for /dex-doctor."""
     target = stamp_path(vault)
@@ -509,32 +938,47 @@ def write_stamp(vault: Path, ok: bool, detail: dict) -> None:
 
 
 def run_backup(vault: Path) -> int:
-    stamp = f"{datetime.now():{STAMP_FORMAT}}"
     config: dict = {}
     try:
-        config = load_config(vault)
-        backend_cls = BACKENDS.get(config["backend"])
-        if backend_cls is None:
-            raise RuntimeError(f"unknown backup backend: {config['backend']!r}")
-        backend = backend_cls(config)
-        warnings: list[str] = []
-        with tempfile.TemporaryDirectory() as tmp:
-            artifacts = build_artifacts(vault, Path(tmp), stamp, warnings)
-            sizes = {a.name: a.stat().st_size for a in artifacts}
-            location = backend.store(artifacts)
-        pruned = prune(backend, config["retention"])
-        total_mb = sum(sizes.values()) / 1_048_576
-        log(vault, f"OK {config['backend']}:{location} set {stamp} "
-                   f"({total_mb:.0f}M, {len(sizes)} files"
-                   + (f", pruned {len(pruned)} sets" if pruned else "") + ")")
-        for warning in warnings:  # a degraded set is never silently "OK"
-            log(vault, f"WARNING {warning}")
-        write_stamp(vault, True, {"backend": config["backend"],
-                                  "location": location, "set": stamp,
-                                  "bytes": sum(sizes.values()),
-                                  "pruned": pruned,
-                                  "warnings": warnings})
-        return 0
+        with run_lock(vault):
+            # Stamped once the lock is held, so a run that waited never
+            # shares a set name with the run it waited for.
+            stamp = f"{datetime.now():{STAMP_FORMAT}}"
+            config = load_config(vault)
+            backend_cls = BACKENDS.get(config["backend"])
+            if backend_cls is None:
+                raise RuntimeError(f"unknown backup backend: {config['backend']!r}")
+            backend = backend_cls(config)
+            warnings: list[str] = []
+            with tempfile.TemporaryDirectory() as tmp:
+                if config["mode"] == "incremental":
+                    artifacts, chunks = build_incremental_artifacts(
+                        vault, Path(tmp), stamp, backend, warnings)
+                    # Chunks land before the manifest that names them, so a run
+                    # that dies part-way never publishes a set it cannot restore.
+                    backend.store_chunks(Path(tmp), sorted(chunks))
+                    sizes = {a.name: a.stat().st_size for a in artifacts}
+                    sizes.update((chunk_relative(name), path.stat().st_size)
+                                 for name, path in chunks.items())
+                elif config["mode"] == "full":
+                    artifacts = build_artifacts(vault, Path(tmp), stamp, warnings)
+                    sizes = {a.name: a.stat().st_size for a in artifacts}
+                else:
+                    raise RuntimeError(f"unknown backup mode: {config['mode']!r}")
+                location = backend.store(artifacts)
+            pruned = prune(backend, config["retention"])
+            total_mb = sum(sizes.values()) / 1_048_576
+            log(vault, f"OK {config['backend']}:{location} set {stamp} "
+                       f"({total_mb:.0f}M, {len(sizes)} files"
+                       + (f", pruned {len(pruned)} sets" if pruned else "") + ")")
+            for warning in warnings:  # a degraded set is never silently "OK"
+                log(vault, f"WARNING {warning}")
+            write_stamp(vault, True, {"backend": config["backend"],
+                                      "location": location, "set": stamp,
+                                      "bytes": sum(sizes.values()),
+                                      "pruned": pruned,
+                                      "warnings": warnings})
+            return 0
     except Exception as error:  # any failure must be loud and stamped
         message = str(error)[:500] or error.__class__.__name__
         try:
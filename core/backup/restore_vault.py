@@ -7,7 +7,9 @@ Usage:
     python3 core/backup/restore_vault.py restore --to DIR [--set STAMP] [--source DIR]
 
 verify   recompute the checksums against the .sha256 sidecar and, when a
-         history bundle is present, run `git bundle verify` on it.
+         history bundle is present, run `git bundle verify` on it. For an
+         incremental set, also check every content chunk it names and
+         replay its chain of history bundles into a scratch repository.
 test     verify, then fully extract the archive into a throwaway temporary
          folder, count what came out, and delete the extraction. Proves a
          restore works without touching anything.
@@ -20,22 +22,50 @@ restore  verify, then extract into a folder you choose. The target must be
 rclone backend, first copy one set down to a local folder
 (`rclone copy remote:path/dex-vault-<stamp>.* /some/folder/`) and point
 --source at it; this tool stays honest by not reaching into the network.
+An incremental set also needs the shared chunks folder beside it
+(`rclone copy remote:path/chunks /some/folder/chunks`).
 """
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
 import shutil
 import subprocess
 import sys
 import tarfile
 import tempfile
-from pathlib import Path
+import zlib
+from pathlib import Path, PurePosixPath
 
 try:
-    from core.backup.backup_vault import PREFIX, file_digest, load_config, resolve_vault_root
+    from core.backup.backup_vault import (
+        ARCNAME,
+        MANIFEST_FORMAT,
+        MANIFEST_SUFFIX,
+        PREFIX,
+        chunk_relative,
+        escapes_vault,
+        file_digest,
+        load_config,
+        resolve_vault_root,
+        set_stamp,
+    )
 except ImportError:  # invoked by file path: put the vault root on sys.path
     sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-    from core.backup.backup_vault import PREFIX, file_digest, load_config, resolve_vault_root
+    from core.backup.backup_vault import (
+        ARCNAME,
+        MANIFEST_FORMAT,
+        MANIFEST_SUFFIX,
+        PREFIX,
+        chunk_relative,
+        escapes_vault,
+        file_digest,
+        load_config,
+        resolve_vault_root,
+        set_stamp,
+    )
 
 
 class RestoreError(RuntimeError):
@@ -59,9 +89,15 @@ def resolve_source(vault: Path, override: str | None) -> Path:
     return source
 
 
+def set_stamps(source: Path) -> list[str]:
+    """Every archive or manifest set in source, newest first."""
+    stamps = {set_stamp(p.name) for p in source.glob(f"{PREFIX}*")}
+    stamps.discard(None)
+    return sorted(stamps, reverse=True)
+
+
 def pick_set(source: Path, requested: str | None) -> str:
-    stamps = sorted({p.name[len(PREFIX):-len(".tar.gz")]
-                     for p in source.glob(f"{PREFIX}*.tar.gz")}, reverse=True)
+    stamps = set_stamps(source)
     if not stamps:
         raise RestoreError(f"No backup sets found in {source}")
     if requested is None:
@@ -98,6 +134,9 @@ def verify_set(source: Path, stamp: str) -> list[str]:
     # that other set's files and report this one intact without ever reading
     # the archive about to be unpacked.
     archive_name = f"{PREFIX}{stamp}.tar.gz"
+    manifest_name = f"{PREFIX}{stamp}{MANIFEST_SUFFIX}"
+    if manifest_name in checked and not (source / archive_name).exists():
+        return findings + _verify_manifest_set(source, stamp)
     if archive_name not in checked:
         raise RestoreError(
             f"{sidecar.name} does not cover {archive_name}, so the archive "
@@ -126,13 +165,112 @@ def verify_set(source: Path, stamp: str) -> list[str]:
     return findings
 
 
+def load_manifest(source: Path, stamp: str) -> dict:
+    path = source / f"{PREFIX}{stamp}{MANIFEST_SUFFIX}"
+    try:
+        manifest = json.loads(path.read_bytes())
+    except (OSError, ValueError) as error:
+        raise RestoreError(f"{path.name} could not be read: {_one_line(error)}") \
+            from error
+    if not isinstance(manifest, dict) \
+            or manifest.get("format") != MANIFEST_FORMAT:
+        raise RestoreError(f"{path.name} was written by a different version of "
+                           "the backup engine and cannot be read here")
+    return manifest
+
+
+def read_chunk(source: Path, name: str) -> bytes:
+    """One chunk's content, proven to be the bytes its name promises."""
+    path = source / chunk_relative(name)
+    try:
+        data = zlib.decompress(path.read_bytes())
+    except FileNotFoundError:
+        raise RestoreError(
+            f"content chunk {name[:12]} is missing from {source / 'chunks'}; "
+            "an incremental set needs the shared chunks folder copied with "
+            "it") from None
+    except (OSError, zlib.error) as error:
+        raise RestoreError(f"content chunk {name[:12]} is damaged: "
+                           f"{_one_line(error)}") from error
+    if hashlib.sha256(data).hexdigest() != name:
+        raise RestoreError(f"content chunk {name[:12]} does not match its "
+                           "recorded checksum; the copy in storage is damaged")
+    return data
+
+
+def assemble_history(source: Path, history: dict, repo: Path) -> None:
+    """Replay a set's chain of history bundles into a new bare repository.
+
+    Each bundle only holds the commits since the one before it, so they are
+    fetched oldest first. The result must end up with exactly the refs the
+    set recorded, pointing where it recorded them.
+    """
+    git = shutil.which("git")
+    if git is None:
+        raise RestoreError("git is not installed, so this set's version "
+                           "history cannot be rebuilt here")
+
+    def run(*args: str) -> subprocess.CompletedProcess:
+        return subprocess.run([git, "-C", str(repo), *args],
+                              capture_output=True, text=True)
+
+    subprocess.run([git, "init", "-q", "--bare", str(repo)],
+                   check=True, capture_output=True)
+    bundle = repo / "incoming.bundle"
+    for position, link in enumerate(history["bundles"], 1):
+        with bundle.open("wb") as handle:
+            for name in link["chunks"]:
+                handle.write(read_chunk(source, name))
+        if file_digest(bundle) != link["sha256"]:
+            raise RestoreError(f"history bundle {position} of "
+                               f"{len(history['bundles'])} does not match its "
+                               "recorded checksum")
+        result = run("fetch", "-q", str(bundle), "+refs/*:refs/*")
+        if result.returncode != 0:
+            raise RestoreError(
+                f"history bundle {position} of {len(history['bundles'])} could "
+                f"not be replayed: {(result.stderr or result.stdout).strip()[:300]}")
+    bundle.unlink(missing_ok=True)
+    listed = run("for-each-ref", "--format=%(objectname) %(refname)").stdout
+    for line in listed.splitlines():
+        object_id, _, ref = line.partition(" ")
+        if ref not in history["refs"]:
+            run("update-ref", "-d", ref, object_id)
+        elif history["refs"][ref] != object_id:
+            raise RestoreError(f"the rebuilt history has {ref} at the wrong "
+                               "commit")
+    missing = set(history["refs"]) - {line.partition(" ")[2]
+                                      for line in listed.splitlines()}
+    if missing:
+        raise RestoreError(f"the rebuilt history is missing {sorted(missing)[0]}")
+    if history.get("head") in history["refs"]:
+        run("symbolic-ref", "HEAD", history["head"])
+
+
+def _verify_manifest_set(source: Path, stamp: str) -> list[str]:
+    manifest = load_manifest(source, stamp)
+    findings = []
+    content = {name for entry in manifest.get("entries", [])
+               for name in entry.get("chunks", ())}
+    for name in sorted(content):
+        read_chunk(source, name)
+    findings.append(f"{len(content)} content chunk(s): present and intact")
+    history = manifest.get("history")
+    if history:
+        with tempfile.TemporaryDirectory() as tmp:
+            assemble_history(source, history, Path(tmp) / "history.git")
+        findings.append(f"history: {len(history['bundles'])} bundle(s) "
+                        "replayed and verified as complete")
+    else:
+        findings.append("No history in this set (the vault had no "
+                        "version history when it was taken)")
+    return findings
+
+
 def _with_fallback_hint(error: RestoreError, source: Path,
                         failed: str) -> RestoreError:
     """Add the newest set that does verify, when the requested one does not."""
-    others = [s for s in sorted(
-        {p.name[len(PREFIX):-len(".tar.gz")]
-         for p in source.glob(f"{PREFIX}*.tar.gz")}, reverse=True)
-        if s != failed]
+    others = [s for s in set_stamps(source) if s != failed]
     for candidate in others:
         try:
             verify_set(source, candidate)
@@ -158,6 +296,8 @@ def extract_archive(source: Path, stamp: str, target: Path) -> int:
     for a finished restore.
     """
     archive = source / f"{PREFIX}{stamp}.tar.gz"
+    if not archive.exists() and (source / f"{PREFIX}{stamp}{MANIFEST_SUFFIX}").exists():
+        return extract_manifest(source, stamp, target)
     try:
         with tarfile.open(archive) as tar:
             members = tar.getmembers()
@@ -178,6 +318,63 @@ def extract_archive(source: Path, stamp: str, target: Path) -> int:
     return len(members)
 
 
+def extract_manifest(source: Path, stamp: str, target: Path) -> int:
+    """Rebuild an incremental set's files from its manifest and chunks.
+
+    Applies the same safety rules as unpacking an archive: every path stays
+    inside the folder being written, links pointing outside it are refused,
+    and permissions are reduced to what the archive path would allow.
+    """
+    manifest = load_manifest(source, stamp)
+    name = f"{PREFIX}{stamp}{MANIFEST_SUFFIX}"
+    root = target / ARCNAME
+    try:
+        root.mkdir(parents=True, exist_ok=True)
+        resolved_root = root.resolve()
+        for entry in manifest.get("entries", []):
+            relative = PurePosixPath(entry["path"])
+            if relative.is_absolute() or not relative.parts \
+                    or ".." in relative.parts:
+                raise RestoreError(f"{name} could not be unpacked: it names "
+                                   f"an unsafe path ({entry['path']}).")
+            destination = root.joinpath(*relative.parts)
+            parent = destination.parent.resolve()
+            if parent != resolved_root and resolved_root not in parent.parents:
+                raise RestoreError(f"{name} could not be unpacked: "
+                                   f"{entry['path']} would land outside the "
+                                   "restore folder.")
+            mode = (int(entry.get("mode", 0o644)) & 0o755) | 0o600
+            if entry["type"] == "dir":
+                destination.mkdir(parents=True, exist_ok=True)
+                destination.chmod(mode | 0o700)
+            elif entry["type"] == "symlink":
+                info = tarfile.TarInfo(f"{ARCNAME}/{entry['path']}")
+                info.type, info.linkname = tarfile.SYMTYPE, entry["link"]
+                if escapes_vault(info):
+                    raise RestoreError(
+                        f"{name} could not be unpacked: {entry['path']} is a "
+                        "linked file pointing outside the vault. Nothing "
+                        "usable was written.")
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                os.symlink(entry["link"], destination)
+            elif entry["type"] == "file":
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                with destination.open("xb") as handle:
+                    for chunk in entry["chunks"]:
+                        handle.write(read_chunk(source, chunk))
+                destination.chmod(mode)
+                os.utime(destination, (entry["mtime"], entry["mtime"]))
+    except (KeyError, TypeError) as error:
+        raise RestoreError(f"{name} could not be unpacked: an entry is "
+                           f"malformed ({_one_line(error)}).") from error
+    except OSError as error:
+        raise RestoreError(
+            f"{name} could not be unpacked: {_one_line(error)}. "
+            "This usually means the disk is full or the folder is not "
+            "writable.") from error
+    return len(manifest.get("entries", [])) + 1
+
+
 def _one_line(error: BaseException) -> str:
     text = str(error).strip() or error.__class__.__name__
     return " ".join(text.split())[:300]
@@ -222,7 +419,21 @@ def restore(source: Path, stamp: str, target: Path, vault: Path) -> None:
         raise
     print(f"Restored {count} entries to {target}.")
     bundle = source / f"{PREFIX}{stamp}.bundle"
-    if bundle.exists():
+    history = None
+    if not bundle.exists() and (source / f"{PREFIX}{stamp}{MANIFEST_SUFFIX}").exists():
+        history = load_manifest(source, stamp).get("history")
+    if history:
+        # The chain is rebuilt into one self-contained bundle, so recovering
+        # history reads the same whichever mode took the set.
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp) / "history.git"
+            assemble_history(source, history, repo)
+            subprocess.run(["git", "-C", str(repo), "bundle", "create",
+                            str(target / bundle.name), "--all"],
+                           check=True, capture_output=True)
+        print(f"Rebuilt {bundle.name} alongside; recover the version history "
+              f"with: git clone {bundle.name} restored-history")
+    elif bundle.exists():
         shutil.copy2(bundle, target / bundle.name)
         print(f"Copied {bundle.name} alongside; recover the version history "
               f"with: git clone {bundle.name} restored-history")
@@ -26,6 +26,7 @@ try:
         SkillSourcePin,
         resolve_room_skill_sources,
     )
+    from core.utils import config_snapshot
 except ModuleNotFoundError as error:  # direct ``python core/capabilities.py`` entrypoint
     if error.name != "core":
         raise
@@ -34,6 +35,7 @@ except ModuleNotFoundError as error:  # direct ``python core/capabilities.py`` e
         SkillSourcePin,
         resolve_room_skill_sources,
     )
+    from utils import config_snapshot  # type: ignore[no-redef]
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_CONTRACT_PATH = REPO_ROOT / "packages/dex-contracts/dist/portable-vault.contract.json"
@@ -51,8 +53,8 @@ class UnknownCapability(CapabilityError):
 def _load_contract(contract_path: Path | str | None = None) -> dict[str, Any]:
     path = Path(contract_path or DEFAULT_CONTRACT_PATH)
     try:
-        parsed = json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError) as exc:
+        parsed = config_snapshot.load_json(path)
+    except (OSError, ValueError) as exc:
         raise CapabilityError(f"Could not read capability registry: {path}") from exc
     registry = parsed.get("capabilities")
     if not isinstance(registry, dict):
@@ -90,8 +92,8 @@ def _read_profile(
     if not path.exists():
         return {}
     try:
-        parsed = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    except (OSError, yaml.YAMLError) as exc:
+        parsed = config_snapshot.load_yaml(path) or {}
+    except (OSError, UnicodeDecodeError, yaml.YAMLError) as exc:
         if strict:
             raise CapabilityError(f"Could not safely read profile: {path}") from exc
         return {}
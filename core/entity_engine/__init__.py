@@ -9,6 +9,7 @@ from .contract import (
     RELATIONSHIP_TYPES,
     V2_FIELDS,
     ensure_region,
+    parse_entity_bytes,
     parse_entity_page,
     render_company_page,
     render_person_page,
@@ -40,6 +41,7 @@ __all__ = [
     "fingerprint_page",
     "mutate_page",
     "mutate_relationships",
+    "parse_entity_bytes",
     "parse_entity_page",
     "render_company_page",
     "render_person_page",
@@ -0,0 +1,109 @@
+"""Watcher-fed dirty-path journal for incremental entity-index reconciles."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FULL_SWEEP_SECONDS = 300.0
+
+
+class ChangeJournal:
+    """Collect changed paths between reconciles, with a periodic full sweep.
+
+    ``drain`` returns the paths recorded since the previous drain, or ``None``
+    when the caller must fall back to a full walk: on first use, after a
+    directory-level event the journal cannot expand, and whenever the sweep
+    interval has elapsed. Missed or coalesced watcher events are therefore
+    bounded by ``full_sweep_seconds``.
+    """
+
+    def __init__(self, full_sweep_seconds: float = DEFAULT_FULL_SWEEP_SECONDS):
+        self.full_sweep_seconds = full_sweep_seconds
+        self._lock = threading.Lock()
+        self._dirty: set[Path] = set()
+        self._needs_sweep = True
+        self._next_sweep_at = 0.0
+
+    def mark(self, path: str | Path) -> None:
+        with self._lock:
+            self._dirty.add(Path(path))
+
+    def mark_all(self) -> None:
+        with self._lock:
+            self._needs_sweep = True
+
+    def drain(self) -> set[Path] | None:
+        now = time.monotonic()
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            if self._needs_sweep or now >= self._next_sweep_at:
+                self._needs_sweep = False
+                self._next_sweep_at = now + self.full_sweep_seconds
+                return None
+            return dirty
+
+
+def _event_handler(journal: ChangeJournal) -> Any:
+    from watchdog.events import FileSystemEventHandler
+
+    class _JournalHandler(FileSystemEventHandler):
+        def on_any_event(self, event: Any) -> None:
+            if event.event_type in {"opened", "closed", "closed_no_write"}:
+                return
+            if event.is_directory:
+                # A moved or deleted folder reports no per-file events.
+                if event.event_type in {"moved", "deleted"}:
+                    journal.mark_all()
+                return
+            for path in (event.src_path, getattr(event, "dest_path", "")):
+                if path and str(path).endswith(".md"):
+                    journal.mark(path)
+
+    return _JournalHandler()
+
+
+def _nearest_existing(path: Path) -> Path | None:
+    for candidate in (path, *path.parents):
+        if candidate.is_dir():
+            return candidate
+    return None
+
+
+def start_observer(journal: ChangeJournal, roots: Iterable[Path]) -> Any | None:
+    """Watch ``roots`` (or their nearest existing ancestor) into ``journal``.
+
+    Returns the running observer, or ``None`` when watchdog is not installed
+    or the platform watcher cannot start; callers then keep full walks.
+    """
+    try:
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+    watched: list[Path] = []
+    for root in roots:
+        existing = _nearest_existing(Path(root).resolve())
+        if existing is None or any(
+            existing.is_relative_to(parent) for parent in watched
+        ):
+            continue
+        watched = [path for path in watched if not path.is_relative_to(existing)]
+        watched.append(existing)
+    if not watched:
+        return None
+    observer = Observer()
+    handler = _event_handler(journal)
+    try:
+        for path in watched:
+            observer.schedule(handler, str(path), recursive=True)
+        observer.daemon = True
+        observer.start()
+    except (OSError, RuntimeError) as error:
+        logger.warning("Entity change journal disabled: %s", error)
+        return None
+    return observer
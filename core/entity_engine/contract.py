@@ -409,7 +409,16 @@ def _infer_type(path: Path, values: dict[str, Any]) -> str | None:
 def parse_entity_page(path: str | Path) -> dict[str, Any]:
     """Parse a page using frontmatter, pipe-table, then inline-bold precedence."""
     page_path = Path(path)
-    text = page_path.read_text(encoding="utf-8-sig")
+    return _parse_entity_text(page_path, page_path.read_text(encoding="utf-8-sig"))
+
+
+def parse_entity_bytes(path: str | Path, content: bytes) -> dict[str, Any]:
+    """Parse page bytes already in memory exactly as ``parse_entity_page`` would."""
+    text = content.decode("utf-8-sig").replace("\r\n", "\n").replace("\r", "\n")
+    return _parse_entity_text(Path(path), text)
+
+
+def _parse_entity_text(page_path: Path, text: str) -> dict[str, Any]:
     frontmatter, body, had_frontmatter, quarantined = _split_frontmatter(text)
     pipe, inline, legacy_formats = _legacy_fields(body)
     result = _empty_result()
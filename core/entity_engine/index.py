@@ -2,23 +2,43 @@
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
+import multiprocessing
+import os
 import re
 import sqlite3
+import tempfile
+import threading
 import time
 import unicodedata
-from contextlib import closing
-from dataclasses import dataclass
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Any, Callable, Iterable, TypeVar
+from typing import Any, Callable, Iterable, Iterator, TypeVar
 
-from core.entity_engine.contract import fold, parse_entity_page
+from core.entity_engine.change_journal import (
+    DEFAULT_FULL_SWEEP_SECONDS,
+    ChangeJournal,
+    start_observer,
+)
+from core.entity_engine.contract import fold, parse_entity_bytes
 from core.lifecycle.inventory import load_folder_map
 from core.paths import COMPANIES_DIR, PEOPLE_DIR, VAULT_ROOT
 from core.utils.company_domains import registrable_domain
+from core.utils.sqlite_integrity import (
+    DEFAULT_CHECK_INTERVAL_SECONDS,
+    VerifiedFiles,
+    file_identity,
+    quick_check_passes,
+    start_background_checks,
+)
 
 # Vault-relative PARA roots derived from the canonical core.paths constants
 # (POSIX strings, computed at import time). Using these instead of raw PARA path
@@ -28,11 +48,13 @@ _PEOPLE_EXTERNAL_REL = (PEOPLE_DIR / "External").relative_to(VAULT_ROOT).as_posi
 _PEOPLE_CPO_REL = (PEOPLE_DIR / "CPO_Network").relative_to(VAULT_ROOT).as_posix()
 _COMPANIES_REL = COMPANIES_DIR.relative_to(VAULT_ROOT).as_posix()
 
-SCHEMA_VERSION = "2"
+SCHEMA_VERSION = "4"
 DEFAULT_DEBOUNCE_SECONDS = 0.25
+DEFAULT_EXPORT_DELAY_SECONDS = 5.0
 _DATABASE_RELATIVE_PATH = Path("System/.dex/entity-index/database.sqlite3")
 _PEOPLE_EXPORT_RELATIVE_PATH = Path("System/People_Index.json")
 _COMPANY_EXPORT_RELATIVE_PATH = Path("System/Company_Index.json")
+_FUZZY_THRESHOLD = 0.5
 _GOES_BY_RE = re.compile(
     r"^\s*(?:\*\*)?Goes by(?::\*\*|\*\*\s*:|\s+)(?:\s*)(.+?)\s*$",
     re.IGNORECASE,
@@ -47,6 +69,11 @@ _INVERSE_EDGE_LABELS = {
 }
 _WIKILINK_RE = re.compile(r"^\[\[([^|\]]+)(?:\|[^\]]+)?\]\]$")
 _T = TypeVar("_T")
+# Below this many pages, worker start-up costs more than parsing serially.
+_PARALLEL_PREPARE_MIN_PAGES = 256
+_PREPARE_BATCH_SIZE = 64
+_MAX_PREPARE_WORKERS = 8
+_EXPORT_BATCH_SIZE = 500
 
 _SCHEMA = """
 CREATE TABLE IF NOT EXISTS source_files (
@@ -82,6 +109,14 @@ CREATE TABLE IF NOT EXISTS node_keys (
 );
 CREATE INDEX IF NOT EXISTS idx_node_keys_value ON node_keys(kind, value);
 
+CREATE TABLE IF NOT EXISTS lookup_keys (
+    node_id TEXT NOT NULL REFERENCES nodes(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (node_id, kind, value)
+);
+CREATE INDEX IF NOT EXISTS idx_lookup_keys_value ON lookup_keys(kind, value);
+
 CREATE TABLE IF NOT EXISTS edges (
     src_id TEXT NOT NULL REFERENCES nodes(id) ON DELETE CASCADE,
     edge_type TEXT NOT NULL,
@@ -139,7 +174,28 @@ class _CacheEntry:
     signature: tuple[tuple[str, int, int], ...]
 
 
+@dataclass
+class _Watched:
+    journal: ChangeJournal
+    observer: Any
+    scope: tuple[str | None, str | None] | None = None
+    roots: list[tuple[Path, str, str | None, bool]] = field(default_factory=list)
+    sources: dict[str, _Source] | None = None
+
+
 _RECONCILE_CACHE: dict[Path, _CacheEntry] = {}
+_WATCHED: dict[Path, _Watched] = {}
+_VERIFIED = VerifiedFiles()
+_POOL = threading.local()
+# Bumped by remove_database so pooled connections in other threads notice a
+# rebuild even if the new file happens to reuse the old inode number.
+_GENERATIONS: dict[Path, int] = {}
+_KEEP_CONNECTIONS_OPEN = False
+_EXPORT_DELAY_SECONDS: float | None = None
+_EXPORT_ATEXIT_REGISTERED = False
+_EXPORT_LOCK = threading.Lock()
+_EXPORT_TIMER: dict[str, threading.Timer] = {}
+_PENDING_EXPORTS: dict[Path, tuple[Path, str | Path | None, str | Path | None]] = {}
 
 
 def database_path(vault_root: str | Path) -> Path:
@@ -151,9 +207,55 @@ def clear_reconcile_cache() -> None:
     _RECONCILE_CACHE.clear()
 
 
+def watch(
+    vault_root: str | Path,
+    *,
+    people_dir: str | Path | None = None,
+    companies_dir: str | Path | None = None,
+    full_sweep_seconds: float = DEFAULT_FULL_SWEEP_SECONDS,
+) -> bool:
+    """Feed reconcile from filesystem events instead of a walk per query.
+
+    Returns whether a watcher is active. Without watchdog installed this is
+    a no-op and every reconcile keeps doing its full stat walk.
+    """
+    root = Path(vault_root)
+    cache_key = database_path(root).resolve()
+    if cache_key in _WATCHED:
+        return True
+    journal = ChangeJournal(full_sweep_seconds)
+    observer = start_observer(
+        journal,
+        [
+            path
+            for path, *_ in _source_roots(
+                root,
+                people_dir=people_dir,
+                companies_dir=companies_dir,
+            )
+        ],
+    )
+    if observer is None:
+        return False
+    _WATCHED[cache_key] = _Watched(journal=journal, observer=observer)
+    return True
+
+
+def unwatch(vault_root: str | Path) -> None:
+    """Stop a watcher started by ``watch``; later reconciles walk again."""
+    watched = _WATCHED.pop(database_path(vault_root).resolve(), None)
+    if watched is not None:
+        watched.observer.stop()
+        watched.observer.join(timeout=5)
+
+
 def remove_database(path: str | Path) -> None:
     """Remove the disposable database and both SQLite sidecars as one rebuild unit."""
     db_path = Path(path)
+    _discard_pooled(db_path)
+    _VERIFIED.forget(db_path)
+    key = db_path.resolve()
+    _GENERATIONS[key] = _GENERATIONS.get(key, 0) + 1
     for candidate in (db_path, Path(f"{db_path}-wal"), Path(f"{db_path}-shm")):
         candidate.unlink(missing_ok=True)
     _RECONCILE_CACHE.pop(db_path.resolve(), None)
@@ -168,15 +270,85 @@ def connect(path: str | Path) -> sqlite3.Connection:
         connection.execute("PRAGMA foreign_keys = ON")
         connection.execute("PRAGMA journal_mode = WAL")
         connection.execute("PRAGMA synchronous = NORMAL")
-        quick_check = connection.execute("PRAGMA quick_check").fetchall()
-        if quick_check != [("ok",)]:
-            raise _FailedQuickCheck(f"SQLite quick_check failed: {quick_check!r}")
+        # quick_check scans every page, so it runs once per database file
+        # per process; a replaced file or a failed background check re-arms it.
+        if _VERIFIED.needs_check(db_path):
+            if not quick_check_passes(connection):
+                raise _FailedQuickCheck(f"SQLite quick_check failed: {db_path}")
+            _VERIFIED.record(db_path)
         return connection
     except BaseException:
         connection.close()
         raise
 
 
+def keep_connections_open(enabled: bool = True) -> None:
+    """Reuse one connection per thread and database file for long-lived processes."""
+    global _KEEP_CONNECTIONS_OPEN
+    _KEEP_CONNECTIONS_OPEN = enabled
+    if not enabled:
+        for *_identity, connection in _pooled().values():
+            connection.close()
+        _pooled().clear()
+
+
+def _pooled() -> dict[Path, tuple[Any, int, sqlite3.Connection]]:
+    if not hasattr(_POOL, "connections"):
+        _POOL.connections = {}
+    return _POOL.connections
+
+
+def _discard_pooled(db_path: Path) -> None:
+    entry = _pooled().pop(db_path.resolve(), None)
+    if entry is not None:
+        entry[2].close()
+
+
+@contextmanager
+def pooled_connection(path: str | Path) -> Iterator[sqlite3.Connection]:
+    """Yield a connection, kept open afterwards only when pooling is enabled.
+
+    A pooled connection is dropped when the file it was opened on has been
+    replaced, when it must be re-verified, or when its user raised.
+    """
+    db_path = Path(path)
+    if not _KEEP_CONNECTIONS_OPEN:
+        with closing(connect(db_path)) as connection:
+            yield connection
+        return
+    key = db_path.resolve()
+    entry = _pooled().pop(key, None)
+    generation = _GENERATIONS.get(key, 0)
+    if entry is not None and (
+        entry[:2] != (file_identity(db_path), generation)
+        or _VERIFIED.needs_check(db_path)
+    ):
+        entry[2].close()
+        entry = None
+    connection = entry[2] if entry is not None else connect(db_path)
+    try:
+        yield connection
+    except BaseException:
+        connection.close()
+        raise
+    if connection.in_transaction:
+        connection.rollback()
+    _pooled()[key] = (file_identity(db_path), generation, connection)
+
+
+def schedule_integrity_checks(
+    paths: Iterable[str | Path],
+    *,
+    interval_seconds: float = DEFAULT_CHECK_INTERVAL_SECONDS,
+) -> threading.Event:
+    """Periodically quick_check index files; a failure forces a rebuild on next use."""
+    return start_background_checks(
+        _VERIFIED,
+        paths,
+        interval_seconds=interval_seconds,
+    )
+
+
 def _is_corruption(error: BaseException) -> bool:
     if isinstance(error, _FailedQuickCheck):
         return True
@@ -234,13 +406,12 @@ def _scan_root(
         )
 
 
-def _scan_sources(
+def _source_roots(
     vault_root: Path,
     *,
     people_dir: str | Path | None,
     companies_dir: str | Path | None,
-) -> dict[str, _Source]:
-    sources: dict[str, _Source] = {}
+) -> list[tuple[Path, str, str | None, bool]]:
     if people_dir is not None:
         people_root = Path(people_dir)
         roots = [
@@ -282,6 +453,30 @@ def _scan_sources(
                 True,
             )
         )
+    return roots
+
+
+def _scan_sources(
+    vault_root: Path,
+    *,
+    people_dir: str | Path | None,
+    companies_dir: str | Path | None,
+) -> dict[str, _Source]:
+    return _scan_source_roots(
+        vault_root,
+        _source_roots(
+            vault_root,
+            people_dir=people_dir,
+            companies_dir=companies_dir,
+        ),
+    )
+
+
+def _scan_source_roots(
+    vault_root: Path,
+    roots: list[tuple[Path, str, str | None, bool]],
+) -> dict[str, _Source]:
+    sources: dict[str, _Source] = {}
     for root, entity_type, people_type, recursive in roots:
         for source in _scan_root(
             vault_root,
@@ -294,6 +489,57 @@ def _scan_sources(
     return sources
 
 
+def _apply_dirty_paths(
+    vault_root: Path,
+    roots: list[tuple[Path, str, str | None, bool]],
+    sources: dict[str, _Source],
+    dirty: Iterable[Path],
+) -> dict[str, _Source]:
+    """Re-stat only journaled paths on top of the previous scan result."""
+    updated = dict(sources)
+    resolved_roots = [
+        (root.resolve(), entity_type, people_type, recursive)
+        for root, entity_type, people_type, recursive in roots
+    ]
+    for path in dirty:
+        resolved = path.resolve()
+        if resolved.suffix != ".md":
+            continue
+        try:
+            relative_path = _safe_relative(resolved, vault_root)
+        except ValueError:
+            continue
+        updated.pop(relative_path, None)
+        if resolved.name == "README.md":
+            continue
+        match = None
+        for root, entity_type, people_type, recursive in resolved_roots:
+            inside = (
+                resolved.is_relative_to(root)
+                if recursive
+                else resolved.parent == root
+            )
+            if inside:
+                match = (entity_type, people_type)
+        if match is None:
+            continue
+        try:
+            stat = resolved.stat()
+        except FileNotFoundError:
+            continue
+        if not resolved.is_file():
+            continue
+        updated[relative_path] = _Source(
+            path=resolved,
+            relative_path=relative_path,
+            entity_type=match[0],
+            people_type=match[1],
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+        )
+    return updated
+
+
 def _fingerprint(content: bytes) -> str:
     return f"sha256:{hashlib.sha256(content).hexdigest()}"
 
@@ -371,6 +617,40 @@ def _company_compatibility_entry(
     }
 
 
+def _may_match_fuzzily(query: str, name: str) -> bool:
+    """Whether ``name`` could reach the fuzzy threshold against ``query``.
+
+    The shared-character count is ``SequenceMatcher.quick_ratio``, an upper
+    bound on ``ratio``, so this never drops a name the full score would keep.
+    """
+    if query in name or name in query:
+        return True
+    shared = sum((Counter(query) & Counter(name)).values())
+    return 2 * shared >= _FUZZY_THRESHOLD * (len(query) + len(name))
+
+
+def _lookup_keys(
+    entity_type: str,
+    compatibility: dict[str, Any],
+) -> list[tuple[str, str]]:
+    """Derive lookup-only keys, including for quarantined pages.
+
+    ``node_keys`` also drives relationship resolution, so keys that exist only
+    to answer ``lookup_person`` and ``find_company_by_domain`` live apart.
+    """
+    if entity_type == "person":
+        return [
+            ("name", fold(compatibility.get("name") or "")),
+            ("first_name", fold(compatibility.get("first_name") or "")),
+        ]
+    return [
+        ("registrable_domain", domain)
+        for domain in sorted(
+            {registrable_domain(value) for value in compatibility.get("domains", [])}
+        )
+    ]
+
+
 def _relationship_target_id(
     connection: sqlite3.Connection,
     target_ref: str,
@@ -512,6 +792,13 @@ def _project_source(
             source.relative_path,
         ),
     )
+    connection.executemany(
+        "INSERT OR IGNORE INTO lookup_keys(node_id, kind, value) VALUES (?, ?, ?)",
+        [
+            (source.relative_path, kind, value)
+            for kind, value in _lookup_keys(source.entity_type, compatibility)
+        ],
+    )
     if quarantined:
         return
 
@@ -631,19 +918,19 @@ def _compatibility_rows(
     ):
         fields = json.loads(fields_json)
         rows.append(fields["_compat"])
-    if entity_type == "person":
-        type_order = {"internal": 0, "external": 1, "cpo_network": 2}
-        rows.sort(
-            key=lambda item: (
-                type_order.get(item["type"], 3),
-                fold(item["path"]),
-            )
-        )
-    else:
-        rows.sort(key=lambda item: (fold(item["name"]), item["path"]))
+    rows.sort(key=_person_order if entity_type == "person" else _company_order)
     return rows
 
 
+def _person_order(item: dict[str, Any]) -> tuple[int, str]:
+    type_order = {"internal": 0, "external": 1, "cpo_network": 2}
+    return type_order.get(item["type"], 3), fold(item["path"])
+
+
+def _company_order(item: dict[str, Any]) -> tuple[str, str]:
+    return fold(item["name"]), item["path"]
+
+
 def _built_at(connection: sqlite3.Connection) -> str:
     row = connection.execute(
         "SELECT value FROM meta WHERE key = 'built_at'"
@@ -675,12 +962,152 @@ def _views(connection: sqlite3.Connection) -> tuple[dict[str, Any], dict[str, An
     return people_view, company_view
 
 
-def _write_json(path: Path, payload: dict[str, Any]) -> None:
+def _ordered_compatibility_rows(
+    connection: sqlite3.Connection,
+    entity_type: str,
+) -> Iterator[dict[str, Any]]:
+    """Yield view rows in export order while holding only ids in memory."""
+    if entity_type == "person":
+        type_order = {"internal": 0, "external": 1, "cpo_network": 2}
+        keyed = [
+            ((type_order.get(people_type, 3), fold(node_id)), node_id)
+            for node_id, people_type in connection.execute(
+                """
+                SELECT id, json_extract(fields_json, '$._compat.type')
+                FROM nodes WHERE type = 'person'
+                """
+            )
+        ]
+    else:
+        keyed = [
+            ((fold(name), node_id), node_id)
+            for node_id, name in connection.execute(
+                "SELECT id, name FROM nodes WHERE type = ?",
+                (entity_type,),
+            )
+        ]
+    ordered = [node_id for _key, node_id in sorted(keyed)]
+    for start in range(0, len(ordered), _EXPORT_BATCH_SIZE):
+        batch = ordered[start : start + _EXPORT_BATCH_SIZE]
+        fields_by_id = dict(
+            connection.execute(
+                """
+                SELECT id, fields_json FROM nodes
+                WHERE id IN (SELECT value FROM json_each(?))
+                """,
+                (json.dumps(batch),),
+            )
+        )
+        for node_id in batch:
+            yield json.loads(fields_by_id[node_id])["_compat"]
+
+
+def _stream_view(
+    path: Path,
+    header: dict[str, Any],
+    list_key: str,
+    rows: Iterable[dict[str, Any]],
+) -> None:
+    """Write ``{**header, list_key: rows}`` as ``json.dumps(indent=2)`` would.
+
+    Rows are serialized one at a time into a sibling temp file that replaces
+    the export atomically, so readers never see a half-written view.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(payload, indent=2) + "\n",
-        encoding="utf-8",
+    fd, temp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
     )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(json.dumps(header, indent=2)[:-2])
+            handle.write(f",\n  {json.dumps(list_key)}: [")
+            empty = True
+            for row in rows:
+                handle.write("\n    " if empty else ",\n    ")
+                handle.write(json.dumps(row, indent=2).replace("\n", "\n    "))
+                empty = False
+            handle.write("]\n}\n" if empty else "\n  ]\n}\n")
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def _export_signature(connection: sqlite3.Connection, entity_type: str) -> str:
+    """Hash what a view is derived from: every source fingerprint of one type."""
+    digest = hashlib.sha256(f"schema:{SCHEMA_VERSION}\n".encode())
+    for path, fingerprint in connection.execute(
+        """
+        SELECT path, fingerprint FROM source_files
+        WHERE entity_type = ? ORDER BY path
+        """,
+        (entity_type,),
+    ):
+        digest.update(f"{path}\0{fingerprint}\n".encode())
+    return digest.hexdigest()
+
+
+def _export_view(
+    connection: sqlite3.Connection,
+    entity_type: str,
+    path: Path,
+    *,
+    force: bool,
+) -> bool:
+    signature = _export_signature(connection, entity_type)
+    meta_key = f"export_signature:{path.resolve()}"
+    stored = connection.execute(
+        "SELECT value FROM meta WHERE key = ?",
+        (meta_key,),
+    ).fetchone()
+    if not force and stored is not None and stored[0] == signature and path.exists():
+        return False
+    built_at = _built_at(connection)
+    if entity_type == "person":
+        by_type = dict(
+            connection.execute(
+                """
+                SELECT json_extract(fields_json, '$._compat.type'), COUNT(*)
+                FROM nodes WHERE type = 'person'
+                GROUP BY 1
+                """
+            ).fetchall()
+        )
+        header = {
+            "version": 2,
+            "built_at": built_at,
+            "total": sum(by_type.values()),
+            "by_type": {
+                people_type: by_type.get(people_type, 0)
+                for people_type in ("internal", "external", "cpo_network")
+            },
+        }
+        list_key = "people"
+    else:
+        header = {
+            "version": 1,
+            "built_at": built_at,
+            "total": connection.execute(
+                "SELECT COUNT(*) FROM nodes WHERE type = ?",
+                (entity_type,),
+            ).fetchone()[0],
+        }
+        list_key = "companies"
+    _stream_view(
+        path,
+        header,
+        list_key,
+        _ordered_compatibility_rows(connection, entity_type),
+    )
+    with connection:
+        connection.execute(
+            """
+            INSERT INTO meta(key, value) VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value
+            """,
+            (meta_key, signature),
+        )
+    return True
 
 
 def dump_json_views(
@@ -689,23 +1116,167 @@ def dump_json_views(
     *,
     people_index_path: str | Path | None = None,
     company_index_path: str | Path | None = None,
-) -> tuple[dict[str, Any], dict[str, Any]]:
-    """Export compatibility JSON views from the reconciled SQLite projection."""
+    force: bool = False,
+) -> dict[str, bool]:
+    """Export compatibility JSON views from the reconciled SQLite projection.
+
+    A view whose source fingerprints match the last export to the same path
+    is left untouched unless ``force`` is set. Returns which views were
+    written.
+    """
     root = Path(vault_root)
-    people_view, company_view = _views(connection)
-    _write_json(
-        Path(people_index_path)
-        if people_index_path is not None
-        else root / _PEOPLE_EXPORT_RELATIVE_PATH,
-        people_view,
-    )
-    _write_json(
-        Path(company_index_path)
-        if company_index_path is not None
-        else root / _COMPANY_EXPORT_RELATIVE_PATH,
-        company_view,
+    return {
+        "people": _export_view(
+            connection,
+            "person",
+            Path(people_index_path)
+            if people_index_path is not None
+            else root / _PEOPLE_EXPORT_RELATIVE_PATH,
+            force=force,
+        ),
+        "companies": _export_view(
+            connection,
+            "company",
+            Path(company_index_path)
+            if company_index_path is not None
+            else root / _COMPANY_EXPORT_RELATIVE_PATH,
+            force=force,
+        ),
+    }
+
+
+def defer_json_exports(delay_seconds: float | None = DEFAULT_EXPORT_DELAY_SECONDS) -> None:
+    """Debounce JSON exports after reconciles instead of writing them inline.
+
+    Long-lived servers reconcile on nearly every query; deferring coalesces a
+    burst of edits into one export. Pending exports are flushed by the timer,
+    by ``flush_json_exports``, and at interpreter exit. ``None`` restores
+    inline exports.
+    """
+    global _EXPORT_DELAY_SECONDS
+    _EXPORT_DELAY_SECONDS = delay_seconds
+    if delay_seconds is None:
+        flush_json_exports()
+        return
+    global _EXPORT_ATEXIT_REGISTERED
+    if not _EXPORT_ATEXIT_REGISTERED:
+        atexit.register(flush_json_exports)
+        _EXPORT_ATEXIT_REGISTERED = True
+
+
+def flush_json_exports() -> None:
+    """Write any deferred JSON exports now."""
+    with _EXPORT_LOCK:
+        pending = dict(_PENDING_EXPORTS)
+        _PENDING_EXPORTS.clear()
+        timer = _EXPORT_TIMER.pop("timer", None)
+    if timer is not None:
+        timer.cancel()
+    for db_path, (vault_root, people_index_path, company_index_path) in pending.items():
+        try:
+            with pooled_connection(db_path) as connection:
+                dump_json_views(
+                    connection,
+                    vault_root,
+                    people_index_path=people_index_path,
+                    company_index_path=company_index_path,
+                )
+        except (sqlite3.Error, OSError):
+            # The next reconcile queues the export again; the old JSON stays.
+            continue
+
+
+def _queue_json_export(
+    db_path: Path,
+    vault_root: Path,
+    people_index_path: str | Path | None,
+    company_index_path: str | Path | None,
+) -> None:
+    with _EXPORT_LOCK:
+        _PENDING_EXPORTS[db_path.resolve()] = (
+            vault_root,
+            people_index_path,
+            company_index_path,
+        )
+        if "timer" in _EXPORT_TIMER or _EXPORT_DELAY_SECONDS is None:
+            return
+        timer = threading.Timer(_EXPORT_DELAY_SECONDS, flush_json_exports)
+        timer.daemon = True
+        _EXPORT_TIMER["timer"] = timer
+    timer.start()
+
+
+def _available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _prepare_source(source: _Source) -> _PreparedSource:
+    content = source.path.read_bytes()
+    return _PreparedSource(
+        source=source,
+        content=content,
+        fingerprint=_fingerprint(content),
+        parsed=parse_entity_bytes(source.path, content),
     )
-    return people_view, company_view
+
+
+def _prepare_batch(batch: list[_Source]) -> list[_PreparedSource]:
+    return [_prepare_source(source) for source in batch]
+
+
+def _prepare_sources(sources: list[_Source]) -> dict[str, _PreparedSource]:
+    """Read, hash and parse pages, in worker processes for large batches.
+
+    At most ``workers * 2`` batches are in flight at once, which bounds the
+    pickled work queued between processes. The results themselves are all
+    kept, so peak memory still grows with the number of pages prepared: the
+    caller needs every page before it opens its write transaction.
+    """
+    workers = min(_available_cpus(), _MAX_PREPARE_WORKERS)
+    if len(sources) < _PARALLEL_PREPARE_MIN_PAGES or workers < 2:
+        return {
+            source.relative_path: _prepare_source(source) for source in sources
+        }
+    batches = [
+        sources[start : start + _PREPARE_BATCH_SIZE]
+        for start in range(0, len(sources), _PREPARE_BATCH_SIZE)
+    ]
+    try:
+        # spawn: the MCP servers run watcher threads, which fork would copy.
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    except (OSError, NotImplementedError):
+        pool = None
+    prepared: dict[str, _PreparedSource] = {}
+    try:
+        if pool is None:
+            raise BrokenProcessPool("no worker processes available")
+        with pool:
+            pending: set[Future[list[_PreparedSource]]] = set()
+            for batch in batches:
+                pending.add(pool.submit(_prepare_batch, batch))
+                if len(pending) < workers * 2:
+                    continue
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    prepared.update(
+                        (item.source.relative_path, item) for item in future.result()
+                    )
+            for future in pending:
+                prepared.update(
+                    (item.source.relative_path, item) for item in future.result()
+                )
+    except BrokenProcessPool:
+        # No usable worker processes here (sandboxes, frozen apps): stay serial.
+        return {
+            source.relative_path: _prepare_source(source) for source in sources
+        }
+    return prepared
 
 
 def _reconcile_open_database(
@@ -731,30 +1302,15 @@ def _reconcile_open_database(
     present = current_paths & indexed_paths
     changed = 0
     indexed_at = datetime.now().isoformat()
-    prepared: dict[str, _PreparedSource] = {}
-
-    for relative_path in sorted(added):
-        source = sources[relative_path]
-        content = source.path.read_bytes()
-        prepared[relative_path] = _PreparedSource(
-            source=source,
-            content=content,
-            fingerprint=_fingerprint(content),
-            parsed=parse_entity_page(source.path),
-        )
+    to_prepare = [sources[relative_path] for relative_path in sorted(added)]
     for relative_path in sorted(present):
         source = sources[relative_path]
         _old_fingerprint, old_size, old_mtime_ns = indexed[relative_path]
         # Accepted risk: unchanged size and mtime skip re-hashing on normal filesystems.
         if (source.size, source.mtime_ns) == (old_size, old_mtime_ns):
             continue
-        content = source.path.read_bytes()
-        prepared[relative_path] = _PreparedSource(
-            source=source,
-            content=content,
-            fingerprint=_fingerprint(content),
-            parsed=parse_entity_page(source.path),
-        )
+        to_prepare.append(source)
+    prepared = _prepare_sources(to_prepare)
 
     with connection:
         connection.executemany(
@@ -803,12 +1359,20 @@ def _reconcile_open_database(
             (indexed_at,),
         )
 
-    dump_json_views(
-        connection,
-        vault_root,
-        people_index_path=people_index_path,
-        company_index_path=company_index_path,
-    )
+    if _EXPORT_DELAY_SECONDS is None:
+        dump_json_views(
+            connection,
+            vault_root,
+            people_index_path=people_index_path,
+            company_index_path=company_index_path,
+        )
+    else:
+        _queue_json_export(
+            database_path(vault_root),
+            vault_root,
+            people_index_path,
+            company_index_path,
+        )
     return {"added": len(added), "changed": changed, "removed": len(removed)}
 
 
@@ -822,13 +1386,76 @@ def reconcile(
     force: bool = False,
     debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
 ) -> dict[str, int]:
-    """Reconcile the materialized view using a complete path-set diff."""
+    """Reconcile the materialized view using a complete path-set diff.
+
+    When the vault is being watched (see ``watch``), only journaled paths are
+    re-stated between periodic full sweeps; ``force`` always walks the tree.
+    """
     root = Path(vault_root)
     db_path = database_path(root)
+    cache_key = db_path.resolve()
+    watched = _WATCHED.get(cache_key)
+    scope = (
+        None if people_dir is None else str(people_dir),
+        None if companies_dir is None else str(companies_dir),
+    )
+    dirty = None
+    if watched is not None:
+        dirty = watched.journal.drain()
+        if force:
+            # A caller that just wrote a page cannot wait for its watch event.
+            dirty = None
+        elif (
+            dirty is not None
+            and watched.sources is not None
+            and watched.scope == scope
+            and db_path.exists()
+        ):
+            if not dirty:
+                return {"added": 0, "changed": 0, "removed": 0}
+        else:
+            dirty = None
+    try:
+        result, sources, roots = _reconcile_sources(
+            root,
+            db_path,
+            watched,
+            dirty,
+            people_dir=people_dir,
+            companies_dir=companies_dir,
+            people_index_path=people_index_path,
+            company_index_path=company_index_path,
+            force=force,
+            debounce_seconds=debounce_seconds,
+        )
+    except BaseException:
+        if watched is not None:
+            watched.journal.mark_all()
+        raise
+    if watched is not None:
+        watched.sources = sources
+        watched.roots = roots
+        watched.scope = scope
+    return result
+
+
+def _reconcile_sources(
+    root: Path,
+    db_path: Path,
+    watched: _Watched | None,
+    dirty: set[Path] | None,
+    *,
+    people_dir: str | Path | None,
+    companies_dir: str | Path | None,
+    people_index_path: str | Path | None,
+    company_index_path: str | Path | None,
+    force: bool,
+    debounce_seconds: float,
+) -> tuple[dict[str, int], dict[str, _Source], list[tuple[Path, str, str | None, bool]]]:
     rebuild = False
     if db_path.exists():
         try:
-            with closing(connect(db_path)) as connection:
+            with pooled_connection(db_path) as connection:
                 has_meta = connection.execute(
                     """
                     SELECT 1 FROM sqlite_master
@@ -849,11 +1476,16 @@ def reconcile(
             rebuild = True
     if rebuild:
         remove_database(db_path)
-    sources = _scan_sources(
-        root,
-        people_dir=people_dir,
-        companies_dir=companies_dir,
-    )
+    if dirty is not None and not rebuild and watched is not None:
+        roots = watched.roots
+        sources = _apply_dirty_paths(root, roots, watched.sources or {}, dirty)
+    else:
+        roots = _source_roots(
+            root,
+            people_dir=people_dir,
+            companies_dir=companies_dir,
+        )
+        sources = _scan_source_roots(root, roots)
     signature = tuple(
         (path, source.size, source.mtime_ns)
         for path, source in sorted(sources.items())
@@ -867,10 +1499,10 @@ def reconcile(
         and cached.expires_at >= time.monotonic()
         and cached.signature == signature
     ):
-        return {"added": 0, "changed": 0, "removed": 0}
+        return {"added": 0, "changed": 0, "removed": 0}, sources, roots
 
     try:
-        with closing(connect(db_path)) as connection:
+        with pooled_connection(db_path) as connection:
             result = _reconcile_open_database(
                 connection,
                 root,
@@ -882,7 +1514,7 @@ def reconcile(
         if not _is_corruption(error):
             raise
         remove_database(db_path)
-        with closing(connect(db_path)) as connection:
+        with pooled_connection(db_path) as connection:
             result = _reconcile_open_database(
                 connection,
                 root,
@@ -895,7 +1527,7 @@ def reconcile(
         expires_at=time.monotonic() + debounce_seconds,
         signature=signature,
     )
-    return result
+    return result, sources, roots
 
 
 def build_from_vault(
@@ -925,17 +1557,52 @@ def _read_after_reconcile(
 ) -> _T:
     db_path = database_path(vault_root)
     try:
-        with closing(connect(db_path)) as connection:
+        with pooled_connection(db_path) as connection:
             return reader(connection)
     except sqlite3.Error as error:
         if not _is_corruption(error):
             raise
         remove_database(db_path)
         reconcile(vault_root, force=True, **reconcile_kwargs)
-        with closing(connect(db_path)) as connection:
+        with pooled_connection(db_path) as connection:
             return reader(connection)
 
 
+def _last_exported_view(
+    vault_root: str | Path,
+    export_path: str | Path | None,
+    default_relative_path: Path,
+    error: sqlite3.Error,
+) -> dict[str, Any]:
+    """Serve the last good JSON export while another writer holds the lock."""
+    path = (
+        Path(export_path)
+        if export_path is not None
+        else Path(vault_root) / default_relative_path
+    )
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise error
+
+
+def _query_reconciled(
+    vault_root: str | Path,
+    reconcile_kwargs: dict[str, Any],
+    reader: Callable[[sqlite3.Connection], _T],
+    busy_fallback: Callable[[sqlite3.Error], _T],
+) -> _T:
+    kwargs = dict(reconcile_kwargs)
+    force = kwargs.pop("force", False)
+    try:
+        reconcile(vault_root, **kwargs, force=force)
+        return _read_after_reconcile(vault_root, kwargs, reader)
+    except sqlite3.Error as error:
+        if not _is_busy(error):
+            raise
+        return busy_fallback(error)
+
+
 def people_index_data(
     vault_root: str | Path,
     *,
@@ -945,35 +1612,20 @@ def people_index_data(
     company_index_path: str | Path | None = None,
     force: bool = False,
 ) -> dict[str, Any]:
-    reconcile_kwargs = {
-        "people_dir": people_dir,
-        "companies_dir": companies_dir,
-        "people_index_path": people_index_path,
-        "company_index_path": company_index_path,
-    }
-    try:
-        reconcile(
-            vault_root,
-            **reconcile_kwargs,
-            force=force,
-        )
-        return _read_after_reconcile(
-            vault_root,
-            reconcile_kwargs,
-            lambda connection: _views(connection)[0],
-        )
-    except sqlite3.Error as error:
-        if not _is_busy(error):
-            raise
-        export_path = (
-            Path(people_index_path)
-            if people_index_path is not None
-            else Path(vault_root) / _PEOPLE_EXPORT_RELATIVE_PATH
-        )
-        try:
-            return json.loads(export_path.read_text(encoding="utf-8"))
-        except FileNotFoundError:
-            raise error
+    return _query_reconciled(
+        vault_root,
+        {
+            "people_dir": people_dir,
+            "companies_dir": companies_dir,
+            "people_index_path": people_index_path,
+            "company_index_path": company_index_path,
+            "force": force,
+        },
+        lambda connection: _views(connection)[0],
+        lambda error: _last_exported_view(
+            vault_root, people_index_path, _PEOPLE_EXPORT_RELATIVE_PATH, error
+        ),
+    )
 
 
 def company_index_data(
@@ -985,109 +1637,140 @@ def company_index_data(
     company_index_path: str | Path | None = None,
     force: bool = False,
 ) -> dict[str, Any]:
-    reconcile_kwargs = {
-        "people_dir": people_dir,
-        "companies_dir": companies_dir,
-        "people_index_path": people_index_path,
-        "company_index_path": company_index_path,
-    }
-    try:
-        reconcile(
-            vault_root,
-            **reconcile_kwargs,
-            force=force,
-        )
-        return _read_after_reconcile(
-            vault_root,
-            reconcile_kwargs,
-            lambda connection: _views(connection)[1],
+    return _query_reconciled(
+        vault_root,
+        {
+            "people_dir": people_dir,
+            "companies_dir": companies_dir,
+            "people_index_path": people_index_path,
+            "company_index_path": company_index_path,
+            "force": force,
+        },
+        lambda connection: _views(connection)[1],
+        lambda error: _last_exported_view(
+            vault_root, company_index_path, _COMPANY_EXPORT_RELATIVE_PATH, error
+        ),
+    )
+
+
+# Candidate fetcher for one rung of the lookup ladder: (kind, folded query) to
+# compatibility entries in view order. "fuzzy" returns a superset to score.
+_PersonCandidates = Callable[[str, str], list[dict[str, Any]]]
+
+
+def _rows_for_nodes(
+    connection: sqlite3.Connection,
+    entity_type: str,
+    id_query: str,
+    parameters: tuple[Any, ...],
+) -> list[dict[str, Any]]:
+    rows = [
+        json.loads(fields_json)["_compat"]
+        for (fields_json,) in connection.execute(
+            f"SELECT fields_json FROM nodes WHERE type = ? AND id IN ({id_query})",
+            (entity_type, *parameters),
         )
-    except sqlite3.Error as error:
-        if not _is_busy(error):
-            raise
-        export_path = (
-            Path(company_index_path)
-            if company_index_path is not None
-            else Path(vault_root) / _COMPANY_EXPORT_RELATIVE_PATH
+    ]
+    rows.sort(key=_person_order if entity_type == "person" else _company_order)
+    return rows
+
+
+def _indexed_person_candidates(connection: sqlite3.Connection) -> _PersonCandidates:
+    def candidates(kind: str, value: str) -> list[dict[str, Any]]:
+        if kind == "fuzzy":
+            # Without containment a ratio of 0.5 needs the shorter name to be
+            # at least a third of the longer one, so SQL drops the rest.
+            node_ids = [
+                node_id
+                for node_id, name in connection.execute(
+                    """
+                    SELECT node_id, value FROM lookup_keys
+                    WHERE kind = 'name' AND (
+                        instr(value, ?) > 0
+                        OR instr(?, value) > 0
+                        OR length(value) BETWEEN ? AND ?
+                    )
+                    """,
+                    (value, value, -(-len(value) // 3), 3 * len(value)),
+                )
+                if _may_match_fuzzily(value, name)
+            ]
+            return _rows_for_nodes(
+                connection,
+                "person",
+                "SELECT value FROM json_each(?)",
+                (json.dumps(node_ids),),
+            )
+        table = "node_keys" if kind in {"email", "alias"} else "lookup_keys"
+        return _rows_for_nodes(
+            connection,
+            "person",
+            f"SELECT node_id FROM {table} WHERE kind = ? AND value = ?",
+            (kind, value),
         )
-        try:
-            return json.loads(export_path.read_text(encoding="utf-8"))
-        except FileNotFoundError:
-            raise error
 
+    return candidates
 
-def lookup_person(
-    vault_root: str | Path,
-    name: str,
-    company: str | None = None,
-    **reconcile_kwargs: Any,
-) -> dict[str, Any]:
-    """Return the legacy Work-MCP lookup shape from reconciled SQLite rows."""
-    index = people_index_data(vault_root, **reconcile_kwargs)
-    people = index["people"]
-    if company:
-        company_lower = fold(company)
-        people = [
+
+def _exported_person_candidates(people: list[dict[str, Any]]) -> _PersonCandidates:
+    def keys(person: dict[str, Any], kind: str) -> set[str]:
+        if kind == "email":
+            return {fold(email) for email in person.get("emails", [])}
+        if kind == "alias":
+            return {fold(alias) for alias in person.get("aliases", [])}
+        return {fold(person.get(kind) or "")}
+
+    def candidates(kind: str, value: str) -> list[dict[str, Any]]:
+        if kind == "fuzzy":
+            return people
+        return [person for person in people if value in keys(person, kind)]
+
+    return candidates
+
+
+def _match_people(
+    candidates: _PersonCandidates,
+    query: str,
+    company: str | None,
+) -> tuple[list[dict[str, Any]], bool]:
+    query_lower = fold(query)
+    company_lower = fold(company) if company else None
+    ambiguous = False
+
+    def fetch(kind: str) -> list[dict[str, Any]]:
+        people = candidates(kind, query_lower)
+        if company_lower is None:
+            return people
+        return [
             person
             for person in people
             if company_lower in fold(person.get("company") or "")
         ]
 
-    query = name.strip()
-    query_lower = fold(query)
-    ambiguous = False
-
-    def scored(candidates: list[dict[str, Any]], score: float) -> list[dict[str, Any]]:
-        return [{**person, "_score": score} for person in candidates]
+    def scored(people: list[dict[str, Any]], score: float) -> list[dict[str, Any]]:
+        return [{**person, "_score": score} for person in people]
 
     matches: list[dict[str, Any]] = []
     if "@" in query:
-        matches = scored(
-            [
-                person
-                for person in people
-                if query_lower
-                in {fold(email) for email in person.get("emails", [])}
-            ],
-            1.0,
-        )
+        matches = scored(fetch("email"), 1.0)
     if not matches:
-        matches = scored(
-            [
-                person
-                for person in people
-                if query_lower
-                in {fold(alias) for alias in person.get("aliases", [])}
-            ],
-            1.0,
-        )
+        matches = scored(fetch("alias"), 1.0)
     if not matches:
-        matches = scored(
-            [
-                person
-                for person in people
-                if query_lower == fold(person.get("name") or "")
-            ],
-            1.0,
-        )
+        matches = scored(fetch("name"), 1.0)
     if not matches:
-        first_name_matches = [
-            person
-            for person in people
-            if query_lower == fold(person.get("first_name") or "")
-        ]
+        first_name_matches = fetch("first_name")
         if first_name_matches:
             matches = scored(first_name_matches, 0.9)
             ambiguous = len(first_name_matches) > 1
     if not matches:
         fuzzy_matches = []
-        for person in people:
+        for person in fetch("fuzzy"):
             person_name = fold(person.get("name") or "")
             if query_lower in person_name or person_name in query_lower:
                 score = 0.8
             else:
                 score = SequenceMatcher(None, query_lower, person_name).ratio()
-            if score >= 0.5:
+            if score >= _FUZZY_THRESHOLD:
                 fuzzy_matches.append((score, person))
         fuzzy_matches.sort(key=lambda item: item[0], reverse=True)
         if (
@@ -1099,13 +1782,53 @@ def lookup_person(
             {**person, "_score": round(score, 2)}
             for score, person in fuzzy_matches
         ]
+    return matches, ambiguous
+
+
+def lookup_person(
+    vault_root: str | Path,
+    name: str,
+    company: str | None = None,
+    **reconcile_kwargs: Any,
+) -> dict[str, Any]:
+    """Return the legacy Work-MCP lookup shape from reconciled SQLite rows.
+
+    Exact email, alias, name and first-name rungs are indexed key lookups.
+    The fuzzy rung only scores people whose name contains (or is contained
+    in) the query or shares enough characters with it to possibly reach the
+    threshold, which is exactly the set the full scan could match.
+    """
+    query = name.strip()
 
+    def read(connection: sqlite3.Connection) -> tuple[Any, ...]:
+        return (
+            *_match_people(_indexed_person_candidates(connection), query, company),
+            _built_at(connection),
+        )
+
+    def from_export(error: sqlite3.Error) -> tuple[Any, ...]:
+        index = _last_exported_view(
+            vault_root,
+            reconcile_kwargs.get("people_index_path"),
+            _PEOPLE_EXPORT_RELATIVE_PATH,
+            error,
+        )
+        return (
+            *_match_people(
+                _exported_person_candidates(index["people"]), query, company
+            ),
+            index["built_at"],
+        )
+
+    matches, ambiguous, built_at = _query_reconciled(
+        vault_root, reconcile_kwargs, read, from_export
+    )
     result: dict[str, Any] = {
         "query": name,
         "company_filter": company,
         "matches": matches[:10],
         "total_matches": len(matches),
-        "index_age": index["built_at"],
+        "index_age": built_at,
     }
     if ambiguous:
         result["ambiguous"] = True
@@ -1118,14 +1841,35 @@ def find_company_by_domain(
     **reconcile_kwargs: Any,
 ) -> dict[str, Any] | None:
     """Find a company by registrable domain from the reconciled projection."""
-    index = company_index_data(vault_root, **reconcile_kwargs)
     target = registrable_domain(domain)
-    for company in index["companies"]:
-        if target in {
-            registrable_domain(value) for value in company.get("domains", [])
-        }:
-            return company
-    return None
+
+    def read(connection: sqlite3.Connection) -> dict[str, Any] | None:
+        matches = _rows_for_nodes(
+            connection,
+            "company",
+            """
+            SELECT node_id FROM lookup_keys
+            WHERE kind = 'registrable_domain' AND value = ?
+            """,
+            (target,),
+        )
+        return matches[0] if matches else None
+
+    def from_export(error: sqlite3.Error) -> dict[str, Any] | None:
+        index = _last_exported_view(
+            vault_root,
+            reconcile_kwargs.get("company_index_path"),
+            _COMPANY_EXPORT_RELATIVE_PATH,
+            error,
+        )
+        for company in index["companies"]:
+            if target in {
+                registrable_domain(value) for value in company.get("domains", [])
+            }:
+                return company
+        return None
+
+    return _query_reconciled(vault_root, reconcile_kwargs, read, from_export)
 
 
 def neighbors(
@@ -0,0 +1,312 @@
+"""Disposable SQLite index of ``^task-YYYYMMDD-NNN`` anchors across the vault."""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, TypeVar
+
+from core.entity_engine.index import (
+    _is_corruption,
+    pooled_connection,
+    remove_database,
+)
+from core.utils.config_snapshot import is_settled
+
+SCHEMA_VERSION = "1"
+_DATABASE_RELATIVE_PATH = Path("System/.dex/entity-index/task-anchors.sqlite3")
+_ANCHOR_RE = re.compile(r"\^(task-\d{8}-(\d{3,}))")
+_CANONICAL_ID_RE = re.compile(r"task-\d{8}-\d{3,}")
+_T = TypeVar("_T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS source_files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    checked_ns INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS anchors (
+    task_id TEXT NOT NULL,
+    sequence INTEGER NOT NULL,
+    path TEXT NOT NULL REFERENCES source_files(path) ON DELETE CASCADE,
+    line_number INTEGER NOT NULL,
+    line_content TEXT NOT NULL,
+    is_task INTEGER NOT NULL,
+    completed INTEGER NOT NULL,
+    PRIMARY KEY (path, line_number, task_id)
+);
+CREATE INDEX IF NOT EXISTS idx_anchors_task_id ON anchors(task_id);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+@dataclass(frozen=True)
+class _Source:
+    path: Path
+    relative_path: str
+    size: int
+    mtime_ns: int
+
+
+def database_path(vault_root: str | Path) -> Path:
+    return Path(vault_root) / _DATABASE_RELATIVE_PATH
+
+
+def is_canonical_task_id(task_id: str) -> bool:
+    """Return whether an id has the shape this index stores."""
+    return bool(_CANONICAL_ID_RE.fullmatch(task_id))
+
+
+def _scan_sources(vault_root: Path) -> dict[str, _Source]:
+    sources: dict[str, _Source] = {}
+    for path in vault_root.rglob("*.md"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        if not path.is_file():
+            continue
+        relative_path = path.relative_to(vault_root).as_posix()
+        sources[relative_path] = _Source(
+            path=path,
+            relative_path=relative_path,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+        )
+    return sources
+
+
+def _anchor_rows(relative_path: str, content: bytes) -> list[tuple[Any, ...]]:
+    """Project every anchor occurrence with the legacy checkbox semantics."""
+    if b"^task-" not in content:
+        return []
+    try:
+        text = content.decode("utf-8")
+    except UnicodeDecodeError:
+        return []
+    rows: dict[tuple[int, str], tuple[Any, ...]] = {}
+    for index, line in enumerate(text.split("\n")):
+        if "^task-" not in line:
+            continue
+        completed = "- [x]" in line
+        is_task = completed or "- [ ]" in line
+        for match in _ANCHOR_RE.finditer(line):
+            rows.setdefault(
+                (index + 1, match.group(1)),
+                (
+                    match.group(1),
+                    int(match.group(2)),
+                    relative_path,
+                    index + 1,
+                    line,
+                    int(is_task),
+                    int(completed),
+                ),
+            )
+    return list(rows.values())
+
+
+def _initialize_schema(connection: sqlite3.Connection) -> None:
+    connection.executescript(_SCHEMA)
+    connection.execute(
+        """
+        INSERT INTO meta(key, value) VALUES ('schema_version', ?)
+        ON CONFLICT(key) DO UPDATE SET value = excluded.value
+        """,
+        (SCHEMA_VERSION,),
+    )
+
+
+def _reconcile_open_database(
+    connection: sqlite3.Connection,
+    sources: dict[str, _Source],
+) -> dict[str, int]:
+    with connection:
+        _initialize_schema(connection)
+    indexed = {
+        row[0]: (row[1], row[2], row[3])
+        for row in connection.execute(
+            "SELECT path, size, mtime_ns, checked_ns FROM source_files"
+        )
+    }
+    removed = set(indexed) - set(sources)
+    stale: dict[str, list[tuple[Any, ...]]] = {}
+    for relative_path, source in sources.items():
+        previous = indexed.get(relative_path)
+        if previous is not None:
+            old_size, old_mtime_ns, checked_ns = previous
+            if (
+                (source.size, source.mtime_ns) == (old_size, old_mtime_ns)
+                and is_settled(source.mtime_ns, checked_ns)
+            ):
+                continue
+        try:
+            content = source.path.read_bytes()
+        except OSError:
+            continue
+        stale[relative_path] = _anchor_rows(relative_path, content)
+
+    if not removed and not stale:
+        return {"added": 0, "changed": 0, "removed": 0}
+    checked_ns = time.time_ns()
+    with connection:
+        connection.executemany(
+            "DELETE FROM source_files WHERE path = ?",
+            [(path,) for path in sorted(removed | set(stale))],
+        )
+        for relative_path, rows in sorted(stale.items()):
+            source = sources[relative_path]
+            connection.execute(
+                """
+                INSERT INTO source_files(path, size, mtime_ns, checked_ns)
+                VALUES (?, ?, ?, ?)
+                """,
+                (relative_path, source.size, source.mtime_ns, checked_ns),
+            )
+            connection.executemany(
+                """
+                INSERT INTO anchors(
+                    task_id, sequence, path, line_number, line_content,
+                    is_task, completed
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+    added = len(set(stale) - set(indexed))
+    return {
+        "added": added,
+        "changed": len(stale) - added,
+        "removed": len(removed),
+    }
+
+
+class _SchemaDrift(Exception):
+    pass
+
+
+def _with_database(
+    vault_root: Path,
+    operation: Callable[[sqlite3.Connection], _T],
+) -> tuple[dict[str, int], _T]:
+    """Reconcile, then run one operation; rebuild once on corruption or drift."""
+    db_path = database_path(vault_root)
+    sources = _scan_sources(vault_root)
+
+    def run() -> tuple[dict[str, int], _T]:
+        with pooled_connection(db_path) as connection:
+            has_meta = connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meta'"
+            ).fetchone()
+            version = (
+                connection.execute(
+                    "SELECT value FROM meta WHERE key = 'schema_version'"
+                ).fetchone()
+                if has_meta
+                else None
+            )
+            if version is not None and version[0] != SCHEMA_VERSION:
+                raise _SchemaDrift(version[0])
+            result = _reconcile_open_database(connection, sources)
+            return result, operation(connection)
+
+    try:
+        return run()
+    except (sqlite3.Error, _SchemaDrift) as error:
+        if isinstance(error, sqlite3.Error) and not _is_corruption(error):
+            raise
+        remove_database(db_path)
+        return run()
+
+
+def reconcile(vault_root: str | Path) -> dict[str, int]:
+    """Bring the anchor index up to date using a size/mtime path-set diff."""
+    result, _ = _with_database(Path(vault_root), lambda connection: None)
+    return result
+
+
+def find_many(
+    vault_root: str | Path,
+    task_ids: Iterable[str],
+) -> dict[str, list[dict[str, Any]]]:
+    """Return indexed checkbox lines for several ids after one reconcile."""
+    root = Path(vault_root)
+    wanted = sorted(set(task_ids))
+
+    def read(connection: sqlite3.Connection) -> dict[str, list[dict[str, Any]]]:
+        found: dict[str, list[dict[str, Any]]] = {task_id: [] for task_id in wanted}
+        for task_id in wanted:
+            found[task_id].extend(
+                {
+                    "file": str(root / path),
+                    "line_number": line_number,
+                    "line_content": line_content,
+                    "completed": bool(completed),
+                }
+                for path, line_number, line_content, completed in connection.execute(
+                    """
+                    SELECT path, line_number, line_content, completed
+                    FROM anchors
+                    WHERE task_id = ? AND is_task = 1
+                    ORDER BY path, line_number
+                    """,
+                    (task_id,),
+                )
+            )
+        return found
+
+    return _with_database(root, read)[1]
+
+
+def find(vault_root: str | Path, task_id: str) -> list[dict[str, Any]]:
+    """Return indexed checkbox lines carrying ``^task_id``, in path/line order."""
+    return find_many(vault_root, [task_id])[task_id]
+
+
+def allocate_sequence(
+    vault_root: str | Path,
+    counter_roots: Iterable[str],
+) -> int:
+    """Reserve the next global task sequence number, never reusing one.
+
+    The stored counter only moves forward, so an id handed out but never
+    written (or written and later deleted) is not allocated again.
+    """
+    prefixes = [f"{root.strip('/')}/" for root in counter_roots]
+
+    def allocate(connection: sqlite3.Connection) -> int:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            observed = 0
+            for prefix in prefixes:
+                row = connection.execute(
+                    "SELECT MAX(sequence) FROM anchors WHERE substr(path, 1, ?) = ?",
+                    (len(prefix), prefix),
+                ).fetchone()
+                observed = max(observed, row[0] or 0)
+            stored = connection.execute(
+                "SELECT value FROM meta WHERE key = 'task_counter'"
+            ).fetchone()
+            sequence = max(observed, int(stored[0]) if stored else 0) + 1
+            connection.execute(
+                """
+                INSERT INTO meta(key, value) VALUES ('task_counter', ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                """,
+                (str(sequence),),
+            )
+            connection.commit()
+            return sequence
+        except BaseException:
+            connection.rollback()
+            raise
+
+    return _with_database(Path(vault_root), allocate)[1]
@@ -75,7 +75,7 @@ def main(argv: list[str] | None = None) -> int:
             print(_canonical_json(read_events(vault_root, since=args.since)))
             return 0
         if args.command == "verify":
-            state = project_state(vault_root)
+            state = project_state(vault_root, audit=True)
             count = int(state["last_seq"])
             noun = "event" if count == 1 else "events"
             verb = "forms" if count == 1 else "form"
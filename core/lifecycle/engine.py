@@ -1119,7 +1119,7 @@ def execute_adoption(
     }
 
     try:
-        transaction = Transaction.begin(root, entries)
+        transaction = Transaction.begin(root, entries, group_commit=True)
         receipt = AdoptionReceipt(
             RECEIPT_VERSION,
             requested,
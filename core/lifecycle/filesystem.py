@@ -10,8 +10,11 @@ from __future__ import annotations
 import hashlib
 import os
 import stat
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
+from typing import Iterator
 
 from core import portable_contract
 
@@ -39,6 +42,65 @@ class WalkReport:
     truncated: bool
 
 
+@dataclass(frozen=True)
+class _WalkSnapshot:
+    report: WalkReport
+    # (absolute directory, (st_dev, st_ino, st_mtime_ns, st_ctime_ns)) for the
+    # root and every directory the walk listed.
+    directories: tuple[tuple[str, tuple[int, int, int, int]], ...]
+
+
+_shared_walks: dict[tuple[str, int], _WalkSnapshot] | None = None
+_shared_walks_depth = 0
+_shared_walks_lock = threading.Lock()
+
+
+def _directory_stamp(metadata: os.stat_result) -> tuple[int, int, int, int]:
+    return (
+        metadata.st_dev,
+        metadata.st_ino,
+        metadata.st_mtime_ns,
+        metadata.st_ctime_ns,
+    )
+
+
+@contextmanager
+def shared_walk_snapshots() -> Iterator[None]:
+    """Let every ``walk_read_only`` in this scope reuse one walk per vault.
+
+    Doctor, the adoption report, inventory and customization discovery each
+    walk the whole vault. Inside this scope a repeated walk of the same root
+    with the same bound returns the earlier report, provided every directory
+    it listed still has the same inode and timestamps. Creating, removing or
+    renaming an entry changes its parent directory, so that forces a fresh
+    walk. Rewriting a file in place does not, so entry sizes are as of the
+    first walk in the scope. Scopes nest; the snapshots are dropped when the
+    outermost one exits.
+    """
+    global _shared_walks, _shared_walks_depth
+    with _shared_walks_lock:
+        if _shared_walks_depth == 0:
+            _shared_walks = {}
+        _shared_walks_depth += 1
+    try:
+        yield
+    finally:
+        with _shared_walks_lock:
+            _shared_walks_depth -= 1
+            if _shared_walks_depth == 0:
+                _shared_walks = None
+
+
+def _snapshot_is_current(snapshot: _WalkSnapshot) -> bool:
+    for directory, stamp in snapshot.directories:
+        try:
+            if _directory_stamp(os.lstat(directory)) != stamp:
+                return False
+        except OSError:
+            return False
+    return True
+
+
 def detect_case_collisions(paths: tuple[str, ...]) -> tuple[tuple[str, ...], ...]:
     """Group distinct paths that collide on a case-insensitive filesystem."""
     folded: dict[str, list[str]] = {}
@@ -77,8 +139,25 @@ def _entry_kind(mode: int) -> str:
 
 
 def walk_read_only(root: Path, *, max_entries: int = DEFAULT_MAX_ENTRIES) -> WalkReport:
-    """Walk ``root`` without following symlinks or reading file contents."""
-    vault = Path(root)
+    """Walk ``root`` without following symlinks or reading file contents.
+
+    Inside :func:`shared_walk_snapshots` an unchanged vault is walked once.
+    """
+    if _shared_walks is None:
+        return _walk(Path(root), max_entries).report
+    key = (os.path.abspath(root), max_entries)
+    with _shared_walks_lock:
+        snapshot = _shared_walks.get(key) if _shared_walks is not None else None
+    if snapshot is not None and _snapshot_is_current(snapshot):
+        return snapshot.report
+    snapshot = _walk(Path(root), max_entries)
+    with _shared_walks_lock:
+        if _shared_walks is not None:
+            _shared_walks[key] = snapshot
+    return snapshot.report
+
+
+def _walk(vault: Path, max_entries: int) -> _WalkSnapshot:
     errors: list[str] = []
     entries: list[WalkEntry] = []
     truncated = False
@@ -92,16 +171,19 @@ def walk_read_only(root: Path, *, max_entries: int = DEFAULT_MAX_ENTRIES) -> Wal
     if max_entries <= 0:
         raise ValueError("max_entries must be positive")
 
-    pending: list[tuple[Path, str]] = [(vault, "")]
+    directories = [(os.path.abspath(vault), _directory_stamp(root_stat))]
+    pending: list[tuple[Path, str, os.stat_result | None]] = [(vault, "", None)]
     while pending:
-        directory, prefix = pending.pop()
+        directory, prefix, directory_stat = pending.pop()
+        if directory_stat is not None:
+            directories.append((os.path.abspath(directory), _directory_stamp(directory_stat)))
         try:
             with os.scandir(directory) as iterator:
                 children = sorted(iterator, key=lambda item: (item.name.casefold(), item.name))
         except OSError as error:
             errors.append(f"{prefix or '.'}: directory unreadable: {error.__class__.__name__}")
             continue
-        child_directories: list[tuple[Path, str]] = []
+        child_directories: list[tuple[Path, str, os.stat_result | None]] = []
         for child in children:
             relative = f"{prefix}/{child.name}" if prefix else child.name
             try:
@@ -119,16 +201,17 @@ def walk_read_only(root: Path, *, max_entries: int = DEFAULT_MAX_ENTRIES) -> Wal
                 pending.clear()
                 break
             if kind == "directory" and not denied:
-                child_directories.append((Path(child.path), normalized))
+                child_directories.append((Path(child.path), normalized, metadata))
         pending.extend(reversed(child_directories))
 
     collisions = detect_case_collisions(tuple(entry.path for entry in entries))
-    return WalkReport(
+    report = WalkReport(
         tuple(sorted(entries, key=lambda entry: entry.path)),
         collisions,
         tuple(sorted(set(errors))),
         truncated,
     )
+    return _WalkSnapshot(report, tuple(directories))
 
 
 def _open_beneath(root: Path, relative: str) -> int:
@@ -238,5 +321,6 @@ __all__ = [
     "detect_case_collisions",
     "normalize_relative_path",
     "sha256_file",
+    "shared_walk_snapshots",
     "walk_read_only",
 ]
@@ -10,7 +10,6 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from core import portable_contract
-from core.lifecycle.catalog import crlf_normalized_sha256
 from core.lifecycle.customizations import (
     CustomizationReport,
     ReleaseBaseline,
@@ -30,6 +29,7 @@ from core.lifecycle.machine_state import MachineStateReport, probe_machine_state
 from core.lifecycle.model import ReleaseCatalog
 from core.lifecycle.secrets import assert_no_denied_metadata, redact_document
 from core.path_safety import unsafe_existing_parent
+from core.utils.digest_cache import DigestCache
 
 FOLDER_MAP_PATH = "System/folder-paths.yaml"
 MAX_FOLDER_MAP_BYTES = 256 * 1024
@@ -290,51 +290,57 @@ def build_inventory(
     errors = list(folder_map.errors) + list(baseline.errors) + list(walked.errors)
     canonical_to_actual: dict[str, list[str]] = {}
 
-    for observed in walked.entries:
-        canonical = folder_map.canonicalize(observed.path)
-        canonical_to_actual.setdefault(canonical.casefold(), []).append(observed.path)
-        ownership, rule, denied, write_allowed, write_action = _contract_facts(canonical, exists=True)
-        digest: str | None = None
-        normalized_digest: str | None = None
-        if (
-            observed.kind == "file"
-            and not denied
-            and baseline.expected_sha256(canonical) is not None
-        ):
-            try:
-                raw = bounded_read(root, observed.path, max_bytes=max_hash_bytes)
-            except FilesystemInspectionError as error:
-                errors.append(str(error))
-            else:
-                # The entry records the honest on-disk digest; the normalized
-                # digest only feeds the release-state comparison (issue #256).
-                digest = hashlib.sha256(raw).hexdigest()
-                normalized_digest = crlf_normalized_sha256(raw)
-        release_state = classify_release_state(
-            canonical_path=canonical,
-            kind=observed.kind,
-            ownership_class=ownership,
-            denied=denied,
-            actual_sha256=digest,
-            baseline=baseline,
-            crlf_normalized_sha256=normalized_digest,
-        )
-        entries.append(
-            InventoryEntry(
-                observed.path,
-                canonical,
-                observed.kind,
-                ownership,
-                rule,
-                denied,
-                release_state,
-                write_allowed,
-                write_action,
-                None if denied else observed.size,
-                None if denied else digest,
-                denied,
+    with DigestCache.for_vault(root) as digests:
+        for observed in walked.entries:
+            canonical = folder_map.canonicalize(observed.path)
+            canonical_to_actual.setdefault(canonical.casefold(), []).append(observed.path)
+            ownership, rule, denied, write_allowed, write_action = _contract_facts(canonical, exists=True)
+            digest: str | None = None
+            normalized_digest: str | None = None
+            if (
+                observed.kind == "file"
+                and not denied
+                and baseline.expected_sha256(canonical) is not None
+            ):
+                try:
+                    file_digests = digests.digests_for(
+                        root / observed.path,
+                        observed.path,
+                        lambda: bounded_read(root, observed.path, max_bytes=max_hash_bytes),
+                        max_bytes=max_hash_bytes,
+                    )
+                except FilesystemInspectionError as error:
+                    errors.append(str(error))
+                else:
+                    # The entry records the honest on-disk digest; the normalized
+                    # digest only feeds the release-state comparison (issue #256).
+                    digest = file_digests.sha256
+                    normalized_digest = file_digests.crlf_normalized_sha256
+            release_state = classify_release_state(
+                canonical_path=canonical,
+                kind=observed.kind,
+                ownership_class=ownership,
+                denied=denied,
+                actual_sha256=digest,
+                baseline=baseline,
+                crlf_normalized_sha256=normalized_digest,
+            )
+            entries.append(
+                InventoryEntry(
+                    observed.path,
+                    canonical,
+                    observed.kind,
+                    ownership,
+                    rule,
+                    denied,
+                    release_state,
+                    write_allowed,
+                    write_action,
+                    None if denied else observed.size,
+                    None if denied else digest,
+                    denied,
+                )
             )
-        )
 
     present_canonical = {entry.canonical_path for entry in entries}
     for expected_path in baseline.expected_hashes:
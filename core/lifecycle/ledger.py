@@ -7,6 +7,17 @@ already published event.  An append-only ``commitments/<seq>.sha256`` witness
 marks publication complete, while the state cache is also a high-water mark
 against joint tail loss.  An interrupted publication is repaired only while
 holding the exclusive write lock.
+
+Every ``CHECKPOINT_INTERVAL`` events a ``checkpoints/<seq>.json`` records the
+projected state at that sequence, the transaction ids recorded so far, and a
+self-hash.  It is bound to history by the commitment at its sequence: a
+checkpoint is used only when its ``last_event_sha256`` equals that immutable
+witness.  Ordinary reads verify and replay from the newest such checkpoint,
+so projection costs O(new events).  An audit (``verify``, ``rebuild-state``
+and every ``AUDIT_INTERVAL``-th checkpoint) re-verifies the full chain from
+genesis and requires every checkpoint it passes to match the replay exactly.
+Checkpoints are caches: an invalid one is skipped by reads and quarantined by
+repairs, never trusted.
 """
 
 from __future__ import annotations
@@ -20,7 +31,7 @@ import stat
 from collections.abc import Mapping
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Iterable, Iterator
 from uuid import UUID, uuid4
 
 from core.lifecycle.engine import (
@@ -34,6 +45,8 @@ from core.transaction.fsync import fsync_directory
 LEDGER_VERSION = 1
 GENESIS_SHA256 = "0" * 64
 MAX_SEQUENCE = 99_999_999
+CHECKPOINT_INTERVAL = 256
+AUDIT_INTERVAL = 16
 LEDGER_RELATIVE = Path("System") / ".dex" / "ledger"
 EVENT_TYPES = frozenset(
     {
@@ -50,6 +63,7 @@ EVENT_FILENAME = re.compile(
     + r")\.json$"
 )
 COMMITMENT_FILENAME = re.compile(r"^(?P<seq>[0-9]{8})\.sha256$")
+CHECKPOINT_FILENAME = re.compile(r"^(?P<seq>[0-9]{8})\.json$")
 EVENT_FIELDS = {
     "ledger_version",
     "seq",
@@ -66,6 +80,11 @@ STATE_FIELDS = {
     "last_seq",
     "last_event_sha256",
 }
+CHECKPOINT_FIELDS = {"ledger_version", "state", "transactions", "checkpoint_sha256"}
+TRANSACTION_ID_FIELDS = {
+    "adoption-recorded": "transaction_id",
+    "rewind-recorded": "rewind_transaction_id",
+}
 
 
 class LedgerError(RuntimeError):
@@ -76,6 +95,14 @@ class _UnreadableEvent(LedgerError):
     """A byte-level parse failure that may be a torn final publication."""
 
 
+class _Verified(list):
+    """Verified events after ``checkpoint`` (``None`` means from genesis)."""
+
+    def __init__(self, events=(), checkpoint: dict[str, object] | None = None):
+        super().__init__(events)
+        self.checkpoint = checkpoint
+
+
 def _canonical_bytes(value: object, context: str) -> bytes:
     try:
         return (
@@ -272,7 +299,7 @@ def _validate_event(path: Path, raw: bytes, expected_seq: int, expected_prev: st
     return dict(document)
 
 
-def _event_candidates(events_dir: Path) -> list[tuple[int, Path]]:
+def _event_candidates(events_dir: Path, verify_from: int = 1) -> list[tuple[int, Path]]:
     if events_dir.is_symlink():
         raise LedgerError(f"ledger events path is unsafe: {events_dir}")
     if not events_dir.exists():
@@ -289,7 +316,7 @@ def _event_candidates(events_dir: Path) -> list[tuple[int, Path]]:
             raise LedgerError(
                 f"ledger fork at sequence {sequence}: {seen[sequence].name}, {path.name}"
             )
-        if path.is_symlink() or not path.is_file():
+        if sequence >= verify_from and (path.is_symlink() or not path.is_file()):
             raise LedgerError(f"event {sequence} is missing or unsafe: {path}")
         seen[sequence] = path
         candidates.append((sequence, path))
@@ -306,16 +333,16 @@ def _repair_command(vault_root: Path) -> str:
     return f"python3 -m core.lifecycle.cli --vault-root {Path(vault_root)} rebuild-state"
 
 
-def _quarantine_torn_event(vault_root: Path, path: Path) -> Path:
+def _quarantine(vault_root: Path, path: Path, label: str = "torn") -> Path:
     ledger_root, _events_dir, _state_path = _ensure_directories(vault_root)
     quarantine = ledger_root / "quarantine"
     _check_existing_directory(quarantine, "quarantine")
     quarantine.mkdir(exist_ok=True, mode=0o700)
     os.chmod(quarantine, 0o700)
-    target = quarantine / f"{path.name}.torn"
+    target = quarantine / f"{path.name}.{label}"
     suffix = 1
     while target.exists():
-        target = quarantine / f"{path.name}.torn-{suffix}"
+        target = quarantine / f"{path.name}.{label}-{suffix}"
         suffix += 1
     os.rename(path, target)
     fsync_directory(path.parent)
@@ -364,7 +391,7 @@ def _complete_commitment(vault_root: Path, sequence: int, digest: str) -> None:
         raise
 
 
-def _commitments(vault_root: Path) -> list[tuple[int, str]]:
+def _commitment_paths(vault_root: Path) -> list[tuple[int, Path]]:
     ledger_root, _events_dir, _state_path = _ledger_paths(vault_root)
     directory = ledger_root / "commitments"
     if directory.is_symlink():
@@ -372,32 +399,168 @@ def _commitments(vault_root: Path) -> list[tuple[int, str]]:
     if not directory.exists():
         return []
     _check_existing_directory(directory, "commitments")
-    commitments: list[tuple[int, str]] = []
+    paths: list[tuple[int, Path]] = []
     for path in directory.iterdir():
         match = COMMITMENT_FILENAME.fullmatch(path.name)
         if match is None:
             raise LedgerError(f"commitments directory contains an unexpected entry: {path.name}")
-        sequence = int(match.group("seq"))
-        if path.is_symlink() or not path.is_file():
-            raise LedgerError(f"commitment {sequence} is missing or unsafe: {path}")
-        try:
-            raw = path.read_bytes()
-        except OSError as error:
-            raise LedgerError(f"commitment {sequence} could not be read: {error}") from error
-        try:
-            digest = raw.decode("ascii").removesuffix("\n")
-        except UnicodeDecodeError as error:
-            raise LedgerError(f"commitment {sequence} is unreadable") from error
-        if raw != f"{digest}\n".encode("ascii") or HEX_SHA256.fullmatch(digest) is None:
-            raise LedgerError(f"commitment {sequence} is not a canonical sha256 record")
-        commitments.append((sequence, digest))
-    commitments.sort(key=lambda entry: entry[0])
-    for expected, (sequence, _digest) in enumerate(commitments, start=1):
+        paths.append((int(match.group("seq")), path))
+    paths.sort(key=lambda entry: entry[0])
+    for expected, (sequence, _path) in enumerate(paths, start=1):
         if sequence != expected:
             raise LedgerError(
                 f"ledger commitment gap: expected {expected}, found {sequence}; history is missing"
             )
-    return commitments
+    return paths
+
+
+def _read_commitment(sequence: int, path: Path) -> str:
+    if path.is_symlink() or not path.is_file():
+        raise LedgerError(f"commitment {sequence} is missing or unsafe: {path}")
+    try:
+        raw = path.read_bytes()
+    except OSError as error:
+        raise LedgerError(f"commitment {sequence} could not be read: {error}") from error
+    try:
+        digest = raw.decode("ascii").removesuffix("\n")
+    except UnicodeDecodeError as error:
+        raise LedgerError(f"commitment {sequence} is unreadable") from error
+    if raw != f"{digest}\n".encode("ascii") or HEX_SHA256.fullmatch(digest) is None:
+        raise LedgerError(f"commitment {sequence} is not a canonical sha256 record")
+    return digest
+
+
+def _checkpoint_document(
+    state: dict[str, object], transactions: Mapping[str, Iterable[str]]
+) -> dict[str, object]:
+    without_sha: dict[str, object] = {
+        "ledger_version": LEDGER_VERSION,
+        "state": _validate_state_document(state),
+        "transactions": {
+            event_type: sorted(transactions[event_type]) for event_type in TRANSACTION_ID_FIELDS
+        },
+    }
+    digest = hashlib.sha256(_canonical_bytes(without_sha, "ledger checkpoint")).hexdigest()
+    return {**without_sha, "checkpoint_sha256": digest}
+
+
+def _validate_checkpoint(raw: bytes, sequence: int, committed_hash: str) -> dict[str, object]:
+    context = f"checkpoint {sequence}"
+    document = _closed_mapping(
+        _strict_json(raw, context),
+        fields=CHECKPOINT_FIELDS,
+        context=context,
+    )
+    state = _validate_state_document(document["state"])
+    if state["last_seq"] != sequence or state["last_event_sha256"] != committed_hash:
+        raise LedgerError(f"{context} is not bound to the commitment at its sequence")
+    transactions = _closed_mapping(
+        document["transactions"],
+        fields=set(TRANSACTION_ID_FIELDS),
+        context=f"{context} transactions",
+    )
+    for event_type, ids in transactions.items():
+        if not isinstance(ids, list) or not all(isinstance(value, str) for value in ids):
+            raise LedgerError(f"{context} {event_type} transactions must be an array of ids")
+    expected = _checkpoint_document(state, transactions)
+    if raw != _canonical_bytes(expected, context):
+        raise LedgerError(f"{context} fails its integrity hash or is not canonical")
+    return expected
+
+
+def _checkpoint_paths(vault_root: Path) -> dict[int, Path]:
+    ledger_root, _events_dir, _state_path = _ledger_paths(vault_root)
+    directory = ledger_root / "checkpoints"
+    if directory.is_symlink():
+        raise LedgerError(f"ledger checkpoints path is unsafe: {directory}")
+    if not directory.is_dir():
+        return {}
+    paths: dict[int, Path] = {}
+    for path in directory.iterdir():
+        match = CHECKPOINT_FILENAME.fullmatch(path.name)
+        if match is not None:
+            paths[int(match.group("seq"))] = path
+    return paths
+
+
+def _newest_checkpoint(
+    vault_root: Path, commitments: list[tuple[int, Path]], before: int
+) -> dict[str, object] | None:
+    """The newest checkpoint below ``before`` that is bound to its commitment."""
+    for sequence, path in sorted(_checkpoint_paths(vault_root).items(), reverse=True):
+        if sequence >= before or sequence > len(commitments):
+            continue
+        committed_hash = _read_commitment(*commitments[sequence - 1])
+        try:
+            if path.is_symlink() or not path.is_file():
+                continue
+            return _validate_checkpoint(path.read_bytes(), sequence, committed_hash)
+        except (LedgerError, OSError):
+            continue
+    return None
+
+
+def _write_checkpoint(
+    vault_root: Path,
+    document: dict[str, object],
+    repair_actions: list[str] | None = None,
+) -> None:
+    """Publish ``document`` once; a disagreeing file at its sequence is quarantined."""
+    ledger_root, _events_dir, _state_path = _ensure_directories(vault_root)
+    directory = ledger_root / "checkpoints"
+    _check_existing_directory(directory, "checkpoints")
+    directory.mkdir(exist_ok=True, mode=0o700)
+    os.chmod(directory, 0o700)
+    state = document["state"]
+    assert isinstance(state, dict)
+    sequence = int(state["last_seq"])
+    target = directory / f"{sequence:08d}.json"
+    data = _canonical_bytes(document, f"checkpoint {sequence}")
+    if target.is_symlink() or target.exists():
+        if not target.is_symlink() and target.is_file() and target.read_bytes() == data:
+            return
+        _quarantine(vault_root, target, "rejected")
+        if repair_actions is not None:
+            repair_actions.append(f"quarantined invalid checkpoint {sequence}")
+    temporary = ledger_root / f".checkpoint.tmp-{os.getpid()}-{secrets.token_hex(8)}"
+    descriptor: int | None = None
+    try:
+        descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(descriptor, view) :]
+        os.fsync(descriptor)
+        os.close(descriptor)
+        descriptor = None
+        os.link(temporary, target)
+        fsync_directory(directory)
+        temporary.unlink()
+        fsync_directory(ledger_root)
+    except BaseException:
+        if descriptor is not None:
+            os.close(descriptor)
+        try:
+            temporary.unlink()
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _base_sequence(events: list[dict[str, object]]) -> int:
+    checkpoint = getattr(events, "checkpoint", None)
+    if checkpoint is None:
+        return 0
+    return int(checkpoint["state"]["last_seq"])
+
+
+def _tip(events: list[dict[str, object]]) -> tuple[int, str]:
+    """Sequence and hash of the newest verified event, including a checkpoint base."""
+    if events:
+        return int(events[-1]["seq"]), str(events[-1]["event_sha256"])
+    checkpoint = getattr(events, "checkpoint", None)
+    if checkpoint is None:
+        return 0, GENESIS_SHA256
+    return int(checkpoint["state"]["last_seq"]), str(checkpoint["state"]["last_event_sha256"])
 
 
 def _existing_state_floor(vault_root: Path) -> dict[str, object] | None:
@@ -423,14 +586,25 @@ def _enforce_state_floor(vault_root: Path, events: list[dict[str, object]]) -> N
     if floor is None:
         return
     floor_seq = int(floor["last_seq"])
-    if len(events) < floor_seq:
+    tip_seq, _tip_hash = _tip(events)
+    if tip_seq < floor_seq:
         raise LedgerError(
-            f"possible ledger tail loss: verified history ends at sequence {len(events)}, but "
+            f"possible ledger tail loss: verified history ends at sequence {tip_seq}, but "
             f"valid state.json reached sequence {floor_seq}; backup/sync may have dropped the "
             "newest event and commitment files. Restore the missing files from backup/sync "
             f"before retrying {_repair_command(vault_root)!r}"
         )
-    actual_hash = GENESIS_SHA256 if floor_seq == 0 else str(events[floor_seq - 1]["event_sha256"])
+    base_seq = _base_sequence(events)
+    if floor_seq == 0:
+        actual_hash = GENESIS_SHA256
+    elif floor_seq > base_seq:
+        actual_hash = str(events[floor_seq - base_seq - 1]["event_sha256"])
+    elif floor_seq == base_seq:
+        actual_hash = str(events.checkpoint["state"]["last_event_sha256"])
+    else:
+        # The checkpoint vouches for history before it; its commitments are
+        # the immutable witnesses of that history.
+        actual_hash = _read_commitment(*_commitment_paths(vault_root)[floor_seq - 1])
     if actual_hash != floor["last_event_sha256"]:
         raise LedgerError(
             f"possible ledger tail loss or history replacement at state.json sequence {floor_seq}: "
@@ -445,10 +619,25 @@ def _load_events(
     repair_terminal_publication: bool,
     quarantine_unreadable: bool = False,
     repair_actions: list[str] | None = None,
-) -> list[dict[str, object]]:
+    audit: bool = False,
+    since: int | None = None,
+) -> _Verified:
+    """Verify history and return the events after the newest usable checkpoint.
+
+    ``since`` asks for every event at or after that sequence, so only a
+    checkpoint before it is used.  ``audit`` verifies from genesis and checks
+    every checkpoint against the replay; a disagreeing checkpoint fails
+    closed, or is quarantined when ``quarantine_unreadable`` allows repairs.
+    """
     _ledger_root, events_dir, _state_path = _ledger_paths(vault_root)
-    candidates = _event_candidates(events_dir)
-    commitments = _commitments(vault_root)
+    commitments = _commitment_paths(vault_root)
+    checkpoint = None
+    if not audit:
+        limit = since if since is not None else len(commitments) + 1
+        checkpoint = _newest_checkpoint(vault_root, commitments, limit)
+    events = _Verified(checkpoint=checkpoint)
+    base_seq, previous = _tip(events)
+    candidates = _event_candidates(events_dir, verify_from=base_seq + 1)
     if len(candidates) < len(commitments):
         raise LedgerError(
             f"ledger is missing event file for committed sequence {len(candidates) + 1}"
@@ -462,15 +651,14 @@ def _load_events(
                 f"{uncommitted[0]}"
             )
         candidates = candidates[: len(commitments)]
-    events: list[dict[str, object]] = []
-    previous = GENESIS_SHA256
-    for (sequence, path), (committed_sequence, committed_hash) in zip(
-        candidates, commitments, strict=True
+    for (sequence, path), (committed_sequence, commitment_path) in zip(
+        candidates[base_seq:], commitments[base_seq:], strict=True
     ):
         if sequence != committed_sequence:
             raise LedgerError(
                 f"event and commitment sequences disagree at {sequence} and {committed_sequence}"
             )
+        committed_hash = _read_commitment(committed_sequence, commitment_path)
         try:
             event = _validate_event(path, path.read_bytes(), sequence, previous)
         except OSError as error:
@@ -479,6 +667,13 @@ def _load_events(
             raise LedgerError(f"event {sequence} disagrees with its immutable commitment")
         events.append(event)
         previous = str(event["event_sha256"])
+    if audit:
+        _audit_checkpoints(
+            vault_root,
+            events,
+            repair=quarantine_unreadable,
+            repair_actions=repair_actions,
+        )
     if uncommitted is not None:
         sequence, path = uncommitted
         try:
@@ -491,7 +686,7 @@ def _load_events(
                     f"or torn; run {_repair_command(vault_root)!r} to quarantine it and rebuild state"
                 ) from error
             _enforce_state_floor(vault_root, events)
-            _quarantine_torn_event(vault_root, path)
+            _quarantine(vault_root, path)
             if repair_actions is not None:
                 repair_actions.append(f"quarantined unreadable torn event {sequence}")
         except OSError as error:
@@ -502,7 +697,7 @@ def _load_events(
                     f"event {sequence} publication is incomplete: the valid event has no "
                     f"commitment; run {_repair_command(vault_root)!r} to complete publication"
                 )
-            _enforce_state_floor(vault_root, [*events, event])
+            _enforce_state_floor(vault_root, _Verified([*events, event], checkpoint))
             _complete_commitment(vault_root, sequence, str(event["event_sha256"]))
             events.append(event)
             if repair_actions is not None:
@@ -513,6 +708,40 @@ def _load_events(
     return events
 
 
+def _audit_checkpoints(
+    vault_root: Path,
+    events: _Verified,
+    *,
+    repair: bool,
+    repair_actions: list[str] | None,
+) -> None:
+    """Require every checkpoint within verified history to equal the replay."""
+    paths = _checkpoint_paths(vault_root)
+    if not paths:
+        return
+    projection = _Projection()
+    for event in events:
+        projection.apply(event)
+        path = paths.get(int(event["seq"]))
+        if path is None:
+            continue
+        expected = _canonical_bytes(projection.checkpoint(), f"checkpoint {event['seq']}")
+        try:
+            matches = not path.is_symlink() and path.is_file() and path.read_bytes() == expected
+        except OSError:
+            matches = False
+        if matches:
+            continue
+        if not repair:
+            raise LedgerError(
+                f"checkpoint {event['seq']} disagrees with the verified event chain; run "
+                f"{_repair_command(vault_root)!r} to quarantine it"
+            )
+        _quarantine(vault_root, path, "rejected")
+        if repair_actions is not None:
+            repair_actions.append(f"quarantined invalid checkpoint {event['seq']}")
+
+
 def _empty_state() -> dict[str, object]:
     return {
         "ledger_version": LEDGER_VERSION,
@@ -524,23 +753,36 @@ def _empty_state() -> dict[str, object]:
     }
 
 
-def _project(events: list[dict[str, object]]) -> dict[str, object]:
-    state = _empty_state()
-    adopted: dict[str, dict[str, str]] = {}
-    held_back: set[str] = set()
-    for event in events:
+class _Projection:
+    """Incremental replay of verified events, starting from a checkpoint or genesis."""
+
+    def __init__(self, checkpoint: Mapping[str, Any] | None = None):
+        base = checkpoint["state"] if checkpoint is not None else _empty_state()
+        self.install_id = base["install_id"]
+        self.adopted: dict[str, dict[str, str]] = {
+            item_id: dict(entry) for item_id, entry in base["adopted"].items()
+        }
+        self.held_back: set[str] = set(base["held_back"])
+        self.last_seq = base["last_seq"]
+        self.last_event_sha256 = base["last_event_sha256"]
+        self.transactions: dict[str, set[str]] = {
+            event_type: set(checkpoint["transactions"][event_type]) if checkpoint else set()
+            for event_type in TRANSACTION_ID_FIELDS
+        }
+
+    def apply(self, event: Mapping[str, object]) -> None:
         event_type = str(event["event_type"])
         payload = event["payload"]
         assert isinstance(payload, dict)
         if event_type == "install-registered":
-            if state["install_id"] is not None:
+            if self.install_id is not None:
                 raise LedgerError(f"event {event['seq']} attempts to re-register the install")
-            state["install_id"] = payload["install_id"]
+            self.install_id = payload["install_id"]
         elif event_type == "adoption-recorded":
             receipt = _validated_adoption(payload["receipt"])
             versions = _validated_versions(payload["item_versions"], receipt)
             for item_id in receipt.items_adopted:
-                adopted[item_id] = {
+                self.adopted[item_id] = {
                     "version": versions[item_id],
                     "tx_id": receipt.transaction_id,
                     "receipt_path": (
@@ -551,28 +793,51 @@ def _project(events: list[dict[str, object]]) -> dict[str, object]:
             receipt = _validated_rewind(payload["receipt"])
             item_ids = {entry.item_id for entry in receipt.files_restored}
             for item_id in sorted(item_ids):
-                current = adopted.get(item_id)
+                current = self.adopted.get(item_id)
                 if current is None:
                     continue
                 if current["tx_id"] != receipt.adoption_transaction_id:
                     raise LedgerError(
                         f"event {event['seq']} rewinds item {item_id} without its matching current adoption"
                     )
-                del adopted[item_id]
+                del self.adopted[item_id]
         elif event_type == "holdback-recorded":
-            held_back.add(str(payload["item_id"]))
+            self.held_back.add(str(payload["item_id"]))
         elif event_type == "holdback-cleared":
             item_id = str(payload["item_id"])
-            if item_id not in held_back:
+            if item_id not in self.held_back:
                 raise LedgerError(
                     f"event {event['seq']} clears item {item_id}, but it is not held back"
                 )
-            held_back.remove(item_id)
-        state["last_seq"] = event["seq"]
-        state["last_event_sha256"] = event["event_sha256"]
-    state["adopted"] = {key: adopted[key] for key in sorted(adopted)}
-    state["held_back"] = sorted(held_back)
-    return state
+            self.held_back.remove(item_id)
+        if event_type in TRANSACTION_ID_FIELDS:
+            receipt_document = payload["receipt"]
+            assert isinstance(receipt_document, dict)
+            self.transactions[event_type].add(
+                str(receipt_document[TRANSACTION_ID_FIELDS[event_type]])
+            )
+        self.last_seq = event["seq"]
+        self.last_event_sha256 = event["event_sha256"]
+
+    def state(self) -> dict[str, object]:
+        return {
+            "ledger_version": LEDGER_VERSION,
+            "install_id": self.install_id,
+            "adopted": {key: dict(self.adopted[key]) for key in sorted(self.adopted)},
+            "held_back": sorted(self.held_back),
+            "last_seq": self.last_seq,
+            "last_event_sha256": self.last_event_sha256,
+        }
+
+    def checkpoint(self) -> dict[str, object]:
+        return _checkpoint_document(self.state(), self.transactions)
+
+
+def _project(events: list[dict[str, object]]) -> dict[str, object]:
+    projection = _Projection(getattr(events, "checkpoint", None))
+    for event in events:
+        projection.apply(event)
+    return projection.state()
 
 
 def _validate_state_document(raw: object) -> dict[str, object]:
@@ -630,14 +895,18 @@ def canonical_state_bytes(state: object) -> bytes:
     return _canonical_bytes(_validate_state_document(state), "ledger state")
 
 
-def _project_state_unlocked(vault_root: Path) -> dict[str, object]:
-    return _project(_load_events(vault_root, repair_terminal_publication=False))
+def _project_state_unlocked(vault_root: Path, *, audit: bool = False) -> dict[str, object]:
+    return _project(_load_events(vault_root, repair_terminal_publication=False, audit=audit))
+
 
+def project_state(vault_root: Path, *, audit: bool = False) -> dict[str, object]:
+    """Verify and replay a shared-lock-consistent snapshot without writes.
 
-def project_state(vault_root: Path) -> dict[str, object]:
-    """Verify and replay a shared-lock-consistent snapshot without writes."""
+    Replay starts at the newest valid checkpoint; ``audit`` verifies the
+    whole chain from genesis instead.
+    """
     with _read_lock(vault_root):
-        return _project_state_unlocked(vault_root)
+        return _project_state_unlocked(vault_root, audit=audit)
 
 
 def _write_state(vault_root: Path, state: dict[str, object]) -> None:
@@ -667,16 +936,31 @@ def _write_state(vault_root: Path, state: dict[str, object]) -> None:
 
 
 def _rebuild_state_unlocked(
-    vault_root: Path, repair_actions: list[str] | None = None
+    vault_root: Path, repair_actions: list[str] | None = None, *, audit: bool = False
 ) -> dict[str, object]:
-    projected = _project(
-        _load_events(
+    def load(audit: bool) -> _Verified:
+        return _load_events(
             vault_root,
             repair_terminal_publication=True,
             quarantine_unreadable=True,
             repair_actions=repair_actions,
+            audit=audit,
         )
+
+    events = load(audit)
+    tip_seq, _tip_hash = _tip(events)
+    boundary = tip_seq - tip_seq % CHECKPOINT_INTERVAL
+    due = boundary > _base_sequence(events) and (
+        boundary not in _checkpoint_paths(vault_root) or not audit
     )
+    if due and not audit and (boundary // CHECKPOINT_INTERVAL) % AUDIT_INTERVAL == 0:
+        events = load(True)
+    projection = _Projection(events.checkpoint)
+    for event in events:
+        projection.apply(event)
+        if due and event["seq"] == boundary:
+            _write_checkpoint(vault_root, projection.checkpoint(), repair_actions)
+    projected = projection.state()
     _write_state(vault_root, projected)
     return projected
 
@@ -684,14 +968,14 @@ def _rebuild_state_unlocked(
 def rebuild_state(vault_root: Path) -> dict[str, object]:
     """Serialize with writers, verify history, and regenerate the state cache."""
     with _write_lock(vault_root):
-        return _rebuild_state_unlocked(vault_root)
+        return _rebuild_state_unlocked(vault_root, audit=True)
 
 
 def repair_state(vault_root: Path) -> tuple[dict[str, object], tuple[str, ...]]:
     """Repair an interrupted tail and rebuild state under the exclusive lock."""
     with _write_lock(vault_root):
         actions: list[str] = []
-        state = _rebuild_state_unlocked(vault_root, actions)
+        state = _rebuild_state_unlocked(vault_root, actions, audit=True)
         return state, tuple(actions)
 
 
@@ -708,7 +992,7 @@ def read_events(vault_root: Path, *, since: int = 1) -> list[dict[str, object]]:
     if type(since) is not int or since < 0:
         raise LedgerError("event --since sequence must be a non-negative integer")
     with _read_lock(vault_root):
-        events = _load_events(vault_root, repair_terminal_publication=False)
+        events = _load_events(vault_root, repair_terminal_publication=False, since=since)
         _project(events)
         return [event for event in events if int(event["seq"]) >= since]
 
@@ -780,13 +1064,12 @@ def _publish_event(vault_root: Path, event_type: str, payload: dict[str, object]
     ledger_root, events_dir, _state_path = _ensure_directories(vault_root)
     events = _load_events(vault_root, repair_terminal_publication=True)
     _project(events)
-    last_sequence = int(events[-1]["seq"]) if events else 0
+    last_sequence, previous = _tip(events)
     if last_sequence >= MAX_SEQUENCE:
         raise LedgerError(
             f"lifecycle ledger sequence maximum {MAX_SEQUENCE:,} reached; refusing to append"
         )
     sequence = last_sequence + 1
-    previous = str(events[-1]["event_sha256"]) if events else GENESIS_SHA256
     without_sha: dict[str, object] = {
         "ledger_version": LEDGER_VERSION,
         "seq": sequence,
@@ -893,11 +1176,15 @@ def _record(vault_root: Path, event_type: str, payload: dict[str, object]) -> di
         transaction_id: str | None = None
         if event_type == "adoption-recorded":
             transaction_id = _validated_adoption(validated_payload["receipt"]).transaction_id
-            id_field = "transaction_id"
         elif event_type == "rewind-recorded":
             transaction_id = _validated_rewind(validated_payload["receipt"]).rewind_transaction_id
-            id_field = "rewind_transaction_id"
         if transaction_id is not None:
+            id_field = TRANSACTION_ID_FIELDS[event_type]
+            checkpoint = events.checkpoint
+            if checkpoint is not None and transaction_id in checkpoint["transactions"][event_type]:
+                # A retry of a transaction recorded before the checkpoint:
+                # compare its evidence against the full history.
+                events = _load_events(vault_root, repair_terminal_publication=True, audit=True)
             for event in events:
                 if event["event_type"] != event_type:
                     continue
@@ -951,6 +1238,8 @@ __all__ = [
     "EVENT_TYPES",
     "GENESIS_SHA256",
     "LEDGER_VERSION",
+    "AUDIT_INTERVAL",
+    "CHECKPOINT_INTERVAL",
     "MAX_SEQUENCE",
     "LedgerError",
     "canonical_state_bytes",
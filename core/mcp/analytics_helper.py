@@ -14,12 +14,14 @@ Usage in skills:
     from analytics_helper import fire_event, check_consent, mark_feature_used
 """
 
+import copy
 import hashlib
 import json
 import os
 import re
 import sys
-from datetime import datetime, timezone
+import threading
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -32,6 +34,8 @@ from core.analytics_events import (
     is_safe_analytics_event_name,
 )
 from core.lifecycle import service as lifecycle_service
+from core.mcp.analytics_outbox import AnalyticsOutbox
+from core.utils import config_snapshot
 
 try:
     import requests
@@ -48,6 +52,7 @@ _CONNECTION_TEST_EVENT = "dex_analytics_test"
 _CONNECTION_TEST_VISITOR_ID = "dex-analytics-test"
 _CONNECTION_TEST_ACCOUNT_ID = "dex-analytics-test"
 _DEFAULT_REQUEST_TIMEOUT_SECONDS = 10.0
+_OUTBOX_RELATIVE = Path('System/.dex/analytics-outbox.jsonl')
 
 
 def _bounded_request_timeout_seconds(value: object) -> float:
@@ -157,14 +162,32 @@ def get_analytics_transport() -> Dict[str, Any]:
     }
 
 
+_SOURCE_CACHE: Dict[str, Dict[str, Any]] = {}
+_SOURCE_CACHE_LOCK = threading.Lock()
+
+
+def clear_source_cache() -> None:
+    """Forget cached usage-log, profile and journey data (tests, run boundaries)."""
+    with _SOURCE_CACHE_LOCK:
+        _SOURCE_CACHE.clear()
+    config_snapshot.clear()
+
+
+def _usage_log_path() -> Path:
+    return get_vault_path() / 'System' / 'usage_log.md'
+
+
 def load_usage_log() -> Dict[str, Any]:
     """Parse usage_log.md into structured data."""
-    usage_path = get_vault_path() / 'System' / 'usage_log.md'
-    if not usage_path.exists():
+    try:
+        data = config_snapshot.cached(_usage_log_path(), _parse_usage_log, kind='usage-log')
+    except FileNotFoundError:
         return {}
-    
-    with open(usage_path, 'r') as f:
-        content = f.read()
+    return copy.deepcopy(data)
+
+
+def _parse_usage_log(raw: bytes) -> Dict[str, Any]:
+    content = raw.decode('utf-8', errors='replace')
     
     data = {
         'features': {},
@@ -223,15 +246,16 @@ def is_analytics_enabled() -> bool:
 def load_user_profile() -> dict:
     """Load user profile from yaml."""
     try:
-        import yaml
+        import yaml  # noqa: F401
     except ImportError:
         return {}
-    
+
     profile_path = get_vault_path() / 'System' / 'user-profile.yaml'
-    if profile_path.exists():
-        with open(profile_path, 'r') as f:
-            return yaml.safe_load(f) or {}
-    return {}
+    try:
+        profile = config_snapshot.load_yaml(profile_path)
+    except FileNotFoundError:
+        return {}
+    return copy.deepcopy(profile or {})
 
 
 def calculate_journey_metadata() -> Dict[str, Any]:
@@ -245,6 +269,18 @@ def calculate_journey_metadata() -> Dict[str, Any]:
         - most_active_area: str
     """
     data = load_usage_log()
+    today = date.today()
+    with _SOURCE_CACHE_LOCK:
+        memo = _SOURCE_CACHE.get('journey')
+    if memo is not None and memo['date'] == today and memo['data'] == data:
+        return dict(memo['value'])
+    journey = _journey_metadata(data)
+    with _SOURCE_CACHE_LOCK:
+        _SOURCE_CACHE['journey'] = {'data': data, 'date': today, 'value': journey}
+    return dict(journey)
+
+
+def _journey_metadata(data: Dict[str, Any]) -> Dict[str, Any]:
     features = data.get('features', {})
     
     # Count features by area - matches usage_log.md sections (55 total features)
@@ -392,6 +428,110 @@ def _with_attempt_receipt(
     return {**result, 'receipt_written': True}
 
 
+def _post_event(
+    client: Any,
+    transport: Dict[str, Any],
+    payload: Dict[str, Any],
+    timeout: float,
+) -> tuple[str, bool]:
+    """POST one payload; return its receipt reason and whether to retry it."""
+    try:
+        response = client.post(
+            transport['endpoint'],
+            json=payload,
+            headers=transport['headers'],
+            timeout=timeout,
+        )
+    except Exception:
+        return 'request_failed', True
+    if response.status_code == 200:
+        return 'sent', False
+    return 'http_error', response.status_code == 429 or response.status_code >= 500
+
+
+def _deliver_queued(entries: list) -> list:
+    """Deliver one outbox batch over a shared connection.
+
+    Consent and transport are re-resolved at delivery time, so an opt-out or
+    removed credential also stops events that were queued before it.
+    """
+    try:
+        enabled = is_analytics_enabled()
+    except Exception:
+        return [('request_failed', True)] * len(entries)
+    if not enabled:
+        return [('analytics_disabled', False)] * len(entries)
+    if not HAS_REQUESTS:
+        return [('requests_not_installed', False)] * len(entries)
+    transport = get_analytics_transport()
+    if not transport.get('configured'):
+        reason = transport.get('reason')
+        if reason not in {'no_analytics_endpoint', 'no_pendo_secret'}:
+            reason = 'no_analytics_endpoint'
+        return [(reason, False)] * len(entries)
+    session_factory = getattr(requests, 'Session', None)
+    client = session_factory() if session_factory is not None else requests
+    try:
+        return [
+            _post_event(
+                client,
+                transport,
+                entry['payload'],
+                _bounded_request_timeout_seconds(entry.get('timeout')),
+            )
+            for entry in entries
+        ]
+    finally:
+        if client is not requests:
+            client.close()
+
+
+_OUTBOXES: Dict[Path, AnalyticsOutbox] = {}
+_OUTBOX_LOCK = threading.Lock()
+_OUTBOX_ENABLED = False
+
+
+def use_outbox(enabled: bool = True) -> None:
+    """Queue opted-in events for background delivery instead of posting inline.
+
+    Long-lived MCP servers opt in at startup so tool latency never includes
+    network time. Events left over from an earlier process are flushed as
+    soon as the outbox starts. Short-lived callers keep synchronous delivery.
+    """
+    global _OUTBOX_ENABLED
+    with _OUTBOX_LOCK:
+        _OUTBOX_ENABLED = enabled
+        if enabled:
+            outboxes = []
+        else:
+            outboxes = list(_OUTBOXES.values())
+            _OUTBOXES.clear()
+    for outbox in outboxes:
+        outbox.stop()
+    if enabled:
+        _active_outbox()
+
+
+def _active_outbox() -> Optional[AnalyticsOutbox]:
+    if not _OUTBOX_ENABLED:
+        return None
+    vault = get_vault_path()
+    with _OUTBOX_LOCK:
+        outbox = _OUTBOXES.get(vault)
+        if outbox is None:
+
+            def record(event_name: str, outcome: str, reason: str) -> None:
+                lifecycle_service._append_analytics_attempt_receipt(
+                    vault, event_name=event_name, outcome=outcome, reason=reason
+                )
+
+            outbox = _OUTBOXES[vault] = AnalyticsOutbox(
+                vault / _OUTBOX_RELATIVE, _deliver_queued, record
+            )
+            outbox.start()
+    return outbox
+
+
 def fire_event(
     event_name: str,
     properties: Dict[str, Any] = None,
@@ -403,6 +543,8 @@ def fire_event(
     Fire an analytics event to Pendo.
     
     Only fires if user has opted in. Automatically includes journey metadata.
+    After ``use_outbox()`` the event is queued and ``{'queued': True}`` is
+    returned; its receipt is written when the background flush decides it.
     
     Args:
         event_name: Name of the event (e.g., 'daily_plan_completed')
@@ -505,6 +647,27 @@ def fire_event(
             'properties': event_props
         }
 
+        outbox = None if _connection_test else _active_outbox()
+        if outbox is not None:
+            try:
+                outbox.enqueue(
+                    {
+                        'event': event_name,
+                        'payload': payload,
+                        'timeout': request_timeout_seconds,
+                    }
+                )
+            except OSError:
+                pass
+            else:
+                # The flusher writes the receipt once delivery is decided.
+                return {
+                    'fired': False,
+                    'queued': True,
+                    'event': event_name,
+                    'mode': transport['mode'],
+                }
+
         response = requests.post(
             transport['endpoint'],
             json=payload,
@@ -0,0 +1,258 @@
+"""Durable local outbox for analytics events, delivered in the background.
+
+Tool handlers append one JSON line per event and return immediately. A daemon
+flusher later claims due entries in batches, hands each batch to a delivery
+callable, retries transient failures with exponential backoff, and records
+the final outcome through a receipt callable. Entries only leave the file
+after delivery has been decided, so a crash re-sends rather than drops.
+
+Several MCP servers share one vault, so the file is guarded with ``flock``:
+writers append under a shared-file lock and re-open if the flusher replaced
+the file underneath them, and only one process flushes at a time.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BASE_BACKOFF_SECONDS = 2.0
+DEFAULT_MAX_BACKOFF_SECONDS = 300.0
+DEFAULT_FLUSH_DELAY_SECONDS = 2.0
+DEFAULT_POLL_SECONDS = 30.0
+
+# ``deliver`` returns one ``(reason, retryable)`` pair per entry, where reason
+# is a receipt reason such as ``sent``, ``http_error`` or ``request_failed``.
+Deliver = Callable[[list[dict[str, Any]]], list[tuple[str, bool]]]
+Record = Callable[[str, str, str], None]
+
+
+class AnalyticsOutbox:
+    """Append-only JSONL outbox with a batching, retrying flusher."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        deliver: Deliver,
+        record: Record,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_backoff_seconds: float = DEFAULT_BASE_BACKOFF_SECONDS,
+        max_backoff_seconds: float = DEFAULT_MAX_BACKOFF_SECONDS,
+        flush_delay_seconds: float = DEFAULT_FLUSH_DELAY_SECONDS,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+    ):
+        self.path = Path(path)
+        self.deliver = deliver
+        self.record = record
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.flush_delay_seconds = flush_delay_seconds
+        self.poll_seconds = poll_seconds
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def enqueue(self, entry: dict[str, Any]) -> None:
+        """Persist one event; raises ``OSError`` when the outbox is unwritable."""
+        line = json.dumps(
+            {"attempts": 0, "next_attempt_at": 0.0, **entry},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        data = (line + "\n").encode("utf-8")
+        with self._locked(os.O_WRONLY | os.O_APPEND) as fd:
+            while data:
+                data = data[os.write(fd, data):]
+        self._wake.set()
+
+    def pending(self) -> list[dict[str, Any]]:
+        with self._locked(os.O_RDONLY) as fd:
+            return _parse(_read_all(fd))
+
+    def flush(self, *, now: float | None = None) -> dict[str, int]:
+        """Deliver every entry that is due, one batch at a time.
+
+        Returns counts of delivered, retried and dropped entries. A flush
+        already running in another process makes this a no-op.
+        """
+        totals = {"sent": 0, "retried": 0, "dropped": 0}
+        with self._flusher() as owned:
+            if not owned:
+                return totals
+            while True:
+                counts = self._flush_batch(time.time() if now is None else now)
+                if counts is None:
+                    break
+                for key, value in counts.items():
+                    totals[key] += value
+        return totals
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._wake.set()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="dex-analytics-outbox",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.poll_seconds)
+            self._wake.clear()
+            # Let a burst of tool calls land so they go out as one batch.
+            if self._stop.wait(self.flush_delay_seconds):
+                return
+            try:
+                self.flush()
+            except Exception:
+                logger.warning("Analytics outbox flush failed", exc_info=True)
+
+    def _flush_batch(self, now: float) -> dict[str, int] | None:
+        with self._locked(os.O_RDONLY) as fd:
+            claimed = _read_all(fd)
+        entries = _parse(claimed)
+        due = [entry for entry in entries if entry["next_attempt_at"] <= now]
+        batch = due[: self.batch_size]
+        if not batch:
+            return None
+
+        try:
+            outcomes = self.deliver(batch)
+        except Exception:
+            outcomes = [("request_failed", True)] * len(batch)
+        finals: list[tuple[str, str, str]] = []
+        counts = {"sent": 0, "retried": 0, "dropped": 0}
+        for entry, (reason, retryable) in zip(batch, outcomes):
+            attempts = entry["attempts"] + 1
+            if reason != "sent" and retryable and attempts < self.max_attempts:
+                entry["attempts"] = attempts
+                entry["next_attempt_at"] = now + min(
+                    self.max_backoff_seconds,
+                    self.base_backoff_seconds * 2 ** (attempts - 1),
+                )
+                counts["retried"] += 1
+                continue
+            entry["done"] = True
+            finals.append(
+                (entry["event"], "sent" if reason == "sent" else "not_sent", reason)
+            )
+            counts["sent" if reason == "sent" else "dropped"] += 1
+
+        kept = [entry for entry in entries if not entry.pop("done", False)]
+        with self._locked(os.O_RDONLY) as fd:
+            # Only this flusher rewrites the file, so anything past the bytes
+            # claimed above was appended while the batch was in flight.
+            tail = _read_all(fd)[len(claimed):]
+            _replace(self.path, _serialize(kept) + tail)
+        for event_name, outcome, reason in finals:
+            try:
+                self.record(event_name, outcome, reason)
+            except Exception:
+                logger.warning("Analytics receipt write failed", exc_info=True)
+        return counts
+
+    @contextmanager
+    def _locked(self, flags: int) -> Iterator[int]:
+        """Open and ``flock`` the live outbox file, following replacements."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        while True:
+            fd = os.open(self.path, flags | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                opened = os.fstat(fd)
+                try:
+                    current = os.stat(self.path)
+                except FileNotFoundError:
+                    current = None
+                if current is not None and (current.st_dev, current.st_ino) == (
+                    opened.st_dev,
+                    opened.st_ino,
+                ):
+                    yield fd
+                    return
+            finally:
+                os.close(fd)
+
+    @contextmanager
+    def _flusher(self) -> Iterator[bool]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            yield True
+        finally:
+            os.close(fd)
+
+
+def _read_all(fd: int) -> bytes:
+    os.lseek(fd, 0, os.SEEK_SET)
+    chunks = []
+    while chunk := os.read(fd, 1 << 16):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _parse(data: bytes) -> list[dict[str, Any]]:
+    entries = []
+    for line in data.splitlines():
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(entry, dict) and isinstance(entry.get("event"), str):
+            entries.append(entry)
+    return entries
+
+
+def _serialize(entries: list[dict[str, Any]]) -> bytes:
+    return b"".join(
+        (json.dumps(entry, sort_keys=True, separators=(",", ":")) + "\n").encode("utf-8")
+        for entry in entries
+    )
+
+
+def _replace(path: Path, data: bytes) -> None:
+    descriptor, temporary = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.chmod(temporary, 0o600)
+        os.replace(temporary, path)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
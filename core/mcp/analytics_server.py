@@ -43,6 +43,7 @@ from analytics_helper import (
     get_visitor_info,
     is_analytics_enabled,
     load_user_profile,
+    use_outbox,
 )
 
 from core.utils.feature_status import feature_status
@@ -278,6 +279,7 @@ async def main():
     """Run the MCP server."""
     if _HAS_HEALTH:
         _mark_healthy("dex-analytics")
+    use_outbox()
     async with stdio_server() as (read_stream, write_stream):
         await server.run(read_stream, write_stream, server.create_initialization_options())
 
@@ -46,6 +46,7 @@ if _repo_root not in sys.path:
     sys.path.append(_repo_root)
 from core.paths import PEOPLE_DIR
 from core.paths import VAULT_ROOT as VAULT_PATH
+from core.utils import config_snapshot
 from core.utils.feature_status import feature_status
 
 # Health system — error queue and health reporting
@@ -93,10 +94,8 @@ def get_default_work_calendar() -> str:
     only the relevant calendar instead of all calendars.
     """
     try:
-        import yaml
         if USER_PROFILE_PATH.exists():
-            with open(USER_PROFILE_PATH, 'r') as f:
-                profile = yaml.safe_load(f)
+            profile = config_snapshot.load_yaml(USER_PROFILE_PATH)
             
             # Try calendar.work_calendar first
             if profile.get('calendar', {}).get('work_calendar'):
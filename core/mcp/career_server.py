@@ -69,6 +69,12 @@ from career_parser import (
     scan_evidence_directory,
 )
 
+# Import QMD search index refresh (optional - silently skips if QMD not installed)
+try:
+    from core.utils.qmd_indexer import refresh_search_index
+except ImportError:
+    def refresh_search_index(): pass
+
 # Health system — error queue and health reporting
 try:
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -354,7 +360,9 @@ async def handle_call_tool(
         elif name == "skills_gap_analysis":
             return await handle_skills_gap_analysis(arguments)
         elif name == "generate_evidence_from_work":
-            return await handle_generate_evidence_from_work(arguments)
+            result = await handle_generate_evidence_from_work(arguments)
+            refresh_search_index()  # new evidence note (non-blocking)
+            return result
         elif name == "promotion_readiness_score":
             return await handle_promotion_readiness_score(arguments)
         else:
@@ -1271,6 +1279,10 @@ async def _main():
     logger.info(f"Vault path: {BASE_DIR}")
     logger.info(f"Career directory: {CAREER_DIR}")
     logger.info(f"Evidence directory: {EVIDENCE_DIR}")
+    if HAS_ANALYTICS:
+        from core.mcp.analytics_helper import use_outbox
+
+        use_outbox()
     
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await app.run(
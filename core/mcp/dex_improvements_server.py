@@ -54,6 +54,12 @@ except ImportError:
     def _fire_analytics_event(event_name, properties=None):
         return unavailable_analytics_delivery()
 
+# Import QMD search index refresh (optional - silently skips if QMD not installed)
+try:
+    from core.utils.qmd_indexer import refresh_search_index
+except ImportError:
+    def refresh_search_index(): pass
+
 # Health system — error queue and health reporting
 try:
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -1047,13 +1053,26 @@ async def handle_list_tools() -> list[types.Tool]:
         ),
     ]
 
+BACKLOG_WRITE_TOOLS = {
+    "capture_idea",
+    "mark_implemented",
+    "enrich_idea",
+    "synthesize_changelog",
+    "synthesize_learnings",
+}
+
+
 @app.call_tool()
 async def handle_call_tool(
     name: str, arguments: dict | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """Handle tool calls"""
     try:
-        return await _handle_call_tool_inner(name, arguments)
+        result = await _handle_call_tool_inner(name, arguments)
+        # The backlog is a vault note; keep search in step with it (non-blocking)
+        if name in BACKLOG_WRITE_TOOLS:
+            refresh_search_index()
+        return result
     except Exception as e:
         if _HAS_HEALTH:
             _log_health_error(
@@ -1501,6 +1520,10 @@ async def _main():
     logger.info("Starting Dex Improvements MCP Server")
     logger.info(f"Vault path: {BASE_DIR}")
     logger.info(f"Backlog file: {BACKLOG_FILE}")
+    if HAS_ANALYTICS:
+        from core.mcp.analytics_helper import use_outbox
+
+        use_outbox()
     
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await app.run(
@@ -0,0 +1,341 @@
+"""Local SQLite mirror of Granola notes for the Granola MCP server.
+
+Granola's public API has no search endpoint, so answering "which meetings
+mention X" used to mean listing up to a thousand notes and fetching their
+details one request at a time. The mirror keeps every listed note, the
+summary and attendees from its last detail fetch, and an FTS5 index over
+title, summary and attendees, so search and recent-meeting tools are local
+queries.
+
+Sync state lives in ``meta``: ``covered_since`` is the oldest
+``created_after`` the mirror has listed completely, ``high_water`` the newest
+``created_at`` seen, ``synced_at`` when the last complete listing finished
+and ``full_synced_at`` when the whole covered window was last re-listed.
+A full re-list also drops notes the API no longer returns. A detail is stale
+when the list view reports a different ``updated_at`` than the stored detail
+carries. Transcripts are not stored; ``granola_get_meeting_details`` still
+fetches them live.
+
+The database is disposable: a file with another schema version is discarded
+and rebuilt from the API on the next sync.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+SCHEMA_VERSION = "1"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notes (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    detail_json TEXT,
+    detail_updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_notes_created_at ON notes(created_at);
+
+CREATE TABLE IF NOT EXISTS attendees (
+    note_id TEXT NOT NULL REFERENCES notes(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT,
+    email TEXT,
+    PRIMARY KEY (note_id, position)
+);
+
+-- rowid matches notes.rowid, which an upsert never changes.
+CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+    title,
+    summary,
+    attendees,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _summary_text(detail: dict[str, Any]) -> str:
+    return detail.get("summary_markdown") or detail.get("summary_text") or ""
+
+
+def _attendee_rows(detail: dict[str, Any]) -> list[tuple[str | None, str | None]]:
+    rows = []
+    for attendee in detail.get("attendees", []) or []:
+        if isinstance(attendee, dict) and (attendee.get("name") or attendee.get("email")):
+            rows.append((attendee.get("name"), attendee.get("email")))
+    return rows
+
+
+def match_expression(query: str) -> str:
+    """An FTS5 phrase for ``query`` whose last token also matches as a prefix.
+
+    Quoting keeps user text out of the FTS5 query grammar; the tokenizer
+    still splits it, so ``acme.com`` matches the tokens of ``ana@acme.com``.
+    """
+    return '"' + query.replace('"', '""') + '"*'
+
+
+class GranolaMirror:
+    """One vault's mirror database; every method opens its own connection."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        for attempt in range(2):
+            connection = sqlite3.connect(self.path, timeout=5.0)
+            try:
+                connection.execute("PRAGMA foreign_keys = ON")
+                connection.execute("PRAGMA journal_mode = WAL")
+                connection.executescript(_SCHEMA)
+                version = connection.execute(
+                    "SELECT value FROM meta WHERE key = 'schema_version'"
+                ).fetchone()
+                if version is None:
+                    with connection:
+                        connection.execute(
+                            "INSERT INTO meta(key, value) VALUES ('schema_version', ?)",
+                            (SCHEMA_VERSION,),
+                        )
+                elif version[0] != SCHEMA_VERSION:
+                    raise sqlite3.DatabaseError("granola mirror schema drift")
+                break
+            except sqlite3.DatabaseError:
+                connection.close()
+                if attempt:
+                    raise
+                for suffix in ("", "-wal", "-shm"):
+                    Path(f"{self.path}{suffix}").unlink(missing_ok=True)
+        with closing(connection):
+            yield connection
+
+    # ------------------------------------------------------------------
+    # Sync state
+    # ------------------------------------------------------------------
+
+    def sync_state(self) -> dict[str, str]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT key, value FROM meta "
+                "WHERE key IN ('covered_since', 'high_water', 'synced_at', 'full_synced_at')"
+            ).fetchall()
+        return {key: value for key, value in rows}
+
+    def record_listing(
+        self,
+        notes: Iterable[dict[str, Any]],
+        *,
+        covered_since: str | None = None,
+        synced_at: float | None = None,
+    ) -> int:
+        """Upsert list-view notes; with ``covered_since`` also mark the listing complete.
+
+        Returns how many notes were recorded. ``high_water`` only ever moves
+        forward, and ``covered_since`` only ever moves back.
+        """
+        rows = [
+            (
+                note["id"],
+                note.get("title") or "Untitled Meeting",
+                note.get("created_at") or "",
+                note.get("updated_at") or "",
+            )
+            for note in notes
+            if note.get("id")
+        ]
+        with self._connect() as connection, connection:
+            for note_id, title, created_at, updated_at in rows:
+                connection.execute(
+                    """
+                    INSERT INTO notes(id, title, created_at, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        title = excluded.title,
+                        created_at = excluded.created_at,
+                        updated_at = max(updated_at, excluded.updated_at)
+                    """,
+                    (note_id, title, created_at, updated_at),
+                )
+                self._index(connection, note_id)
+            newest = max((row[2] for row in rows), default="")
+            if newest:
+                connection.execute(
+                    """
+                    INSERT INTO meta(key, value) VALUES ('high_water', ?)
+                    ON CONFLICT(key) DO UPDATE SET value = max(value, excluded.value)
+                    """,
+                    (newest,),
+                )
+            if covered_since is not None:
+                connection.execute(
+                    """
+                    INSERT INTO meta(key, value) VALUES ('covered_since', ?)
+                    ON CONFLICT(key) DO UPDATE SET value = min(value, excluded.value)
+                    """,
+                    (covered_since,),
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta(key, value) VALUES ('synced_at', ?)",
+                    (repr(synced_at),),
+                )
+        return len(rows)
+
+    def reconcile_window(
+        self,
+        created_after: str,
+        listed_ids: Iterable[str],
+        *,
+        synced_at: float | None = None,
+    ) -> int:
+        """Forget notes in the window a complete listing no longer returned.
+
+        Call only after every page from ``created_after`` was recorded.
+        Returns how many notes were removed.
+        """
+        listed = set(listed_ids)
+        with self._connect() as connection, connection:
+            doomed = [
+                (rowid, note_id)
+                for rowid, note_id in connection.execute(
+                    "SELECT rowid, id FROM notes WHERE created_at >= ?", (created_after,)
+                )
+                if note_id not in listed
+            ]
+            for rowid, note_id in doomed:
+                connection.execute("DELETE FROM notes_fts WHERE rowid = ?", (rowid,))
+                connection.execute("DELETE FROM notes WHERE id = ?", (note_id,))
+            connection.execute(
+                "INSERT OR REPLACE INTO meta(key, value) VALUES ('full_synced_at', ?)",
+                (repr(synced_at),),
+            )
+        return len(doomed)
+
+    # ------------------------------------------------------------------
+    # Details
+    # ------------------------------------------------------------------
+
+    def store_details(self, details: Iterable[dict[str, Any]]) -> None:
+        """Store fetched note details (without transcripts) and re-index them."""
+        with self._connect() as connection, connection:
+            for detail in details:
+                note_id = detail.get("id")
+                if not note_id:
+                    continue
+                stored = {key: value for key, value in detail.items() if key != "transcript"}
+                connection.execute(
+                    """
+                    INSERT INTO notes(id, title, created_at, updated_at, detail_json, detail_updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        title = excluded.title,
+                        updated_at = max(updated_at, excluded.updated_at),
+                        detail_json = excluded.detail_json,
+                        detail_updated_at = excluded.detail_updated_at
+                    """,
+                    (
+                        note_id,
+                        detail.get("title") or "Untitled Meeting",
+                        detail.get("created_at") or "",
+                        detail.get("updated_at") or "",
+                        json.dumps(stored, sort_keys=True),
+                        detail.get("updated_at") or "",
+                    ),
+                )
+                connection.execute("DELETE FROM attendees WHERE note_id = ?", (note_id,))
+                connection.executemany(
+                    "INSERT INTO attendees(note_id, position, name, email) VALUES (?, ?, ?, ?)",
+                    [
+                        (note_id, position, name, email)
+                        for position, (name, email) in enumerate(_attendee_rows(detail))
+                    ],
+                )
+                self._index(connection, note_id)
+
+    def stale_details(self, created_after: str, limit: int) -> list[str]:
+        """Newest-first ids in the window whose detail is missing or outdated."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                """
+                SELECT id FROM notes
+                WHERE created_at >= ?
+                  AND (detail_json IS NULL OR detail_updated_at IS NOT updated_at)
+                ORDER BY created_at DESC
+                LIMIT ?
+                """,
+                (created_after, max(limit, 0)),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def notes_since(self, created_after: str, limit: int | None = None) -> list[dict[str, Any]]:
+        """Newest-first notes created at or after ``created_after``."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"""
+                SELECT id, title, created_at, updated_at, detail_json FROM notes
+                WHERE created_at >= ?
+                ORDER BY created_at DESC
+                {"LIMIT ?" if limit is not None else ""}
+                """,
+                (created_after, limit) if limit is not None else (created_after,),
+            ).fetchall()
+        return [self._row(row) for row in rows]
+
+    def search(self, query: str, created_after: str, limit: int) -> list[dict[str, Any]]:
+        """Newest-first notes in the window matching ``query`` in title, summary or attendees."""
+        if not query.strip():
+            return []
+        with self._connect() as connection:
+            rows = connection.execute(
+                """
+                SELECT notes.id, notes.title, notes.created_at, notes.updated_at, notes.detail_json
+                FROM notes_fts JOIN notes ON notes.rowid = notes_fts.rowid
+                WHERE notes_fts MATCH ? AND notes.created_at >= ?
+                ORDER BY notes.created_at DESC
+                LIMIT ?
+                """,
+                (match_expression(query), created_after, max(limit, 0)),
+            ).fetchall()
+        return [self._row(row) for row in rows]
+
+    @staticmethod
+    def _row(row: tuple[Any, ...]) -> dict[str, Any]:
+        return {
+            "id": row[0],
+            "title": row[1],
+            "created_at": row[2],
+            "updated_at": row[3],
+            "detail": json.loads(row[4]) if row[4] else None,
+        }
+
+    @staticmethod
+    def _index(connection: sqlite3.Connection, note_id: str) -> None:
+        rowid, title, detail_json = connection.execute(
+            "SELECT rowid, title, detail_json FROM notes WHERE id = ?", (note_id,)
+        ).fetchone()
+        detail = json.loads(detail_json) if detail_json else {}
+        attendees = " ".join(
+            part
+            for name, email in _attendee_rows(detail)
+            for part in (name, email)
+            if part
+        )
+        connection.execute(
+            "INSERT OR REPLACE INTO notes_fts(rowid, title, summary, attendees) VALUES (?, ?, ?, ?)",
+            (rowid, title, _summary_text(detail), attendees),
+        )
@@ -14,6 +14,14 @@ API shape:
 - LIST:   GET /v1/notes (cursor pagination; list items have no summary/attendees/transcript)
 - DETAIL: GET /v1/notes/{note_id}?include=transcript (full summary, attendees, transcript)
 
+Listings, summaries and attendees are mirrored into a local SQLite database
+(see granola_mirror.py) that is synced incrementally by created_after, with a
+periodic full re-list that picks up late edits and deletions. Recent, today,
+search and extent queries are answered from the mirror; missing or outdated
+details are refreshed a few requests at a time before searching. If the
+mirror database cannot be opened or written, those queries fall back to live
+API listings.
+
 Tools (interface unchanged):
 - granola_check_available: Check if the Granola API is connected and reachable
 - granola_get_recent_meetings: Get recent meetings
@@ -26,15 +34,19 @@ Tools (interface unchanged):
 import json
 import logging
 import os
+import sqlite3
 import subprocess
 import sys
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import mcp.server.stdio
 import mcp.types as types
@@ -44,6 +56,7 @@ from mcp.server.models import InitializationOptions
 _repo_root = str(Path(__file__).parent.parent.parent)
 if _repo_root not in sys.path:
     sys.path.insert(0, _repo_root)
+from core.mcp.granola_mirror import GranolaMirror
 from core.utils.feature_status import feature_status
 
 # ============================================================================
@@ -69,6 +82,18 @@ logger = logging.getLogger(__name__)
 _response_cache: Dict[str, Any] = {}
 _cache_ttl = 300  # 5 minutes
 
+# Local mirror of notes, attendees and summaries. A covered window is served
+# without any request for _cache_ttl after the last complete sync.
+MIRROR_PATH = VAULT_PATH / "System" / ".dex" / "granola-mirror.sqlite3"
+# Incremental syncs re-list this far behind the newest known note, so notes
+# whose summary finished after the previous sync get their details refreshed.
+MIRROR_RELIST_OVERLAP = timedelta(days=2)
+# Edits to older notes and deletions never reach an incremental sync, so the
+# whole covered window is re-listed (and reconciled) this often.
+MIRROR_FULL_RELIST_INTERVAL = 6 * 60 * 60
+# Detail requests in flight at once when refreshing the mirror.
+DETAIL_FETCH_WORKERS = 4
+
 
 # Custom JSON encoder for handling date/datetime objects
 class DateTimeEncoder(json.JSONEncoder):
@@ -164,8 +189,26 @@ def _read_key_from_connection_manager() -> Optional[str]:
     return authorization[len("Bearer "):].strip() or None
 
 
+# A key resolved once by a caller that cannot keep the environment bound
+# for the whole request (the doctor's concurrent probes).
+_pinned_api_key: ContextVar[Optional[str]] = ContextVar("granola_pinned_api_key", default=None)
+
+
+@contextmanager
+def pinned_api_key(key: Optional[str]) -> Iterator[None]:
+    """Use `key` for requests in this context; None means no key is configured."""
+    token = _pinned_api_key.set(key or "")
+    try:
+        yield
+    finally:
+        _pinned_api_key.reset(token)
+
+
 def get_api_key() -> Optional[str]:
     """Resolve the Granola key from connection manager, environment, then .env."""
+    pinned = _pinned_api_key.get()
+    if pinned is not None:
+        return pinned or None
     key = _read_key_from_connection_manager()
     if key:
         return key
@@ -292,11 +335,14 @@ def _api_get(path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dic
     raise GranolaAPIError(body="request retries exhausted", reason="unexpected")
 
 
-def _iter_note_pages(params: Dict[str, Any]):
+def _iter_note_pages(params: Dict[str, Any], *, partial_ok: bool = True):
     """
     Yield each page (list of note summaries) from GET /v1/notes, following the
     cursor until hasMore is false. `params` is the base query (created_after,
     page_size, etc.); the cursor is managed here.
+
+    A failure after the first page ends the iteration with a warning, unless
+    partial_ok is false (mirror syncs must not mistake it for the end).
     """
     cursor: Optional[str] = None
     pages_succeeded = 0
@@ -307,7 +353,7 @@ def _iter_note_pages(params: Dict[str, Any]):
         try:
             response = _api_get("/v1/notes", page_params)
         except GranolaAPIError as error:
-            if pages_succeeded == 0:
+            if pages_succeeded == 0 or not partial_ok:
                 raise
             suffix = "" if pages_succeeded == 1 else "s"
             logger.warning(
@@ -381,8 +427,12 @@ def _cutoff_iso(days_back: int) -> str:
     Granola's API rejects the microsecond + numeric-offset form produced by
     datetime.isoformat(); it wants seconds precision with a Z suffix (issue #79).
     """
-    dt = datetime.now(timezone.utc) - timedelta(days=days_back)
-    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return _format_iso(datetime.now(timezone.utc) - timedelta(days=days_back))
+
+
+def _format_iso(dt: datetime) -> str:
+    """Format a datetime in the seconds-precision UTC form the API accepts."""
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def _date_only(value: str) -> Optional[str]:
@@ -475,6 +525,172 @@ def _meeting_info_from_detail(detail: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _summary_from_mirror(row: Dict[str, Any]) -> Dict[str, Any]:
+    """A list-view summary, with notes and participants once a detail is mirrored."""
+    meeting = _summary_from_list_item(row)
+    detail = row.get("detail")
+    if detail:
+        participants = _attendees_from_detail(detail)
+        meeting["notes"] = detail.get("summary_markdown") or detail.get("summary_text") or ""
+        meeting["participants"] = participants
+        meeting["participant_count"] = len(participants)
+    return meeting
+
+
+# ============================================================================
+# LOCAL MIRROR
+# ============================================================================
+
+
+def _mirror() -> GranolaMirror:
+    return GranolaMirror(MIRROR_PATH)
+
+
+def _sync_mirror(days_back: int) -> GranolaMirror:
+    """
+    Bring the mirror's listing of the last `days_back` days up to date.
+
+    Only notes created since the high-water mark (less MIRROR_RELIST_OVERLAP)
+    are listed, unless the window reaches further back than the mirror has
+    ever listed or the last full re-list is older than
+    MIRROR_FULL_RELIST_INTERVAL. A full listing re-lists the whole covered
+    window and drops notes the API no longer returns. A failed sync raises
+    GranolaAPIError only when the mirror does not cover the window yet;
+    otherwise the last synced state is served.
+    """
+    mirror = _mirror()
+    cutoff = _cutoff_iso(days_back)
+    state = mirror.sync_state()
+    covered_since = state.get("covered_since")
+    window_covered = covered_since is not None and covered_since <= cutoff
+    if window_covered and time.time() - float(state.get("synced_at", 0)) < _cache_ttl:
+        return mirror
+
+    full = (
+        not window_covered
+        or time.time() - float(state.get("full_synced_at", 0)) >= MIRROR_FULL_RELIST_INTERVAL
+    )
+    high_water = _parse_iso(state.get("high_water", ""))
+    if not window_covered:
+        created_after = cutoff
+    elif full or high_water is None:
+        created_after = covered_since
+    else:
+        created_after = max(cutoff, _format_iso(high_water - MIRROR_RELIST_OVERLAP))
+
+    started = time.time()
+    listed_ids: List[str] = []
+    try:
+        for page in _iter_note_pages(
+            {"page_size": 30, "created_after": created_after}, partial_ok=False
+        ):
+            mirror.record_listing(page)
+            listed_ids.extend(note["id"] for note in page if note.get("id"))
+    except GranolaAPIError as error:
+        if not window_covered:
+            raise
+        logger.warning(f"Granola sync failed, serving the local mirror: {error}")
+        return mirror
+    mirror.record_listing([], covered_since=created_after, synced_at=started)
+    if full:
+        mirror.reconcile_window(created_after, listed_ids, synced_at=started)
+    return mirror
+
+
+def _fetch_details(
+    note_ids: List[str],
+) -> tuple[List[Dict[str, Any]], Optional[GranolaAPIError]]:
+    """
+    Fetch details (without transcripts) for `note_ids`, DETAIL_FETCH_WORKERS
+    at a time.
+
+    The first GranolaAPIError cancels the requests not yet started; it is
+    returned alongside the details that did arrive.
+    """
+    if not note_ids:
+        return [], None
+    details: List[Dict[str, Any]] = []
+    first_error: Optional[GranolaAPIError] = None
+    with ThreadPoolExecutor(
+        max_workers=min(DETAIL_FETCH_WORKERS, len(note_ids)),
+        thread_name_prefix="granola-detail",
+    ) as pool:
+        futures = [
+            pool.submit(_get_note_detail, note_id, False) for note_id in note_ids
+        ]
+        for future in as_completed(futures):
+            try:
+                detail = future.result()
+            except CancelledError:
+                continue
+            except GranolaAPIError as error:
+                if first_error is None:
+                    first_error = error
+                    for pending in futures:
+                        pending.cancel()
+                continue
+            if detail:
+                details.append(detail)
+    return details, first_error
+
+
+def _refresh_details(mirror: GranolaMirror, note_ids: List[str]) -> None:
+    """
+    Fetch and mirror details for `note_ids`.
+
+    The first GranolaAPIError is raised once the details that did arrive are
+    stored.
+    """
+    details, first_error = _fetch_details(note_ids)
+    mirror.store_details(details)
+    if first_error is not None:
+        raise first_error
+
+
+def _live_rows(
+    days_back: int,
+    *,
+    max_notes: int = 1000,
+    detail_limit: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Mirror-shaped rows listed straight from the API, for when the mirror
+    database is unusable. The newest `detail_limit` rows carry a detail.
+    """
+    notes = _list_notes(created_after=_cutoff_iso(days_back), max_notes=max_notes)
+    notes.sort(key=lambda note: note.get("created_at") or "", reverse=True)
+    details, first_error = _fetch_details(
+        [note["id"] for note in notes[:detail_limit] if note.get("id")]
+    )
+    if first_error is not None:
+        raise first_error
+    by_id = {detail.get("id"): detail for detail in details}
+    return [
+        {
+            "id": note.get("id", ""),
+            "title": note.get("title") or "Untitled Meeting",
+            "created_at": note.get("created_at") or "",
+            "updated_at": note.get("updated_at") or "",
+            "detail": by_id.get(note.get("id")),
+        }
+        for note in notes
+    ]
+
+
+def _row_matches(row: Dict[str, Any], query: str) -> bool:
+    """Case-insensitive substring match on title, summary and attendees."""
+    needle = query.lower()
+    detail = row.get("detail") or {}
+    haystacks = [
+        row.get("title") or "",
+        detail.get("summary_markdown") or detail.get("summary_text") or "",
+    ]
+    for attendee in detail.get("attendees", []) or []:
+        if isinstance(attendee, dict):
+            haystacks.extend((attendee.get("name") or "", attendee.get("email") or ""))
+    return any(needle in haystack.lower() for haystack in haystacks)
+
+
 # ============================================================================
 # HIGH-LEVEL DATA FUNCTIONS
 # ============================================================================
@@ -482,17 +698,20 @@ def _meeting_info_from_detail(detail: Dict[str, Any]) -> Dict[str, Any]:
 
 def get_recent_meetings(days_back: int = 7, limit: int = 20) -> List[Dict[str, Any]]:
     """
-    Get recent meetings via the public API.
+    Get recent meetings from the local mirror, syncing it first when due.
 
-    Lists note summaries within the date window. NOTE: list items contain no
-    attendees, so participant data is only populated by detail fetches (used by
-    get_meeting_details and get_extent, which enrich per note).
+    Participants and notes are filled in for meetings whose detail has been
+    mirrored (by search, extent or a details lookup); others carry the
+    list-view fields only.
     """
     logger.info(f"Fetching recent meetings (days_back={days_back}, limit={limit})")
-    notes = _list_notes(created_after=_cutoff_iso(days_back), max_notes=max(limit, 1))
-    meetings = [_summary_from_list_item(n) for n in notes]
-    meetings.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-    return meetings[:limit]
+    try:
+        mirror = _sync_mirror(days_back)
+        rows = mirror.notes_since(_cutoff_iso(days_back), limit=max(limit, 0))
+    except sqlite3.Error as error:
+        logger.warning(f"Granola mirror unavailable, listing live: {error}")
+        rows = _live_rows(days_back, max_notes=max(limit, 1))[: max(limit, 0)]
+    return [_summary_from_mirror(row) for row in rows]
 
 
 def get_meeting_details(meeting_id: str) -> Optional[Dict[str, Any]]:
@@ -502,64 +721,58 @@ def get_meeting_details(meeting_id: str) -> Optional[Dict[str, Any]]:
     if not detail:
         logger.warning(f"Meeting {meeting_id} not found via API")
         return None
+    try:
+        _mirror().store_details([detail])
+    except sqlite3.Error as error:
+        logger.warning(f"Could not mirror Granola meeting {meeting_id}: {error}")
     return _meeting_info_from_detail(detail)
 
 
 def search_meetings(query: str, days_back: int = 30, limit: int = 10) -> List[Dict[str, Any]]:
     """
-    Search meetings by title or participant name via the API.
+    Search meetings by title, notes or participant via the local mirror.
 
-    The public API has no full-text search endpoint, so this lists notes in the
-    window, matches titles directly, then fetches detail for unmatched notes to
-    match on attendees and summary. Detail fetches are sequential and bounded.
+    The public API has no search endpoint, so the mirror's FTS5 index answers
+    the query. Before searching, up to max(limit * 5, 25) of the newest notes
+    in the window whose detail is missing or outdated are refreshed through
+    the bounded concurrent fetcher.
     """
     logger.info(f"Searching meetings for '{query}' (days_back={days_back}, limit={limit})")
-    query_lower = query.lower()
-    notes = _list_notes(created_after=_cutoff_iso(days_back), max_notes=1000)
-
-    results: List[Dict[str, Any]] = []
-
-    # First pass: cheap title matches from the list view.
-    title_matched_ids = set()
-    unmatched: List[Dict[str, Any]] = []
-    for note in notes:
-        title = (note.get("title") or "").lower()
-        if query_lower in title:
-            results.append(_summary_from_list_item(note))
-            title_matched_ids.add(note.get("id"))
-        else:
-            unmatched.append(note)
-
-    # Second pass: enrich unmatched notes with detail to match attendees/summary.
-    # Bounded so we don't fetch the whole history for a broad query.
+    cutoff = _cutoff_iso(days_back)
     detail_budget = max(limit * 5, 25)
-    for note in unmatched:
-        if len(results) >= limit or detail_budget <= 0:
-            break
-        note_id = note.get("id")
-        if not note_id:
-            continue
-        detail_budget -= 1
-        detail = _get_note_detail(note_id, include_transcript=False)
-        if not detail:
-            continue
-
-        matched = False
-        for attendee in detail.get("attendees", []) or []:
-            name = (attendee.get("name") or attendee.get("email") or "").lower()
-            if name and query_lower in name:
-                matched = True
-                break
-        if not matched:
-            summary = (detail.get("summary_markdown") or detail.get("summary_text") or "").lower()
-            if summary and query_lower in summary:
-                matched = True
-
-        if matched:
-            results.append(_meeting_info_from_detail(detail))
-
-    results.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-    return results[:limit]
+    try:
+        mirror = _sync_mirror(days_back)
+        _refresh_details(mirror, mirror.stale_details(cutoff, detail_budget))
+        rows = mirror.search(query, cutoff, limit)
+    except sqlite3.Error as error:
+        logger.warning(f"Granola mirror unavailable, searching live: {error}")
+        rows = [
+            row
+            for row in _live_rows(days_back, detail_limit=detail_budget)
+            if _row_matches(row, query)
+        ][: max(limit, 0)]
+    return [
+        _meeting_info_from_detail(row["detail"]) if row["detail"] else _summary_from_list_item(row)
+        for row in rows
+    ]
+
+
+def get_extent_rows(days_back: int) -> List[Dict[str, Any]]:
+    """
+    Mirror rows for the extent summary, with up to 150 stale details refreshed.
+
+    People/company stats require attendees, which only appear in detail.
+    Refreshing a bounded number per call keeps discovery fast; the mirror
+    keeps them for later calls.
+    """
+    cutoff = _cutoff_iso(days_back)
+    try:
+        mirror = _sync_mirror(days_back)
+        _refresh_details(mirror, mirror.stale_details(cutoff, 150))
+        return mirror.notes_since(cutoff)
+    except sqlite3.Error as error:
+        logger.warning(f"Granola mirror unavailable, listing live: {error}")
+        return _live_rows(days_back, detail_limit=150)
 
 
 # Initialize the MCP server
@@ -872,41 +1085,19 @@ async def handle_call_tool(
         # Default to 6 months for speed, optionally extend to 2 years.
         days_to_fetch = 365 * 2 if extended else 180
         try:
-            notes = _list_notes(
-                created_after=_cutoff_iso(days_to_fetch),
-                max_notes=1000,
-            )
+            rows = get_extent_rows(days_to_fetch)
         except GranolaAPIError as error:
             return _api_error_response(error)
 
-        if not notes:
+        if not rows:
             return [types.TextContent(type="text", text=json.dumps({
                 "success": False,
                 "error": "No meetings found",
                 "has_data": False
             }, indent=2))]
 
-        meetings = [_summary_from_list_item(n) for n in notes]
-
-        # People/company stats require attendees, which only appear in detail.
-        # Enrich a bounded number of notes so discovery stays fast.
-        enrich_budget = min(len(notes), 150)
-        for note in notes[:enrich_budget]:
-            note_id = note.get("id")
-            if not note_id:
-                continue
-            try:
-                detail = _get_note_detail(note_id, include_transcript=False)
-            except GranolaAPIError as error:
-                return _api_error_response(error)
-            if not detail:
-                continue
-            participants = _attendees_from_detail(detail)
-            for meeting in meetings:
-                if meeting["id"] == note_id:
-                    meeting["participants"] = participants
-                    meeting["participant_count"] = len(participants)
-                    break
+        meetings = [_summary_from_mirror(row) for row in rows]
+        enriched = sum(1 for row in rows if row["detail"])
 
         # Find oldest and newest dates.
         dates = [m["date"] for m in meetings if m.get("date")]
@@ -988,7 +1179,7 @@ async def handle_call_tool(
             "meetings_90d": meetings_90d,
             "has_more_data": has_more,
             "fetched_range_days": days_to_fetch,
-            "people_enriched": enrich_budget,
+            "people_enriched": enriched,
             "data_source": "official_api"
         }
 
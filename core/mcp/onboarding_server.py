@@ -61,6 +61,7 @@ from core.paths import (
     VAULT_ROOT as BASE_DIR,
 )
 from core.transaction.engine import PlanRejected
+from core.utils import config_snapshot
 from core.utils.nudge_calendar import build_nudge_calendar, is_dex_nudge_event
 
 
@@ -634,8 +635,8 @@ def _load_first_week_profile() -> Dict[str, Any]:
     profile_path = BASE_DIR / 'System' / 'user-profile.yaml'
     if profile_path.exists():
         try:
-            import yaml
-            profile = yaml.safe_load(profile_path.read_text(encoding='utf-8')) or {}
+            # Copied: the session data below is merged into it.
+            profile = dict(config_snapshot.load_yaml(profile_path) or {})
         except Exception as e:
             logger.warning(f"Failed to load user profile for first-week analysis: {e}")
 
@@ -2628,6 +2629,10 @@ async def handle_call_tool(name: str, arguments: dict | None) -> list[types.Text
 
 async def _main():
     """Main entry point for the MCP server"""
+    if HAS_ANALYTICS:
+        from core.mcp.analytics_helper import use_outbox
+
+        use_outbox()
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await app.run(
             read_stream,
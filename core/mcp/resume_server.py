@@ -1316,6 +1316,10 @@ async def _main():
     logger.info(f"Resume directory: {RESUME_DIR}")
     logger.info(f"Sessions directory: {SESSIONS_DIR}")
     logger.info(f"Evidence directory: {EVIDENCE_DIR}")
+    if HAS_ANALYTICS:
+        from core.mcp.analytics_helper import use_outbox
+
+        use_outbox()
     
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await app.run(
@@ -16,7 +16,11 @@ import json
 import logging
 import os
 import re
+import sqlite3
+import stat
 import sys
+import tempfile
+import time
 import unicodedata
 from collections import Counter
 from datetime import date, datetime, timedelta
@@ -143,6 +147,7 @@ from core.entity_engine import (
     fingerprint_page,
     mutate_relationships,
     render_company_page,
+    task_anchors,
 )
 from core.entity_engine import index as entity_index
 from core.meeting_capture_match import match_capture_to_calendar
@@ -167,6 +172,7 @@ from core.paths import (
     VAULT_ROOT as BASE_DIR,
 )
 from core.soft_promise import detect_soft_promises
+from core.utils import config_snapshot
 from core.utils.company_domains import registrable_domain
 from core.utils.entity_pages import parse_entity_page, render_person_page
 from core.utils.feature_status import feature_status
@@ -289,8 +295,7 @@ def load_pillars_from_yaml() -> Dict[str, Dict]:
         return DEFAULT_PILLARS
     
     try:
-        content = get_pillars_file().read_text()
-        data = yaml.safe_load(content)
+        data = config_snapshot.load_yaml(get_pillars_file())
         
         if not data or 'pillars' not in data:
             logger.warning("No pillars found in YAML, using defaults")
@@ -327,8 +332,7 @@ def load_priority_limits_from_yaml() -> Dict[str, int]:
         return DEFAULT_PRIORITY_LIMITS
     
     try:
-        content = get_pillars_file().read_text()
-        data = yaml.safe_load(content)
+        data = config_snapshot.load_yaml(get_pillars_file())
         
         if data and 'priority_limits' in data:
             return {
@@ -445,25 +449,17 @@ def active_tasks_for_priority_limits(tasks: List[Dict[str, Any]]) -> List[Dict[s
         if not task.get('completed') and task.get('source', 'tasks') == 'tasks'
     ]
 
-def generate_task_id() -> str:
-    """Generate a unique task ID in format: task-YYYYMMDD-XXX
-
-    The XXX counter is globally unique across all dates to avoid
-    duplicate short references (last 3 digits used for quick user input).
-
-    Only scans user content folders (not documentation or system examples)
-    to avoid counting example IDs from docs as real tasks.
-    """
-    date_str = _tz_now().strftime('%Y%m%d')
+# Only these folders contain real task references (not docs/examples).
+_TASK_ID_FOLDERS = (
+    '00-Inbox', '01-Quarter_Goals', '02-Week_Priorities',
+    '03-Tasks', '04-Projects', '05-Areas',
+)
 
-    # Only scan folders that contain real task references (not docs/examples)
-    task_folders = [
-        '00-Inbox', '01-Quarter_Goals', '02-Week_Priorities',
-        '03-Tasks', '04-Projects', '05-Areas',
-    ]
 
+def _scan_task_sequence() -> int:
+    """Return the highest task sequence by reading every task folder."""
     existing_ids = []
-    for folder_name in task_folders:
+    for folder_name in _TASK_ID_FOLDERS:
         folder = BASE_DIR / folder_name
         if not folder.exists():
             continue
@@ -475,9 +471,27 @@ def generate_task_id() -> str:
                 existing_ids.extend([int(m) for m in matches])
             except Exception:
                 continue
+    return max(existing_ids, default=0)
+
+
+def generate_task_id() -> str:
+    """Generate a unique task ID in format: task-YYYYMMDD-XXX
+
+    The XXX counter is globally unique across all dates to avoid
+    duplicate short references (last 3 digits used for quick user input).
+
+    Only counts user content folders (not documentation or system examples)
+    to avoid counting example IDs from docs as real tasks. The persistent
+    task-anchor index answers this from its monotonic counter; a full folder
+    scan is the fallback when the index cannot be opened.
+    """
+    date_str = _tz_now().strftime('%Y%m%d')
 
-    # Get next available number (globally unique)
-    next_num = max(existing_ids, default=0) + 1
+    try:
+        next_num = task_anchors.allocate_sequence(BASE_DIR, _TASK_ID_FOLDERS)
+    except (sqlite3.Error, OSError) as error:
+        logger.warning("Task anchor index unavailable, scanning vault: %s", error)
+        next_num = _scan_task_sequence() + 1
     return f"task-{date_str}-{next_num:03d}"
 
 def extract_task_id(line: str) -> Optional[str]:
@@ -688,8 +702,8 @@ def stamp_task_source_line(source: str, source_line: str,
         logger.warning("Could not stamp task source line in %s: %s", source_path, error)
         return {**result, 'reason': 'write_failed'}
 
-def find_task_by_id(task_id: str) -> List[Dict[str, Any]]:
-    """Find all instances of a task ID across all markdown files"""
+def _scan_task_instances(task_id: str) -> List[Dict[str, Any]]:
+    """Find task instances by reading every markdown file in the vault."""
     instances = []
     # Anchor on a digit boundary: a plain substring test lets task-...-100
     # match inside task-...-1000 and update the wrong row.
@@ -719,6 +733,45 @@ def find_task_by_id(task_id: str) -> List[Dict[str, Any]]:
     return instances
 
 
+def _indexed_task_instance(instance: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'file': instance['file'],
+        'line_number': instance['line_number'],
+        'line_content': instance['line_content'],
+        'title': _task_title_from_line(instance['line_content']).split('|', 1)[0].strip(),
+        'completed': instance['completed'],
+    }
+
+
+def find_task_by_id(task_id: str) -> List[Dict[str, Any]]:
+    """Find all instances of a task ID across all markdown files"""
+    return find_tasks_by_ids([task_id])[task_id]
+
+
+def find_tasks_by_ids(task_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Find every instance of several task IDs with one index reconcile."""
+    canonical = [
+        task_id for task_id in task_ids
+        if task_anchors.is_canonical_task_id(task_id)
+    ]
+    found: Dict[str, List[Dict[str, Any]]] = {}
+    try:
+        indexed = task_anchors.find_many(BASE_DIR, canonical) if canonical else {}
+    except (sqlite3.Error, OSError) as error:
+        logger.warning("Task anchor index unavailable, scanning vault: %s", error)
+        indexed = None
+    for task_id in task_ids:
+        if task_id in found:
+            continue
+        if indexed is None or task_id not in indexed:
+            found[task_id] = _scan_task_instances(task_id)
+        else:
+            found[task_id] = [
+                _indexed_task_instance(instance) for instance in indexed[task_id]
+            ]
+    return found
+
+
 def reusable_source_task_id(source: str, source_line: str) -> Optional[str]:
     """Reuse a legacy source-only anchor when it has no canonical task yet."""
     source_path = _source_page_path(source)
@@ -756,6 +809,81 @@ def reusable_source_task_id(source: str, source_line: str) -> Optional[str]:
         return None
     return task_id
 
+def _task_status_line(
+    old_line: str, task_id: str, completed: bool, completion_timestamp: str
+) -> str:
+    """Return a task line with its checkbox and completion stamp normalized."""
+    if completed:
+        new_line = old_line.replace('- [ ]', '- [x]')
+    else:
+        # Uncompleting: change checkbox and remove timestamp
+        new_line = old_line.replace('- [x]', '- [ ]')
+    new_line = re.sub(r'\s*✅\s*\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}', '', new_line)
+    task_id_match = re.search(r'\^' + re.escape(task_id) + r'(?!\d)', new_line)
+    if task_id_match:
+        without_anchor = (
+            new_line[:task_id_match.start()] + new_line[task_id_match.end():]
+        ).rstrip()
+        if completed:
+            new_line = f'{without_anchor} ✅ {completion_timestamp} ^{task_id}'
+        else:
+            new_line = f'{without_anchor} ^{task_id}'
+    return new_line
+
+
+def _atomic_write_text(path: Path, content: str) -> None:
+    """Replace a vault file in one rename while preserving its file mode."""
+    existing_mode = stat.S_IMODE(path.stat().st_mode)
+    descriptor, temporary_name = tempfile.mkstemp(
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+        dir=path.parent,
+    )
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8", newline="") as handle:
+            handle.write(content)
+        os.chmod(temporary_name, existing_mode)
+        os.replace(temporary_name, path)
+    except BaseException:
+        try:
+            os.unlink(temporary_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _task_status_result(
+    task_id: str,
+    completed: bool,
+    completion_timestamp: str,
+    instances: List[Dict[str, Any]],
+    updated_files: List[Dict[str, Any]],
+    failed_files: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    result = {
+        'success': len(failed_files) == 0,
+        'task_id': task_id,
+        'title': instances[0]['title'] if instances else '',
+        'status': 'completed' if completed else 'not_completed',
+        'completed_at': completion_timestamp if completed else None,
+        'updated_files': updated_files,
+        'instances_found': len(instances)
+    }
+
+    if failed_files:
+        failures = '; '.join(
+            f"{failure['file']}: {failure['error']}"
+            for failure in failed_files
+        )
+        result['failed_files'] = failed_files
+        result['error'] = (
+            f"task updated in {len(updated_files)} of {len(instances)} locations; "
+            f"failures: {failures}"
+        )
+
+    return result
+
+
 def update_task_status_everywhere(task_id: str, completed: bool) -> Dict[str, Any]:
     """Update task status for all instances of a task ID across all files"""
     instances = find_task_by_id(task_id)
@@ -780,29 +908,17 @@ def update_task_status_everywhere(task_id: str, completed: bool) -> Dict[str, An
             old_line = lines[line_idx]
             
             # Update checkbox and normalize completion metadata around the anchor.
-            if completed:
-                new_line = old_line.replace('- [ ]', '- [x]')
-                new_line = re.sub(r'\s*✅\s*\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}', '', new_line)
-                task_id_match = re.search(r'\^' + re.escape(task_id) + r'(?!\d)', new_line)
-                if task_id_match:
-                    without_anchor = (
-                        new_line[:task_id_match.start()] + new_line[task_id_match.end():]
-                    ).rstrip()
-                    new_line = f'{without_anchor} ✅ {completion_timestamp} ^{task_id}'
-            else:
-                # Uncompleting: change checkbox and remove timestamp
-                new_line = old_line.replace('- [x]', '- [ ]')
-                new_line = re.sub(r'\s*✅\s*\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}', '', new_line)
-                task_id_match = re.search(r'\^' + re.escape(task_id) + r'(?!\d)', new_line)
-                if task_id_match:
-                    without_anchor = (
-                        new_line[:task_id_match.start()] + new_line[task_id_match.end():]
-                    ).rstrip()
-                    new_line = f'{without_anchor} ^{task_id}'
+            new_line = _task_status_line(
+                old_line, task_id, completed, completion_timestamp
+            )
             
             if new_line != old_line:
                 lines[line_idx] = new_line
-                filepath.write_text('\n'.join(lines))
+                new_content = '\n'.join(lines)
+                filepath.write_text(new_content)
+                _remember_tasks_write(
+                    filepath, content, new_content, {instance['line_number']}
+                )
                 updated_files.append({
                     'file': str(filepath),
                     'line': instance['line_number']
@@ -815,28 +931,93 @@ def update_task_status_everywhere(task_id: str, completed: bool) -> Dict[str, An
             })
             continue
 
-    result = {
-        'success': len(failed_files) == 0,
-        'task_id': task_id,
-        'title': instances[0]['title'] if instances else '',
-        'status': 'completed' if completed else 'not_completed',
-        'completed_at': completion_timestamp if completed else None,
-        'updated_files': updated_files,
-        'instances_found': len(instances)
-    }
+    return _task_status_result(
+        task_id, completed, completion_timestamp,
+        instances, updated_files, failed_files,
+    )
 
-    if failed_files:
-        failures = '; '.join(
-            f"{failure['file']}: {failure['error']}"
-            for failure in failed_files
-        )
-        result['failed_files'] = failed_files
-        result['error'] = (
-            f"task updated in {len(updated_files)} of {len(instances)} locations; "
-            f"failures: {failures}"
-        )
 
-    return result
+def update_task_statuses(updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Apply many task status changes with one read-modify-write per file.
+
+    Each update is ``{'task_id': str, 'completed': bool}``; a later entry for
+    the same ID wins. Edits are grouped by file, applied in one pass over that
+    file's lines, and written back once with an atomic rename. Each task gets
+    the same result shape as ``update_task_status_everywhere``.
+    """
+    desired: Dict[str, bool] = {}
+    for update in updates:
+        desired[update['task_id']] = bool(update['completed'])
+
+    completion_timestamp = _tz_now().strftime('%Y-%m-%d %H:%M')
+    instances_by_task = find_tasks_by_ids(list(desired))
+
+    edits_by_file: Dict[str, List[tuple[int, str]]] = {}
+    for task_id, instances in instances_by_task.items():
+        for instance in instances:
+            edits_by_file.setdefault(instance['file'], []).append(
+                (instance['line_number'], task_id)
+            )
+
+    updated_by_task: Dict[str, List[Dict[str, Any]]] = {task_id: [] for task_id in desired}
+    failed_by_task: Dict[str, List[Dict[str, Any]]] = {task_id: [] for task_id in desired}
+    files_written = 0
+    for file_name, edits in sorted(edits_by_file.items()):
+        filepath = Path(file_name)
+        try:
+            content = filepath.read_text(encoding='utf-8')
+            lines = content.split('\n')
+            changed = []
+            for line_number, task_id in sorted(edits):
+                old_line = lines[line_number - 1]
+                new_line = _task_status_line(
+                    old_line, task_id, desired[task_id], completion_timestamp
+                )
+                if new_line != old_line:
+                    lines[line_number - 1] = new_line
+                    changed.append((line_number, task_id))
+            if changed:
+                new_content = '\n'.join(lines)
+                _atomic_write_text(filepath, new_content)
+                _remember_tasks_write(
+                    filepath, content, new_content,
+                    {line_number for line_number, _task_id in changed},
+                )
+                files_written += 1
+            for line_number, task_id in changed:
+                updated_by_task[task_id].append({
+                    'file': str(filepath),
+                    'line': line_number,
+                })
+        except Exception as e:
+            logger.error(f"Error updating {file_name}: {e}")
+            for _line_number, task_id in edits:
+                failure = {'file': file_name, 'error': str(e)}
+                if failure not in failed_by_task[task_id]:
+                    failed_by_task[task_id].append(failure)
+
+    results = []
+    for task_id, completed in desired.items():
+        instances = instances_by_task[task_id]
+        if not instances:
+            results.append({
+                'success': False,
+                'task_id': task_id,
+                'error': f'No task found with ID: {task_id}'
+            })
+            continue
+        results.append(_task_status_result(
+            task_id, completed, completion_timestamp, instances,
+            updated_by_task[task_id], failed_by_task[task_id],
+        ))
+
+    return {
+        'success': all(result['success'] for result in results),
+        'results': results,
+        'updated_count': sum(1 for result in results if result['success']),
+        'failed_count': sum(1 for result in results if not result['success']),
+        'files_written': files_written,
+    }
 
 def get_pillar_ids() -> List[str]:
     """Get list of valid pillar IDs"""
@@ -1062,24 +1243,34 @@ def sync_task_refs_for_page(page_path: str) -> Dict[str, Any]:
 
 def propagate_task_status_to_refs(task_title: str, completed: bool) -> List[str]:
     """Update task status in all referenced pages' Related Tasks sections"""
+    return propagate_task_statuses_to_refs([(task_title, completed)])
+
+
+def propagate_task_statuses_to_refs(changes: List[tuple[str, bool]]) -> List[str]:
+    """Re-sync each page referenced by the changed tasks exactly once."""
     updated_pages = []
     
-    # Find all pages that might reference this task
-    # Look for WikiLinks in the task line
-    if not get_tasks_file().exists():
+    # Find all pages that might reference these tasks
+    # Look for WikiLinks in the task lines
+    if not changes or not get_tasks_file().exists():
         return updated_pages
     
-    content = get_tasks_file().read_text()
+    lines = get_tasks_file().read_text().split('\n')
     
-    # Find the task line
-    for line in content.split('\n'):
-        if task_title.lower() in line.lower() and ('- [ ]' in line or '- [x]' in line):
-            file_refs = extract_file_refs_from_task(line)
-            for ref in file_refs:
-                result = sync_task_refs_for_page(ref)
-                if result['success']:
-                    updated_pages.append(ref)
-            break
+    refs: List[str] = []
+    for task_title, _completed in changes:
+        # Find the task line
+        for line in lines:
+            if task_title.lower() in line.lower() and ('- [ ]' in line or '- [x]' in line):
+                for ref in extract_file_refs_from_task(line):
+                    if ref not in refs:
+                        refs.append(ref)
+                break
+
+    for ref in refs:
+        result = sync_task_refs_for_page(ref)
+        if result['success']:
+            updated_pages.append(ref)
     
     return updated_pages
 
@@ -1202,20 +1393,24 @@ def _entity_index_kwargs() -> Dict[str, Path]:
 
 def build_people_index_data() -> Dict[str, Any]:
     """Reconcile SQLite and return its People_Index compatibility export."""
-    return entity_index.people_index_data(
+    index = entity_index.people_index_data(
         BASE_DIR,
         force=True,
         **_entity_index_kwargs(),
     )
+    entity_index.flush_json_exports()
+    return index
 
 
 def build_company_index_data() -> Dict[str, Any]:
     """Reconcile SQLite and return its Company_Index compatibility export."""
-    return entity_index.company_index_data(
+    index = entity_index.company_index_data(
         BASE_DIR,
         force=True,
         **_entity_index_kwargs(),
     )
+    entity_index.flush_json_exports()
+    return index
 
 
 def find_company_by_domain(domain: str) -> Dict[str, Any] | None:
@@ -1485,7 +1680,7 @@ def _profile_email_domains() -> set[str]:
     if yaml is None or not USER_PROFILE_FILE.exists():
         return set()
     try:
-        profile = yaml.safe_load(USER_PROFILE_FILE.read_text()) or {}
+        profile = config_snapshot.load_yaml(USER_PROFILE_FILE) or {}
     except (OSError, yaml.YAMLError):
         return set()
     configured = profile.get('email_domain') or ''
@@ -2695,13 +2890,123 @@ def infer_goal_link(priority_title: str, priority_pillar: str,
 # TASK PARSING AND MANAGEMENT
 # ============================================================================
 
+# Parsed task lists keyed by file path. An entry is reused while the file's
+# (size, mtime_ns) still match; an entry verified too soon after the mtime to
+# be settled is re-read and compared before reuse.
+_PARSED_TASKS_CACHE: Dict[str, Dict[str, Any]] = {}
+
+
+def clear_parsed_tasks_cache() -> None:
+    """Forget every cached parse, primarily for tests and run boundaries."""
+    _PARSED_TASKS_CACHE.clear()
+
+
+def _cache_parsed_tasks(
+    filepath: Path,
+    content: str,
+    tasks: List[Dict[str, Any]],
+    verified_ns: int,
+) -> None:
+    try:
+        file_stat = filepath.stat()
+    except OSError:
+        _PARSED_TASKS_CACHE.pop(str(filepath), None)
+        return
+    _PARSED_TASKS_CACHE[str(filepath)] = {
+        'size': file_stat.st_size,
+        'mtime_ns': file_stat.st_mtime_ns,
+        'pillars': PILLARS,
+        'content_hash': hash(content),
+        'verified_ns': verified_ns,
+        'tasks': tasks,
+    }
+
+
+def _remember_tasks_write(
+    filepath: Path,
+    old_content: str,
+    new_content: str,
+    changed_lines: Optional[set] = None,
+) -> None:
+    """Carry a cached parse across a write this server just made.
+
+    Checkbox-only edits (``changed_lines``) patch the affected tasks in place
+    when the cache was built from ``old_content``; any other write re-parses
+    ``new_content`` from memory instead of re-reading the file.
+    """
+    entry = _PARSED_TASKS_CACHE.get(str(filepath))
+    if entry is None:
+        return
+    verified_ns = time.time_ns()
+    tasks = None
+    if (
+        changed_lines is not None
+        and entry['pillars'] is PILLARS
+        and entry['content_hash'] == hash(old_content)
+    ):
+        new_lines = new_content.split('\n')
+        by_line = {task['line_number']: task for task in entry['tasks']}
+        tasks = []
+        for task in entry['tasks']:
+            if task['line_number'] not in changed_lines:
+                tasks.append(task)
+                continue
+            line = new_lines[task['line_number'] - 1]
+            stripped = line.strip()
+            if _task_title_from_line(line) != task['raw_title'] or not (
+                stripped.startswith('- [ ]') or stripped.startswith('- [x]')
+            ):
+                tasks = None
+                break
+            completed = stripped.startswith('- [x]')
+            tasks.append({
+                **task,
+                'completed': completed,
+                'status': 'd' if completed else 'n',
+            })
+        if tasks is not None and any(
+            line_number not in by_line for line_number in changed_lines
+        ):
+            tasks = None
+    if tasks is None:
+        tasks = _parse_tasks_content(new_content, filepath)
+    _cache_parsed_tasks(filepath, new_content, tasks, verified_ns)
+
+
 def parse_tasks_file(filepath: Path) -> List[Dict[str, Any]]:
     """Parse tasks from a markdown file"""
-    tasks = []
     if not filepath.exists():
-        return tasks
-    
-    content = filepath.read_text()
+        return []
+
+    verified_ns = time.time_ns()
+    entry = _PARSED_TASKS_CACHE.get(str(filepath))
+    content = None
+    if entry is not None and entry['pillars'] is PILLARS:
+        try:
+            file_stat = filepath.stat()
+        except OSError:
+            file_stat = None
+        if file_stat is not None and (
+            (file_stat.st_size, file_stat.st_mtime_ns)
+            == (entry['size'], entry['mtime_ns'])
+        ):
+            if config_snapshot.is_settled(entry['mtime_ns'], entry['verified_ns']):
+                return [dict(task) for task in entry['tasks']]
+            content = filepath.read_text()
+            if hash(content) == entry['content_hash']:
+                entry['verified_ns'] = verified_ns
+                return [dict(task) for task in entry['tasks']]
+
+    if content is None:
+        content = filepath.read_text()
+    tasks = _parse_tasks_content(content, filepath)
+    _cache_parsed_tasks(filepath, content, tasks, verified_ns)
+    return [dict(task) for task in tasks]
+
+
+def _parse_tasks_content(content: str, filepath: Path) -> List[Dict[str, Any]]:
+    """Parse task lines from already-loaded markdown content."""
+    tasks = []
     lines = content.split('\n')
     
     current_section = None
@@ -3774,6 +4079,29 @@ async def handle_list_tools() -> list[types.Tool]:
                 "required": ["status"]
             }
         ),
+        types.Tool(
+            name="update_task_statuses",
+            description="Update the status of many tasks at once by task ID. Edits are grouped so each affected file (03-Tasks/Tasks.md, meeting notes, person pages) is rewritten once.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "updates": {
+                        "type": "array",
+                        "minItems": 1,
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "task_id": {"type": "string", "description": "Unique task ID (e.g., task-20260128-001)"},
+                                "status": {"type": "string", "enum": ["n", "s", "b", "d"], "description": "New status (d=done)"}
+                            },
+                            "required": ["task_id", "status"]
+                        },
+                        "description": "Task status changes to apply together"
+                    }
+                },
+                "required": ["updates"]
+            }
+        ),
         types.Tool(
             name="confirm_goal_link",
             description="Confirm or clear a tentative quarterly-goal link on a canonical task.",
@@ -4261,7 +4589,7 @@ async def handle_list_tools() -> list[types.Tool]:
 # Tools that write to vault files and should trigger search index refresh
 WRITE_TOOLS = {
     "confirm_relationship", "dismiss_relationship",
-    "create_task", "update_task_status", "confirm_goal_link", "create_company", "refresh_company",
+    "create_task", "update_task_status", "update_task_statuses", "confirm_goal_link", "create_company", "refresh_company",
     "sync_external_tasks",
     "sync_task_refs", "create_quarterly_goal", "update_goal_progress",
     "create_weekly_priority", "complete_weekly_priority",
@@ -4322,6 +4650,7 @@ async def handle_call_tool(
                 "list_tasks": "Task listing failed",
                 "create_task": "Task creation failed",
                 "update_task_status": "Task status update failed",
+                "update_task_statuses": "Bulk task status update failed",
                 "sync_external_tasks": "External task sync failed",
                 "record_external_task_mapping": "External task mapping failed",
                 "get_system_status": "System status check failed",
@@ -4715,6 +5044,7 @@ async def _handle_call_tool_inner(
             new_content = '\n'.join(lines)
         
         get_tasks_file().write_text(new_content)
+        _remember_tasks_write(get_tasks_file(), content, new_content)
 
         if stamp_source_line and source:
             try:
@@ -4803,7 +5133,8 @@ async def _handle_call_tool_inner(
                 "error": "task not found",
             }))]
 
-        lines = tasks_file.read_text().split("\n")
+        content = tasks_file.read_text()
+        lines = content.split("\n")
         task_anchor = re.compile(rf"\^{re.escape(task_id)}(?![A-Za-z0-9_-])")
         task_index = next(
             (
@@ -4903,7 +5234,9 @@ async def _handle_call_tool_inner(
                 "goal_id": goal_id,
             }
 
-        tasks_file.write_text("\n".join(lines))
+        new_content = "\n".join(lines)
+        tasks_file.write_text(new_content)
+        _remember_tasks_write(tasks_file, content, new_content)
         return [types.TextContent(type="text", text=json.dumps(result))]
 
     elif name == "update_task_status":
@@ -5033,6 +5366,31 @@ async def _handle_call_tool_inner(
                 "error": "Must provide either task_id or task_title"
             }, indent=2))]
     
+    elif name == "update_task_statuses":
+        requested = [
+            {'task_id': update['task_id'], 'completed': update['status'] == 'd'}
+            for update in arguments['updates']
+        ]
+        result = update_task_statuses(requested)
+
+        synced = [
+            (task_result['title'], task_result['status'] == 'completed')
+            for task_result in result['results']
+            if task_result['success']
+        ]
+        result['related_tasks_synced'] = propagate_task_statuses_to_refs(synced)
+
+        for task_result in result['results']:
+            if task_result['success'] and task_result['status'] == 'completed':
+                surface_analytics_attempt(
+                    task_result,
+                    _fire_analytics_event,
+                    'task_completed',
+                    {'method': 'bulk'},
+                )
+
+        return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
+
     elif name == "sync_external_tasks":
         from core.integrations import task_sync
 
@@ -5562,6 +5920,7 @@ async def _handle_call_tool_inner(
             new_content = content
         
         priorities_file.write_text(new_content)
+        _remember_tasks_write(priorities_file, content, new_content)
         
         result = {
             "success": True,
@@ -6238,6 +6597,22 @@ async def _main():
     logger.info(f"Vault path: {BASE_DIR}")
     logger.info(f"Tasks file: {get_tasks_file()}")
     logger.info(f"Pillars loaded: {list(PILLARS.keys())}")
+    if HAS_ANALYTICS:
+        from core.mcp.analytics_helper import use_outbox
+
+        use_outbox()
+    entity_index.keep_connections_open()
+    entity_index.defer_json_exports()
+    entity_index.schedule_integrity_checks(
+        [entity_index.database_path(BASE_DIR), task_anchors.database_path(BASE_DIR)]
+    )
+    index_kwargs = _entity_index_kwargs()
+    if entity_index.watch(
+        BASE_DIR,
+        people_dir=index_kwargs['people_dir'],
+        companies_dir=index_kwargs['companies_dir'],
+    ):
+        logger.info("Entity index reconciles from filesystem change events")
     
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await app.run(
@@ -35,7 +35,9 @@ from __future__ import annotations
 
 import fnmatch
 import posixpath
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable
 
 CONTRACT_VERSION = 2
@@ -923,6 +925,85 @@ def _normalize(path: str) -> str:
     return candidate
 
 
+class _CompiledContract:
+    """``HARD_DENY_PATTERNS`` and ``RULES`` compiled for per-path lookups.
+
+    Deny globs become two anchored alternations: every pattern against the
+    full path, and the slash-free ones against a single segment. Ownership
+    rules become prefix tables walked from a path's parent upward. Both
+    per-directory answers are memoized, so a 100k-path walk pays for each
+    directory once rather than each pattern or rule per path.
+    """
+
+    def __init__(self, patterns: tuple[str, ...], rules: tuple[Rule, ...]):
+        self.patterns = patterns
+        self.rules = rules
+        folded = [pattern.lower() for pattern in patterns]
+        self._full = re.compile("|".join(fnmatch.translate(p) for p in folded))
+        segment_patterns = [p for p in folded if "/" not in p]
+        self._segment = (
+            re.compile("|".join(fnmatch.translate(p) for p in segment_patterns))
+            if segment_patterns
+            else None
+        )
+        # First rule wins on a tie, exactly as the linear scan resolved it.
+        self._files: dict[str, Rule] = {}
+        self._dirs: dict[str, Rule] = {}
+        for rule in rules:
+            table = self._files if rule.kind == "file" else self._dirs
+            table.setdefault(rule.path, rule)
+        self.segment_denied = lru_cache(maxsize=65536)(self._segment_denied)
+        self.directory_denied = lru_cache(maxsize=65536)(self._directory_denied)
+        self.directory_rule = lru_cache(maxsize=65536)(self._directory_rule)
+
+    def denied(self, folded: str) -> bool:
+        if self._full.match(folded):
+            return True
+        parent, _, name = folded.rpartition("/")
+        return self.segment_denied(name) or (
+            bool(parent) and self.directory_denied(parent)
+        )
+
+    def _segment_denied(self, segment: str) -> bool:
+        return self._segment is not None and self._segment.match(segment) is not None
+
+    def _directory_denied(self, directory: str) -> bool:
+        parent, _, name = directory.rpartition("/")
+        return self.segment_denied(name) or (
+            bool(parent) and self.directory_denied(parent)
+        )
+
+    def rule_for(self, candidate: str) -> Rule | None:
+        rule = self._files.get(candidate) or self._dirs.get(candidate)
+        if rule is not None:
+            return rule
+        parent = candidate.rpartition("/")[0]
+        return self.directory_rule(parent) if parent else None
+
+    def _directory_rule(self, directory: str) -> Rule | None:
+        rule = self._dirs.get(directory)
+        if rule is not None:
+            return rule
+        parent = directory.rpartition("/")[0]
+        return self.directory_rule(parent) if parent else None
+
+
+_COMPILED: _CompiledContract | None = None
+
+
+def _compiled() -> _CompiledContract:
+    """Return the compiled contract, rebuilding it if the tables were replaced."""
+    global _COMPILED
+    compiled = _COMPILED
+    if (
+        compiled is None
+        or compiled.patterns is not HARD_DENY_PATTERNS
+        or compiled.rules is not RULES
+    ):
+        compiled = _COMPILED = _CompiledContract(HARD_DENY_PATTERNS, RULES)
+    return compiled
+
+
 def is_denied(path: str) -> bool:
     """True when the hard-deny list vetoes any write to ``path``.
 
@@ -930,17 +1011,7 @@ def is_denied(path: str) -> bool:
     case-insensitive, so ``MyKey.PEM`` is physically the same secret class as
     ``*.pem`` and must not slip through on spelling.
     """
-    candidate = _normalize(path).lower()
-    segments = candidate.split("/")
-    for raw_pattern in HARD_DENY_PATTERNS:
-        pattern = raw_pattern.lower()
-        if fnmatch.fnmatch(candidate, pattern):
-            return True
-        if "/" not in pattern and any(
-            fnmatch.fnmatch(segment, pattern) for segment in segments
-        ):
-            return True
-    return False
+    return _compiled().denied(_normalize(path).lower())
 
 
 def resolve(path: str) -> Resolution:
@@ -951,21 +1022,11 @@ def resolve(path: str) -> Resolution:
     :class:`ContractViolation` — the completeness gate depends on that.
     """
     candidate = _normalize(path)
-    denied = is_denied(candidate)
-
-    best: Rule | None = None
-    best_specificity = -1
-    for rule in RULES:
-        if rule.kind == "file":
-            if candidate == rule.path:
-                # Exact file match always wins outright.
-                return Resolution(candidate, rule.ownership, rule.rule_id, denied)
-        else:
-            if candidate == rule.path or candidate.startswith(rule.path + "/"):
-                specificity = rule.path.count("/") + 1
-                if specificity > best_specificity:
-                    best = rule
-                    best_specificity = specificity
+    compiled = _compiled()
+    denied = compiled.denied(candidate.lower())
+    # An exact file rule beats any directory; among directories the deepest
+    # prefix wins, which is the first one met walking up from the path.
+    best = compiled.rule_for(candidate)
     if best is None:
         if denied:
             # Hard-denied paths without a dedicated rule (e.g. .env.local,
@@ -6,9 +6,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Iterable
 
-import yaml
-
 from core.paths import LEGACY_MEETINGS_DIR, TRACKED_MEETINGS_DIR, USER_PROFILE_FILE
+from core.utils import config_snapshot
 from core.utils.nudge_calendar import is_dex_nudge_event
 
 from .models import NormalizedAttendee, NormalizedCalendarEvent
@@ -21,8 +20,7 @@ class CalendarIngestError(RuntimeError):
 def _load_profile() -> dict:
     if not USER_PROFILE_FILE.exists():
         return {}
-    with USER_PROFILE_FILE.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
+    return config_snapshot.load_yaml(USER_PROFILE_FILE) or {}
 
 
 def get_configured_work_calendar() -> str:
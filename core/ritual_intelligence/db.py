@@ -10,6 +10,13 @@ from pathlib import Path
 from typing import Iterator
 
 from core.paths import DEX_RUNTIME_DIR, RITUAL_INTELLIGENCE_DB_FILE, SYSTEM_DIR
+from core.utils.sqlite_integrity import DEFAULT_CHECK_INTERVAL_SECONDS, VerifiedFiles
+
+# Callers open and close their own connections and the hosts are one-shot
+# (the CLI, doctor), so there is no pool or background checker here. Instead a
+# pass expires on the background checker's interval: a process that lives
+# longer re-runs quick_check on its next open.
+_VERIFIED = VerifiedFiles(max_age_seconds=DEFAULT_CHECK_INTERVAL_SECONDS)
 
 
 class RitualIntelligenceError(RuntimeError):
@@ -87,7 +94,15 @@ def connect(*, create: bool = True) -> sqlite3.Connection:
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
     conn.execute("PRAGMA journal_mode = WAL")
-    _validate_database(conn)
+    # quick_check reads every page; verify each database file once per
+    # process, and again once the last pass is older than the check interval.
+    if _VERIFIED.needs_check(db_path):
+        try:
+            _validate_database(conn)
+        except DatabaseCorruptError:
+            conn.close()
+            raise
+        _VERIFIED.record(db_path)
     return conn
 
 
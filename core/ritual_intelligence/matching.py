@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from difflib import SequenceMatcher
+from functools import lru_cache
 
 from .models import TranscriptArtifact
 
@@ -11,7 +12,13 @@ from .models import TranscriptArtifact
 def _title_similarity(left: str, right: str) -> float:
     if not left or not right:
         return 0.0
-    return SequenceMatcher(None, left.lower(), right.lower()).ratio()
+    return _folded_title_similarity(left.lower(), right.lower())
+
+
+@lru_cache(maxsize=16384)
+def _folded_title_similarity(left: str, right: str) -> float:
+    # Recurring meetings repeat the same few titles across a reconcile backlog.
+    return SequenceMatcher(None, left, right).ratio()
 
 
 def _time_similarity(transcript: TranscriptArtifact, occurrence: dict) -> float:
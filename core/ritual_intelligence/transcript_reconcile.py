@@ -3,98 +3,175 @@
 from __future__ import annotations
 
 import json
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 
 from .db import transaction, utc_now
 from .matching import occurrence_match_confidence
 from .models import NormalizedAttendee, TranscriptArtifact
 
+_TRANSCRIPT_COLUMNS = """
+    id, source, source_transcript_id, title, started_at, ended_at,
+    source_event_id, attendees_json
+"""
+_WINDOW = timedelta(hours=6)
+_UNDATED_CANDIDATE_LIMIT = 20
 
-def _load_occurrence_contacts(conn, occurrence_id: str) -> list[dict]:
+
+def _transcript_from_row(row) -> TranscriptArtifact:
+    """Build the matching view of a transcript; bodies are never loaded here."""
+    return TranscriptArtifact(
+        transcript_id=row["id"],
+        source=row["source"],
+        source_transcript_id=row["source_transcript_id"],
+        title=row["title"],
+        started_at=datetime.fromisoformat(row["started_at"]) if row["started_at"] else None,
+        ended_at=datetime.fromisoformat(row["ended_at"]) if row["ended_at"] else None,
+        source_event_id=row["source_event_id"],
+        attendees=[
+            NormalizedAttendee(
+                name=entry.get("name"),
+                email=entry.get("email"),
+                status=entry.get("status"),
+                attendee_type=entry.get("attendee_type"),
+            )
+            for entry in json.loads(row["attendees_json"] or "[]")
+        ],
+    )
+
+
+def _window(started_at: str) -> tuple[str, str]:
+    parsed = datetime.fromisoformat(started_at)
+    return (parsed - _WINDOW).isoformat(), (parsed + _WINDOW).isoformat()
+
+
+def _merged_windows(windows: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    merged: list[tuple[str, str]] = []
+    for earliest, latest in sorted(windows):
+        if merged and earliest <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], latest))
+        else:
+            merged.append((earliest, latest))
+    return merged
+
+
+def _windowed_occurrences(conn, windows: list[tuple[str, str]]) -> list[dict]:
+    """Load every occurrence inside any window in one query, by ``starts_at``.
+
+    Windows are merged first so each occurrence row is returned once; callers
+    slice the sorted result per transcript.
+    """
+    merged = _merged_windows(windows)
+    if not merged:
+        return []
     rows = conn.execute(
         """
-        SELECT attendee_name, attendee_email, attendee_type
-        FROM occurrence_contacts
-        WHERE occurrence_id = ?
+        SELECT o.*, se.source_event_id
+        FROM json_each(?) w
+        JOIN occurrences o
+          ON o.starts_at BETWEEN json_extract(w.value, '$[0]') AND json_extract(w.value, '$[1]')
+        LEFT JOIN source_events se ON se.occurrence_id = o.id AND se.provider = o.provider
+        ORDER BY o.starts_at ASC
         """,
-        (occurrence_id,),
+        (json.dumps(merged),),
     ).fetchall()
     return [dict(row) for row in rows]
 
 
-def _candidate_occurrences(conn, transcript_row: dict) -> list[dict]:
-    if transcript_row.get("started_at"):
-        started_at = datetime.fromisoformat(transcript_row["started_at"])
-        earliest = (started_at - timedelta(hours=6)).isoformat()
-        latest = (started_at + timedelta(hours=6)).isoformat()
-        rows = conn.execute(
-            """
-            SELECT o.*, se.source_event_id
-            FROM occurrences o
-            LEFT JOIN source_events se ON se.occurrence_id = o.id AND se.provider = o.provider
-            WHERE o.starts_at BETWEEN ? AND ?
-            ORDER BY o.starts_at ASC
-            """,
-            (earliest, latest),
-        ).fetchall()
-    else:
-        rows = conn.execute(
-            """
-            SELECT o.*, se.source_event_id
-            FROM occurrences o
-            LEFT JOIN source_events se ON se.occurrence_id = o.id AND se.provider = o.provider
-            ORDER BY o.starts_at DESC
-            LIMIT 20
-            """
-        ).fetchall()
+def _latest_occurrences(conn) -> list[dict]:
+    rows = conn.execute(
+        """
+        SELECT o.*, se.source_event_id
+        FROM occurrences o
+        LEFT JOIN source_events se ON se.occurrence_id = o.id AND se.provider = o.provider
+        ORDER BY o.starts_at DESC
+        LIMIT ?
+        """,
+        (_UNDATED_CANDIDATE_LIMIT,),
+    ).fetchall()
     return [dict(row) for row in rows]
 
 
+def _negative_matches(conn) -> set[tuple[str, str]]:
+    rows = conn.execute(
+        """
+        SELECT n.transcript_id, n.occurrence_id
+        FROM transcript_negative_matches n
+        JOIN transcripts t ON t.id = n.transcript_id
+        WHERE t.status IN ('unmatched', 'ambiguous')
+        """
+    ).fetchall()
+    return {(row[0], row[1]) for row in rows}
+
+
+def _contacts_by_occurrence(conn, occurrence_ids: set[str]) -> dict[str, list[dict]]:
+    contacts: dict[str, list[dict]] = {occurrence_id: [] for occurrence_id in occurrence_ids}
+    if not occurrence_ids:
+        return contacts
+    rows = conn.execute(
+        """
+        SELECT occurrence_id, attendee_name, attendee_email, attendee_type
+        FROM occurrence_contacts
+        WHERE occurrence_id IN (SELECT value FROM json_each(?))
+        """,
+        (json.dumps(sorted(occurrence_ids)),),
+    ).fetchall()
+    for row in rows:
+        contacts[row["occurrence_id"]].append(
+            {
+                "attendee_name": row["attendee_name"],
+                "attendee_email": row["attendee_email"],
+                "attendee_type": row["attendee_type"],
+            }
+        )
+    return contacts
+
+
 def reconcile_unmatched_transcripts() -> list[dict]:
+    """Match every unmatched or ambiguous transcript in a fixed number of reads.
+
+    Candidate occurrences, their contacts and the negative matches are each
+    loaded once for the whole backlog; per-transcript work is in memory.
+    """
     results: list[dict] = []
     with transaction(create=True) as conn:
         transcript_rows = conn.execute(
-            """
-            SELECT *
+            f"""
+            SELECT {_TRANSCRIPT_COLUMNS}
             FROM transcripts
             WHERE status IN ('unmatched', 'ambiguous')
             ORDER BY started_at DESC, created_at DESC
             """
         ).fetchall()
+        if not transcript_rows:
+            return results
+        windows = {
+            row["id"]: _window(row["started_at"]) for row in transcript_rows if row["started_at"]
+        }
+        windowed = _windowed_occurrences(conn, list(windows.values()))
+        window_starts = [occurrence["starts_at"] for occurrence in windowed]
+        latest = _latest_occurrences(conn) if len(windows) < len(transcript_rows) else []
+        negatives = _negative_matches(conn)
+        contacts = _contacts_by_occurrence(
+            conn, {occurrence["id"] for occurrence in (*windowed, *latest)}
+        )
+
         for transcript_row in transcript_rows:
-            transcript = TranscriptArtifact(
-                transcript_id=transcript_row["id"],
-                source=transcript_row["source"],
-                source_transcript_id=transcript_row["source_transcript_id"],
-                title=transcript_row["title"],
-                started_at=datetime.fromisoformat(transcript_row["started_at"]) if transcript_row["started_at"] else None,
-                ended_at=datetime.fromisoformat(transcript_row["ended_at"]) if transcript_row["ended_at"] else None,
-                source_event_id=transcript_row["source_event_id"],
-                attendees=[
-                    NormalizedAttendee(
-                        name=entry.get("name"),
-                        email=entry.get("email"),
-                        status=entry.get("status"),
-                        attendee_type=entry.get("attendee_type"),
-                    )
-                    for entry in json.loads(transcript_row["attendees_json"] or "[]")
-                ],
-                raw_text=transcript_row["raw_text"],
-            )
+            transcript = _transcript_from_row(transcript_row)
+            window = windows.get(transcript.transcript_id)
+            if window is None:
+                pool = latest
+            else:
+                pool = windowed[
+                    bisect_left(window_starts, window[0]) : bisect_right(window_starts, window[1])
+                ]
             candidates = []
-            for occurrence in _candidate_occurrences(conn, dict(transcript_row)):
-                negative = conn.execute(
-                    """
-                    SELECT 1
-                    FROM transcript_negative_matches
-                    WHERE transcript_id = ? AND occurrence_id = ?
-                    """,
-                    (transcript.transcript_id, occurrence["id"]),
-                ).fetchone()
-                if negative:
+            for occurrence in pool:
+                if (transcript.transcript_id, occurrence["id"]) in negatives:
                     continue
-                contacts = _load_occurrence_contacts(conn, occurrence["id"])
-                confidence = occurrence_match_confidence(transcript, occurrence, contacts)
+                confidence = occurrence_match_confidence(
+                    transcript, occurrence, contacts[occurrence["id"]]
+                )
                 candidates.append((confidence, occurrence))
 
             candidates.sort(key=lambda item: item[0], reverse=True)
@@ -116,6 +193,7 @@ def reconcile_unmatched_transcripts() -> list[dict]:
                         "UPDATE occurrences SET capture_mode = 'tracked meeting', updated_at = ? WHERE id = ?",
                         (utc_now(), best_occurrence["id"]),
                     )
+                    best_occurrence["capture_mode"] = "tracked meeting"
                 results.append(
                     {
                         "transcript_id": transcript.transcript_id,
@@ -25,6 +25,8 @@ shutil.copytree(SOURCE_FIXTURE_VAULT, RUNTIME_FIXTURE_VAULT)
 # core.paths binds VAULT_PATH when test modules import it, so force the
 # disposable copy here before collection imports any product modules.
 os.environ["VAULT_PATH"] = str(RUNTIME_FIXTURE_VAULT)
+# Keep the persistent digest cache out of the developer's real cache dir.
+os.environ["DEX_DIGEST_CACHE_DIR"] = str(_RUNTIME_ROOT / "digest-cache")
 
 for relative in (
     "05-Areas/Meetings",
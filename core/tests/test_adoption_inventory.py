@@ -4,6 +4,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
+from core.lifecycle import filesystem
+from core.lifecycle.filesystem import shared_walk_snapshots
 from core.lifecycle.inventory import build_inventory, canonical_inventory_bytes
 from core.tests.lifecycle_test_helpers import catalog_for, write_file, write_manifest
 
@@ -74,3 +78,33 @@ def test_remapped_folder_is_canonicalized_before_contract_resolution(tmp_path: P
     assert entries["Work/Projects/Client/notes.md"].canonical_path == "04-Projects/Client/notes.md"
     assert entries["Work/Projects/Client/notes.md"].ownership_class == "vault"
     assert "Work/Projects/Client/notes.md" not in report.unknown_paths
+
+
+def test_shared_walk_snapshot_is_reused_until_a_directory_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    write_file(vault, "04-Projects/Client/notes.md", b"private notes\n")
+    walks: list[Path] = []
+    original = filesystem._walk
+
+    def counting(root, max_entries):
+        walks.append(root)
+        return original(root, max_entries)
+
+    monkeypatch.setattr(filesystem, "_walk", counting)
+
+    with shared_walk_snapshots():
+        first = build_inventory(vault)
+        with shared_walk_snapshots():
+            assert canonical_inventory_bytes(build_inventory(vault)) == canonical_inventory_bytes(first)
+        assert len(walks) == 1
+
+        write_file(vault, "04-Projects/Client/added.md", b"new\n")
+        changed = build_inventory(vault)
+
+    assert len(walks) == 2
+    assert "04-Projects/Client/added.md" in _by_path(changed)
+    build_inventory(vault)
+    assert len(walks) == 3
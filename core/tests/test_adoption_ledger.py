@@ -642,3 +642,140 @@ def test_ledger_failure_after_rewind_reports_without_rolling_back_commit(
 
     assert (vault / EXISTING_PATH).read_bytes() == OLD
     assert not (vault / CREATED_PATH).exists()
+
+
+def _checkpoint_files(vault: Path) -> list[Path]:
+    return sorted((vault / "System/.dex/ledger/checkpoints").glob("*.json"))
+
+
+def _toggle_holdbacks(vault: Path, count: int) -> None:
+    for index in range(count):
+        if index % 2 == 0:
+            record_holdback(vault, "alpha")
+        else:
+            clear_holdback(vault, "alpha")
+
+
+@pytest.fixture
+def validated_events(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    sequences: list[int] = []
+    original = ledger_module._validate_event
+
+    def counting(path, raw, expected_seq, expected_prev):
+        sequences.append(expected_seq)
+        return original(path, raw, expected_seq, expected_prev)
+
+    monkeypatch.setattr(ledger_module, "_validate_event", counting)
+    return sequences
+
+
+def test_projection_replays_only_events_after_the_newest_checkpoint(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, validated_events: list[int]
+) -> None:
+    monkeypatch.setattr(ledger_module, "CHECKPOINT_INTERVAL", 4)
+    vault = _new_vault(tmp_path / "vault")
+    register_install(vault, UUID("12345678-1234-4678-9234-567812345678"))
+    record_adoption(vault, _adoption_receipt(), {"alpha": "1.0.0"})
+    _toggle_holdbacks(vault, 8)
+
+    assert [path.name for path in _checkpoint_files(vault)] == ["00000004.json", "00000008.json"]
+    validated_events.clear()
+    state = project_state(vault)
+
+    assert validated_events == [9, 10]
+    assert state == project_state(vault, audit=True)
+    assert state["last_seq"] == 10 and state["held_back"] == []
+    assert list(state["adopted"]) == ["alpha"]
+    validated_events.clear()
+    assert [event["seq"] for event in read_events(vault, since=6)] == [6, 7, 8, 9, 10]
+    assert validated_events == [5, 6, 7, 8, 9, 10]
+
+
+def test_unusable_checkpoint_is_skipped_and_replaced_by_the_next_record(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, validated_events: list[int]
+) -> None:
+    monkeypatch.setattr(ledger_module, "CHECKPOINT_INTERVAL", 4)
+    vault = _new_vault(tmp_path / "vault")
+    register_install(vault, UUID("12345678-1234-4678-9234-567812345678"))
+    _toggle_holdbacks(vault, 4)
+    [checkpoint] = _checkpoint_files(vault)
+    original = checkpoint.read_bytes()
+    checkpoint.write_bytes(b"{")
+
+    validated_events.clear()
+    assert project_state(vault)["last_seq"] == 5
+    assert validated_events == [1, 2, 3, 4, 5]
+
+    record_holdback(vault, "beta")
+
+    assert checkpoint.read_bytes() == original
+    quarantined = list((vault / "System/.dex/ledger/quarantine").iterdir())
+    assert [path.name for path in quarantined] == ["00000004.json.rejected"]
+
+
+def test_forged_checkpoint_is_caught_by_audit_and_quarantined_by_rebuild(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(ledger_module, "CHECKPOINT_INTERVAL", 4)
+    vault = _new_vault(tmp_path / "vault")
+    register_install(vault, UUID("12345678-1234-4678-9234-567812345678"))
+    _toggle_holdbacks(vault, 4)
+    [checkpoint] = _checkpoint_files(vault)
+    honest = json.loads(checkpoint.read_bytes())
+    forged_state = {**honest["state"], "held_back": ["alpha", "mallory"]}
+    checkpoint.write_bytes(
+        ledger_module._canonical_bytes(
+            ledger_module._checkpoint_document(forged_state, honest["transactions"]), "test"
+        )
+    )
+
+    # Bound to the right commitment, so the fast path trusts it; only an
+    # audit replays the history it claims to summarize.
+    assert project_state(vault)["held_back"] == ["mallory"]
+    with pytest.raises(LedgerError, match="checkpoint 4 disagrees with the verified event chain"):
+        project_state(vault, audit=True)
+
+    state = rebuild_state(vault)
+
+    assert state["held_back"] == []
+    assert json.loads(checkpoint.read_bytes()) == honest
+    assert project_state(vault) == state
+
+
+def test_every_audit_interval_checkpoint_audits_the_full_chain_first(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(ledger_module, "CHECKPOINT_INTERVAL", 2)
+    monkeypatch.setattr(ledger_module, "AUDIT_INTERVAL", 3)
+    vault = _new_vault(tmp_path / "vault")
+    register_install(vault, UUID("12345678-1234-4678-9234-567812345678"))
+    record_holdback(vault, "alpha")
+    event_two = _event_files(vault)[1]
+    event_two.write_bytes(event_two.read_bytes().replace(b'"alpha"', b'"omega"'))
+
+    clear_holdback(vault, "alpha")
+    record_holdback(vault, "alpha")
+    clear_holdback(vault, "alpha")
+
+    with pytest.raises(LedgerError, match="event 2 fails its integrity hash"):
+        record_holdback(vault, "alpha")
+    assert len(_event_files(vault)) == 6
+    assert [path.name for path in _checkpoint_files(vault)] == ["00000002.json", "00000004.json"]
+
+
+def test_retry_of_transaction_recorded_before_checkpoint_is_checked_against_history(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(ledger_module, "CHECKPOINT_INTERVAL", 4)
+    vault = _new_vault(tmp_path / "vault")
+    receipt = _adoption_receipt()
+    record_adoption(vault, receipt, {"alpha": "1.0.0"})
+    _toggle_holdbacks(vault, 4)
+    assert _checkpoint_files(vault)
+
+    state = record_adoption(vault, receipt, {"alpha": "1.0.0"})
+
+    assert state["last_seq"] == 6
+    with pytest.raises(LedgerError, match="already recorded with different evidence"):
+        record_adoption(vault, receipt, {"alpha": "2.0.0"})
+    assert len(_event_files(vault)) == 6
@@ -289,8 +289,8 @@ def test_drift_after_rebuild_is_detected_from_snapshot_and_rolled_back(
     target = vault / ".claude/skills/alpha/SKILL.md"
     real_begin = Transaction.begin
 
-    def begin_then_race(vault_root: Path, entries):
-        transaction = real_begin(vault_root, entries)
+    def begin_then_race(vault_root: Path, entries, **options):
+        transaction = real_begin(vault_root, entries, **options)
         target.write_bytes(b"external writer won the race\n")
         return transaction
 
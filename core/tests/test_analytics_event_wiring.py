@@ -29,7 +29,7 @@ ANALYTICS_CALLER_EVENTS = {
     "core/mcp/work_server.py": Counter(
         {
             "task_created": 1,
-            "task_completed": 3,
+            "task_completed": 4,
             "person_page_created": 1,
             "skill_rated": 1,
         }
@@ -0,0 +1,171 @@
+"""Background analytics outbox: queued delivery, retries and cached sources."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from core.mcp import analytics_helper
+from core.mcp.analytics_outbox import AnalyticsOutbox
+
+RECEIPT_RELATIVE = Path("System/.dex/analytics-attempts.jsonl")
+OUTBOX_RELATIVE = Path("System/.dex/analytics-outbox.jsonl")
+
+
+def _read_receipts(vault: Path) -> list[dict[str, object]]:
+    path = vault / RECEIPT_RELATIVE
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.fixture
+def vault(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    vault = tmp_path / "vault"
+    (vault / "System").mkdir(parents=True)
+    monkeypatch.setenv("VAULT_PATH", str(vault))
+    # Tests drive flushes themselves instead of racing the daemon thread.
+    monkeypatch.setattr(AnalyticsOutbox, "start", lambda self: None)
+    analytics_helper.clear_source_cache()
+    yield vault
+    analytics_helper.use_outbox(False)
+    analytics_helper.clear_source_cache()
+
+
+@pytest.fixture
+def posts(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Deliver with scripted status codes, recording each attempted POST."""
+    posts = SimpleNamespace(scripted=[], attempted=[])
+
+    def post(*_args, **_kwargs):
+        status = posts.scripted.pop(0) if posts.scripted else 200
+        posts.attempted.append(status)
+        return SimpleNamespace(status_code=status)
+
+    monkeypatch.setattr(analytics_helper, "is_analytics_enabled", lambda: True)
+    monkeypatch.setattr(analytics_helper, "HAS_REQUESTS", True)
+    monkeypatch.setattr(
+        analytics_helper,
+        "get_analytics_transport",
+        lambda: {
+            "configured": True,
+            "mode": "proxy",
+            "endpoint": "https://relay.example.test/track",
+            "headers": {},
+        },
+    )
+    monkeypatch.setattr(
+        analytics_helper,
+        "get_visitor_info",
+        lambda: {"visitor_id": "visitor-123", "account_id": "account-123"},
+    )
+    monkeypatch.setattr(analytics_helper, "requests", SimpleNamespace(post=post), raising=False)
+    return posts
+
+
+def test_queued_event_returns_without_network_and_flush_writes_the_receipt(
+    vault: Path, posts: SimpleNamespace
+) -> None:
+    analytics_helper.use_outbox()
+
+    result = analytics_helper.fire_event("task_created", {"count": 2})
+
+    assert result == {"fired": False, "queued": True, "event": "task_created", "mode": "proxy"}
+    assert posts.attempted == []
+    assert _read_receipts(vault) == []
+    [entry] = analytics_helper._active_outbox().pending()
+    assert entry["payload"]["properties"]["count"] == 2
+
+    totals = analytics_helper._active_outbox().flush()
+
+    assert totals == {"sent": 1, "retried": 0, "dropped": 0}
+    assert posts.attempted == [200]
+    [receipt] = _read_receipts(vault)
+    assert (receipt["event"], receipt["outcome"], receipt["reason"]) == ("task_created", "sent", "sent")
+    assert (vault / OUTBOX_RELATIVE).read_bytes() == b""
+
+
+def test_transient_failures_back_off_and_permanent_ones_are_dropped(
+    vault: Path, posts: SimpleNamespace
+) -> None:
+    analytics_helper.use_outbox()
+    outbox = analytics_helper._active_outbox()
+    posts.scripted.extend([503, 400])
+    analytics_helper.fire_event("task_created")
+    analytics_helper.fire_event("task_completed")
+
+    assert outbox.flush(now=1000.0) == {"sent": 0, "retried": 1, "dropped": 1}
+    [pending] = outbox.pending()
+    assert (pending["event"], pending["attempts"]) == ("task_created", 1)
+    assert pending["next_attempt_at"] == 1000.0 + outbox.base_backoff_seconds
+    assert outbox.flush(now=1000.5) == {"sent": 0, "retried": 0, "dropped": 0}
+
+    assert outbox.flush(now=1000.0 + outbox.base_backoff_seconds) == {
+        "sent": 1,
+        "retried": 0,
+        "dropped": 0,
+    }
+    assert posts.attempted == [503, 400, 200]
+    assert [(r["event"], r["outcome"], r["reason"]) for r in _read_receipts(vault)] == [
+        ("task_completed", "not_sent", "http_error"),
+        ("task_created", "sent", "sent"),
+    ]
+
+
+def test_events_appended_during_delivery_survive_the_rewrite(tmp_path: Path) -> None:
+    recorded: list[tuple[str, str, str]] = []
+    outbox: AnalyticsOutbox
+
+    def deliver(entries):
+        if entries[0]["event"] == "task_created":
+            outbox.enqueue({"event": "task_completed", "payload": {}})
+        return [("sent", False)] * len(entries)
+
+    outbox = AnalyticsOutbox(
+        tmp_path / "outbox.jsonl", deliver, lambda *receipt: recorded.append(receipt)
+    )
+    outbox.enqueue({"event": "task_created", "payload": {}})
+
+    assert outbox.flush() == {"sent": 2, "retried": 0, "dropped": 0}
+    assert recorded == [
+        ("task_created", "sent", "sent"),
+        ("task_completed", "sent", "sent"),
+    ]
+    assert outbox.pending() == []
+
+
+def test_consent_is_served_from_cache_until_the_usage_log_changes(
+    vault: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    usage_log = vault / "System" / "usage_log.md"
+    usage_log.write_text(
+        "**Consent decision:** opted-out\n**Setup date:** 2026-01-01\n- [x] Task created\n",
+        encoding="utf-8",
+    )
+    stat = usage_log.stat()
+    settled_ns = stat.st_mtime_ns - 60_000_000_000
+    os.utime(usage_log, ns=(stat.st_atime_ns, settled_ns))
+    parses: list[Path] = []
+    original = analytics_helper._parse_usage_log
+
+    def counting(path: Path):
+        parses.append(path)
+        return original(path)
+
+    monkeypatch.setattr(analytics_helper, "_parse_usage_log", counting)
+
+    assert analytics_helper.check_consent() == "opted-out"
+    journey = analytics_helper.calculate_journey_metadata()
+    assert analytics_helper.is_analytics_enabled() is False
+    assert analytics_helper.calculate_journey_metadata() == journey
+    assert journey["feature_adoption_score"] == 1
+    assert len(parses) == 1
+
+    analytics_helper.update_consent("opted-in")
+
+    assert analytics_helper.check_consent() == "opted-in"
+    assert len(parses) == 2
@@ -2143,3 +2143,41 @@ def test_vault_section_assumes_direct_child_exceptions_only() -> None:
         root = rule.path.split("/", 1)[0]
         if root in tops:
             assert rule.path.count("/") == 1, rule.path
+
+
+def test_update_plan_reads_blobs_over_one_pipe_and_skips_unchanged_files(
+    split_release_fixture: dict[str, object],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    vault = split_release_fixture["vault"]
+    release = _verified(split_release_fixture)
+    baseline = apply_update.build_update_plan(vault, release)
+    single_reads: list[tuple[str, ...]] = []
+    batched_reads: list[str] = []
+    original_output = apply_update._brain_output
+    original_read = apply_update.GitObjectReader.read
+
+    def brain_output(vault_root, brain_git, *arguments):
+        if arguments[:2] == ("cat-file", "blob"):
+            single_reads.append(arguments)
+        return original_output(vault_root, brain_git, *arguments)
+
+    def read(self, object_id, **kwargs):
+        batched_reads.append(object_id)
+        return original_read(self, object_id, **kwargs)
+
+    monkeypatch.setattr(apply_update, "_brain_output", brain_output)
+    monkeypatch.setattr(apply_update.GitObjectReader, "read", read)
+
+    plan = apply_update.build_update_plan(vault, release)
+
+    assert plan == baseline
+    assert plan.untouched and plan.entries
+    assert len(single_reads) == 1  # the installed manifest, verified up front
+    planned = {entry.relative for entry in plan.entries}
+    needed = {
+        entry.object_id
+        for entry in release.entries
+        if entry.path in planned or entry.path in apply_update.COMPOSERS
+    }
+    assert set(batched_reads) <= needed
@@ -8,6 +8,7 @@ import shutil
 import subprocess
 import sys
 import tarfile
+import threading
 from pathlib import Path
 
 import pytest
@@ -580,6 +581,13 @@ def test_backup_excludes_everything_the_contract_hard_denies():
             f"{sample} (hard-denied by {pattern}) would be uploaded in a backup"
 
 
+def test_backup_racy_window_matches_config_snapshot():
+    """backup_vault duplicates the window so launchd runs stay stdlib-only."""
+    from core.utils import config_snapshot
+
+    assert backup_vault.RACY_WINDOW_NS == config_snapshot.RACY_WINDOW_NS
+
+
 def test_a_real_oauth_token_never_reaches_the_archive(vault, tmp_path):
     """The Google Workspace setup writes this exact file into the vault."""
     (vault / "System" / ".gmail-oauth-token.json").write_text('{"refresh_token": "x"}')
@@ -605,3 +613,149 @@ def test_ordinary_notes_that_merely_look_secret_are_still_backed_up(vault, tmp_p
     with tarfile.open(artifacts[0]) as tar:
         names = tar.getnames()
     assert f"{backup_vault.ARCNAME}/04-Projects/API_keys_rotation_plan.md" in names
+
+
+# --- incremental sets -------------------------------------------------------
+
+GIT_ENV = {"GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@example.com",
+           "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@example.com",
+           "PATH": "/usr/bin:/bin"}
+
+
+def take_incremental(vault, dest, stamp, tmp_path):
+    """One incremental run under a fixed stamp; returns the chunks it wrote."""
+    backend = backup_vault.FolderBackend({"destination": str(dest)})
+    work = tmp_path / f"work-{stamp}"
+    work.mkdir()
+    artifacts, chunks = backup_vault.build_incremental_artifacts(
+        vault, work, stamp, backend, [])
+    backend.store_chunks(work, sorted(chunks))
+    backend.store(artifacts)
+    return chunks
+
+
+def commit_all(vault, message, tmp_path):
+    env = {**GIT_ENV, "HOME": str(tmp_path)}
+    subprocess.run(["git", "add", "-A"], cwd=vault, check=True, env=env)
+    subprocess.run(["git", "commit", "-qm", message], cwd=vault, check=True, env=env)
+
+
+def test_incremental_run_verifies_and_restores_like_an_archive(vault, tmp_path):
+    dest = tmp_path / "backups"
+    write_config(vault, destination=str(dest), extra="  mode: incremental\n")
+    assert backup_vault.run_backup(vault) == 0
+    stamp = read_stamp(vault)["set"]
+    assert not list(dest.glob("*.tar.gz"))
+    assert restore_vault.pick_set(dest, None) == stamp
+
+    findings = restore_vault.verify_set(dest, stamp)
+    assert any("content chunk(s): present and intact" in f for f in findings)
+    target = tmp_path / "restored"
+    restore_vault.restore(dest, stamp, target, vault)
+    restored = target / backup_vault.ARCNAME
+    assert (restored / "05-Areas" / "People" / "Ada_Lovelace.md").read_text() == "# Ada\n"
+    assert (restored / backup_vault.RUNBOOK_IN_ARCHIVE).read_text() == \
+        "# Restoring a Dex vault\n"
+    assert not (restored / ".env").exists()
+    assert not (restored / "node_modules").exists()
+
+    # The run's own log and stamp changed; after that, nothing has, so the
+    # next set is a manifest over chunks the destination already holds.
+    take_incremental(vault, dest, "20990101-000000", tmp_path)
+    assert take_incremental(vault, dest, "20990102-000000", tmp_path) == {}
+
+
+def test_incremental_sets_share_chunks_and_prune_collects_orphans(vault, tmp_path):
+    dest = tmp_path / "backups"
+    take_incremental(vault, dest, "20260710-020000", tmp_path)
+    note = vault / "05-Areas" / "People" / "Ada_Lovelace.md"
+    note.write_text("# Ada\n\nWrote the first program.\n")
+    written = take_incremental(vault, dest, "20260711-020000", tmp_path)
+    assert len(written) == 1  # only the edited note is new content
+
+    backend = backup_vault.FolderBackend({"destination": str(dest)})
+    before = backend.list_chunks()
+    pruned = backup_vault.prune(backend, {"daily": 0, "weekly": 0, "monthly": 0})
+    assert pruned == ["20260710-020000"]
+    assert len(backend.list_chunks()) == len(before) - 1
+    restore_vault.verify_set(dest, "20260711-020000")
+
+    (dest / backup_vault.chunk_relative(next(iter(written)))).unlink()
+    with pytest.raises(restore_vault.RestoreError, match="is missing"):
+        restore_vault.verify_set(dest, "20260711-020000")
+
+
+def test_an_unreadable_manifest_stops_chunk_collection(vault, tmp_path):
+    dest = tmp_path / "backups"
+    take_incremental(vault, dest, "20260711-020000", tmp_path)
+    make_set(dest, "20260712-020000")
+    (dest / f"{backup_vault.PREFIX}20260712-020000.manifest.json").write_text("{")
+    backend = backup_vault.FolderBackend({"destination": str(dest)})
+    stored = backend.list_chunks()
+    (dest / f"{backup_vault.PREFIX}20260711-020000.manifest.json").unlink()
+
+    assert backup_vault.collect_chunks(backend) == set()
+    assert backend.list_chunks() == stored
+
+
+def test_a_second_run_waits_instead_of_pruning_under_the_first(vault, tmp_path, monkeypatch):
+    dest = tmp_path / "backups"
+    write_config(vault, destination=str(dest),
+                 extra="  mode: incremental\n  retention:\n    daily: 0\n"
+                       "    weekly: 0\n    monthly: 0\n")
+    take_incremental(vault, dest, "20260710-020000", tmp_path)
+    note = vault / "05-Areas" / "People" / "Ada_Lovelace.md"
+    original_store_chunks = backup_vault.FolderBackend.store_chunks
+    second: dict = {}
+
+    def store_chunks(self, root, names):
+        # The first run has listed the chunks it reuses; a second run now
+        # sees a changed note and would prune the set those chunks live in.
+        if not second:
+            note.write_text("# Ada\n\nWrote the first program.\n")
+            worker = threading.Thread(
+                target=lambda: second.update(code=backup_vault.run_backup(vault)))
+            second["thread"] = worker
+            worker.start()
+            worker.join(timeout=1.0)
+            second["waited"] = worker.is_alive()
+        original_store_chunks(self, root, names)
+
+    monkeypatch.setattr(backup_vault.FolderBackend, "store_chunks", store_chunks)
+    assert backup_vault.run_backup(vault) == 0
+    second["thread"].join(timeout=30)
+
+    assert second["waited"] is True
+    assert second["code"] == 0
+    sets = backup_vault.list_sets(backup_vault.FolderBackend({"destination": str(dest)}))
+    assert len(sets) == 1 and sets[0] == read_stamp(vault)["set"]
+    restore_vault.verify_set(dest, sets[0])
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not available")
+def test_incremental_history_chain_restores_every_commit(vault, tmp_path):
+    subprocess.run(["git", "init", "-q"], cwd=vault, check=True,
+                   env={**GIT_ENV, "HOME": str(tmp_path)})
+    commit_all(vault, "seed", tmp_path)
+    dest = tmp_path / "backups"
+    take_incremental(vault, dest, "20260710-020000", tmp_path)
+    (vault / "05-Areas" / "People" / "Grace_Hopper.md").write_text("# Grace\n")
+    commit_all(vault, "add Grace", tmp_path)
+    take_incremental(vault, dest, "20260711-020000", tmp_path)
+
+    manifest = json.loads(
+        (dest / f"{backup_vault.PREFIX}20260711-020000.manifest.json").read_text())
+    assert len(manifest["history"]["bundles"]) == 2
+    findings = restore_vault.verify_set(dest, "20260711-020000")
+    assert any("2 bundle(s) replayed" in finding for finding in findings)
+
+    target = tmp_path / "restored"
+    restore_vault.restore(dest, "20260711-020000", target, vault)
+    clone = tmp_path / "clone"
+    subprocess.run(["git", "clone", "-q",
+                    str(target / f"{backup_vault.PREFIX}20260711-020000.bundle"),
+                    str(clone)], check=True, env={**GIT_ENV, "HOME": str(tmp_path)})
+    log = subprocess.run(["git", "log", "--format=%s"], cwd=clone, check=True,
+                         capture_output=True, text=True).stdout.splitlines()
+    assert log == ["add Grace", "seed"]
+    assert (clone / "05-Areas" / "People" / "Grace_Hopper.md").read_text() == "# Grace\n"
@@ -29,4 +29,12 @@ def test_build_company_index_and_rebuild_on_page_mtime(tmp_path, monkeypatch):
     future = datetime.fromisoformat(old_built_at).timestamp() + 2
     os.utime(acme, (future, future))
     assert work_server.find_company_by_domain("acme.co.uk")["name"] == "Acme"
-    assert json.loads(index_file.read_text())["built_at"] != old_built_at
+    # A touch that leaves the page unchanged does not rewrite the export.
+    assert json.loads(index_file.read_text())["built_at"] == old_built_at
+
+    acme.write_text(render_company_page("Acme", ["acme.co.uk"], "https://acme.co.uk", "Customer"))
+    os.utime(acme, (future + 2, future + 2))
+    assert work_server.find_company_by_domain("acme.co.uk")["status"] == "Customer"
+    exported = json.loads(index_file.read_text())
+    assert exported["built_at"] != old_built_at
+    assert exported["companies"][0]["status"] == "Customer"
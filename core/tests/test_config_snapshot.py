@@ -0,0 +1,93 @@
+"""Stat-keyed configuration snapshots shared by the MCP servers."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from core.utils import config_snapshot
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    config_snapshot.clear()
+    yield
+    config_snapshot.clear()
+
+
+def _settle(path: Path) -> None:
+    """Move the mtime out of the racy window so the snapshot can be trusted."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 60_000_000_000))
+
+
+@pytest.fixture
+def parses(monkeypatch: pytest.MonkeyPatch) -> list[bytes]:
+    calls: list[bytes] = []
+    original = config_snapshot.parse_yaml
+
+    def counting(raw):
+        calls.append(raw)
+        return original(raw)
+
+    monkeypatch.setattr(config_snapshot, "parse_yaml", counting)
+    return calls
+
+
+def test_settled_file_is_parsed_once_and_edits_are_picked_up(
+    tmp_path: Path, parses: list[bytes]
+) -> None:
+    profile = tmp_path / "user-profile.yaml"
+    profile.write_text("name: Ada\n", encoding="utf-8")
+    _settle(profile)
+
+    assert config_snapshot.load_yaml(profile) == {"name": "Ada"}
+    assert config_snapshot.load_yaml(profile) == {"name": "Ada"}
+    assert len(parses) == 1
+
+    profile.write_text("name: Grace Hopper\n", encoding="utf-8")
+
+    assert config_snapshot.load_yaml(profile) == {"name": "Grace Hopper"}
+    assert len(parses) == 2
+
+
+def test_recently_modified_file_is_reparsed_until_it_settles(
+    tmp_path: Path, parses: list[bytes]
+) -> None:
+    profile = tmp_path / "user-profile.yaml"
+    profile.write_text("role: PM\n", encoding="utf-8")
+
+    config_snapshot.load_yaml(profile)
+    # Same size, same tick: the stat signature alone cannot see this edit.
+    stat = profile.stat()
+    profile.write_text("role: QA\n", encoding="utf-8")
+    os.utime(profile, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert config_snapshot.load_yaml(profile) == {"role": "QA"}
+    assert len(parses) == 2
+
+
+def test_missing_and_malformed_files_raise_and_are_not_cached(tmp_path: Path) -> None:
+    profile = tmp_path / "user-profile.yaml"
+    with pytest.raises(FileNotFoundError):
+        config_snapshot.load_yaml(profile)
+
+    profile.write_text("name: [unterminated\n", encoding="utf-8")
+    _settle(profile)
+    with pytest.raises(yaml.YAMLError):
+        config_snapshot.load_yaml(profile)
+
+    profile.write_text("name: Ada\n", encoding="utf-8")
+    assert config_snapshot.load_yaml(profile) == {"name": "Ada"}
+
+
+def test_yaml_uses_the_c_loader_when_pyyaml_has_one(monkeypatch: pytest.MonkeyPatch) -> None:
+    expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    assert config_snapshot._yaml_loader() is expected
+
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+    assert config_snapshot._yaml_loader() is yaml.SafeLoader
+    assert config_snapshot.parse_yaml(b"days: [monday]\n") == {"days": ["monday"]}
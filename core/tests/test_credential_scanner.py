@@ -6,6 +6,7 @@ from pathlib import Path
 
 import pytest
 
+from core.utils import credential_scanner
 from core.utils.credential_scanner import _bounded_file, scan_credentials
 
 
@@ -280,3 +281,33 @@ def test_bounded_file_refuses_hardlinked_file(tmp_path):
     assert original.stat().st_nlink == 2
     with pytest.raises(OSError, match="unsafe-or-oversized-file"):
         _bounded_file(original)
+
+
+def test_history_scan_process_count_does_not_grow_with_objects(tmp_path, monkeypatch):
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "tests@example.com")
+    _git(tmp_path, "config", "user.name", "Synthetic")
+    secret = b"synthetic-history-secret"
+    for index in range(40):
+        (tmp_path / f"note-{index}.txt").write_bytes(b"ordinary %d\n" % index)
+    (tmp_path / "leak.txt").write_bytes(secret)
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "fixture")
+    _git(tmp_path, "rm", "-q", "leak.txt")
+    _git(tmp_path, "commit", "-qm", "remove leak")
+    spawned: list[tuple[str, ...]] = []
+    original = credential_scanner.git_output
+
+    def counting(root, *args, **kwargs):
+        spawned.append(args)
+        return original(root, *args, **kwargs)
+
+    monkeypatch.setattr(credential_scanner, "git_output", counting)
+
+    report = scan_credentials(tmp_path, (secret,))
+
+    assert {"index", "reachable-refs", "tags", "stashes"} <= set(report.inspected_scopes)
+    assert any(finding.scope == "reachable-refs" for finding in report.findings)
+    assert not any(finding.scope == "index" for finding in report.findings)
+    assert not any(args[:1] == ("show",) or args[:2] == ("cat-file", "blob") for args in spawned)
+    assert len(spawned) < 15
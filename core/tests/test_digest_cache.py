@@ -0,0 +1,117 @@
+"""Persistent content-digest cache shared by inventory and update planning."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from core.lifecycle import inventory
+from core.lifecycle.inventory import build_inventory, canonical_inventory_bytes
+from core.tests.lifecycle_test_helpers import catalog_for, write_file, write_manifest
+from core.utils.digest_cache import DigestCache, database_path
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    directory = tmp_path / "digest-cache"
+    monkeypatch.setenv("DEX_DIGEST_CACHE_DIR", str(directory))
+    return directory
+
+
+def _settle(path: Path) -> None:
+    """Move the mtime out of the racy window so a cached digest is trusted."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 60_000_000_000))
+
+
+def _digest(cache_root: Path, path: Path, reads: list[str]) -> str:
+    def read() -> bytes:
+        reads.append(path.name)
+        return path.read_bytes()
+
+    with DigestCache.for_vault(cache_root) as cache:
+        return cache.digests_for(path, path.name, read).sha256
+
+
+def test_unchanged_files_are_served_from_the_cache_until_they_change(tmp_path: Path) -> None:
+    target = tmp_path / "note.md"
+    target.write_bytes(b"first\r\n")
+    _settle(target)
+    reads: list[str] = []
+
+    assert _digest(tmp_path, target, reads) == hashlib.sha256(b"first\r\n").hexdigest()
+    assert _digest(tmp_path, target, reads) == hashlib.sha256(b"first\r\n").hexdigest()
+    with DigestCache.for_vault(tmp_path) as cache:
+        cached = cache.lookup("note.md", target.lstat())
+    assert cached is not None
+    assert cached.crlf_normalized_sha256 == hashlib.sha256(b"first\n").hexdigest()
+    assert reads == ["note.md"]
+
+    target.write_bytes(b"second, longer\n")
+    _settle(target)
+
+    assert _digest(tmp_path, target, reads) == hashlib.sha256(b"second, longer\n").hexdigest()
+    assert reads == ["note.md", "note.md"]
+
+
+def test_files_changed_inside_the_racy_window_are_rehashed(tmp_path: Path) -> None:
+    target = tmp_path / "note.md"
+    target.write_bytes(b"fresh\n")
+    reads: list[str] = []
+
+    _digest(tmp_path, target, reads)
+    _digest(tmp_path, target, reads)
+
+    assert reads == ["note.md", "note.md"]
+
+
+def test_a_corrupt_sidecar_is_rebuilt(tmp_path: Path) -> None:
+    database = database_path(tmp_path)
+    database.parent.mkdir(parents=True)
+    database.write_bytes(b"not a sqlite database" * 100)
+    target = tmp_path / "note.md"
+    target.write_bytes(b"content\n")
+    _settle(target)
+    reads: list[str] = []
+
+    _digest(tmp_path, target, reads)
+    _digest(tmp_path, target, reads)
+
+    assert reads == ["note.md"]
+
+
+def test_repeated_inventory_reuses_digests_without_touching_the_vault(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, cache_dir: Path
+) -> None:
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    shipped = b"release bytes\n"
+    write_file(vault, "core/feature.py", shipped)
+    write_file(vault, "core/edited.py", b"local edit\n")
+    manifest = write_manifest(vault, ["core/feature.py", "core/edited.py"])
+    catalog = catalog_for(manifest, {"core/feature.py": shipped, "core/edited.py": b"stock\n"})
+    for path in vault.rglob("*"):
+        if path.is_file():
+            _settle(path)
+    before = sorted((path.relative_to(vault).as_posix(), path.lstat().st_mtime_ns) for path in vault.rglob("*"))
+    first = build_inventory(vault, catalog=catalog)
+    reads: list[str] = []
+    original = inventory.bounded_read
+
+    def counting(root, relative, **kwargs):
+        reads.append(relative)
+        return original(root, relative, **kwargs)
+
+    monkeypatch.setattr(inventory, "bounded_read", counting)
+
+    second = build_inventory(vault, catalog=catalog)
+
+    assert canonical_inventory_bytes(first) == canonical_inventory_bytes(second)
+    assert "core/feature.py" not in reads
+    assert "core/edited.py" not in reads
+    assert database_path(vault).parent == cache_dir
+    after = sorted((path.relative_to(vault).as_posix(), path.lstat().st_mtime_ns) for path in vault.rglob("*"))
+    assert after == before
@@ -1,5 +1,6 @@
 """Contract tests for the /dex-doctor collector."""
 
+import dataclasses
 import hashlib
 import json
 import os
@@ -9,6 +10,8 @@ import shutil
 import stat
 import subprocess
 import sys
+import threading
+import time
 import venv
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -1277,7 +1280,7 @@ def test_json_contract_shape_and_last_run_file(monkeypatch, context, deep, expec
     assert [check["id"] for check in report["checks"]] == expected_ids
     assert report["summary"] == {"ok": len(expected_ids), "off": 0, "broken": 0, "unknown": 0}
     for check in report["checks"]:
-        assert set(check) == {"id", "feature", "verdict", "detail", "heal"}
+        assert set(check) == {"id", "feature", "verdict", "detail", "heal", "duration_ms"}
         assert check["verdict"] in doctor.VERDICTS
         assert isinstance(check["detail"], str) and check["detail"]
         assert check["heal"] is None
@@ -1285,6 +1288,112 @@ def test_json_contract_shape_and_last_run_file(monkeypatch, context, deep, expec
     assert json.loads(context.last_run_path.read_text()) == report
 
 
+def test_read_only_probes_run_concurrently_and_report_their_own_timing(monkeypatch, context):
+    _stub_probes(monkeypatch)
+    rendezvous = threading.Barrier(3, timeout=10)
+
+    def slow_probe(_context):
+        rendezvous.wait()
+        time.sleep(0.2)
+        return doctor.ProbeResult("OK", "Slow probe completed.")
+
+    for probe in ("_probe_vault_git", "_probe_brain_git", "_probe_core_drift"):
+        monkeypatch.setattr(doctor, probe, slow_probe)
+
+    report = doctor.collect(context=context)
+
+    for check_id in ("vault.git", "brain.git", "core.drift"):
+        assert _check(report, check_id)["verdict"] == "OK"
+        assert 200 <= _check(report, check_id)["duration_ms"] < 2000
+    assert _check(report, "vault.configs")["duration_ms"] < 200
+    # The three slow probes met at the barrier, so the pass took one delay.
+    assert _check(report, "doctor.self")["duration_ms"] >= 200
+    assert report["instruments"]["failed"] == []
+
+
+def test_probes_with_effects_stay_ordered_and_dependencies_finish_first(monkeypatch, context):
+    _stub_probes(monkeypatch)
+    events: list[tuple[str, str, str]] = []
+    collector = threading.current_thread().name
+
+    def recording(name, delay=0.0):
+        def probe(_context):
+            events.append(("start", name, threading.current_thread().name))
+            time.sleep(delay)
+            events.append(("end", name, threading.current_thread().name))
+            return doctor.ProbeResult("OK", f"{name} completed.")
+
+        return probe
+
+    monkeypatch.setattr(doctor, "_probe_jobs_loaded", recording("jobs.loaded", 0.1))
+    monkeypatch.setattr(doctor, "_probe_jobs_fresh", recording("jobs.fresh"))
+
+    def with_effects(definitions):
+        return tuple(
+            dataclasses.replace(definition, effects=frozenset({"test"}))
+            if definition.id in {"preflight.queue", "pipedrive.connection"}
+            else definition
+            for definition in definitions
+        )
+
+    monkeypatch.setattr(doctor, "QUICK_CHECKS", with_effects(doctor.QUICK_CHECKS))
+    monkeypatch.setattr(doctor, "DEEP_CHECKS", with_effects(doctor.DEEP_CHECKS))
+    effectful = [
+        definition
+        for definition in (*doctor.QUICK_CHECKS, *doctor.DEEP_CHECKS)
+        if definition.effects
+    ]
+    assert [definition.id for definition in effectful] == ["preflight.queue", "pipedrive.connection"]
+    for definition in effectful:
+        monkeypatch.setattr(doctor, definition.probe, recording(definition.id, 0.02))
+
+    report = doctor.collect(deep=True, context=context)
+
+    assert report["instruments"]["failed"] == []
+    serial = [(kind, name) for kind, name, thread in events if thread == collector]
+    assert serial == [
+        (kind, definition.id) for definition in effectful for kind in ("start", "end")
+    ]
+    order = [(kind, name) for kind, name, _thread in events]
+    assert order.index(("end", "jobs.loaded")) < order.index(("start", "jobs.fresh"))
+
+
+def test_network_probes_overlap_once_their_configuration_is_resolved(monkeypatch, context):
+    from core.mcp import granola_server
+
+    pipedrive = _pipedrive_module()
+    _stub_probes(monkeypatch, exclude=("granola.query_path", "pipedrive.connection"))
+    in_flight = threading.Barrier(2, timeout=10)
+
+    def blocking_call(result):
+        in_flight.wait()
+        time.sleep(0.2)
+        return result
+
+    monkeypatch.setattr(doctor, "_granola_api_key", lambda _context: "grn_test")
+    monkeypatch.setattr(granola_server, "get_api_key", lambda: "grn_test")
+    monkeypatch.setattr(granola_server, "_list_notes", lambda **_kwargs: blocking_call([]))
+    monkeypatch.setattr(
+        pipedrive,
+        "_resolve",
+        lambda: {"ok": True, "api_token": "t", "base_url": "https://example.pipedrive.com"},
+    )
+    monkeypatch.setattr(
+        pipedrive,
+        "_request",
+        lambda *_args, **_kwargs: blocking_call({"ok": True, "data": {"name": "Test User"}}),
+    )
+
+    started = time.monotonic()
+    report = doctor.collect(deep=True, context=context)
+
+    # Both calls met at the barrier, so neither waited for the other to finish.
+    assert _check(report, "granola.query_path")["verdict"] == "OK"
+    assert _check(report, "pipedrive.connection")["verdict"] == "OK"
+    assert time.monotonic() - started < 5
+    assert report["instruments"]["failed"] == []
+
+
 def test_summary_counts_each_exact_verdict(monkeypatch, context):
     _stub_probes(
         monkeypatch,
@@ -4849,3 +4958,28 @@ def test_pipedrive_sandbox_failure_is_unknown_not_broken(monkeypatch, context):
 def test_pipedrive_check_is_registered_in_the_deep_check_list():
     ids = {definition.id for definition in doctor.DEEP_CHECKS}
     assert "pipedrive.connection" in ids
+
+
+def test_qmd_live_reports_the_last_background_reindex(monkeypatch, context):
+    _write_mcp_config(context, {"qmd": {"command": "qmd", "args": ["mcp"]}})
+    monkeypatch.setattr(doctor, "_qmd_binary", lambda _context: "/tmp/qmd")
+    monkeypatch.setattr(doctor, "_qmd_status", lambda _binary: (True, "3 collections"))
+    status_file = context.vault_root / ".logs" / "qmd-reindex.json"
+    status_file.parent.mkdir(parents=True, exist_ok=True)
+    status_file.write_text(
+        json.dumps(
+            {
+                "pending": 2,
+                "coalesced": 19,
+                "lastStartedAt": "2026-07-27T12:00:00Z",
+                "lastDurationSeconds": 1.5,
+                "lastError": None,
+            }
+        )
+    )
+
+    result = doctor._probe_qmd_live(context)
+
+    assert result.verdict == "OK"
+    assert "last background reindex started 2026-07-27T12:00:00Z" in result.detail
+    assert "took 1.5s (19 request(s) coalesced, 2 queued)" in result.detail
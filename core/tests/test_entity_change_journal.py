@@ -0,0 +1,165 @@
+"""Watcher-fed dirty-path journal behind entity-index reconciles."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from core.entity_engine import index as entity_index
+from core.entity_engine.change_journal import ChangeJournal
+from core.entity_engine.contract import render_person_page
+
+
+class _IdleObserver:
+    def stop(self) -> None:
+        pass
+
+    def join(self, timeout: float | None = None) -> None:
+        pass
+
+
+@pytest.fixture
+def vault(tmp_path: Path):
+    people = tmp_path / "05-Areas" / "People"
+    (people / "External").mkdir(parents=True)
+    (tmp_path / "05-Areas" / "Companies").mkdir(parents=True)
+    kwargs = {
+        "people_dir": people,
+        "companies_dir": tmp_path / "05-Areas" / "Companies",
+        "people_index_path": tmp_path / "System" / "People_Index.json",
+        "company_index_path": tmp_path / "System" / "Company_Index.json",
+    }
+    entity_index.clear_reconcile_cache()
+    yield tmp_path, people / "External", kwargs
+    entity_index.unwatch(tmp_path)
+    entity_index.clear_reconcile_cache()
+
+
+def _journal(root: Path, full_sweep_seconds: float = 300.0) -> ChangeJournal:
+    journal = ChangeJournal(full_sweep_seconds)
+    entity_index._WATCHED[entity_index.database_path(root).resolve()] = (
+        entity_index._Watched(journal=journal, observer=_IdleObserver())
+    )
+    return journal
+
+
+def _names(root: Path, kwargs: dict[str, Path]) -> list[str]:
+    entity_index.clear_reconcile_cache()
+    view = entity_index.people_index_data(root, **kwargs)
+    return [person["name"] for person in view["people"]]
+
+
+def _count_walks(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    walks: list[int] = []
+    original = entity_index._scan_source_roots
+
+    def counting(*args, **kwargs):
+        walks.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(entity_index, "_scan_source_roots", counting)
+    return walks
+
+
+def test_quiet_journal_skips_the_walk_and_the_database(
+    vault, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root, external, kwargs = vault
+    (external / "Ada.md").write_text(render_person_page("Ada"), encoding="utf-8")
+    _journal(root)
+    walks = _count_walks(monkeypatch)
+    assert entity_index.reconcile(root, **kwargs)["added"] == 1
+
+    def no_connect(path):
+        raise AssertionError("a quiet journal must not open the index")
+
+    monkeypatch.setattr(entity_index, "connect", no_connect)
+
+    assert entity_index.reconcile(root, **kwargs) == {
+        "added": 0,
+        "changed": 0,
+        "removed": 0,
+    }
+    assert walks == [1]
+
+
+def test_force_walks_the_tree_even_when_the_journal_is_quiet(vault) -> None:
+    root, external, kwargs = vault
+    _journal(root)
+    assert entity_index.reconcile(root, **kwargs)["added"] == 0
+
+    (external / "Ada.md").write_text(render_person_page("Ada"), encoding="utf-8")
+
+    assert entity_index.reconcile(root, force=True, **kwargs) == {
+        "added": 1,
+        "changed": 0,
+        "removed": 0,
+    }
+    (external / "Grace.md").write_text(render_person_page("Grace"), encoding="utf-8")
+    view = entity_index.people_index_data(root, force=True, **kwargs)
+    assert sorted(person["name"] for person in view["people"]) == ["Ada", "Grace"]
+
+
+def test_journaled_paths_are_reconciled_without_a_walk(
+    vault, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root, external, kwargs = vault
+    ada = external / "Ada.md"
+    ada.write_text(render_person_page("Ada"), encoding="utf-8")
+    journal = _journal(root)
+    entity_index.reconcile(root, **kwargs)
+    walks = _count_walks(monkeypatch)
+
+    grace = external / "Grace.md"
+    grace.write_text(render_person_page("Grace"), encoding="utf-8")
+    ada.unlink()
+    journal.mark(grace)
+    journal.mark(ada)
+    journal.mark(root / "00-Inbox" / "Unrelated.md")
+
+    assert entity_index.reconcile(root, **kwargs) == {
+        "added": 1,
+        "changed": 0,
+        "removed": 1,
+    }
+    assert _names(root, kwargs) == ["Grace"]
+    assert walks == []
+
+
+def test_periodic_sweep_catches_changes_the_watcher_missed(vault) -> None:
+    root, external, kwargs = vault
+    _journal(root, full_sweep_seconds=0.0)
+    assert _names(root, kwargs) == []
+
+    (external / "Ada.md").write_text(render_person_page("Ada"), encoding="utf-8")
+
+    assert _names(root, kwargs) == ["Ada"]
+
+
+def test_directory_events_force_a_full_sweep(vault) -> None:
+    root, external, kwargs = vault
+    journal = _journal(root)
+    assert _names(root, kwargs) == []
+
+    (external / "Ada.md").write_text(render_person_page("Ada"), encoding="utf-8")
+    journal.mark_all()
+
+    assert _names(root, kwargs) == ["Ada"]
+
+
+def test_watch_follows_real_filesystem_events(vault) -> None:
+    pytest.importorskip("watchdog")
+    root, external, kwargs = vault
+    assert entity_index.watch(
+        root, people_dir=kwargs["people_dir"], companies_dir=kwargs["companies_dir"]
+    )
+    assert _names(root, kwargs) == []
+
+    (external / "Ada.md").write_text(render_person_page("Ada"), encoding="utf-8")
+
+    deadline = time.monotonic() + 10
+    while _names(root, kwargs) != ["Ada"] and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert _names(root, kwargs) == ["Ada"]
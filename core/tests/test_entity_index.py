@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import sqlite3
 import unicodedata
+from difflib import SequenceMatcher
 from pathlib import Path
 
 import pytest
@@ -702,7 +703,7 @@ def test_reconcile_reads_and_parses_sources_before_write_transaction(
     _write_person(entity_vault)
     captured_connection: sqlite3.Connection | None = None
     original_connect = entity_index.connect
-    original_parse = entity_index.parse_entity_page
+    original_parse = entity_index.parse_entity_bytes
     original_read_bytes = Path.read_bytes
 
     def capture_connection(path: str | Path) -> sqlite3.Connection:
@@ -710,10 +711,12 @@ def test_reconcile_reads_and_parses_sources_before_write_transaction(
         captured_connection = original_connect(path)
         return captured_connection
 
-    def parse_outside_transaction(path: str | Path) -> dict[str, object]:
+    def parse_outside_transaction(
+        path: str | Path, content: bytes
+    ) -> dict[str, object]:
         assert captured_connection is not None
         assert captured_connection.in_transaction is False
-        return original_parse(path)
+        return original_parse(path, content)
 
     def read_outside_transaction(path: Path) -> bytes:
         if path.suffix == ".md":
@@ -722,7 +725,7 @@ def test_reconcile_reads_and_parses_sources_before_write_transaction(
         return original_read_bytes(path)
 
     monkeypatch.setattr(entity_index, "connect", capture_connection)
-    monkeypatch.setattr(entity_index, "parse_entity_page", parse_outside_transaction)
+    monkeypatch.setattr(entity_index, "parse_entity_bytes", parse_outside_transaction)
     monkeypatch.setattr(Path, "read_bytes", read_outside_transaction)
 
     entity_index.build_from_vault(entity_vault["root"], **_kwargs(entity_vault))
@@ -912,3 +915,232 @@ def test_default_scan_respects_folder_path_remapping(tmp_path: Path) -> None:
     assert entity_index.find_company_by_domain(
         tmp_path, "mail.engines.test"
     )["path"] == "Relationships/Accounts/Analytical_Engines.md"
+
+
+def test_indexed_lookup_matches_the_exported_view_ladder(
+    entity_vault: dict[str, Path],
+) -> None:
+    _write_person(entity_vault)
+    _write_person(entity_vault, "Alice Jones")
+    _write_person(entity_vault, "Bob Jones")
+    _write_person(entity_vault, "Katelyn")
+    entity_index.build_from_vault(entity_vault["root"], **_kwargs(entity_vault))
+    people = json.loads(entity_vault["people_export"].read_text())["people"]
+
+    for query, company in [
+        ("fixture-alice@example.com", None),
+        ("AL", None),
+        ("alice smith", None),
+        ("alice", None),
+        ("alice", "acme"),
+        ("alise smith", None),
+        ("jones", None),
+        ("b", None),
+        ("caitlin", None),
+        ("nobody", "Acme"),
+    ]:
+        looked_up = entity_index.lookup_person(
+            entity_vault["root"], query, company, **_kwargs(entity_vault)
+        )
+        expected, ambiguous = entity_index._match_people(
+            entity_index._exported_person_candidates(people), query, company
+        )
+        assert looked_up["matches"] == expected[:10], query
+        assert looked_up.get("ambiguous", False) is ambiguous, query
+
+
+def test_fuzzy_lookup_only_scores_people_who_could_reach_the_threshold(
+    entity_vault: dict[str, Path],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    for name in ("Alice Smith", "Bob Jones", "Zed Quux"):
+        _write_person(entity_vault, name)
+    entity_index.build_from_vault(entity_vault["root"], **_kwargs(entity_vault))
+    scored: list[str] = []
+    original = entity_index.SequenceMatcher
+
+    def counting(isjunk, a, b):
+        scored.append(b)
+        return original(isjunk, a, b)
+
+    monkeypatch.setattr(entity_index, "SequenceMatcher", counting)
+
+    result = entity_index.lookup_person(
+        entity_vault["root"], "Alise Smith", **_kwargs(entity_vault)
+    )
+
+    assert [match["name"] for match in result["matches"]] == ["Alice Smith"]
+    assert scored == ["alice smith"]
+
+
+def test_fuzzy_prefilter_keeps_matches_that_share_no_trigram(
+    entity_vault: dict[str, Path],
+) -> None:
+    # "caitlin" and "katelyn" score 0.57 without sharing a single trigram.
+    _write_person(entity_vault, "Katelyn")
+    entity_index.build_from_vault(entity_vault["root"], **_kwargs(entity_vault))
+
+    result = entity_index.lookup_person(
+        entity_vault["root"], "Caitlin", **_kwargs(entity_vault)
+    )
+
+    assert [match["name"] for match in result["matches"]] == ["Katelyn"]
+    assert result["matches"][0]["_score"] == 0.57
+
+
+def test_fuzzy_prefilter_never_rejects_a_name_the_full_score_keeps() -> None:
+    names = ["ada", "caitlin", "katelyn", "alice smith", "bob jones", "zed", "al", "x"]
+    for query in names:
+        for name in names:
+            if SequenceMatcher(None, query, name).ratio() >= 0.5:
+                assert entity_index._may_match_fuzzily(query, name), (query, name)
+
+
+def test_company_domain_lookup_uses_stored_registrable_domains(
+    entity_vault: dict[str, Path],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    company = entity_vault["companies"] / "Globex.md"
+    company.write_text(
+        render_company_page("Globex", domains=["eu.globex.co.uk"]),
+        encoding="utf-8",
+    )
+    _write_company(entity_vault)
+    entity_index.build_from_vault(entity_vault["root"], **_kwargs(entity_vault))
+    calls: list[object] = []
+    original = entity_index.registrable_domain
+
+    def counting(domain: object) -> str:
+        calls.append(domain)
+        return original(domain)
+
+    monkeypatch.setattr(entity_index, "registrable_domain", counting)
+
+    match = entity_index.find_company_by_domain(
+        entity_vault["root"], "mail.globex.co.uk", **_kwargs(entity_vault)
+    )
+
+    assert match is not None
+    assert match["name"] == "Globex"
+    assert calls == ["mail.globex.co.uk"]
+
+
+def test_parse_entity_bytes_matches_reading_the_page(tmp_path: Path) -> None:
+    page = tmp_path / "05-Areas" / "People" / "External" / "Ada_Lovelace.md"
+    page.parent.mkdir(parents=True)
+    content = (
+        "﻿"
+        + render_person_page("Ada Lovelace", role="Analyst").replace("\n", "\r\n")
+    ).encode("utf-8")
+    page.write_bytes(content)
+
+    assert entity_engine.parse_entity_bytes(page, content) == (
+        entity_engine.parse_entity_page(page)
+    )
+
+
+def test_parallel_prepare_builds_the_same_projection_as_serial(
+    entity_vault: dict[str, Path],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    for index in range(12):
+        _write_person(entity_vault, f"Person {index:02d}")
+    _write_company(entity_vault)
+
+    def snapshot() -> list[tuple[str, str]]:
+        with sqlite3.connect(
+            entity_index.database_path(entity_vault["root"])
+        ) as connection:
+            return connection.execute(
+                "SELECT id, fields_json FROM nodes ORDER BY id"
+            ).fetchall()
+
+    entity_index.build_from_vault(entity_vault["root"], **_kwargs(entity_vault))
+    serial = snapshot()
+
+    pools: list[int] = []
+
+    class CountingPool(entity_index.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs) -> None:
+            pools.append(kwargs["max_workers"])
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(entity_index, "ProcessPoolExecutor", CountingPool)
+    monkeypatch.setattr(entity_index, "_PARALLEL_PREPARE_MIN_PAGES", 2)
+    monkeypatch.setattr(entity_index, "_PREPARE_BATCH_SIZE", 3)
+    monkeypatch.setattr(entity_index, "_available_cpus", lambda: 2)
+    entity_index.build_from_vault(entity_vault["root"], **_kwargs(entity_vault))
+
+    assert pools == [2]
+    assert snapshot() == serial
+
+
+def test_streamed_exports_match_the_in_memory_views_byte_for_byte(
+    entity_vault: dict[str, Path],
+) -> None:
+    _write_person(entity_vault, "Zoë Adams")
+    _write_person(entity_vault)
+    internal = entity_vault["people"] / "Internal"
+    internal.mkdir()
+    (internal / "Ada.md").write_text(render_person_page("Ada"), encoding="utf-8")
+
+    entity_index.build_from_vault(entity_vault["root"], **_kwargs(entity_vault))
+
+    with entity_index.connect(
+        entity_index.database_path(entity_vault["root"])
+    ) as connection:
+        people_view, company_view = entity_index._views(connection)
+    assert entity_vault["people_export"].read_text(encoding="utf-8") == (
+        json.dumps(people_view, indent=2) + "\n"
+    )
+    assert entity_vault["company_export"].read_text(encoding="utf-8") == (
+        json.dumps(company_view, indent=2) + "\n"
+    )
+
+
+def test_export_is_skipped_while_the_view_is_unchanged(
+    entity_vault: dict[str, Path],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    person = _write_person(entity_vault)
+    entity_index.build_from_vault(entity_vault["root"], **_kwargs(entity_vault))
+    written: list[Path] = []
+    original = entity_index._stream_view
+
+    def recording(path: Path, *args, **kwargs) -> None:
+        written.append(path)
+        original(path, *args, **kwargs)
+
+    monkeypatch.setattr(entity_index, "_stream_view", recording)
+
+    entity_index.reconcile(entity_vault["root"], force=True, **_kwargs(entity_vault))
+    assert written == []
+
+    entity_vault["company_export"].unlink()
+    person.write_text(render_person_page("Alice Smith", role="CEO"), encoding="utf-8")
+    entity_index.reconcile(entity_vault["root"], force=True, **_kwargs(entity_vault))
+
+    assert written == [entity_vault["people_export"], entity_vault["company_export"]]
+
+
+def test_deferred_exports_are_written_on_flush(
+    entity_vault: dict[str, Path],
+) -> None:
+    _write_person(entity_vault)
+    entity_index.build_from_vault(entity_vault["root"], **_kwargs(entity_vault))
+    entity_index.defer_json_exports(60)
+    try:
+        _write_person(entity_vault, "Bob Jones")
+        entity_index.reconcile(entity_vault["root"], **_kwargs(entity_vault))
+        exported = json.loads(entity_vault["people_export"].read_text())
+        assert exported["total"] == 1
+
+        entity_index.flush_json_exports()
+    finally:
+        entity_index.defer_json_exports(None)
+
+    exported = json.loads(entity_vault["people_export"].read_text())
+    assert [person["name"] for person in exported["people"]] == [
+        "Alice Smith",
+        "Bob Jones",
+    ]
@@ -6,6 +6,7 @@ import ast
 import builtins
 import inspect
 import json
+import multiprocessing
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -105,6 +106,57 @@ def test_logging_omits_version_without_raising_when_package_cannot_be_read(vault
     assert all("dexVersion" not in entry for entry in _queue(vault))
 
 
+def test_repeats_append_without_rewriting_and_fold_into_one_counted_entry(
+    vault: Path,
+) -> None:
+    dex_logger.log_error("work-mcp", "task failed")
+    view = vault / ".logs" / "error-queue.json"
+    events = vault / ".logs" / "error-events.jsonl"
+    written = view.stat().st_mtime_ns, view.stat().st_ino
+
+    for _ in range(5):
+        dex_logger.log_error("work-mcp", "task failed")
+
+    assert (view.stat().st_mtime_ns, view.stat().st_ino) == written
+    assert len(events.read_text().splitlines()) == 5
+
+    [entry] = dex_logger.get_unacknowledged_errors()
+    assert entry["count"] == 6
+    assert events.read_text() == ""
+    assert _queue(vault)[0]["count"] == 6
+
+
+def _log_distinct_errors(vault: str, worker: int) -> None:
+    import os
+
+    os.environ["VAULT_PATH"] = vault
+    for index in range(10):
+        dex_logger.log_error(f"server-{worker}", f"failure {index}")
+        dex_logger.mark_healthy(f"server-{worker}-{index}")
+
+
+def test_concurrent_servers_never_lose_each_others_entries(vault: Path) -> None:
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=_log_distinct_errors, args=(str(vault), worker))
+        for worker in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(30)
+        assert worker.exitcode == 0
+
+    logged = {(entry["source"], entry["message"]) for entry in dex_logger.read_error_queue()}
+    assert logged == {
+        (f"server-{worker}", f"failure {index}")
+        for worker in range(4)
+        for index in range(10)
+    }
+    health = json.loads((vault / ".logs" / "mcp-health.json").read_text())
+    assert len(health["servers"]) == 40
+
+
 def test_error_retention_policy_is_thirty_days() -> None:
     assert dex_logger.STALE_ERROR_DAYS == 30
 
@@ -278,6 +330,48 @@ def test_tier_one_heal_acknowledges_only_errors_resolved_by_newer_success(
     assert saved["work-mcp"]["acknowledged"] is False
 
 
+def test_acknowledging_keeps_errors_logged_while_preflight_ran(
+    vault: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dex_logger.log_error("update-checker", "offline")
+    error_at = datetime.fromisoformat(
+        str(_queue(vault)[0]["timestamp"]).replace("Z", "+00:00")
+    )
+    success_at = (error_at + timedelta(seconds=1)).isoformat()
+
+    def preflight_while_others_log():
+        dex_logger.log_error("calendar-mcp", "permission denied")
+        dex_logger._append_event(
+            {
+                "id": "pending-1",
+                "severity": "error",
+                "source": "work-mcp",
+                "message": "task failed",
+                "timestamp": success_at,
+            }
+        )
+        return {
+            "lastCheck": success_at,
+            "servers": {
+                "update-checker": {"status": "ok", "checkedAt": success_at},
+            },
+        }
+
+    monkeypatch.setattr(doctor.preflight, "run_preflight", preflight_while_others_log)
+
+    acknowledged = doctor._acknowledge_resolved_preflight_errors(
+        _context(vault, error_at + timedelta(seconds=2))
+    )
+
+    assert acknowledged == 1
+    saved = {entry["source"]: entry for entry in _queue(vault)}
+    assert saved["update-checker"]["acknowledged"] is True
+    assert saved["calendar-mcp"]["acknowledged"] is False
+    assert saved["work-mcp"]["id"] == "pending-1"
+    assert (vault / ".logs" / "error-events.jsonl").read_bytes() == b""
+
+
 def test_current_version_error_newer_than_retention_threshold_is_current_breakage(
     vault: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -0,0 +1,237 @@
+"""Granola local mirror: incremental sync, bounded detail fetches and local search.
+
+A stand-in HTTP server plays the public API so the real urllib path is used.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.mcp import granola_server
+
+
+def _iso(days_ago: float) -> str:
+    return granola_server._format_iso(datetime.now(timezone.utc) - timedelta(days=days_ago))
+
+
+class StandInGranola:
+    """Serves /v1/notes (created_after, cursor paging) and /v1/notes/{id}."""
+
+    def __init__(self, page_size: int = 2, detail_delay: float = 0.0):
+        self.notes: dict[str, dict] = {}
+        self.page_size = page_size
+        self.detail_delay = detail_delay
+        self.fail_list_after_pages: int | None = None
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def add(self, note_id: str, days_ago: float, *, title: str, summary: str = "", attendees=()):
+        created_at = _iso(days_ago)
+        self.notes[note_id] = {
+            "id": note_id,
+            "title": title,
+            "created_at": created_at,
+            "updated_at": created_at,
+            "summary_markdown": summary,
+            "attendees": [{"name": name, "email": email} for name, email in attendees],
+        }
+
+    def handle(self, path: str, query: dict[str, str]) -> tuple[int, dict]:
+        with self._lock:
+            self.requests.append((path, query))
+        if path == "/v1/notes":
+            listed = sorted(
+                (
+                    note
+                    for note in self.notes.values()
+                    if note["created_at"] > query.get("created_after", "")
+                ),
+                key=lambda note: note["created_at"],
+                reverse=True,
+            )
+            start = int(query.get("cursor", 0))
+            if self.fail_list_after_pages is not None and start >= self.fail_list_after_pages * self.page_size:
+                return 503, {"error": "unavailable"}
+            page = listed[start : start + self.page_size]
+            more = start + self.page_size < len(listed)
+            return 200, {
+                "notes": [
+                    {key: note[key] for key in ("id", "title", "created_at", "updated_at")}
+                    for note in page
+                ],
+                "hasMore": more,
+                "cursor": str(start + self.page_size) if more else None,
+            }
+        note_id = path.rsplit("/", 1)[-1]
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.detail_delay)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        if note_id not in self.notes:
+            return 404, {"error": "not found"}
+        return 200, self.notes[note_id]
+
+    def detail_requests(self) -> list[str]:
+        return [path.rsplit("/", 1)[-1] for path, _query in self.requests if path != "/v1/notes"]
+
+    def list_requests(self) -> list[dict[str, str]]:
+        return [query for path, query in self.requests if path == "/v1/notes"]
+
+
+@pytest.fixture
+def granola(monkeypatch, tmp_path):
+    stand_in = StandInGranola()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parsed = urllib.parse.urlparse(self.path)
+            status, body = stand_in.handle(parsed.path, dict(urllib.parse.parse_qsl(parsed.query)))
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    monkeypatch.setenv("GRANOLA_API_KEY", "grn_test")
+    monkeypatch.setattr(granola_server, "_read_key_from_connection_manager", lambda: None)
+    monkeypatch.setattr(granola_server, "API_BASE_URL", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setattr(granola_server, "MIRROR_PATH", tmp_path / "granola-mirror.sqlite3")
+    granola_server._response_cache.clear()
+    yield stand_in
+    granola_server._response_cache.clear()
+    server.shutdown()
+    server.server_close()
+
+
+def test_search_is_served_locally_after_one_sync_and_bounded_detail_refresh(granola):
+    granola.detail_delay = 0.05
+    granola.add("n1", 1, title="Roadmap review", attendees=[("Ana Ruiz", "ana@acme.com")])
+    granola.add("n2", 2, title="1:1", summary="Discussed the Q3 pricing experiment")
+    granola.add("n3", 3, title="Standup")
+    granola.add("n4", 4, title="Hiring sync", attendees=[("Bo Chen", "bo@globex.io")])
+    granola.add("n5", 40, title="Old roadmap", attendees=[("Ana Ruiz", "ana@acme.com")])
+
+    results = granola_server.search_meetings("acme.com", days_back=30, limit=10)
+
+    assert [meeting["id"] for meeting in results] == ["n1"]
+    assert results[0]["participants"] == [{"name": "Ana Ruiz", "email": "ana@acme.com"}]
+    assert sorted(granola.detail_requests()) == ["n1", "n2", "n3", "n4"]
+    assert 1 < granola.max_in_flight <= granola_server.DETAIL_FETCH_WORKERS
+    [first_listing, *_pages] = granola.list_requests()
+    assert first_listing["created_after"] <= _iso(30)
+
+    granola.requests.clear()
+    assert [m["id"] for m in granola_server.search_meetings("pric", days_back=30)] == ["n2"]
+    assert [m["id"] for m in granola_server.search_meetings("roadmap", days_back=30)] == ["n1"]
+    recent = granola_server.get_recent_meetings(days_back=30, limit=2)
+    assert [meeting["id"] for meeting in recent] == ["n1", "n2"]
+    assert recent[0]["participant_count"] == 1
+    assert granola.requests == []
+
+
+def test_incremental_sync_lists_from_the_high_water_mark_and_refetches_changed_details(
+    granola, monkeypatch
+):
+    granola.add("n1", 5, title="Planning")
+    granola.add("n2", 1, title="Retro")
+    granola_server.search_meetings("planning", days_back=30)
+    monkeypatch.setattr(granola_server, "_cache_ttl", 0)
+    granola.requests.clear()
+
+    granola.add("n3", 0.01, title="Planning follow-up", summary="Ship the beta")
+    granola.notes["n2"]["updated_at"] = _iso(0)
+    granola.notes["n2"]["summary_markdown"] = "Planning went well"
+
+    results = granola_server.search_meetings("planning", days_back=30)
+
+    [listing] = granola.list_requests()
+    high_water = granola_server._parse_iso(granola.notes["n2"]["created_at"])
+    assert listing["created_after"] == granola_server._format_iso(
+        high_water - granola_server.MIRROR_RELIST_OVERLAP
+    )
+    assert sorted(granola.detail_requests()) == ["n2", "n3"]
+    assert [meeting["id"] for meeting in results] == ["n3", "n2", "n1"]
+
+
+def test_failed_sync_serves_a_covered_mirror_but_a_partial_listing_covers_nothing(
+    granola, monkeypatch
+):
+    for index in range(5):
+        granola.add(f"n{index}", index + 1, title=f"Meeting {index}")
+    granola.fail_list_after_pages = 1
+    monkeypatch.setattr(granola_server.time, "sleep", lambda _seconds: None)
+
+    with pytest.raises(granola_server.GranolaAPIError):
+        granola_server.get_recent_meetings(days_back=30)
+    assert granola_server._mirror().sync_state().get("covered_since") is None
+
+    granola.fail_list_after_pages = None
+    assert len(granola_server.get_recent_meetings(days_back=30)) == 5
+
+    monkeypatch.setattr(granola_server, "_cache_ttl", 0)
+    granola.fail_list_after_pages = 0
+    assert len(granola_server.get_recent_meetings(days_back=30)) == 5
+
+
+def test_periodic_full_relist_refreshes_old_edits_and_drops_deleted_notes(granola, monkeypatch):
+    granola.add("n1", 20, title="Budget review", summary="Draft numbers")
+    granola.add("n2", 10, title="Vendor call")
+    granola.add("n3", 1, title="Standup")
+    granola_server.search_meetings("budget", days_back=30)
+    monkeypatch.setattr(granola_server, "_cache_ttl", 0)
+
+    granola.notes["n1"]["updated_at"] = _iso(0)
+    granola.notes["n1"]["summary_markdown"] = "Final numbers"
+    del granola.notes["n2"]
+
+    # Within the interval only the overlap is re-listed: neither change is seen.
+    assert [m["id"] for m in granola_server.search_meetings("vendor", days_back=30)] == ["n2"]
+    assert granola_server.search_meetings("final", days_back=30) == []
+
+    monkeypatch.setattr(granola_server, "MIRROR_FULL_RELIST_INTERVAL", 0)
+    granola.requests.clear()
+
+    assert granola_server.search_meetings("vendor", days_back=30) == []
+    [listing, *_pages] = granola.list_requests()
+    assert listing["created_after"] == granola_server._mirror().sync_state()["covered_since"]
+    assert granola.detail_requests() == ["n1"]
+    assert [m["id"] for m in granola_server.search_meetings("final", days_back=30)] == ["n1"]
+    assert [m["id"] for m in granola_server.get_recent_meetings(days_back=30)] == ["n3", "n1"]
+
+
+def test_unusable_mirror_database_falls_back_to_live_listings(granola, monkeypatch):
+    granola.add("n1", 1, title="Roadmap review", attendees=[("Ana Ruiz", "ana@acme.com")])
+    granola.add("n2", 2, title="Standup")
+    monkeypatch.setattr(
+        granola_server.GranolaMirror,
+        "_connect",
+        lambda self: (_ for _ in ()).throw(granola_server.sqlite3.OperationalError("readonly")),
+    )
+
+    assert [m["id"] for m in granola_server.get_recent_meetings(days_back=30)] == ["n1", "n2"]
+    results = granola_server.search_meetings("acme.com", days_back=30)
+    assert [m["id"] for m in results] == ["n1"]
+    assert results[0]["participants"] == [{"name": "Ana Ruiz", "email": "ana@acme.com"}]
+    rows = granola_server.get_extent_rows(30)
+    assert [row["id"] for row in rows] == ["n1", "n2"]
+    assert all(row["detail"] for row in rows)
@@ -18,9 +18,10 @@ from core.mcp import granola_server
 
 
 @pytest.fixture(autouse=True)
-def _configured_api(monkeypatch):
+def _configured_api(monkeypatch, tmp_path):
     """Keep tests offline while exercising the connected-tool code paths."""
     monkeypatch.setenv("GRANOLA_API_KEY", "grn_test")
+    monkeypatch.setattr(granola_server, "MIRROR_PATH", tmp_path / "granola-mirror.sqlite3")
     monkeypatch.setattr(
         granola_server.subprocess,
         "run",
@@ -139,6 +140,21 @@ def test_api_key_returns_none_when_connection_manager_and_legacy_sources_are_abs
     assert granola_server.get_api_key() is None
 
 
+def test_pinned_api_key_overrides_resolution_only_inside_its_context(monkeypatch):
+    monkeypatch.setenv("GRANOLA_API_KEY", "grn_from_environment")
+    monkeypatch.setattr(
+        granola_server.subprocess,
+        "run",
+        lambda *_args, **_kwargs: SimpleNamespace(returncode=2, stdout=""),
+    )
+
+    with granola_server.pinned_api_key("grn_pinned"):
+        assert granola_server.get_api_key() == "grn_pinned"
+    with granola_server.pinned_api_key(None):
+        assert granola_server.get_api_key() is None
+    assert granola_server.get_api_key() == "grn_from_environment"
+
+
 def test_recent_meetings_preserves_legitimate_empty_success(monkeypatch):
     def empty_page(path, params):
         assert path == "/v1/notes"
@@ -158,8 +174,8 @@ def test_recent_meetings_returns_meetings_from_successful_page(monkeypatch):
     note = {
         "id": "note-1",
         "title": "Weekly sync",
-        "created_at": "2026-07-09T10:00:00Z",
-        "updated_at": "2026-07-09T11:00:00Z",
+        "created_at": granola_server._cutoff_iso(1),
+        "updated_at": granola_server._cutoff_iso(0),
     }
 
     def successful_page(path, params):
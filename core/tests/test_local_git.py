@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import os
 import subprocess
+import sys
+import time
 from pathlib import Path
 
 import pytest
@@ -82,3 +84,42 @@ def test_read_only_profile_refuses_mutation_before_subprocess(tmp_path, monkeypa
     )
     with pytest.raises(ValueError, match="read-only"):
         local_git.git_output(tmp_path, "update-ref", "HEAD", "0" * 40, profile="read-only")
+
+
+def test_object_reader_streams_blobs_over_one_process_and_fails_closed(tmp_path):
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    contents = [b"first\n", b"", b"binary\x00\r\nbytes"]
+    object_ids = [
+        subprocess.run(
+            ["git", "-C", str(tmp_path), "hash-object", "-w", "--stdin"],
+            input=content,
+            capture_output=True,
+            check=True,
+        ).stdout.decode().strip()
+        for content in contents
+    ]
+
+    assert [local_git.git_blob_id(content) for content in contents] == object_ids
+    with local_git.GitObjectReader(tmp_path) as reader:
+        assert [reader.read(object_id) for object_id in object_ids] == contents
+        with pytest.raises(RuntimeError, match="sanitized local Git operation failed"):
+            reader.read("0" * 40)
+        with pytest.raises(RuntimeError, match="closed"):
+            reader.read(object_ids[0])
+    with local_git.GitObjectReader(tmp_path, max_output=4) as reader:
+        with pytest.raises(RuntimeError, match="output exceeded"):
+            reader.read(object_ids[0])
+
+
+def test_object_reader_watchdog_kills_a_stalled_pipe(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        local_git,
+        "_git_command",
+        lambda *_args: [sys.executable, "-c", "import time; time.sleep(60)"],
+    )
+
+    started = time.monotonic()
+    with local_git.GitObjectReader(tmp_path, timeout=0.2) as reader:
+        with pytest.raises(RuntimeError, match="sanitized local Git operation failed"):
+            reader.read("0" * 40)
+    assert time.monotonic() - started < 10
@@ -709,3 +709,57 @@ def test_gate_red_on_dist_drift(tmp_path: Path) -> None:
 
     assert result.returncode == 1
     assert "DRIFT" in result.stdout
+
+
+def _load_contract_benchmark():
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location(
+        "benchmark_portable_contract",
+        REPO_ROOT / "scripts" / "benchmark_portable_contract.py",
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_compiled_matcher_classifies_exactly_like_the_linear_scan() -> None:
+    benchmark = _load_contract_benchmark()
+    paths = benchmark.synthetic_paths(5000) + [
+        "System/credentials",
+        "system/CREDENTIALS/api.txt",
+        ".env.d/nested/file.md",
+        "core/certs/Server.PEM",
+        "a/b/xtoken.json",
+        ".git",
+        "./core//mcp/../mcp/work_server.py",
+        "\\core\\mcp\\work_server.py",
+        "unclassified-top",
+    ]
+    portable_contract._COMPILED = None
+
+    compiled = benchmark.classify(paths, portable_contract.is_denied, portable_contract.resolve)
+    reference = benchmark.classify(paths, benchmark.reference_is_denied, benchmark.reference_resolve)
+
+    assert compiled == reference
+
+
+def test_compiled_matcher_follows_replaced_rule_tables(monkeypatch) -> None:
+    with pytest.raises(portable_contract.ContractViolation):
+        portable_contract.resolve("brand-new/file.md")
+
+    monkeypatch.setattr(
+        portable_contract,
+        "RULES",
+        portable_contract.RULES
+        + (portable_contract._r("vault-brand-new", "brand-new", "dir", "vault"),),
+    )
+    monkeypatch.setattr(
+        portable_contract,
+        "HARD_DENY_PATTERNS",
+        portable_contract.HARD_DENY_PATTERNS + ("*.secret",),
+    )
+
+    resolution = portable_contract.resolve("brand-new/file.md")
+    assert (resolution.rule_id, resolution.denied) == ("vault-brand-new", False)
+    assert portable_contract.is_denied("brand-new/launch.SECRET") is True
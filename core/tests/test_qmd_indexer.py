@@ -0,0 +1,71 @@
+"""Coalescing QMD reindex scheduler: debounce, single flight, trailing rerun."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+from core.utils import qmd_indexer
+from core.utils.qmd_indexer import ReindexScheduler
+
+
+def test_a_burst_of_writes_becomes_one_run(tmp_path: Path) -> None:
+    runs: list[int] = []
+    status_file = tmp_path / ".logs" / "qmd-reindex.json"
+    scheduler = ReindexScheduler(
+        lambda: runs.append(1),
+        debounce_seconds=0.05,
+        status_file=lambda: status_file,
+    )
+
+    for _ in range(20):
+        scheduler.request()
+
+    assert scheduler.wait_idle(5)
+    assert runs == [1]
+    status = scheduler.status()
+    assert (status["runs"], status["coalesced"], status["pending"]) == (1, 19, 0)
+    recorded = json.loads(status_file.read_text())
+    assert recorded["runs"] == 1 and recorded["lastError"] is None
+    assert recorded["lastDurationSeconds"] >= 0
+
+
+def test_writes_during_a_run_get_exactly_one_trailing_run() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    active: list[int] = []
+    overlaps: list[int] = []
+    runs: list[int] = []
+
+    def run() -> str | None:
+        if active:
+            overlaps.append(1)
+        active.append(1)
+        runs.append(1)
+        started.set()
+        release.wait(5)
+        active.pop()
+        return "qmd embed returned 1" if len(runs) == 2 else None
+
+    scheduler = ReindexScheduler(run, debounce_seconds=0.01)
+    scheduler.request()
+    assert started.wait(5)
+    for _ in range(5):
+        scheduler.request()
+    assert scheduler.status()["pending"] == 5
+    release.set()
+
+    assert scheduler.wait_idle(5)
+    assert len(runs) == 2 and overlaps == []
+    assert scheduler.status()["lastError"] == "qmd embed returned 1"
+
+
+def test_refresh_is_a_no_op_without_qmd(monkeypatch) -> None:
+    requested: list[int] = []
+    monkeypatch.setattr(qmd_indexer, "_find_qmd", lambda: None)
+    monkeypatch.setattr(qmd_indexer._scheduler, "request", lambda: requested.append(1))
+
+    qmd_indexer.refresh_search_index()
+
+    assert requested == []
@@ -11,6 +11,7 @@ import stat
 import subprocess
 import sys
 import tarfile
+import threading
 import time
 from pathlib import Path
 
@@ -371,9 +372,10 @@ def test_report_schema_exit_zero_and_no_live_write(tmp_path: Path) -> None:
         "off": 3,
     }
     for journey in run.report["journeys"]:
-        assert set(journey) == {"id", "verdict", "detail", "duration_ms"}
+        assert set(journey) == {"id", "verdict", "detail", "queued_ms", "duration_ms"}
         assert journey["verdict"] in smoke.VERDICTS
         assert isinstance(journey["detail"], str) and journey["detail"]
+        assert isinstance(journey["queued_ms"], int) and journey["queued_ms"] >= 0
         assert isinstance(journey["duration_ms"], int) and journey["duration_ms"] >= 0
     assert _tree_hash(vault) == before
 
@@ -695,6 +697,71 @@ def test_release_snapshot_is_absent_from_every_child_pythonpath(
         assert str(release_root) not in python_paths
 
 
+def test_journeys_share_one_read_only_release_snapshot_and_run_in_parallel(
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    vault = _write_valid_vault(tmp_path)
+    repo = _release_repo(tmp_path)
+    snapshots = []
+    original_materialize = smoke._materialize_release_core
+
+    def counting_materialize(repository, destination, **kwargs):
+        snapshots.append(destination)
+        return original_materialize(repository, destination, **kwargs)
+
+    monkeypatch.setattr(smoke, "_materialize_release_core", counting_materialize)
+    definitions = (_definition("configs"), _definition("skills"), _definition("hooks"))
+    barrier = threading.Barrier(len(definitions), timeout=10)
+    observed = []
+    original_journey = smoke._run_journey_process
+
+    def journey_together(definition, **kwargs):
+        release_root = kwargs["release_root"]
+        observed.append((kwargs["cwd"], release_root, release_root.stat().st_mode))
+        barrier.wait()
+        return original_journey(definition, **kwargs)
+
+    monkeypatch.setattr(smoke, "_run_journey_process", journey_together)
+
+    run = smoke.run_smoke(vault_root=vault, repo_root=repo, journey_definitions=definitions)
+
+    assert run.harness_failed is False
+    assert [journey["id"] for journey in run.report["journeys"]] == ["configs", "skills", "hooks"]
+    [snapshot] = snapshots
+    assert {release_root for _cwd, release_root, _mode in observed} == {snapshot}
+    assert all(not mode & 0o222 for _cwd, _release_root, mode in observed)
+    assert len({cwd for cwd, _release_root, _mode in observed}) == len(definitions)
+    assert all(cwd.parent == snapshot.parent for cwd, _release_root, _mode in observed)
+
+
+def test_journeys_beyond_the_worker_limit_report_their_queueing_time(
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    vault = _write_valid_vault(tmp_path)
+    monkeypatch.setattr(smoke, "JOURNEY_WORKERS", 1)
+    original_journey = smoke._run_journey_process
+
+    def slow_journey(definition, **kwargs):
+        time.sleep(0.3)
+        return original_journey(definition, **kwargs)
+
+    monkeypatch.setattr(smoke, "_run_journey_process", slow_journey)
+
+    run = smoke.run_smoke(
+        vault_root=vault,
+        repo_root=REPO_ROOT,
+        journey_definitions=(_definition("skills"), _definition("hooks")),
+    )
+
+    first, second = run.report["journeys"]
+    assert run.harness_failed is False
+    assert first["queued_ms"] < 300 <= first["duration_ms"]
+    assert second["queued_ms"] >= first["duration_ms"]
+    assert second["duration_ms"] >= 300
+
+
 def test_runner_materialization_excludes_untracked_core_files(
     monkeypatch,
     tmp_path: Path,
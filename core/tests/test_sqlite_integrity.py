@@ -0,0 +1,126 @@
+"""Once-per-file quick_check and pooled entity-index connections."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from core.entity_engine import index as entity_index
+from core.entity_engine.contract import render_person_page
+from core.utils.sqlite_integrity import VerifiedFiles, start_background_checks
+
+
+@pytest.fixture
+def vault(tmp_path: Path):
+    people = tmp_path / "05-Areas" / "People"
+    (people / "External").mkdir(parents=True)
+    (people / "External" / "Ada.md").write_text(
+        render_person_page("Ada Lovelace"), encoding="utf-8"
+    )
+    kwargs = {
+        "people_dir": people,
+        "companies_dir": tmp_path / "05-Areas" / "Companies",
+        "people_index_path": tmp_path / "System" / "People_Index.json",
+        "company_index_path": tmp_path / "System" / "Company_Index.json",
+    }
+    entity_index.clear_reconcile_cache()
+    yield tmp_path, kwargs
+    entity_index.keep_connections_open(False)
+    entity_index.clear_reconcile_cache()
+
+
+@pytest.fixture
+def quick_checks(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+    original = entity_index.quick_check_passes
+
+    def counting(connection: sqlite3.Connection) -> bool:
+        calls.append("check")
+        return original(connection)
+
+    monkeypatch.setattr(entity_index, "quick_check_passes", counting)
+    return calls
+
+
+def test_quick_check_runs_once_per_database_file(vault, quick_checks) -> None:
+    root, kwargs = vault
+    entity_index.build_from_vault(root, **kwargs)
+    for _ in range(3):
+        entity_index.lookup_person(root, "Ada", force=True, **kwargs)
+
+    assert quick_checks == ["check"]
+
+    entity_index.build_from_vault(root, **kwargs)
+
+    assert quick_checks == ["check", "check"]
+
+
+def test_pooled_connection_is_reused_until_the_file_is_replaced(vault) -> None:
+    root, kwargs = vault
+    entity_index.keep_connections_open()
+    db_path = entity_index.database_path(root)
+    entity_index.build_from_vault(root, **kwargs)
+
+    with entity_index.pooled_connection(db_path) as first:
+        pass
+    with entity_index.pooled_connection(db_path) as second:
+        assert second is first
+        assert second.execute("SELECT COUNT(*) FROM nodes").fetchone() == (1,)
+
+    entity_index.build_from_vault(root, **kwargs)
+
+    with entity_index.pooled_connection(db_path) as rebuilt:
+        assert rebuilt is not first
+        assert rebuilt.execute("SELECT COUNT(*) FROM nodes").fetchone() == (1,)
+
+
+def test_corruption_after_verification_still_rebuilds(vault) -> None:
+    root, kwargs = vault
+    entity_index.keep_connections_open()
+    entity_index.build_from_vault(root, **kwargs)
+    db_path = entity_index.database_path(root)
+    entity_index.keep_connections_open(False)
+    entity_index.keep_connections_open()
+    db_path.write_bytes(b"not a database" * 512)
+
+    result = entity_index.lookup_person(root, "Ada", force=True, **kwargs)
+
+    assert result["matches"][0]["name"] == "Ada Lovelace"
+    with sqlite3.connect(db_path) as connection:
+        assert connection.execute("PRAGMA quick_check").fetchone() == ("ok",)
+
+
+def test_background_check_forgets_a_failing_file(tmp_path: Path) -> None:
+    db_path = tmp_path / "index.sqlite3"
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("CREATE TABLE t (x)")
+    verified = VerifiedFiles()
+    verified.record(db_path)
+    assert verified.needs_check(db_path) is False
+
+    db_path.write_bytes(b"not a database" * 512)
+    stop = start_background_checks(verified, [db_path], interval_seconds=0.01)
+    try:
+        deadline = time.monotonic() + 5
+        while not verified.needs_check(db_path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        stop.set()
+
+    assert verified.needs_check(db_path) is True
+
+
+def test_verification_with_a_max_age_expires(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    database = tmp_path / "ritual-intelligence.db"
+    sqlite3.connect(database).close()
+    verified = VerifiedFiles(max_age_seconds=60.0)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    verified.record(database)
+
+    assert verified.needs_check(database) is False
+    now += 61.0
+    assert verified.needs_check(database) is True
@@ -0,0 +1,132 @@
+"""Persistent task-anchor index behind find_task_by_id and generate_task_id."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from core.entity_engine import task_anchors
+from core.mcp import work_server
+
+
+@pytest.fixture
+def vault(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    (tmp_path / "03-Tasks").mkdir(parents=True)
+    (tmp_path / "00-Inbox" / "Meetings").mkdir(parents=True)
+    monkeypatch.setattr(work_server, "BASE_DIR", tmp_path)
+    return tmp_path
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def test_find_answers_from_index_with_file_line_and_state(vault: Path) -> None:
+    tasks = vault / "03-Tasks" / "Tasks.md"
+    tasks.write_text(
+        "# Tasks\n\n- [ ] **Ship it** | Acme.md ^task-20260101-001\n"
+        "- [x] Done thing ✅ 2026-01-02 09:00 ^task-20260101-002\n",
+        encoding="utf-8",
+    )
+    note = vault / "00-Inbox" / "Meetings" / "Sync.md"
+    note.write_text("Mentions ^task-20260101-001 in prose\n", encoding="utf-8")
+
+    assert work_server.find_task_by_id("task-20260101-001") == [
+        {
+            "file": str(tasks),
+            "line_number": 3,
+            "line_content": "- [ ] **Ship it** | Acme.md ^task-20260101-001",
+            "title": "Ship it",
+            "completed": False,
+        }
+    ]
+    [done] = work_server.find_task_by_id("task-20260101-002")
+    assert done["completed"] is True
+    assert done["title"] == "Done thing"
+
+
+def test_unchanged_files_are_not_reread(
+    vault: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tasks = vault / "03-Tasks" / "Tasks.md"
+    tasks.write_text("- [ ] One ^task-20260101-001\n", encoding="utf-8")
+    _age(tasks)
+    assert task_anchors.reconcile(vault)["added"] == 1
+
+    reads: list[Path] = []
+    original = Path.read_bytes
+
+    def counting_read_bytes(self: Path) -> bytes:
+        reads.append(self)
+        return original(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+    assert len(work_server.find_task_by_id("task-20260101-001")) == 1
+    assert reads == []
+
+
+def test_same_size_checkbox_toggle_is_seen_immediately(vault: Path) -> None:
+    tasks = vault / "03-Tasks" / "Tasks.md"
+    tasks.write_text("- [ ] One ^task-20260101-001\n", encoding="utf-8")
+    assert work_server.find_task_by_id("task-20260101-001")[0]["completed"] is False
+
+    mtime_ns = tasks.stat().st_mtime_ns
+    tasks.write_text("- [x] One ^task-20260101-001\n", encoding="utf-8")
+    os.utime(tasks, ns=(mtime_ns, mtime_ns))
+
+    assert work_server.find_task_by_id("task-20260101-001")[0]["completed"] is True
+
+
+def test_deleted_file_drops_its_anchors(vault: Path) -> None:
+    note = vault / "00-Inbox" / "Meetings" / "Sync.md"
+    note.write_text("- [ ] Follow up ^task-20260101-007\n", encoding="utf-8")
+    assert len(work_server.find_task_by_id("task-20260101-007")) == 1
+
+    note.unlink()
+
+    assert work_server.find_task_by_id("task-20260101-007") == []
+
+
+def test_counter_is_monotonic_even_after_the_highest_task_is_deleted(
+    vault: Path,
+) -> None:
+    tasks = vault / "03-Tasks" / "Tasks.md"
+    tasks.write_text("- [ ] One ^task-20260101-041\n", encoding="utf-8")
+
+    assert work_server.generate_task_id().endswith("-042")
+    assert work_server.generate_task_id().endswith("-043")
+
+    tasks.write_text("# Tasks\n", encoding="utf-8")
+    assert work_server.generate_task_id().endswith("-044")
+
+
+def test_counter_ignores_anchors_outside_task_folders(vault: Path) -> None:
+    docs = vault / "06-Resources" / "Docs.md"
+    docs.parent.mkdir(parents=True)
+    docs.write_text("Example: - [ ] Demo ^task-20250101-900\n", encoding="utf-8")
+
+    assert work_server.generate_task_id().endswith("-001")
+    assert len(work_server.find_task_by_id("task-20250101-900")) == 1
+
+
+def test_corrupt_task_index_is_rebuilt(vault: Path) -> None:
+    tasks = vault / "03-Tasks" / "Tasks.md"
+    tasks.write_text("- [ ] One ^task-20260101-001\n", encoding="utf-8")
+    work_server.find_task_by_id("task-20260101-001")
+    db_path = task_anchors.database_path(vault)
+    db_path.write_bytes(b"not a database" * 100)
+
+    assert len(work_server.find_task_by_id("task-20260101-001")) == 1
+
+
+def test_non_canonical_ids_fall_back_to_a_vault_scan(vault: Path) -> None:
+    tasks = vault / "03-Tasks" / "Tasks.md"
+    tasks.write_text("- [ ] Legacy ^task-legacy\n", encoding="utf-8")
+
+    [instance] = work_server.find_task_by_id("task-legacy")
+
+    assert instance["line_content"] == "- [ ] Legacy ^task-legacy"
+    assert not task_anchors.database_path(vault).exists()
@@ -16,7 +16,9 @@ import os
 import stat
 import subprocess
 import sys
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -236,6 +238,101 @@ def test_snapshot_refuses_symlinks_and_directories(tmp_path: Path) -> None:
         Snapshot(tmp_path / "tx2").capture(vault, ["System"])
 
 
+def test_snapshot_capture_reads_each_source_byte_once_across_workers(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from core.transaction import snapshot as snapshot_module
+
+    vault = _vault(tmp_path)
+    relatives = [f"file-{index}.md" for index in range(12)]
+    for index, relative in enumerate(relatives):
+        (vault / relative).write_bytes(bytes([index]) * (3 << 20 if index == 5 else 1000 + index))
+    relatives.append("absent.md")
+    monkeypatch.setattr(snapshot_module, "_clone", lambda *_args: False)
+    bytes_read: list[int] = []
+    threads: set[str] = set()
+    original_read = os.read
+
+    def counting_read(descriptor, count):
+        chunk = original_read(descriptor, count)
+        bytes_read.append(len(chunk))
+        threads.add(threading.current_thread().name)
+        return chunk
+
+    monkeypatch.setattr(snapshot_module.os, "read", counting_read)
+
+    snapshot = Snapshot(tmp_path / "tx")
+    entries = snapshot.capture(vault, relatives)
+
+    sizes = [(vault / relative).stat().st_size for relative in relatives[:-1]]
+    assert sum(bytes_read) == sum(sizes)
+    assert [entry.relative for entry in entries] == relatives
+    assert [entry.size for entry in entries] == [*sizes, None]
+    assert entries[5].sha256 == hashlib.sha256((vault / "file-5.md").read_bytes()).hexdigest()
+    assert all(name.startswith("tx-snapshot") for name in threads)
+    assert snapshot.read_manifest() == entries
+
+
+def test_snapshot_capture_hashes_a_clone_when_the_filesystem_supports_it(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from core.transaction import snapshot as snapshot_module
+
+    vault = _vault(tmp_path)
+    (vault / "a.md").write_bytes(b"cloned bytes\n")
+    (vault / "b.md").write_bytes(b"streamed bytes\n")
+    clones: list[int] = []
+
+    def fake_ficlone(store, request, source):
+        assert request == snapshot_module._FICLONE
+        if clones:
+            raise OSError(95, "Operation not supported")
+        clones.append(source)
+        os.lseek(source, 0, os.SEEK_SET)
+        os.write(store, os.read(source, 1 << 20))
+        os.lseek(store, 0, os.SEEK_SET)
+
+    monkeypatch.setattr(snapshot_module, "fcntl", SimpleNamespace(ioctl=fake_ficlone))
+    monkeypatch.setattr(snapshot_module, "_UNCLONEABLE", set())
+    monkeypatch.setattr(snapshot_module, "CAPTURE_WORKERS", 1)
+
+    snapshot = Snapshot(tmp_path / "tx")
+    snapshot.capture(vault, ["a.md", "b.md", "c.md"])
+    (vault / "a.md").write_text("CLOBBERED")
+    (vault / "b.md").write_text("CLOBBERED")
+    snapshot.restore(vault)
+
+    assert len(clones) == 1
+    assert len(snapshot_module._UNCLONEABLE) == 1
+    assert (vault / "a.md").read_bytes() == b"cloned bytes\n"
+    assert (vault / "b.md").read_bytes() == b"streamed bytes\n"
+
+
+def test_snapshot_capture_fails_closed_when_the_source_changes_mid_copy(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from core.transaction import snapshot as snapshot_module
+
+    vault = _vault(tmp_path)
+    target = vault / "a.md"
+    target.write_bytes(b"original\n")
+    original_copy = snapshot_module._copy_and_hash
+
+    def copy_while_user_edits(source, store):
+        result = original_copy(source, store)
+        target.write_bytes(b"edited while copying\n")
+        return result
+
+    monkeypatch.setattr(snapshot_module, "_clone", lambda *_args: False)
+    monkeypatch.setattr(snapshot_module, "_copy_and_hash", copy_while_user_edits)
+
+    with pytest.raises(SnapshotError, match="changed while being snapshotted"):
+        Snapshot(tmp_path / "tx").capture(vault, ["a.md"])
+
+
 # ---------------------------------------------------------------------------
 # Engine semantics
 # ---------------------------------------------------------------------------
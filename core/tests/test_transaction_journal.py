@@ -0,0 +1,319 @@
+"""Open-journal appends, group commit, and crash injection around both.
+
+The process-kill cases run the engine in a subprocess that ``os._exit``s at a
+seam, as ``test_transaction_core`` does. The power-loss cases crash in-process
+and then cut the journal back to its last fsync (plus a torn fragment of the
+next line), which is the most a group commit may lose. In every case
+``Transaction.resume`` must leave the tree byte-identical to before the
+transaction.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from core.transaction import engine as engine_module
+from core.transaction import journal as journal_module
+from core.transaction.engine import PlanEntry, Transaction
+from core.transaction.journal import Journal, JournalCorruptError
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+_ROOT = "System/.dex/customization-migrations/x"
+_EXISTING = [f"{_ROOT}/existing-{index}.json" for index in range(4)]
+_CREATED = [f"{_ROOT}/created-{index}.json" for index in range(3)]
+_RELATIVES = _EXISTING + _CREATED
+
+
+def _vault(tmp_path: Path) -> Path:
+    vault = tmp_path / "vault"
+    (vault / _ROOT).mkdir(parents=True)
+    for index, relative in enumerate(_EXISTING):
+        (vault / relative).write_bytes(f'{{"original": {index}}}\n'.encode())
+    return vault
+
+
+def _tree_state(vault: Path) -> dict[str, bytes | None]:
+    return {
+        relative: (vault / relative).read_bytes() if (vault / relative).exists() else None
+        for relative in _RELATIVES
+    }
+
+
+def _plan(vault: Path) -> list[PlanEntry]:
+    """Overwrites, a deletion, plain creates and an expected-absent create."""
+    doomed = (vault / _EXISTING[3]).read_bytes()
+    return [
+        PlanEntry(_EXISTING[0], b'{"new": 0}\n'),
+        PlanEntry(_CREATED[0], b'{"created": 0}\n'),
+        PlanEntry(_EXISTING[1], b'{"new": 1}\n'),
+        PlanEntry(
+            _EXISTING[3],
+            None,
+            expected_current_sha256=hashlib.sha256(doomed).hexdigest(),
+        ),
+        PlanEntry(_CREATED[1], b'{"created": 1}\n', expected_absent=True),
+        PlanEntry(_EXISTING[2], b'{"new": 2}\n'),
+        PlanEntry(_CREATED[2], b'{"created": 2}\n'),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Open journal
+# ---------------------------------------------------------------------------
+
+
+def test_open_journal_validates_once_and_fsyncs_once_per_append(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    journal = Journal(tmp_path / "j.jsonl")
+    journal.append("BEGIN")
+    reads: list[int] = []
+    original_read = Journal.read
+
+    def counting_read(self):
+        reads.append(1)
+        return original_read(self)
+
+    monkeypatch.setattr(Journal, "read", counting_read)
+    fsyncs: list[int] = []
+    original_fsync = os.fsync
+    monkeypatch.setattr(
+        journal_module.os, "fsync", lambda fd: (fsyncs.append(fd), original_fsync(fd))
+    )
+
+    with journal:
+        for index in range(50):
+            journal.append("APPLIED", {"index": index})
+
+    assert len(reads) == 1
+    assert len(fsyncs) == 50
+    entries = original_read(journal)
+    assert [entry.sequence for entry in entries] == list(range(1, 52))
+
+
+def test_group_commit_fsyncs_only_when_asked_and_at_the_end(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    journal = Journal(tmp_path / "j.jsonl")
+    fsyncs: list[int] = []
+    original_fsync = os.fsync
+    monkeypatch.setattr(
+        journal_module.os, "fsync", lambda fd: (fsyncs.append(fd), original_fsync(fd))
+    )
+
+    with journal, journal.group_commit():
+        for index in range(100):
+            journal.append("APPLYING", {"index": index})
+        journal.sync()
+        journal.sync()
+        journal.append("APPLIED")
+        assert len([entry for entry in journal.read()]) == 101
+        group_fsyncs = len(fsyncs)
+
+    # One for creating the file's directory entry, one for the explicit sync.
+    assert group_fsyncs == 2
+    assert len(fsyncs) == 3
+    assert len(journal.read()) == 101
+
+
+def test_failed_write_drops_open_state_and_the_next_append_repairs_the_tail(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    journal = Journal(tmp_path / "j.jsonl").open()
+    journal.append("BEGIN")
+    original_write = os.write
+
+    def torn_write(fd, data):
+        original_write(fd, data[: len(data) // 2])
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(journal_module.os, "write", torn_write)
+    with pytest.raises(OSError):
+        journal.append("APPLYING")
+    monkeypatch.setattr(journal_module.os, "write", original_write)
+
+    assert not journal.is_open
+    journal.append("NOT-APPLIED")
+    assert [(entry.sequence, entry.event) for entry in journal.read()] == [
+        (1, "BEGIN"),
+        (2, "NOT-APPLIED"),
+    ]
+
+
+def test_closed_journal_still_fails_closed_on_interior_damage(tmp_path: Path) -> None:
+    journal = Journal(tmp_path / "j.jsonl")
+    with journal:
+        journal.append("A")
+        journal.append("B")
+    journal.path.write_bytes(journal.path.read_bytes().replace(b'"event":"A"', b'"event":"X"'))
+
+    with pytest.raises(JournalCorruptError):
+        journal.open()
+    assert not journal.is_open
+
+
+# ---------------------------------------------------------------------------
+# Group-committed transactions
+# ---------------------------------------------------------------------------
+
+
+def test_group_commit_transaction_applies_with_one_intent_fsync_per_group(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    vault = _vault(tmp_path)
+    monkeypatch.setattr(engine_module, "APPLY_GROUP_SIZE", 3)
+    syncs: list[int] = []
+    original_sync = Journal.sync
+
+    def counting_sync(self):
+        syncs.append(1)
+        original_sync(self)
+
+    monkeypatch.setattr(Journal, "sync", counting_sync)
+
+    tx = Transaction.begin(vault, _plan(vault), operation="customization-migration", group_commit=True)
+    result = tx.run()
+
+    assert result["committed"] is True
+    assert (vault / _CREATED[1]).read_bytes() == b'{"created": 1}\n'
+    assert not (vault / _EXISTING[3]).exists()
+    # Three groups of intent plus the end of the group-commit block.
+    assert len(syncs) == 4
+    assert not tx.journal.is_open
+    events = [entry.event for entry in tx.journal.read()]
+    assert events.count("APPLYING") == events.count("APPLIED") == 7
+
+
+def test_group_commit_rejection_marks_the_rest_of_the_group_not_applied(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    vault = _vault(tmp_path)
+    monkeypatch.setattr(engine_module, "APPLY_GROUP_SIZE", 4)
+    before = _tree_state(vault)
+    tx = Transaction.begin(vault, _plan(vault), operation="customization-migration", group_commit=True)
+    # A user edit lands after the snapshot: the deletion (index 3) must abort.
+    original_apply = tx._apply_one
+
+    def edit_before_delete(index, entry):
+        if index == 3:
+            (vault / _EXISTING[3]).write_bytes(b"user edit\n")
+        original_apply(index, entry)
+
+    monkeypatch.setattr(tx, "_apply_one", edit_before_delete)
+
+    with pytest.raises(engine_module.PlanRejected):
+        tx.run()
+
+    entries = tx.journal.read()
+    not_applied = [entry.payload["index"] for entry in entries if entry.event == "NOT-APPLIED"]
+    assert not_applied == [3]
+    assert entries[-1].event == "ROLLED-BACK"
+    assert _tree_state(vault) == {**before, _EXISTING[3]: b"user edit\n"}
+
+
+_GROUP_COMMIT_WORKER = r"""
+import hashlib
+import sys
+sys.path.insert(0, sys.argv[2])
+from pathlib import Path
+from core.transaction import engine
+from core.transaction.engine import Transaction
+from core.tests.test_transaction_journal import _plan
+engine.APPLY_GROUP_SIZE = 3
+vault = Path(sys.argv[1])
+Transaction.begin(vault, _plan(vault), operation="customization-migration", group_commit=True).run()
+"""
+
+_SEAMS = [
+    "after-begin",
+    "after-snapshot",
+    "mid-apply:0",
+    "mid-apply:2",
+    "mid-apply:4",
+    "mid-apply:6",
+    "after-apply",
+    "after-verify",
+]
+
+
+@pytest.mark.parametrize("seam", _SEAMS)
+def test_killed_group_commit_transaction_resumes_byte_identical(seam: str, tmp_path: Path) -> None:
+    vault = _vault(tmp_path)
+    before = _tree_state(vault)
+
+    process = subprocess.run(
+        [sys.executable, "-c", _GROUP_COMMIT_WORKER, str(vault), str(REPO_ROOT)],
+        env=dict(os.environ, DEX_TX_TEST_STOP_AFTER=seam),
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert process.returncode == 137, (seam, process.stderr[-300:])
+
+    outcomes = Transaction.resume(vault)
+
+    assert _tree_state(vault) == before, seam
+    assert len(outcomes) == 1 and outcomes[0]["resumed"] is True
+
+
+class _PowerLoss(BaseException):
+    pass
+
+
+@pytest.mark.parametrize("seam", _SEAMS[1:])
+def test_power_loss_keeps_only_synced_journal_and_still_resumes_byte_identical(
+    seam: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    vault = _vault(tmp_path)
+    before = _tree_state(vault)
+    monkeypatch.setattr(engine_module, "APPLY_GROUP_SIZE", 3)
+    synced_length: dict[str, int] = {}
+    original_fsync = os.fsync
+
+    def recording_fsync(fd):
+        original_fsync(fd)
+        path = os.readlink(f"/proc/self/fd/{fd}") if os.path.exists("/proc/self/fd") else ""
+        if path.endswith("journal.jsonl"):
+            synced_length["bytes"] = os.fstat(fd).st_size
+
+    if not os.path.exists("/proc/self/fd"):
+        pytest.skip("needs /proc to map descriptors to paths")
+    monkeypatch.setattr(journal_module.os, "fsync", recording_fsync)
+
+    def crash_at(name: str) -> None:
+        if name == seam:
+            # Unwinding runs the group's final sync, which a dead process
+            # never would: remember what was durable at the crash itself.
+            synced_length["at_crash"] = synced_length["bytes"]
+            raise _PowerLoss(name)
+
+    def die(tx: Transaction) -> dict:
+        # The process is gone: no rollback, no unlock, no final fsync.
+        os.close(tx.journal._descriptor)
+        tx.journal._descriptor = None
+        tx._release()
+        tx._release = None
+        return {}
+
+    monkeypatch.setattr(engine_module, "_stop_seam", crash_at)
+    monkeypatch.setattr(Transaction, "rollback", die)
+    tx = Transaction.begin(vault, _plan(vault), operation="customization-migration", group_commit=True)
+    with pytest.raises(_PowerLoss):
+        tx.run()
+    monkeypatch.undo()
+
+    raw = tx.journal.path.read_bytes()
+    kept = raw[: synced_length["at_crash"]]
+    unsynced = raw[len(kept) :]
+    tx.journal.path.write_bytes(kept + unsynced[: len(unsynced) // 2])
+
+    outcomes = Transaction.resume(vault)
+
+    assert _tree_state(vault) == before, seam
+    assert len(outcomes) == 1 and outcomes[0]["resumed"] is True
@@ -192,3 +192,92 @@ def test_confirmed_ritual_brief_uses_previous_transcript_summary():
     assert "Transcript continuity: Decision: ship the update" in note_path.read_text(encoding="utf-8")
     assert daily_log_path.exists()
     assert f"[[{note_path.name}]]" in daily_log_path.read_text(encoding="utf-8")
+
+
+def test_reconcile_uses_a_fixed_number_of_reads_and_never_loads_bodies(monkeypatch):
+    from contextlib import contextmanager
+
+    from core.ritual_intelligence import transcript_reconcile
+
+    _cleanup()
+    service = RitualIntelligenceService()
+    base = datetime(2026, 3, 2, 10, 0, tzinfo=timezone.utc)
+    service.refresh_calendar(
+        events=[
+            _event(source_event_id=f"evt-e{day}", source_series_id="series-e", title="Client Sync", starts_at=base + timedelta(days=day))
+            for day in range(5)
+        ]
+    )
+    ingest_artifacts(
+        [
+            TranscriptArtifact(
+                transcript_id=f"trn-bulk-{index}",
+                source="granola",
+                source_transcript_id=f"bulk-{index}",
+                title="Client Sync",
+                started_at=base + timedelta(days=index) if index < 5 else None,
+                ended_at=None,
+                attendees=[NormalizedAttendee(name="Client", email="client@acme.com")],
+                raw_text="Body that reconcile should never read.",
+            )
+            for index in range(6)
+        ]
+    )
+    statements: list[str] = []
+    original = transcript_reconcile.transaction
+
+    @contextmanager
+    def traced(**kwargs):
+        with original(**kwargs) as conn:
+            conn.set_trace_callback(statements.append)
+            yield conn
+
+    monkeypatch.setattr(transcript_reconcile, "transaction", traced)
+
+    results = reconcile_unmatched_transcripts()
+
+    reads = [statement for statement in statements if statement.lstrip().upper().startswith("SELECT")]
+    assert len(reads) <= 5
+    assert not any("raw_text" in statement or "SELECT *" in statement for statement in reads)
+    by_id = {result["transcript_id"]: result for result in results}
+    occurrence_by_start = {row["starts_at"]: row["id"] for row in service.list_occurrences()}
+    for index in range(5):
+        assert by_id[f"trn-bulk-{index}"]["status"] == "matched"
+        assert by_id[f"trn-bulk-{index}"]["occurrence_id"] == occurrence_by_start[(base + timedelta(days=index)).isoformat()]
+    assert by_id["trn-bulk-5"] == {
+        "transcript_id": "trn-bulk-5",
+        "status": "unmatched",
+        "occurrenceMatchConfidence": 0.35,
+    }
+
+
+def test_negative_match_excludes_the_rejected_occurrence():
+    from core.ritual_intelligence.db import transaction
+
+    _cleanup()
+    service = RitualIntelligenceService()
+    starts_at = datetime(2026, 3, 10, 10, 0, tzinfo=timezone.utc)
+    service.refresh_calendar(events=[_event(source_event_id="evt-f", source_series_id="series-f", title="Client Sync", starts_at=starts_at)])
+    occurrence_id = service.list_occurrences()[0]["id"]
+    ingest_artifacts(
+        [
+            TranscriptArtifact(
+                transcript_id="trn-granola-f",
+                source="granola",
+                source_transcript_id="granola-f",
+                title="Client Sync",
+                started_at=starts_at,
+                ended_at=None,
+                attendees=[NormalizedAttendee(name="Client", email="client@acme.com")],
+            )
+        ]
+    )
+    with transaction() as conn:
+        conn.execute(
+            "INSERT INTO transcript_negative_matches (transcript_id, occurrence_id, created_at) VALUES (?, ?, ?)",
+            ("trn-granola-f", occurrence_id, "2026-03-10T11:00:00+00:00"),
+        )
+
+    [result] = reconcile_unmatched_transcripts()
+
+    assert result == {"transcript_id": "trn-granola-f", "status": "unmatched", "occurrenceMatchConfidence": 0.0}
@@ -0,0 +1,149 @@
+"""Bulk task status updates write each affected file once, atomically."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from core.mcp import work_server
+
+
+def _call_tool(name: str, arguments: dict) -> dict:
+    result = asyncio.run(work_server.handle_call_tool(name, arguments))
+    return json.loads(result[0].text)
+
+
+@pytest.fixture
+def vault(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> dict[str, Path]:
+    tasks_file = tmp_path / "03-Tasks" / "Tasks.md"
+    meeting = tmp_path / "00-Inbox" / "Meetings" / "Weekly.md"
+    tasks_file.parent.mkdir(parents=True)
+    meeting.parent.mkdir(parents=True)
+    tasks_file.write_text(
+        "# Tasks\n\n## This Week\n"
+        "- [ ] Draft plan ^task-20260711-001\n"
+        "- [ ] Review budget ^task-20260711-002\n"
+        "- [x] Send recap ✅ 2026-07-10 08:30 ^task-20260711-003\n",
+        encoding="utf-8",
+    )
+    meeting.write_text(
+        "# Weekly\n\n"
+        "- [ ] Draft plan ^task-20260711-001\n"
+        "- [ ] Review budget ^task-20260711-002\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(work_server, "BASE_DIR", tmp_path)
+    monkeypatch.setattr(work_server, "get_tasks_file", lambda: tasks_file)
+    monkeypatch.setattr(work_server, "_tz_now", lambda: datetime(2026, 7, 11, 21, 15))
+    monkeypatch.setattr(work_server, "_fire_analytics_event", lambda *args, **kwargs: None)
+    monkeypatch.setattr(work_server, "refresh_search_index", lambda: None)
+    return {"root": tmp_path, "tasks": tasks_file, "meeting": meeting}
+
+
+def test_bulk_update_rewrites_each_file_once(
+    vault: dict[str, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    replaced: list[Path] = []
+    original_replace = work_server.os.replace
+
+    def recording_replace(source, target):
+        replaced.append(Path(target))
+        return original_replace(source, target)
+
+    monkeypatch.setattr(work_server.os, "replace", recording_replace)
+
+    result = work_server.update_task_statuses(
+        [
+            {"task_id": "task-20260711-001", "completed": True},
+            {"task_id": "task-20260711-002", "completed": True},
+            {"task_id": "task-20260711-003", "completed": False},
+        ]
+    )
+
+    assert result["success"] is True
+    assert result["files_written"] == 2
+    assert sorted(replaced) == sorted([vault["tasks"], vault["meeting"]])
+    assert vault["tasks"].read_text(encoding="utf-8").splitlines()[3:] == [
+        "- [x] Draft plan ✅ 2026-07-11 21:15 ^task-20260711-001",
+        "- [x] Review budget ✅ 2026-07-11 21:15 ^task-20260711-002",
+        "- [ ] Send recap ^task-20260711-003",
+    ]
+    assert vault["meeting"].read_text(encoding="utf-8").splitlines()[2:] == [
+        "- [x] Draft plan ✅ 2026-07-11 21:15 ^task-20260711-001",
+        "- [x] Review budget ✅ 2026-07-11 21:15 ^task-20260711-002",
+    ]
+    by_id = {item["task_id"]: item for item in result["results"]}
+    assert by_id["task-20260711-001"]["instances_found"] == 2
+    assert by_id["task-20260711-003"]["status"] == "not_completed"
+    assert not list(vault["root"].rglob("*.tmp"))
+
+
+def test_bulk_update_reports_unknown_ids_without_blocking_others(
+    vault: dict[str, Path],
+) -> None:
+    result = work_server.update_task_statuses(
+        [
+            {"task_id": "task-20260711-001", "completed": True},
+            {"task_id": "task-20260711-999", "completed": True},
+        ]
+    )
+
+    assert result["success"] is False
+    assert result["updated_count"] == 1
+    assert result["failed_count"] == 1
+    assert result["results"][1] == {
+        "success": False,
+        "task_id": "task-20260711-999",
+        "error": "No task found with ID: task-20260711-999",
+    }
+    assert "✅" in vault["tasks"].read_text(encoding="utf-8").splitlines()[3]
+
+
+def test_failed_file_write_leaves_the_original_and_other_files_updated(
+    vault: dict[str, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    before = vault["meeting"].read_text(encoding="utf-8")
+    original_replace = work_server.os.replace
+
+    def fail_meeting(source, target):
+        if Path(target) == vault["meeting"]:
+            raise OSError("disk full")
+        return original_replace(source, target)
+
+    monkeypatch.setattr(work_server.os, "replace", fail_meeting)
+
+    result = work_server.update_task_statuses(
+        [{"task_id": "task-20260711-001", "completed": True}]
+    )
+
+    [task_result] = result["results"]
+    assert task_result["success"] is False
+    assert task_result["failed_files"] == [
+        {"file": str(vault["meeting"]), "error": "disk full"}
+    ]
+    assert task_result["updated_files"] == [{"file": str(vault["tasks"]), "line": 4}]
+    assert vault["meeting"].read_text(encoding="utf-8") == before
+    assert not list(vault["root"].rglob("*.tmp"))
+
+
+def test_update_task_statuses_tool_maps_status_codes(vault: dict[str, Path]) -> None:
+    payload = _call_tool(
+        "update_task_statuses",
+        {
+            "updates": [
+                {"task_id": "task-20260711-001", "status": "d"},
+                {"task_id": "task-20260711-003", "status": "n"},
+            ]
+        },
+    )
+
+    assert payload["success"] is True
+    assert [item["status"] for item in payload["results"]] == [
+        "completed",
+        "not_completed",
+    ]
+    assert payload["related_tasks_synced"] == []
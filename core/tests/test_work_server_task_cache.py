@@ -0,0 +1,139 @@
+"""Parsed-task cache for Tasks.md and Week Priorities, keyed by file stat."""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from core.mcp import work_server
+
+
+@pytest.fixture
+def tasks_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "03-Tasks" / "Tasks.md"
+    path.parent.mkdir(parents=True)
+    path.write_text(
+        "# Tasks\n\n## This Week\n"
+        "- [ ] Draft plan ^task-20260711-001\n"
+        "\t- Pillar: Test | Priority: P1 | Source: notes.md\n"
+        "- [ ] Review budget ^task-20260711-002\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(work_server, "BASE_DIR", tmp_path)
+    monkeypatch.setattr(work_server, "get_tasks_file", lambda: path)
+    monkeypatch.setattr(
+        work_server, "get_week_priorities_file", lambda: tmp_path / "missing.md"
+    )
+    monkeypatch.setattr(work_server, "_tz_now", lambda: datetime(2026, 7, 11, 21, 15))
+    work_server.clear_parsed_tasks_cache()
+    yield path
+    work_server.clear_parsed_tasks_cache()
+
+
+@pytest.fixture
+def parse_calls(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    calls: list[Path] = []
+    original = work_server._parse_tasks_content
+
+    def counting(content: str, filepath: Path):
+        calls.append(filepath)
+        return original(content, filepath)
+
+    monkeypatch.setattr(work_server, "_parse_tasks_content", counting)
+    return calls
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def test_unchanged_file_is_served_without_reading_or_parsing(
+    tasks_file: Path, parse_calls: list[Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _age(tasks_file)
+    first = work_server.parse_tasks_file(tasks_file)
+
+    def no_read(self, *args, **kwargs):
+        raise AssertionError("an unchanged, settled file must not be re-read")
+
+    monkeypatch.setattr(Path, "read_text", no_read)
+    second = work_server.parse_tasks_file(tasks_file)
+
+    assert second == first
+    assert parse_calls == [tasks_file]
+
+
+def test_callers_mutating_results_do_not_poison_the_cache(tasks_file: Path) -> None:
+    tasks = work_server.get_all_tasks()
+    assert tasks[0]["source"] == "tasks"
+    assert tasks[0]["metadata_source"] == "notes.md"
+
+    [first, _second] = work_server.parse_tasks_file(tasks_file)
+
+    assert first["source"] == "notes.md"
+
+
+def test_same_size_edit_in_the_same_tick_is_not_missed(tasks_file: Path) -> None:
+    assert work_server.parse_tasks_file(tasks_file)[0]["completed"] is False
+    stat = tasks_file.stat()
+
+    tasks_file.write_text(
+        tasks_file.read_text(encoding="utf-8").replace("- [ ] Draft", "- [x] Draft"),
+        encoding="utf-8",
+    )
+    os.utime(tasks_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert work_server.parse_tasks_file(tasks_file)[0]["completed"] is True
+
+
+def test_status_update_patches_the_cached_parse_in_place(
+    tasks_file: Path, parse_calls: list[Path]
+) -> None:
+    work_server.parse_tasks_file(tasks_file)
+
+    result = work_server.update_task_status_everywhere(
+        "task-20260711-002", completed=True
+    )
+    tasks = work_server.parse_tasks_file(tasks_file)
+
+    assert result["success"] is True
+    assert parse_calls == [tasks_file]
+    assert [(task["task_id"], task["completed"], task["status"]) for task in tasks] == [
+        ("task-20260711-001", False, "n"),
+        ("task-20260711-002", True, "d"),
+    ]
+    assert tasks == work_server._parse_tasks_content(
+        tasks_file.read_text(), tasks_file
+    )
+
+
+def test_bulk_update_patches_the_cached_parse_in_place(
+    tasks_file: Path, parse_calls: list[Path]
+) -> None:
+    work_server.parse_tasks_file(tasks_file)
+
+    work_server.update_task_statuses(
+        [
+            {"task_id": "task-20260711-001", "completed": True},
+            {"task_id": "task-20260711-002", "completed": True},
+        ]
+    )
+
+    assert all(task["completed"] for task in work_server.parse_tasks_file(tasks_file))
+    assert parse_calls == [tasks_file]
+
+
+def test_pillar_configuration_change_reparses(
+    tasks_file: Path, parse_calls: list[Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _age(tasks_file)
+    work_server.parse_tasks_file(tasks_file)
+    monkeypatch.setattr(work_server, "PILLARS", dict(work_server.PILLARS))
+
+    work_server.parse_tasks_file(tasks_file)
+
+    assert parse_calls == [tasks_file, tasks_file]
@@ -20,6 +20,14 @@ Test seams: setting ``DEX_TX_TEST_STOP_AFTER`` to one of
 after-verify | before-finalize | after-commit-record`` makes the engine
 ``os._exit(137)`` at that exact point, so tests can assert recovery from every
 crash window.
+
+Group commit (``Transaction.begin(..., group_commit=True)``) is for plans
+with thousands of entries. The apply phase then journals the APPLYING intent
+for up to ``APPLY_GROUP_SIZE`` entries, fsyncs once, and applies them. Their
+APPLIED records ride on the next group's fsync. Intent still precedes every
+act on disk. A crash can now leave up to one group of APPLYING records without
+their act, rather than one. Recovery already treats an APPLYING record as
+possibly applied.
 """
 
 from __future__ import annotations
@@ -44,6 +52,8 @@ from core.transaction.lock import acquire_owned_lock
 from core.transaction.snapshot import Snapshot
 
 TX_ROOT_RELATIVE = Path("System") / ".dex" / "tx"
+# Plan entries whose APPLYING intent shares one journal fsync in group commit.
+APPLY_GROUP_SIZE = 256
 
 
 class TransactionError(RuntimeError):
@@ -109,6 +119,7 @@ class Transaction:
         *,
         operation: str = "update",
         max_read_bytes_by_relative: Mapping[str, int] | None = None,
+        group_commit: bool = False,
         _resumed: bool = False,
     ) -> None:
         self.vault_root = Path(vault_root).resolve()
@@ -120,6 +131,7 @@ class Transaction:
         self.snapshot = Snapshot(self.tx_dir / "snapshot")
         self._release = None
         self._plan: list[PlanEntry] | None = None
+        self._group_commit = group_commit
         self._resumed = _resumed
 
     # -- lifecycle -----------------------------------------------------------
@@ -133,8 +145,13 @@ class Transaction:
         allow_empty: bool = False,
         operation: str = "update",
         max_read_bytes_by_relative: Mapping[str, int] | None = None,
+        group_commit: bool = False,
     ) -> "Transaction":
-        """Authorize the whole plan, take the lock, journal BEGIN."""
+        """Authorize the whole plan, take the lock, journal BEGIN.
+
+        ``group_commit`` batches the apply phase's journal fsyncs; see the
+        module docstring.
+        """
         return cls._begin_with_id(
             vault_root,
             plan,
@@ -142,6 +159,7 @@ class Transaction:
             operation=operation,
             max_read_bytes_by_relative=max_read_bytes_by_relative,
             tx_id=None,
+            group_commit=group_commit,
         )
 
     @classmethod
@@ -154,6 +172,7 @@ class Transaction:
         operation: str,
         tx_id: str | None,
         max_read_bytes_by_relative: Mapping[str, int] | None = None,
+        group_commit: bool = False,
     ) -> "Transaction":
         """Internal begin seam for plans that must persist their tx id."""
         if not plan and not allow_empty:
@@ -244,6 +263,7 @@ class Transaction:
             tx_id or time.strftime("%Y%m%dT%H%M%S-") + uuid.uuid4().hex[:8],
             operation=operation,
             max_read_bytes_by_relative=read_limits,
+            group_commit=group_commit,
         )
         tx._plan = list(plan)
         unsafe_directory = _unsafe_infrastructure_directory(tx.vault_root, tx.tx_dir)
@@ -259,6 +279,8 @@ class Transaction:
                     f"refusing unsafe transaction directory {unsafe_directory}"
                 )
             tx.tx_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+            # Held open for the transaction's lifetime: appends stay O(1).
+            tx.journal.open()
             tx.journal.append(
                 "BEGIN",
                 {
@@ -300,6 +322,7 @@ class Transaction:
                 os.chmod(blob, 0o600)
             tx.journal.append("STAGED")
         except BaseException:
+            tx.journal.close()
             tx._release()
             raise
         _stop_seam("after-begin")
@@ -365,50 +388,98 @@ class Transaction:
     def _apply_phase(self) -> None:
         assert self._plan is not None
         self.journal.append("APPLY-START")
-        for index, entry in enumerate(self._plan):
-            unsafe_parent = unsafe_existing_parent(self.vault_root, entry.relative)
-            if unsafe_parent is not None:
-                raise PlanRejected(f"{entry.relative}: {unsafe_parent}")
-            # F1 guard: the begin()-time authorization was provisional for
-            # write-if-absent paths. The vault is live — if the user (or any
-            # non-transaction writer) created this file since, THEIR file
-            # wins and the whole transaction aborts (all-or-nothing), rolling
-            # back anything already applied.
-            verdict = portable_contract.update_write_verdict(
-                entry.relative,
-                exists=(self.vault_root / entry.relative).exists(),
-                operation=self.operation,
-            )
-            if not verdict.allowed:
-                raise PlanRejected(
-                    f"{entry.relative} appeared in the vault after authorization "
-                    f"[{verdict.action}]; the existing file wins and the "
-                    "transaction aborts"
-                )
-            if entry.content is None:
-                self._verify_deletion_precondition(
-                    entry,
-                    changed_when="after the mutation snapshot",
-                )
-            self.journal.append(
-                "APPLYING",
-                {
-                    "index": index,
-                    "relative": entry.relative,
-                    "expected_absent": entry.expected_absent,
-                },
-            )
+        if self._group_commit:
+            with self.journal.group_commit():
+                for start in range(0, len(self._plan), APPLY_GROUP_SIZE):
+                    self._apply_group(start, self._plan[start : start + APPLY_GROUP_SIZE])
+        else:
+            for index, entry in enumerate(self._plan):
+                self._check_before_apply(entry)
+                self._journal_applying(index, entry)
+                try:
+                    self._apply_one(index, entry)
+                except PlanRejected:
+                    self.journal.append(
+                        "NOT-APPLIED",
+                        {"index": index, "relative": entry.relative},
+                    )
+                    raise
+                self.journal.append("APPLIED", {"index": index, "relative": entry.relative})
+                _stop_seam(f"mid-apply:{index}")
+        self.journal.append("APPLY-DONE")
+
+    def _apply_group(self, start: int, group: list[PlanEntry]) -> None:
+        """Journal one group's intent, fsync once, then apply it entry by entry.
+
+        Every entry that leaves the group unapplied (a rejection, or any
+        failure before its turn) is journaled NOT-APPLIED before the error
+        propagates, so rollback only restores what may have changed.
+        """
+        intended = 0
+        try:
+            for index, entry in enumerate(group, start=start):
+                self._check_before_apply(entry)
+                self._journal_applying(index, entry)
+                intended += 1
+        except BaseException:
+            self._journal_not_applied(start, group[:intended])
+            raise
+        finally:
+            # Intent before act: the group's APPLYING records are on disk
+            # before any of its targets changes (or before rollback runs).
+            self.journal.sync()
+        for offset, entry in enumerate(group):
+            index = start + offset
             try:
                 self._apply_one(index, entry)
-            except PlanRejected:
-                self.journal.append(
-                    "NOT-APPLIED",
-                    {"index": index, "relative": entry.relative},
+            except BaseException as error:
+                first_unapplied = offset if isinstance(error, PlanRejected) else offset + 1
+                self._journal_not_applied(
+                    start + first_unapplied, group[first_unapplied:]
                 )
                 raise
             self.journal.append("APPLIED", {"index": index, "relative": entry.relative})
             _stop_seam(f"mid-apply:{index}")
-        self.journal.append("APPLY-DONE")
+
+    def _journal_not_applied(self, start: int, entries: list[PlanEntry]) -> None:
+        for index, entry in enumerate(entries, start=start):
+            self.journal.append("NOT-APPLIED", {"index": index, "relative": entry.relative})
+
+    def _check_before_apply(self, entry: PlanEntry) -> None:
+        unsafe_parent = unsafe_existing_parent(self.vault_root, entry.relative)
+        if unsafe_parent is not None:
+            raise PlanRejected(f"{entry.relative}: {unsafe_parent}")
+        # F1 guard: the begin()-time authorization was provisional for
+        # write-if-absent paths. The vault is live — if the user (or any
+        # non-transaction writer) created this file since, THEIR file
+        # wins and the whole transaction aborts (all-or-nothing), rolling
+        # back anything already applied.
+        verdict = portable_contract.update_write_verdict(
+            entry.relative,
+            exists=(self.vault_root / entry.relative).exists(),
+            operation=self.operation,
+        )
+        if not verdict.allowed:
+            raise PlanRejected(
+                f"{entry.relative} appeared in the vault after authorization "
+                f"[{verdict.action}]; the existing file wins and the "
+                "transaction aborts"
+            )
+        if entry.content is None:
+            self._verify_deletion_precondition(
+                entry,
+                changed_when="after the mutation snapshot",
+            )
+
+    def _journal_applying(self, index: int, entry: PlanEntry) -> None:
+        self.journal.append(
+            "APPLYING",
+            {
+                "index": index,
+                "relative": entry.relative,
+                "expected_absent": entry.expected_absent,
+            },
+        )
 
     def _verify_deletion_precondition(
         self,
@@ -554,6 +625,7 @@ class Transaction:
     def _commit_phase(self) -> dict:
         self.journal.append("COMMITTED")
         _stop_seam("after-commit-record")
+        self.journal.close()
         self._prune_committed(keep=3)
         result = {
             "tx_id": self.tx_id,
@@ -766,6 +838,7 @@ class Transaction:
             if journal_ok:
                 self.journal.append("ROLLED-BACK", {"restored": restored})
         finally:
+            self.journal.close()
             if self._release is not None:
                 self._release()
                 self._release = None
@@ -11,6 +11,15 @@ torn final line — the only corruption an append-only fsynced file can suffer
 from a crash — is detected and dropped on read. Any corruption EARLIER in
 the file is not survivable-by-guessing: reads fail closed with
 :class:`JournalCorruptError` rather than trusting a damaged history.
+
+A closed journal validates the whole file on every append. An open one
+(:meth:`Journal.open`, held by a transaction for its lifetime under the
+mutation lock) validates once and then keeps the descriptor and the next
+sequence number in memory, so an append is one write plus one fsync. Inside
+:meth:`Journal.group_commit` appends are written but not fsynced until
+:meth:`Journal.sync` or the end of the group: a killed process loses nothing
+(the bytes are already in the kernel), and after a power loss the file is
+still a valid prefix of history, possibly with a torn tail.
 """
 
 from __future__ import annotations
@@ -18,9 +27,11 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
 
 from core.transaction.fsync import fsync_directory
 
@@ -57,24 +68,96 @@ def _entry_sha(record: dict) -> str:
     return hashlib.sha256(_canonical(without_sha)).hexdigest()
 
 
-
-
 class Journal:
     """One transaction's journal file."""
 
     def __init__(self, path: Path) -> None:
         self.path = Path(path)
+        self._descriptor: int | None = None
+        self._next_sequence = 1
+        self._group_depth = 0
+        self._unsynced = False
 
-    def append(self, event: str, payload: dict | None = None) -> JournalEntry:
-        """Append one entry; fsync file and parent before returning.
+    def __enter__(self) -> "Journal":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def open(self) -> "Journal":
+        """Validate the file once and keep it open for O(1) appends.
 
         A torn tail from an earlier crash is truncated first — it is by
         definition not part of history (read() already ignores it), and
-        appending after it would wedge the file.
+        appending after it would wedge the file. Creating the file fsyncs
+        the parent so the new entry survives a crash.
         """
+        if self._descriptor is not None:
+            return self
         entries = self.read()
         self._truncate_torn_tail()
-        sequence = entries[-1].sequence + 1 if entries else 1
+        self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        created = not self.path.exists()
+        self._descriptor = os.open(
+            self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600
+        )
+        if created:
+            fsync_directory(self.path.parent)
+        self._next_sequence = entries[-1].sequence + 1 if entries else 1
+        return self
+
+    def close(self) -> None:
+        """Fsync anything still pending and release the descriptor."""
+        descriptor, self._descriptor = self._descriptor, None
+        if descriptor is None:
+            return
+        try:
+            if self._unsynced:
+                os.fsync(descriptor)
+        finally:
+            self._unsynced = False
+            os.close(descriptor)
+
+    @property
+    def is_open(self) -> bool:
+        return self._descriptor is not None
+
+    def sync(self) -> None:
+        """Make every entry appended so far durable."""
+        if self._descriptor is not None and self._unsynced:
+            os.fsync(self._descriptor)
+            self._unsynced = False
+
+    @contextmanager
+    def group_commit(self) -> Iterator["Journal"]:
+        """Defer per-append fsyncs until :meth:`sync` or the end of the group.
+
+        Callers that act on an entry before the group ends must ``sync()``
+        first: intent is only durable once it is on disk.
+        """
+        self.open()
+        self._group_depth += 1
+        try:
+            yield self
+        finally:
+            self._group_depth -= 1
+            if self._group_depth == 0:
+                self.sync()
+
+    def append(self, event: str, payload: dict | None = None) -> JournalEntry:
+        """Append one entry; fsync it before returning unless in a group commit.
+
+        A closed journal is opened (and fully validated) for this one append
+        and closed again.
+        """
+        if self._descriptor is None:
+            self.open()
+            try:
+                return self.append(event, payload)
+            finally:
+                self.close()
+        sequence = self._next_sequence
         record = {
             "schema_version": SCHEMA_VERSION,
             "sequence": sequence,
@@ -83,23 +166,29 @@ class Journal:
             "payload": payload or {},
         }
         record["sha"] = _entry_sha(record)
-        line = json.dumps(record, sort_keys=True, separators=(",", ":")) + "\n"
+        data = (json.dumps(record, sort_keys=True, separators=(",", ":")) + "\n").encode("utf-8")
 
-        self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
-        descriptor = os.open(
-            self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600
-        )
         try:
-            os.write(descriptor, line.encode("utf-8"))
-            os.fsync(descriptor)
-        finally:
-            os.close(descriptor)
-        fsync_directory(self.path.parent)
+            written = 0
+            while written < len(data):
+                written += os.write(self._descriptor, data[written:])
+            if self._group_depth:
+                self._unsynced = True
+            else:
+                os.fsync(self._descriptor)
+        except BaseException:
+            # The tail may now hold a partial line. Drop the in-memory state
+            # so the next append revalidates and truncates it.
+            os.close(self._descriptor)
+            self._descriptor = None
+            self._unsynced = False
+            raise
+        self._next_sequence = sequence + 1
         return JournalEntry(sequence, record["event"], record["payload"])
 
     def _truncate_torn_tail(self) -> None:
         """Drop any bytes after the final newline that don't parse as a
-        complete, hash-valid entry. Called only from append(), after read()
+        complete, hash-valid entry. Called only from open(), after read()
         has validated the preceding history."""
         try:
             raw = self.path.read_bytes()
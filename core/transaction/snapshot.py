@@ -9,6 +9,14 @@ rather than "restoring" wrong bytes.
 
 The tx directory is 0o700 and files 0o600 — and hard-denied paths can never
 appear in a plan (the engine refuses them), so secrets never enter snapshots.
+
+Capture reads each byte once. Where the filesystem supports it (Linux
+``FICLONE``: btrfs, XFS, bcachefs), the store is a copy-on-write clone and
+the one read is the hash of the clone. Otherwise a single streaming pass
+copies and hashes together. In both cases the source's identity (device,
+inode, size, mtime, ctime) must be unchanged across the copy; a changed
+source fails closed as a torn snapshot. Targets are captured on a small
+thread pool.
 """
 
 from __future__ import annotations
@@ -17,15 +25,31 @@ import hashlib
 import json
 import os
 import shutil
+import stat as stat_module
+import threading
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows: no ioctl, always stream.
+    fcntl = None
+
 from core.lifecycle.filesystem import bounded_read
 from core.path_safety import unsafe_existing_parent
 from core.transaction.fsync import fsync_directory
 
 MANIFEST_NAME = "manifest.json"
+CAPTURE_WORKERS = 4
+_CHUNK_BYTES = 1 << 20
+# linux/fs.h: _IOW(0x94, 9, int).
+_FICLONE = 0x40049409
+# (source device, store device) pairs whose filesystem refused a clone; they
+# stream for the rest of the process instead of failing an ioctl per file.
+_UNCLONEABLE: set[tuple[int, int]] = set()
+_UNCLONEABLE_LOCK = threading.Lock()
 
 
 class SnapshotError(RuntimeError):
@@ -58,6 +82,57 @@ def _store_name(index: int) -> str:
     return f"{index:06d}.bin"
 
 
+def _identity(metadata: os.stat_result) -> tuple[int, int, int, int, int]:
+    return (
+        metadata.st_dev,
+        metadata.st_ino,
+        metadata.st_size,
+        metadata.st_mtime_ns,
+        metadata.st_ctime_ns,
+    )
+
+
+def _clone(source: int, store: int, devices: tuple[int, int]) -> bool:
+    """Make ``store`` a copy-on-write clone of ``source``; False if unsupported."""
+    if fcntl is None or devices in _UNCLONEABLE:
+        return False
+    try:
+        fcntl.ioctl(store, _FICLONE, source)
+    except OSError:
+        with _UNCLONEABLE_LOCK:
+            _UNCLONEABLE.add(devices)
+        return False
+    return True
+
+
+def _hash_descriptor(descriptor: int) -> tuple[str, int]:
+    digest = hashlib.sha256()
+    size = 0
+    while True:
+        chunk = os.read(descriptor, _CHUNK_BYTES)
+        if not chunk:
+            break
+        digest.update(chunk)
+        size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def _copy_and_hash(source: int, store: int) -> tuple[str, int]:
+    """Stream ``source`` into ``store``, hashing the same bytes on the way."""
+    digest = hashlib.sha256()
+    size = 0
+    while True:
+        chunk = os.read(source, _CHUNK_BYTES)
+        if not chunk:
+            break
+        digest.update(chunk)
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(store, view) :]
+        size += len(chunk)
+    return digest.hexdigest(), size
+
+
 class Snapshot:
     """One transaction's snapshot store."""
 
@@ -96,55 +171,91 @@ class Snapshot:
                     f"{unsafe_parent}"
                 )
         self.root.mkdir(parents=True, exist_ok=True, mode=0o700)
-        entries: list[SnapshotEntry] = []
-        for index, relative in enumerate(relatives):
+        for relative in relatives:
             target = vault / relative
             if target.is_symlink():
                 raise SnapshotError(f"refusing to snapshot a symlink: {relative}")
             if target.is_dir():
                 raise SnapshotError(f"plans operate on files, not directories: {relative}")
-            if target.exists():
-                store = self.root / _store_name(index)
-                max_bytes = read_limits.get(relative)
-                if max_bytes is None:
-                    shutil.copyfile(target, store)
-                else:
-                    store.write_bytes(
-                        bounded_read(vault, relative, max_bytes=max_bytes)
-                    )
-                os.chmod(store, 0o600)
-                digest, size = _sha256(store)
-                # The copy must byte-match the source AT CAPTURE TIME; if the
-                # source is being mutated concurrently the lock was violated
-                # and we must not proceed on a torn snapshot.
-                if max_bytes is None:
-                    source_digest, _ = _sha256(target)
-                else:
-                    source_digest = hashlib.sha256(
-                        bounded_read(vault, relative, max_bytes=max_bytes)
-                    ).hexdigest()
-                if digest != source_digest:
-                    raise SnapshotError(f"target changed while being snapshotted: {relative}")
-                descriptor = os.open(store, os.O_RDONLY)
-                try:
-                    os.fsync(descriptor)
-                finally:
-                    os.close(descriptor)
-                entries.append(
-                    SnapshotEntry(
-                        relative,
-                        True,
-                        target.stat().st_mode & 0o7777,
-                        digest,
-                        size,
-                    )
-                )
-            else:
-                entries.append(SnapshotEntry(relative, False, None, None, None))
+        if len(relatives) < 2:
+            entries = [
+                self._capture_one(vault, index, relative, read_limits.get(relative))
+                for index, relative in enumerate(relatives)
+            ]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(CAPTURE_WORKERS, len(relatives)),
+                thread_name_prefix="tx-snapshot",
+            ) as pool:
+                futures = [
+                    pool.submit(self._capture_one, vault, index, relative, read_limits.get(relative))
+                    for index, relative in enumerate(relatives)
+                ]
+                # In plan order, so the first failing target is the one reported.
+                entries = [future.result() for future in futures]
         self._write_manifest(entries)
         fsync_directory(self.root)
         return entries
 
+    def _capture_one(
+        self,
+        vault: Path,
+        index: int,
+        relative: str,
+        max_bytes: int | None,
+    ) -> SnapshotEntry:
+        """Capture one target in a single read; fail if it changed meanwhile.
+
+        The copy must byte-match the source AT CAPTURE TIME; if the source
+        is being mutated concurrently the lock was violated and we must not
+        proceed on a torn snapshot.
+        """
+        target = vault / relative
+        try:
+            source = os.open(target, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+        except FileNotFoundError:
+            return SnapshotEntry(relative, False, None, None, None)
+        except OSError as error:
+            if target.is_symlink():
+                raise SnapshotError(f"refusing to snapshot a symlink: {relative}") from error
+            raise
+        try:
+            before = os.fstat(source)
+            if not stat_module.S_ISREG(before.st_mode):
+                raise SnapshotError(f"plans operate on files, not directories: {relative}")
+            store_path = self.root / _store_name(index)
+            store = os.open(store_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.fchmod(store, 0o600)
+                if max_bytes is not None:
+                    data = bounded_read(vault, relative, max_bytes=max_bytes)
+                    digest, size = hashlib.sha256(data).hexdigest(), len(data)
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(store, view) :]
+                elif _clone(source, store, (before.st_dev, os.fstat(store).st_dev)):
+                    digest, size = _hash_descriptor(store)
+                else:
+                    digest, size = _copy_and_hash(source, store)
+                os.fsync(store)
+            finally:
+                os.close(store)
+            after = os.fstat(source)
+        finally:
+            os.close(source)
+        try:
+            current = os.lstat(target)
+        except FileNotFoundError:
+            current = None
+        if (
+            current is None
+            or _identity(after) != _identity(before)
+            or _identity(current) != _identity(before)
+            or size != before.st_size
+        ):
+            raise SnapshotError(f"target changed while being snapshotted: {relative}")
+        return SnapshotEntry(relative, True, before.st_mode & 0o7777, digest, size)
+
     def _write_manifest(self, entries: list[SnapshotEntry]) -> None:
         manifest = {
             "schema_version": 1,
@@ -16,15 +16,17 @@ import json
 import os
 import re
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from time import monotonic as _monotonic
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 from core import portable_contract
 from core.transaction.engine import PlanEntry, Transaction
 from core.utils import release_channel
-from core.utils.local_git import git_output
+from core.utils.digest_cache import DigestCache
+from core.utils.local_git import GitObjectReader, git_blob_id, git_output
 
 MANIFEST_RELATIVE = "System/.installed-files.manifest"
 TOPOLOGY_RELATIVE = Path("System/.dex/topology.json")
@@ -446,7 +448,31 @@ def _tree_entries(vault_root: Path, brain_git: Path, commit: str) -> tuple[TreeE
     return tuple(sorted(entries, key=lambda entry: entry.path))
 
 
+# Open ``cat-file --batch`` readers keyed by (vault root, brain git dir); see
+# ``_batched_blobs``.
+_blob_readers: dict[tuple[str, str], GitObjectReader] = {}
+
+
+@contextmanager
+def _batched_blobs(vault_root: Path, brain_git: Path) -> Iterator[None]:
+    """Serve every ``_blob`` for this brain from one long-lived Git process."""
+    key = (str(vault_root), str(brain_git))
+    if key in _blob_readers:
+        yield
+        return
+    reader = GitObjectReader(vault_root, f"--git-dir={brain_git}")
+    _blob_readers[key] = reader
+    try:
+        yield
+    finally:
+        _blob_readers.pop(key, None)
+        reader.close()
+
+
 def _blob(vault_root: Path, brain_git: Path, object_id: str) -> bytes:
+    reader = _blob_readers.get((str(vault_root), str(brain_git)))
+    if reader is not None:
+        return reader.read(object_id)
     return _brain_output(vault_root, brain_git, "cat-file", "blob", object_id)
 
 
@@ -643,19 +669,54 @@ def verify_release_ref(
     )
 
 
-def _matches_entry(vault_root: Path, entry: TreeEntry, expected: bytes) -> bool:
+def _matches_entry(
+    vault_root: Path,
+    entry: TreeEntry,
+    expected: bytes,
+    digests: DigestCache | None = None,
+) -> bool:
     target = vault_root / entry.path
     try:
-        return (
-            not target.is_symlink()
-            and target.is_file()
-            and target.read_bytes() == expected
-            and (target.stat().st_mode & 0o777) == entry.mode
-        )
+        if target.is_symlink() or not target.is_file():
+            return False
+        current = target.stat()
+        if (current.st_mode & 0o777) != entry.mode or current.st_size != len(expected):
+            return False
+        if digests is None:
+            return target.read_bytes() == expected
+        cached = digests.digests_for(target, entry.path, target.read_bytes)
+        return cached.sha256 == hashlib.sha256(expected).hexdigest()
     except OSError:
         return False
 
 
+def _matching_blob_sha256(
+    vault_root: Path,
+    entry: TreeEntry,
+    digests: DigestCache,
+) -> str | None:
+    """Return the file's sha256 when it is exactly ``entry``'s blob, else None.
+
+    The on-disk bytes are compared by Git blob id, hashed in process, so an
+    unchanged file never needs its release blob read out of the brain.
+    """
+    target = vault_root / entry.path
+    try:
+        if target.is_symlink() or not target.is_file():
+            return None
+        if (target.stat().st_mode & 0o777) != entry.mode:
+            return None
+        if len(entry.object_id) == 40:
+            current = digests.digests_for(target, entry.path, target.read_bytes)
+            return current.sha256 if current.git_blob_sha1 == entry.object_id else None
+        raw = target.read_bytes()
+    except OSError:
+        return None
+    if git_blob_id(raw, object_format="sha256") != entry.object_id:
+        return None
+    return hashlib.sha256(raw).hexdigest()
+
+
 def build_update_plan(vault_root: Path, release: VerifiedReleaseRef) -> UpdatePlan:
     """Build a fail-closed release mutation plan from contract verdicts."""
     root = Path(vault_root).resolve()
@@ -671,64 +732,66 @@ def build_update_plan(vault_root: Path, release: VerifiedReleaseRef) -> UpdatePl
     kept_reasons: list[tuple[str, str]] = []
     untouched: list[str] = []
 
-    for entry in release.entries:
-        target = root / entry.path
-        verdict = portable_contract.update_write_verdict(entry.path, exists=target.exists())
-        if verdict.action in {"deny", "unclassified-never-write"}:
-            raise UpdateError(
-                f"release contains a path the ownership contract refuses: {entry.path} [{verdict.action}]"
-            )
-        if verdict.ownership == "brain":
-            target_brain.add(entry.path)
-        if not verdict.allowed:
-            untouched.append(entry.path)
-            continue
-        content = _blob(root, release.brain_git, entry.object_id)
-        composer = COMPOSERS.get(entry.path)
-        if composer is not None:
-            try:
-                content = composer(content, root)
-            except CompositionError as error:
-                kept.append(entry.path)
-                kept_reasons.append((entry.path, str(error)))
+    with DigestCache.for_vault(root) as digests, _batched_blobs(root, release.brain_git):
+        for entry in release.entries:
+            target = root / entry.path
+            verdict = portable_contract.update_write_verdict(entry.path, exists=target.exists())
+            if verdict.action in {"deny", "unclassified-never-write"}:
+                raise UpdateError(
+                    f"release contains a path the ownership contract refuses: {entry.path} [{verdict.action}]"
+                )
+            if verdict.ownership == "brain":
+                target_brain.add(entry.path)
+            if not verdict.allowed:
+                untouched.append(entry.path)
                 continue
-        if _matches_entry(root, entry, content):
-            untouched.append(entry.path)
-            continue
-        planned.append(PlanEntry(entry.path, content, entry.mode))
-        if verdict.ownership == "brain":
-            replaced.append(entry.path)
-        elif verdict.ownership == "seed":
-            seeded.append(entry.path)
-        elif verdict.ownership == "generated":
-            regenerated.append(entry.path)
-
-    pruned: list[str] = []
-    for previous in previous_entries:
-        resolution = portable_contract.resolve(previous.path)
-        if resolution.ownership != "brain" or previous.path in target_brain:
-            continue
-        target = root / previous.path
-        if not target.exists():
-            continue
-        previous_content = _blob(root, release.brain_git, previous.object_id)
-        if _matches_entry(root, previous, previous_content):
-            verdict = portable_contract.update_write_verdict(previous.path, exists=True)
-            if not verdict.allowed or verdict.ownership != "brain":
-                raise UpdateError(f"ownership contract refuses pruning {previous.path}")
-            planned.append(
-                PlanEntry(
-                    previous.path,
-                    None,
-                    previous.mode,
-                    expected_current_sha256=hashlib.sha256(
-                        previous_content
-                    ).hexdigest(),
+            composer = COMPOSERS.get(entry.path)
+            if composer is None and _matching_blob_sha256(root, entry, digests) is not None:
+                untouched.append(entry.path)
+                continue
+            content = _blob(root, release.brain_git, entry.object_id)
+            if composer is not None:
+                try:
+                    content = composer(content, root)
+                except CompositionError as error:
+                    kept.append(entry.path)
+                    kept_reasons.append((entry.path, str(error)))
+                    continue
+                if _matches_entry(root, entry, content, digests):
+                    untouched.append(entry.path)
+                    continue
+            planned.append(PlanEntry(entry.path, content, entry.mode))
+            if verdict.ownership == "brain":
+                replaced.append(entry.path)
+            elif verdict.ownership == "seed":
+                seeded.append(entry.path)
+            elif verdict.ownership == "generated":
+                regenerated.append(entry.path)
+
+        pruned: list[str] = []
+        for previous in previous_entries:
+            resolution = portable_contract.resolve(previous.path)
+            if resolution.ownership != "brain" or previous.path in target_brain:
+                continue
+            target = root / previous.path
+            if not target.exists():
+                continue
+            current_sha256 = _matching_blob_sha256(root, previous, digests)
+            if current_sha256 is not None:
+                verdict = portable_contract.update_write_verdict(previous.path, exists=True)
+                if not verdict.allowed or verdict.ownership != "brain":
+                    raise UpdateError(f"ownership contract refuses pruning {previous.path}")
+                planned.append(
+                    PlanEntry(
+                        previous.path,
+                        None,
+                        previous.mode,
+                        expected_current_sha256=current_sha256,
+                    )
                 )
-            )
-            pruned.append(previous.path)
-        else:
-            kept.append(previous.path)
+                pruned.append(previous.path)
+            else:
+                kept.append(previous.path)
 
     return UpdatePlan(
         tuple(planned),
@@ -831,7 +894,9 @@ def apply_verified_release(vault_root: Path, release: VerifiedReleaseRef) -> dic
     Transaction.resume(root)
     previous_commit = validated_release_apply_context(root, release)
     plan = build_update_plan(root, release)
-    transaction = Transaction.begin(root, list(plan.entries), allow_empty=True)
+    transaction = Transaction.begin(
+        root, list(plan.entries), allow_empty=True, group_commit=True
+    )
     transaction_result = transaction.run(
         before_commit=lambda: _finalize_release_metadata(
             root,
@@ -0,0 +1,95 @@
+"""Stat-keyed snapshots of the vault's configuration files.
+
+Every MCP tool call used to re-read and re-parse ``System/user-profile.yaml``
+(and ``System/pillars.yaml``, and the capability contract JSON) on its own.
+This module parses each file once and hands back the parsed value until the
+file's ``(st_dev, st_ino, st_size, st_mtime_ns)`` changes, so a steady-state
+lookup costs one ``stat()``. YAML is parsed with libyaml's ``CSafeLoader``
+when PyYAML was built with it, and the pure-Python ``SafeLoader`` otherwise.
+
+Values are shared between callers: treat them as read-only and copy before
+mutating. Parse failures are never cached, so a fixed file is picked up on
+the next call.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+# A same-size edit inside one filesystem timestamp tick keeps a file's stat
+# signature unchanged, so a file checked within this window of its mtime is
+# re-read instead of trusted. Every stat-keyed cache in Dex uses this window;
+# backup_vault keeps a test-pinned copy because it must stay stdlib-only.
+RACY_WINDOW_NS = 2_000_000_000
+
+_cache: dict[tuple[str, str], tuple[tuple[int, int, int, int], int, Any]] = {}
+_lock = threading.Lock()
+
+
+def is_settled(mtime_ns: int, checked_ns: int) -> bool:
+    """Whether a check at ``checked_ns`` can vouch for a file last modified at ``mtime_ns``."""
+    return checked_ns - mtime_ns > RACY_WINDOW_NS
+
+
+def _signature(stat: os.stat_result) -> tuple[int, int, int, int]:
+    return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def cached(path: str | Path, parse: Callable[[bytes], Any], *, kind: str) -> Any:
+    """Return ``parse(bytes of path)``, re-running it only when the file changes.
+
+    ``kind`` separates parsers of the same file. Raises ``FileNotFoundError``
+    for a missing file and whatever ``parse`` raises for a malformed one.
+    """
+    key = (kind, os.fspath(path))
+    stat = os.stat(path)
+    signature = _signature(stat)
+    with _lock:
+        entry = _cache.get(key)
+    if (
+        entry is not None
+        and entry[0] == signature
+        and is_settled(stat.st_mtime_ns, entry[1])
+    ):
+        return entry[2]
+    verified_ns = time.time_ns()
+    with open(path, "rb") as handle:
+        raw = handle.read()
+    value = parse(raw)
+    with _lock:
+        _cache[key] = (signature, verified_ns, value)
+    return value
+
+
+def _yaml_loader():
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def parse_yaml(raw: bytes | str) -> Any:
+    """``yaml.safe_load`` semantics, on the C loader when it is available."""
+    import yaml
+
+    return yaml.load(raw, Loader=_yaml_loader())
+
+
+def load_yaml(path: str | Path) -> Any:
+    """The parsed YAML document at ``path`` (shared; do not mutate)."""
+    return cached(path, parse_yaml, kind="yaml")
+
+
+def load_json(path: str | Path) -> Any:
+    """The parsed JSON document at ``path`` (shared; do not mutate)."""
+    return cached(path, json.loads, kind="json")
+
+
+def clear() -> None:
+    """Forget every snapshot (tests, run boundaries)."""
+    with _lock:
+        _cache.clear()
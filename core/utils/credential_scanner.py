@@ -13,7 +13,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from core.utils.integration_credentials import inspect_active_mcp_config
-from core.utils.local_git import git_output
+from core.utils.local_git import GitObjectReader, git_object_headers, git_output
 
 MAX_FILE_BYTES = 8 * 1024 * 1024
 MAX_WORKTREE_BYTES = 64 * 1024 * 1024
@@ -59,6 +59,14 @@ def _git(root: Path, *args: str, input_data: bytes | None = None) -> bytes:
     )
 
 
+def _object_reader(root: Path) -> GitObjectReader:
+    return GitObjectReader(root, timeout=SCAN_DEADLINE_SECONDS, max_output=MAX_FILE_BYTES)
+
+
+def _contains_any(data: bytes, needles: tuple[bytes, ...]) -> bool:
+    return any(value in data for value in needles)
+
+
 def _bounded_file(path: Path) -> bytes:
     metadata = path.lstat()
     if not stat.S_ISREG(metadata.st_mode) or metadata.st_nlink != 1 or metadata.st_size > MAX_FILE_BYTES:
@@ -130,32 +138,45 @@ def _scan_git_object_scope(
     deadline: float,
     object_matches: dict[str, bool],
     object_total: list[int],
+    reader: GitObjectReader,
 ) -> list[Finding]:
-    object_lines = _git(root, "rev-list", "--objects", *arguments).splitlines()
-    findings: list[Finding] = []
-    for number, line in enumerate(object_lines, 1):
+    """Match every object reachable from ``arguments`` over one batch pipe.
+
+    One ``rev-list`` lists the objects and one ``--batch-check`` types and
+    sizes the unseen ones, so the byte bounds hold before any blob is read.
+    """
+    object_ids = [
+        line.split(b" ", 1)[0].decode("ascii")
+        for line in _git(root, "rev-list", "--objects", *arguments).splitlines()
+    ]
+    unseen = [oid for oid in dict.fromkeys(object_ids) if oid not in object_matches]
+    if len(object_matches) + len(unseen) > MAX_OBJECTS:
+        raise RuntimeError("object-count-bound")
+    headers = git_object_headers(
+        root,
+        unseen,
+        timeout=SCAN_DEADLINE_SECONDS,
+        max_output=MAX_GIT_OUTPUT,
+    )
+    for oid in unseen:
         if time.monotonic() > deadline:
             raise RuntimeError("object-deadline-bound")
-        oid = line.split(b" ", 1)[0].decode("ascii")
-        matched = object_matches.get(oid)
-        if matched is None:
-            if len(object_matches) >= MAX_OBJECTS:
-                raise RuntimeError("object-count-bound")
-            kind = _git(root, "cat-file", "-t", oid).strip()
-            matched = False
-            if kind == b"blob":
-                size = int(_git(root, "cat-file", "-s", oid))
-                object_total[0] += size
-                if size > MAX_FILE_BYTES or object_total[0] > MAX_OBJECT_BYTES:
-                    raise RuntimeError("object-byte-bound")
-                data = _git(root, "cat-file", "blob", oid)
-                if len(data) != size:
-                    raise RuntimeError("object-readback")
-                matched = any(value in data for value in needles)
-            object_matches[oid] = matched
-        if matched:
-            findings.append(_opaque(scope, str(number).encode()))
-    return findings
+        kind, size = headers[oid]
+        matched = False
+        if kind == "blob":
+            object_total[0] += size
+            if size > MAX_FILE_BYTES or object_total[0] > MAX_OBJECT_BYTES:
+                raise RuntimeError("object-byte-bound")
+            data = reader.read(oid)
+            if len(data) != size:
+                raise RuntimeError("object-readback")
+            matched = _contains_any(data, needles)
+        object_matches[oid] = matched
+    return [
+        _opaque(scope, str(number).encode())
+        for number, oid in enumerate(object_ids, 1)
+        if object_matches[oid]
+    ]
 
 
 def scan_credentials(root: Path, needles: tuple[bytes, ...], selected_archives: tuple[Path, ...] = ()) -> ScanReport:
@@ -179,30 +200,41 @@ def scan_credentials(root: Path, needles: tuple[bytes, ...], selected_archives:
             total += len(data)
             if total > MAX_WORKTREE_BYTES:
                 raise OSError("worktree-bound")
-            if any(value in data for value in needles):
+            if _contains_any(data, needles):
                 findings.append(_opaque("worktree", str(number).encode()))
         mcp = inspect_active_mcp_config(root)
         if not mcp.inspected:
             raise OSError(mcp.reason or "unsafe-active-config")
-        if mcp.data and any(value in mcp.data for value in needles):
+        if mcp.data and _contains_any(mcp.data, needles):
             findings.append(_opaque("worktree", b"active-config"))
         inspected.add("worktree")
     except (OSError, RuntimeError):
         unknown["worktree"] = "input-unavailable-unsafe-or-bound"
 
     try:
+        staged: dict[bytes, str] = {}
+        for record in _git(root, "ls-files", "--stage", "-z").split(b"\0"):
+            if not record:
+                continue
+            metadata, path = record.split(b"\t", 1)
+            _mode, oid, stage = metadata.split(b" ")
+            if stage == b"0":
+                staged[path] = oid.decode("ascii")
         total = 0
-        for number, item in enumerate(sorted(tracked), 1):
-            if number > MAX_WORKTREE_FILES or time.monotonic() > deadline:
-                raise RuntimeError("index-bound")
-            data = _git(root, "show", ":" + item.decode("utf-8"))
-            total += len(data)
-            if len(data) > MAX_FILE_BYTES or total > MAX_WORKTREE_BYTES:
-                raise RuntimeError("index-bound")
-            if any(value in data for value in needles):
-                findings.append(_opaque("index", str(number).encode()))
+        with _object_reader(root) as reader:
+            for number, item in enumerate(sorted(tracked), 1):
+                if number > MAX_WORKTREE_FILES or time.monotonic() > deadline:
+                    raise RuntimeError("index-bound")
+                if item not in staged:
+                    raise RuntimeError("index-unmerged")
+                data = reader.read(staged[item])
+                total += len(data)
+                if total > MAX_WORKTREE_BYTES:
+                    raise RuntimeError("index-bound")
+                if _contains_any(data, needles):
+                    findings.append(_opaque("index", str(number).encode()))
         inspected.add("index")
-    except (RuntimeError, UnicodeDecodeError):
+    except (RuntimeError, UnicodeDecodeError, ValueError):
         unknown["index"] = "blob-unavailable-or-bound"
 
     try:
@@ -231,7 +263,7 @@ def scan_credentials(root: Path, needles: tuple[bytes, ...], selected_archives:
             metadata_total += len(data)
             if metadata_total > MAX_GIT_METADATA_BYTES:
                 raise OSError("git-metadata-bound")
-            if any(value in data for value in needles):
+            if _contains_any(data, needles):
                 findings.append(_opaque("git-common-dir", str(number).encode()))
         inspected.add("git-common-dir")
 
@@ -246,32 +278,35 @@ def scan_credentials(root: Path, needles: tuple[bytes, ...], selected_archives:
             )
             object_matches: dict[str, bool] = {}
             object_total = [0]
-            for scope, arguments in object_scopes:
-                findings.extend(
-                    _scan_git_object_scope(
-                        root,
-                        scope,
-                        arguments,
-                        needles,
-                        deadline,
-                        object_matches,
-                        object_total,
+            with _object_reader(root) as reader:
+                for scope, arguments in object_scopes:
+                    findings.extend(
+                        _scan_git_object_scope(
+                            root,
+                            scope,
+                            arguments,
+                            needles,
+                            deadline,
+                            object_matches,
+                            object_total,
+                            reader,
+                        )
                     )
-                )
-                inspected.add(scope)
-            stash = _git(root, "for-each-ref", "--format=%(objectname)", "refs/stash").strip()
-            if stash:
-                findings.extend(
-                    _scan_git_object_scope(
-                        root,
-                        "stashes",
-                        ("refs/stash",),
-                        needles,
-                        deadline,
-                        object_matches,
-                        object_total,
+                    inspected.add(scope)
+                stash = _git(root, "for-each-ref", "--format=%(objectname)", "refs/stash").strip()
+                if stash:
+                    findings.extend(
+                        _scan_git_object_scope(
+                            root,
+                            "stashes",
+                            ("refs/stash",),
+                            needles,
+                            deadline,
+                            object_matches,
+                            object_total,
+                            reader,
+                        )
                     )
-                )
             inspected.add("stashes")
             unknown["primary-object-db"] = "unreachable-objects-not-inspected"
     except (OSError, RuntimeError, UnicodeDecodeError, ValueError):
@@ -285,7 +320,7 @@ def scan_credentials(root: Path, needles: tuple[bytes, ...], selected_archives:
                     raise ValueError("selected-archive-deadline")
                 _bounded_file(archive)
                 for member, data in _archive_members(archive):
-                    if any(value in data for value in needles):
+                    if _contains_any(data, needles):
                         findings.append(_opaque("selected-archives", f"{archive_number}:".encode() + member))
             inspected.add("selected-archives")
         except (OSError, RuntimeError, ValueError, tarfile.TarError, zipfile.BadZipFile):
@@ -4,6 +4,14 @@ Dex Health System — Shared Logger for MCP Servers
 Provides error queue persistence, dedup, and human-friendly error messages.
 Imported by all MCP servers to capture failures instantly.
 
+Logging never rewrites the queue. Each error or warning is one line appended
+with O_APPEND to .logs/error-events.jsonl, so concurrent servers cannot lose
+each other's entries and an error storm costs one write per call. Writers
+only share-lock that log; the compactor takes it exclusively, folds the
+pending lines into .logs/error-queue.json (the queue view everything else
+reads), and truncates it. Readers compact before reading, and a process
+compacts on its own when it logs something it has not logged recently.
+
 Usage:
     from core.utils.dex_logger import log_error, log_warning, mark_healthy
 
@@ -18,18 +26,27 @@ import fcntl
 import json
 import os
 import re
+import tempfile
 import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional
 
 STALE_ERROR_DAYS = 30
 MAX_ERROR_ENTRIES = 50
+DEDUP_WINDOW_SECONDS = 300
+# A storm of repeats is only appended; past this size the next log call
+# compacts anyway so the pending log stays small.
+COMPACT_THRESHOLD_BYTES = 256 * 1024
 _SEMVER_RE = re.compile(r"^(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)$")
 _MISSING_MODULE_RE = re.compile(
     r"No module named\s+['\"](?P<module>[A-Za-z0-9_.-]+)['\"]",
     re.IGNORECASE,
 )
+# (events path, severity, source, message) -> when this process last
+# compacted after logging it. A repeat inside the window is only appended.
+_recently_compacted: dict[tuple[str, str, str, str], float] = {}
 
 
 # ---------------------------------------------------------------------------
@@ -59,6 +76,10 @@ def _get_queue_path(*, create: bool = True) -> Path:
     return _get_logs_dir(create=create) / "error-queue.json"
 
 
+def _get_events_path(*, create: bool = True) -> Path:
+    return _get_logs_dir(create=create) / "error-events.jsonl"
+
+
 def _get_health_path() -> Path:
     return _get_logs_dir() / "mcp-health.json"
 
@@ -131,25 +152,29 @@ def _generate_human_message(source: str, message: str) -> str:
 # Queue I/O (with file locking for concurrent MCP servers)
 # ---------------------------------------------------------------------------
 
-def _read_queue_with_status() -> tuple[str, list]:
-    """Read the queue without throwing and preserve whether it was readable."""
+def _read_view_with_status() -> tuple[str, list]:
     try:
         queue_path = _get_queue_path(create=False)
         if not queue_path.exists():
             return "missing", []
         with open(queue_path, "r") as f:
-            fcntl.flock(f, fcntl.LOCK_SH)
-            try:
-                entries = json.load(f)
-                if not isinstance(entries, list):
-                    return "unreadable", []
-                return "readable", entries
-            finally:
-                fcntl.flock(f, fcntl.LOCK_UN)
+            entries = json.load(f)
+        if not isinstance(entries, list):
+            return "unreadable", []
+        return "readable", entries
     except Exception:
         return "unreadable", []
 
 
+def _read_queue_with_status() -> tuple[str, list]:
+    """Read the queue without throwing and preserve whether it was readable."""
+    try:
+        _compact()
+    except Exception:
+        pass  # pending events stay in the log for the next compaction
+    return _read_view_with_status()
+
+
 def _read_queue() -> list:
     """Read error queue with file locking."""
     _status, entries = _read_queue_with_status()
@@ -194,16 +219,146 @@ def _prune_queue(entries: list, *, now: Optional[datetime] = None) -> list:
     return recent_or_unknown[-MAX_ERROR_ENTRIES:]
 
 
+def _replace_json(path: Path, payload: Any) -> None:
+    """Atomically replace a JSON file; readers never see a partial one."""
+    descriptor, temporary = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+    )
+    try:
+        with os.fdopen(descriptor, "w") as f:
+            json.dump(payload, f, indent=2)
+        os.replace(temporary, path)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+
+
+def _write_view(entries: list, *, now: Optional[datetime] = None) -> None:
+    _replace_json(_get_queue_path(), _prune_queue(entries, now=now))
+
+
+@contextmanager
+def _events_locked(operation: int, *, create: bool = True) -> Iterator[Optional[int]]:
+    """Open and ``flock`` the pending-event log; yields None if it is absent."""
+    flags = os.O_RDWR | os.O_APPEND | (os.O_CREAT if create else 0)
+    try:
+        fd = os.open(_get_events_path(create=create), flags, 0o600)
+    except FileNotFoundError:
+        yield None
+        return
+    try:
+        fcntl.flock(fd, operation)
+        yield fd
+    finally:
+        os.close(fd)
+
+
 def _write_queue(entries: list, *, now: Optional[datetime] = None) -> None:
-    """Write error queue with file locking."""
-    queue_path = _get_queue_path()
-    queue_path.parent.mkdir(exist_ok=True)
-    with open(queue_path, "w") as f:
-        fcntl.flock(f, fcntl.LOCK_EX)
+    """Write error queue, excluding a concurrent compaction."""
+    with _events_locked(fcntl.LOCK_EX):
+        _write_view(entries, now=now)
+
+
+def _append_event(entry: dict) -> int:
+    """Append one event line; return the pending log's size afterwards."""
+    data = (json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8")
+    with _events_locked(fcntl.LOCK_SH) as fd:
+        # O_APPEND makes each write land whole at the end, so writers only
+        # need to exclude the compactor, never each other.
+        while data:
+            data = data[os.write(fd, data):]
+        return os.fstat(fd).st_size
+
+
+def _fold_event(queue: list, event: dict) -> None:
+    """Apply one logged event to the queue view, deduplicating errors.
+
+    A repeat of an unacknowledged error from the same source with the same
+    message, within DEDUP_WINDOW_SECONDS of its last occurrence, bumps that
+    entry's count instead of adding another.
+    """
+    if event.get("severity") == "error":
         try:
-            json.dump(_prune_queue(entries, now=now), f, indent=2)
-        finally:
-            fcntl.flock(f, fcntl.LOCK_UN)
+            event_time = datetime.fromisoformat(
+                event["timestamp"].replace("Z", "+00:00")
+            ).timestamp()
+        except (ValueError, KeyError, AttributeError):
+            event_time = None
+        for entry in reversed(queue):
+            if not (
+                isinstance(entry, dict)
+                and entry.get("source") == event.get("source")
+                and entry.get("message") == event.get("message")
+                and not entry.get("acknowledged", False)
+            ):
+                continue
+            try:
+                entry_time = datetime.fromisoformat(
+                    entry["timestamp"].replace("Z", "+00:00")
+                ).timestamp()
+            except (ValueError, KeyError, AttributeError):
+                continue
+            if event_time is not None and entry_time > event_time - DEDUP_WINDOW_SECONDS:
+                entry["count"] = entry.get("count", 1) + event.get("count", 1)
+                entry["timestamp"] = event["timestamp"]
+                if "dexVersion" in event:
+                    entry["dexVersion"] = event["dexVersion"]
+                return
+    queue.append(event)
+
+
+def _folded_view(fd: int) -> tuple[str, list]:
+    """Return the queue view with every pending event folded in.
+
+    The caller holds the event log exclusively and truncates it once the
+    returned queue has been written.
+    """
+    os.lseek(fd, 0, os.SEEK_SET)
+    chunks = []
+    while chunk := os.read(fd, 1 << 16):
+        chunks.append(chunk)
+    status, queue = _read_view_with_status()
+    for line in b"".join(chunks).splitlines():
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue  # a torn line from a crashed writer
+        if isinstance(event, dict):
+            _fold_event(queue, event)
+    return status, queue
+
+
+def _compact(*, now: Optional[datetime] = None) -> None:
+    """Fold pending events into the queue view and empty the event log."""
+    with _events_locked(fcntl.LOCK_EX, create=False) as fd:
+        if fd is None or os.fstat(fd).st_size == 0:
+            return
+        _status, queue = _folded_view(fd)
+        _write_view(queue, now=now)
+        os.ftruncate(fd, 0)
+
+
+def _log_event(entry: dict, now: datetime) -> None:
+    """Append an event, compacting unless this process just logged the same one."""
+    size = _append_event(entry)
+    key = (
+        str(_get_events_path()),
+        entry["severity"],
+        entry["source"],
+        entry["message"],
+    )
+    last = _recently_compacted.get(key)
+    moment = now.timestamp()
+    if (
+        last is not None
+        and moment - last < DEDUP_WINDOW_SECONDS
+        and size < COMPACT_THRESHOLD_BYTES
+    ):
+        return
+    _compact(now=now)
+    if len(_recently_compacted) >= 4 * MAX_ERROR_ENTRIES:
+        _recently_compacted.clear()
+    _recently_compacted[key] = moment
 
 
 # ---------------------------------------------------------------------------
@@ -226,51 +381,23 @@ def log_error(
         context: Additional context (tool name, args summary, etc.)
     """
     try:
-        queue = _read_queue()
         now = datetime.now(timezone.utc)
-        timestamp = now.isoformat().replace("+00:00", "Z")
-        dex_version = _installed_dex_version()
-
-        # Dedup: if same source+message within last 5 minutes, increment count
-        dedup_cutoff = now.timestamp() - 300  # 5 minutes
-        for entry in reversed(queue):
-            if (
-                entry.get("source") == source
-                and entry.get("message") == message
-                and not entry.get("acknowledged", False)
-            ):
-                try:
-                    entry_time = datetime.fromisoformat(
-                        entry["timestamp"].replace("Z", "+00:00")
-                    ).timestamp()
-                    if entry_time > dedup_cutoff:
-                        entry["count"] = entry.get("count", 1) + 1
-                        entry["timestamp"] = timestamp
-                        if dex_version is not None:
-                            entry["dexVersion"] = dex_version
-                        _write_queue(queue, now=now)
-                        return
-                except (ValueError, KeyError):
-                    pass
-
-        # New entry
         entry = {
             "id": f"err-{int(time.time())}-{os.urandom(2).hex()}",
             "source": source,
             "severity": "error",
             "message": message,
             "humanMessage": human_message or _generate_human_message(source, message),
-            "timestamp": timestamp,
+            "timestamp": now.isoformat().replace("+00:00", "Z"),
             "acknowledged": False,
             "count": 1,
         }
+        dex_version = _installed_dex_version()
         if dex_version is not None:
             entry["dexVersion"] = dex_version
         if context:
             entry["context"] = context
-
-        queue.append(entry)
-        _write_queue(queue, now=now)
+        _log_event(entry, now)
     except Exception:
         pass  # Never throw from error logging code
 
@@ -282,26 +409,21 @@ def log_warning(
 ) -> None:
     """Log a warning (less severe than error, same queue)."""
     try:
-        queue = _read_queue()
         now = datetime.now(timezone.utc)
-        timestamp = now.isoformat().replace("+00:00", "Z")
-        dex_version = _installed_dex_version()
-
         entry = {
             "id": f"wrn-{int(time.time())}-{os.urandom(2).hex()}",
             "source": source,
             "severity": "warning",
             "message": message,
             "humanMessage": human_message or _generate_human_message(source, message),
-            "timestamp": timestamp,
+            "timestamp": now.isoformat().replace("+00:00", "Z"),
             "acknowledged": False,
             "count": 1,
         }
+        dex_version = _installed_dex_version()
         if dex_version is not None:
             entry["dexVersion"] = dex_version
-
-        queue.append(entry)
-        _write_queue(queue, now=now)
+        _log_event(entry, now)
     except Exception:
         pass
 
@@ -311,27 +433,74 @@ def mark_healthy(source: str) -> None:
     try:
         now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
         health_path = _get_health_path()
-        health = {}
-        if health_path.exists():
-            try:
-                health = json.loads(health_path.read_text())
-            except (json.JSONDecodeError, IOError):
+        # Servers start together; the lock keeps one server's update from
+        # overwriting another's read-modify-write.
+        lock = os.open(f"{health_path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            health = {}
+            if health_path.exists():
+                try:
+                    health = json.loads(health_path.read_text())
+                except (json.JSONDecodeError, IOError):
+                    health = {}
+            if not isinstance(health, dict):
                 health = {}
 
-        if "servers" not in health:
-            health["servers"] = {}
+            if "servers" not in health:
+                health["servers"] = {}
 
-        health["servers"][source] = {
-            "status": "ok",
-            "checkedAt": now,
-        }
-        health["lastCheck"] = now
+            health["servers"][source] = {
+                "status": "ok",
+                "checkedAt": now,
+            }
+            health["lastCheck"] = now
 
-        health_path.write_text(json.dumps(health, indent=2))
+            _replace_json(health_path, health)
+        finally:
+            os.close(lock)
     except Exception:
         pass
 
 
+def read_error_queue() -> list:
+    """Return every queued entry, acknowledged or not, after compaction."""
+    return _read_queue()
+
+
+def acknowledge_errors(
+    entry_ids: Iterable[str], *, now: Optional[datetime] = None
+) -> int:
+    """Acknowledge the queued entries with these ids; return how many changed.
+
+    The view is re-read, with pending events folded in, under the same lock
+    as the write, so anything logged since the caller read the queue stays.
+    An unreadable view is left alone.
+    """
+    wanted = set(entry_ids)
+    if not wanted:
+        return 0
+    acknowledged_at = _normalized_now(now).isoformat()
+    with _events_locked(fcntl.LOCK_EX) as fd:
+        status, queue = _folded_view(fd)
+        if status == "unreadable":
+            return 0
+        acknowledged = 0
+        for entry in queue:
+            if (
+                isinstance(entry, dict)
+                and entry.get("id") in wanted
+                and not entry.get("acknowledged", False)
+            ):
+                entry["acknowledged"] = True
+                entry["acknowledgedAt"] = acknowledged_at
+                acknowledged += 1
+        if acknowledged or os.fstat(fd).st_size:
+            _write_view(queue, now=now)
+            os.ftruncate(fd, 0)
+        return acknowledged
+
+
 def get_error_queue_status() -> str:
     """Return missing, readable, or unreadable without disrupting callers."""
     status, _entries = _read_queue_with_status()
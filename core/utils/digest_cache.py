@@ -0,0 +1,261 @@
+"""Persistent per-vault cache of file content digests.
+
+Inventory, update planning and customization assessment all hash the same
+vault files on every run. This cache remembers each file's sha256, its
+CRLF-normalized digest and its Git blob id against ``(path, st_dev, st_ino, st_size,
+st_mtime_ns, st_ctime_ns)`` in a small SQLite sidecar, so only files whose
+identity changed are read again.
+
+The sidecar lives in the user cache directory rather than inside the vault:
+several consumers promise a read-only pass over the vault, and a digest is
+disposable. Any SQLite problem disables the cache for that run; callers then
+hash exactly as before.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import stat as stat_module
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from core.lifecycle.catalog import crlf_normalized_sha256
+from core.utils.config_snapshot import is_settled
+from core.utils.local_git import git_blob_id
+
+SCHEMA_VERSION = "2"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS digests (
+    path TEXT PRIMARY KEY,
+    dev INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    ctime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    crlf_normalized_sha256 TEXT,
+    git_blob_sha1 TEXT NOT NULL,
+    checked_ns INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+@dataclass(frozen=True)
+class FileDigests:
+    sha256: str
+    crlf_normalized_sha256: str | None
+    git_blob_sha1: str
+
+
+def compute_digests(raw: bytes) -> FileDigests:
+    """Digest ``raw``, its LF-normalized form when it has CRLF, and its blob id."""
+    return FileDigests(
+        hashlib.sha256(raw).hexdigest(),
+        crlf_normalized_sha256(raw),
+        git_blob_id(raw),
+    )
+
+
+def cache_directory() -> Path:
+    override = os.environ.get("DEX_DIGEST_CACHE_DIR", "").strip()
+    if override:
+        return Path(override)
+    xdg = os.environ.get("XDG_CACHE_HOME", "").strip()
+    if xdg:
+        return Path(xdg) / "dex" / "digests"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "dex" / "digests"
+    return Path.home() / ".cache" / "dex" / "digests"
+
+
+def database_path(vault_root: str | Path) -> Path:
+    identity = os.path.realpath(vault_root).encode("utf-8", "surrogateescape")
+    return cache_directory() / f"{hashlib.sha256(identity).hexdigest()[:24]}.sqlite3"
+
+
+def _identity(stat: os.stat_result) -> tuple[int, int, int, int, int]:
+    return (
+        stat.st_dev,
+        stat.st_ino,
+        stat.st_size,
+        stat.st_mtime_ns,
+        stat.st_ctime_ns,
+    )
+
+
+class DigestCache:
+    """Digest lookups for one vault; writes are batched until ``close``."""
+
+    def __init__(self, database: Path | None):
+        self.database = database
+        self._connection: sqlite3.Connection | None = None
+        self._pending: dict[str, tuple[object, ...]] = {}
+        if database is not None:
+            self._connection = self._open(database)
+
+    @classmethod
+    def for_vault(cls, vault_root: str | Path) -> "DigestCache":
+        return cls(database_path(vault_root))
+
+    @classmethod
+    def disabled(cls) -> "DigestCache":
+        return cls(None)
+
+    def __enter__(self) -> "DigestCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def lookup(self, relative: str, stat: os.stat_result) -> FileDigests | None:
+        if self._connection is None:
+            return None
+        try:
+            row = self._connection.execute(
+                """
+                SELECT dev, ino, size, mtime_ns, ctime_ns, sha256,
+                       crlf_normalized_sha256, git_blob_sha1, checked_ns
+                FROM digests WHERE path = ?
+                """,
+                (relative,),
+            ).fetchone()
+        except sqlite3.Error:
+            self._disable()
+            return None
+        if row is None or tuple(row[:5]) != _identity(stat):
+            return None
+        if not is_settled(stat.st_mtime_ns, row[8]):
+            return None
+        return FileDigests(row[5], row[6], row[7])
+
+    def store(self, relative: str, stat: os.stat_result, digests: FileDigests) -> None:
+        if self._connection is None:
+            return
+        self._pending[relative] = (
+            relative,
+            *_identity(stat),
+            digests.sha256,
+            digests.crlf_normalized_sha256,
+            digests.git_blob_sha1,
+            time.time_ns(),
+        )
+
+    def digests_for(
+        self,
+        path: Path,
+        relative: str,
+        read: Callable[[], bytes],
+        *,
+        max_bytes: int | None = None,
+    ) -> FileDigests:
+        """Return cached digests for ``path`` or hash what ``read`` returns.
+
+        ``read`` keeps each caller's own safety checks (bounded, no symlink
+        traversal) and its exceptions; files larger than ``max_bytes`` always
+        go through it so its size limit still applies. A result is cached only
+        when the file's identity is the same before and after the read.
+        """
+        try:
+            before = os.lstat(path)
+        except OSError:
+            before = None
+        if (
+            before is not None
+            and stat_module.S_ISREG(before.st_mode)
+            and (max_bytes is None or before.st_size <= max_bytes)
+        ):
+            cached = self.lookup(relative, before)
+            if cached is not None:
+                return cached
+        digests = compute_digests(read())
+        if before is not None and stat_module.S_ISREG(before.st_mode):
+            try:
+                after = os.lstat(path)
+            except OSError:
+                after = None
+            if after is not None and _identity(after) == _identity(before):
+                self.store(relative, before, digests)
+        return digests
+
+    def close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        try:
+            if self._pending:
+                with connection:
+                    connection.executemany(
+                        """
+                        INSERT INTO digests(
+                            path, dev, ino, size, mtime_ns, ctime_ns,
+                            sha256, crlf_normalized_sha256, git_blob_sha1,
+                            checked_ns
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(path) DO UPDATE SET
+                            dev = excluded.dev,
+                            ino = excluded.ino,
+                            size = excluded.size,
+                            mtime_ns = excluded.mtime_ns,
+                            ctime_ns = excluded.ctime_ns,
+                            sha256 = excluded.sha256,
+                            crlf_normalized_sha256 = excluded.crlf_normalized_sha256,
+                            git_blob_sha1 = excluded.git_blob_sha1,
+                            checked_ns = excluded.checked_ns
+                        """,
+                        list(self._pending.values()),
+                    )
+        except sqlite3.Error:
+            pass
+        finally:
+            self._pending.clear()
+            connection.close()
+
+    def _disable(self) -> None:
+        connection, self._connection = self._connection, None
+        self._pending.clear()
+        if connection is not None:
+            connection.close()
+
+    @staticmethod
+    def _open(database: Path) -> sqlite3.Connection | None:
+        for attempt in range(2):
+            try:
+                database.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(database, timeout=2.0)
+            except (OSError, sqlite3.Error):
+                return None
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.executescript(_SCHEMA)
+                version = connection.execute(
+                    "SELECT value FROM meta WHERE key = 'schema_version'"
+                ).fetchone()
+                if version is None:
+                    with connection:
+                        connection.execute(
+                            "INSERT INTO meta(key, value) VALUES ('schema_version', ?)",
+                            (SCHEMA_VERSION,),
+                        )
+                elif version[0] != SCHEMA_VERSION:
+                    raise sqlite3.DatabaseError("digest cache schema drift")
+                return connection
+            except sqlite3.Error:
+                connection.close()
+                if attempt:
+                    return None
+                # The cache is disposable: a corrupt or foreign file is
+                # discarded and rebuilt once.
+                for suffix in ("", "-wal", "-shm"):
+                    Path(f"{database}{suffix}").unlink(missing_ok=True)
+        return None
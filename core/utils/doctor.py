@@ -17,6 +17,9 @@ import stat
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timedelta, timezone
@@ -32,6 +35,7 @@ from core.lifecycle import engine as lifecycle_engine
 from core.lifecycle import ledger as lifecycle_ledger
 from core.lifecycle import service as lifecycle_service
 from core.lifecycle.catalog import CatalogError, load_catalog
+from core.lifecycle.filesystem import shared_walk_snapshots
 from core.lifecycle.inventory import build_inventory
 from core.lifecycle.model import ITEM_ID, SEMVER, AdoptionState
 from core.lifecycle.plan import PlannedAction, ReasonCode, build_adoption_plan
@@ -49,6 +53,9 @@ from core.utils import (
 VERDICTS = frozenset({"OK", "OFF", "BROKEN", "UNKNOWN"})
 DOCTOR_GIT_CANDIDATES = (Path("/usr/bin/git"), Path("/bin/git"))
 QMD_STATUS_TIMEOUT_SECONDS = 10
+# Read-only probes run concurrently; most of their time is spent waiting on
+# git, python and node subprocesses or the network.
+PROBE_WORKERS = 8
 
 # The nightly ledger is written once a night, so two days tolerates a single
 # missed run before the ledger is treated as stopped rather than merely quiet.
@@ -106,11 +113,20 @@ def _validate_surface(surface: object) -> None:
 
 @dataclass(frozen=True)
 class CheckDefinition:
-    """A stable registry entry for one collector probe."""
+    """A stable registry entry for one collector probe.
+
+    ``after`` names earlier checks whose probes must finish before this one
+    starts. ``effects`` names process-wide state the probe changes while it
+    runs; a probe with effects runs on the collector's own thread in registry
+    order, never beside another probe with effects. Probes with neither run
+    concurrently.
+    """
 
     id: str
     feature: str
     probe: str
+    after: tuple[str, ...] = ()
+    effects: frozenset[str] = frozenset()
 
 
 @dataclass(frozen=True)
@@ -620,8 +636,18 @@ QUICK_CHECKS = (
     CheckDefinition("python.env", "Python environment", "_probe_python_env"),
     CheckDefinition("hooks.wired", "Claude hooks", "_probe_hooks_wired"),
     CheckDefinition("jobs.loaded", "Background jobs", "_probe_jobs_loaded"),
-    CheckDefinition("jobs.fresh", "Background job freshness", "_probe_jobs_fresh"),
-    CheckDefinition("preflight.queue", "Preflight health", "_probe_preflight_queue"),
+    CheckDefinition(
+        "jobs.fresh",
+        "Background job freshness",
+        "_probe_jobs_fresh",
+        # Reuses the launch-agent classification jobs.loaded just made.
+        after=("jobs.loaded",),
+    ),
+    CheckDefinition(
+        "preflight.queue",
+        "Preflight health",
+        "_probe_preflight_queue",
+    ),
     CheckDefinition(
         "capabilities.rooms",
         "Capability rooms",
@@ -653,12 +679,24 @@ DEEP_CHECKS = (
         "customization_migration_status",
         "_probe_customization_migration_status",
     ),
-    CheckDefinition("granola.query_path", "Granola meeting sync", "_probe_granola_query_path"),
-    CheckDefinition("pipedrive.connection", "Pipedrive CRM", "_probe_pipedrive_connection"),
+    CheckDefinition(
+        "granola.query_path",
+        "Granola meeting sync",
+        "_probe_granola_query_path",
+    ),
+    CheckDefinition(
+        "pipedrive.connection",
+        "Pipedrive CRM",
+        "_probe_pipedrive_connection",
+    ),
     CheckDefinition("config.meeting_sources", "Configured meeting source", "_probe_meeting_sources"),
     CheckDefinition("config.claude_composition", "CLAUDE customisations live", "_probe_claude_composition"),
     CheckDefinition("update.post-canary", "Post-update canary", "_probe_post_update_canary"),
-    CheckDefinition("calendar.access", "Calendar access", "_probe_calendar_access"),
+    CheckDefinition(
+        "calendar.access",
+        "Calendar access",
+        "_probe_calendar_access",
+    ),
     CheckDefinition("mail.apple-search", "Apple Mail search", "_probe_apple_mail_search"),
     CheckDefinition("qmd.live", "Semantic search", "_probe_qmd_live"),
     CheckDefinition("integrations.enabled", "Enabled integrations", "_probe_integrations_enabled"),
@@ -714,13 +752,18 @@ def _load_yaml(path: Path) -> object:
     return load_yaml_path(path)
 
 
-def _result_json(definition: CheckDefinition, result: ProbeResult) -> dict[str, Any]:
+def _result_json(
+    definition: CheckDefinition,
+    result: ProbeResult,
+    duration_ms: int = 0,
+) -> dict[str, Any]:
     rendered = {
         "id": definition.id,
         "feature": definition.feature,
         "verdict": result.verdict,
         "detail": _sentence(result.detail),
         "heal": asdict(result.heal) if result.heal else None,
+        "duration_ms": duration_ms,
     }
     if result.feature_status is not None:
         rendered["feature_status"] = result.feature_status
@@ -1028,6 +1071,67 @@ def collect(
     context: DoctorContext | None = None,
 ) -> dict[str, Any]:
     """Run the selected registry and return its JSON-serializable report."""
+    # The adoption-plan and customization probes and the adoption report each
+    # walk the whole vault; one snapshot serves them all unless it changes.
+    with shared_walk_snapshots():
+        return _collect(deep=deep, heal=heal, context=context)
+
+
+def _run_probe(
+    definition: CheckDefinition,
+    context: DoctorContext,
+) -> tuple[ProbeResult | Exception, int]:
+    started = time.perf_counter()
+    try:
+        outcome: ProbeResult | Exception = globals()[definition.probe](context)
+    except Exception as error:
+        outcome = error
+    return outcome, round((time.perf_counter() - started) * 1000)
+
+
+def _run_probes(
+    definitions: list[CheckDefinition],
+    context: DoctorContext,
+) -> dict[str, tuple[ProbeResult | Exception, int]]:
+    """Run every probe once, honouring ``after`` and ``effects``.
+
+    Heals are applied before this is called, so probes only observe. Probes
+    with effects run here, one at a time in registry order, while the
+    read-only ones share a thread pool.
+    """
+    known = {definition.id for definition in definitions}
+    finished = {definition.id: threading.Event() for definition in definitions}
+    outcomes: dict[str, tuple[ProbeResult | Exception, int]] = {}
+
+    def run(definition: CheckDefinition) -> None:
+        try:
+            for dependency in definition.after:
+                if dependency in known:
+                    finished[dependency].wait()
+            outcomes[definition.id] = _run_probe(definition, context)
+        finally:
+            finished[definition.id].set()
+
+    # Dependencies come earlier in the registry and the pool is FIFO, so a
+    # waiting probe never holds the worker its dependency needs.
+    with ThreadPoolExecutor(max_workers=PROBE_WORKERS, thread_name_prefix="doctor-probe") as pool:
+        pending = [
+            pool.submit(run, definition) for definition in definitions if not definition.effects
+        ]
+        for definition in definitions:
+            if definition.effects:
+                run(definition)
+        for future in pending:
+            future.result()
+    return outcomes
+
+
+def _collect(
+    *,
+    deep: bool,
+    heal: bool,
+    context: DoctorContext | None,
+) -> dict[str, Any]:
     context = context or DoctorContext.from_environment()
     definitions = [*QUICK_CHECKS, *DEEP_CHECKS] if deep else list(QUICK_CHECKS)
     results: dict[str, ProbeResult] = {}
@@ -1045,97 +1149,107 @@ def collect(
     # One classification pass over ~/Library/LaunchAgents is shared by
     # jobs.loaded and jobs.fresh instead of re-parsing every plist twice.
     _begin_launch_agent_scan_scope(context)
+    pass_started = time.perf_counter()
     try:
-        for definition in definitions:
-            if definition.id == "doctor.self":
-                continue
-            try:
-                result = globals()[definition.probe](context)
-            except Exception as error:
-                error_text = _actionable_probe_error(error)
-                failed.append({"id": definition.id, "error": error_text})
-                result = ProbeResult(
-                    "UNKNOWN",
-                    error_text
-                    if _missing_module_detail(error) is not None
-                    else f"The {definition.feature} probe could not run: {error_text}",
-                )
-            missing_module = dex_logger.missing_module_name(result.detail)
-            missing_detail = _missing_module_detail(result.detail)
-            truthful_missing_diagnosis = bool(
-                missing_module
-                and (
-                    (
-                        dex_logger.is_dex_module(missing_module)
-                        and "Dex checkup fault" in result.detail
-                    )
-                    or (
-                        not dex_logger.is_dex_module(missing_module)
-                        and f"missing module {missing_module!r}" in result.detail
-                    )
-                )
+        outcomes = _run_probes(
+            [definition for definition in definitions if definition.id != "doctor.self"],
+            context,
+        )
+    finally:
+        _end_launch_agent_scan_scope(context)
+    durations = {check_id: duration for check_id, (_outcome, duration) in outcomes.items()}
+    # doctor.self runs no probe of its own; it reports the whole pass.
+    durations["doctor.self"] = round((time.perf_counter() - pass_started) * 1000)
+
+    for definition in definitions:
+        if definition.id == "doctor.self":
+            continue
+        outcome = outcomes[definition.id][0]
+        if isinstance(outcome, Exception):
+            error_text = _actionable_probe_error(outcome)
+            failed.append({"id": definition.id, "error": error_text})
+            result = ProbeResult(
+                "UNKNOWN",
+                error_text
+                if _missing_module_detail(outcome) is not None
+                else f"The {definition.feature} probe could not run: {error_text}",
             )
-            if result.verdict == "UNKNOWN" and missing_detail and not truthful_missing_diagnosis:
-                result = ProbeResult("UNKNOWN", missing_detail, result.heal)
-            check_actions = t1_actions.get(definition.id, [])
-            if definition.id == "vault.structure" and check_actions:
-                action = "; ".join(check_actions) + "."
-                if result.verdict == "OK":
-                    repair_word = _repair_count_word(len(check_actions))
-                    repair_noun = "repair" if len(check_actions) == 1 else "repairs"
-                    detail = f"All standard PARA directories exist after {repair_word} safe {repair_noun}"
-                else:
-                    detail = f"{result.detail.rstrip('.')} while safe Tier-1 repairs were also applied"
-                result = replace(
-                    result,
-                    detail=detail,
-                    heal=Heal(tier=1, action=action, applied=True),
-                )
-            if definition.id == "entity.engine" and check_actions:
-                result = replace(
-                    result,
-                    heal=Heal(tier=1, action="; ".join(check_actions) + ".", applied=True),
+        else:
+            result = outcome
+        missing_module = dex_logger.missing_module_name(result.detail)
+        missing_detail = _missing_module_detail(result.detail)
+        truthful_missing_diagnosis = bool(
+            missing_module
+            and (
+                (
+                    dex_logger.is_dex_module(missing_module)
+                    and "Dex checkup fault" in result.detail
                 )
-            if definition.id == "preflight.queue" and check_actions:
-                result = replace(
-                    result,
-                    detail=f"{result.detail.rstrip('.')} after a safe Tier-1 queue repair",
-                    heal=Heal(tier=1, action="; ".join(check_actions) + ".", applied=True),
+                or (
+                    not dex_logger.is_dex_module(missing_module)
+                    and f"missing module {missing_module!r}" in result.detail
                 )
-            if definition.id == "vault.configs" and check_actions:
-                # Merge, never replace: when the probe is still BROKEN (a
-                # parse failure, or a symlink/foreign-owner .env finding),
-                # its verdict and actionable heal must survive — the applied
-                # env repair is only appended as extra detail.
-                if result.verdict == "OK" and result.heal is None:
-                    result = replace(
-                        result,
-                        detail=f"{result.detail.rstrip('.')} after a safe Tier-1 permission repair",
-                        heal=Heal(tier=1, action="; ".join(check_actions) + ".", applied=True),
-                    )
-                else:
-                    result = replace(
-                        result,
-                        detail=(
-                            f"{result.detail.rstrip('.')}; a safe Tier-1 repair separately "
-                            + "; ".join(check_actions)
-                        ),
-                    )
-            if definition.id == "capabilities.rooms" and check_actions:
+            )
+        )
+        if result.verdict == "UNKNOWN" and missing_detail and not truthful_missing_diagnosis:
+            result = ProbeResult("UNKNOWN", missing_detail, result.heal)
+        check_actions = t1_actions.get(definition.id, [])
+        if definition.id == "vault.structure" and check_actions:
+            action = "; ".join(check_actions) + "."
+            if result.verdict == "OK":
+                repair_word = _repair_count_word(len(check_actions))
+                repair_noun = "repair" if len(check_actions) == 1 else "repairs"
+                detail = f"All standard PARA directories exist after {repair_word} safe {repair_noun}"
+            else:
+                detail = f"{result.detail.rstrip('.')} while safe Tier-1 repairs were also applied"
+            result = replace(
+                result,
+                detail=detail,
+                heal=Heal(tier=1, action=action, applied=True),
+            )
+        if definition.id == "entity.engine" and check_actions:
+            result = replace(
+                result,
+                heal=Heal(tier=1, action="; ".join(check_actions) + ".", applied=True),
+            )
+        if definition.id == "preflight.queue" and check_actions:
+            result = replace(
+                result,
+                detail=f"{result.detail.rstrip('.')} after a safe Tier-1 queue repair",
+                heal=Heal(tier=1, action="; ".join(check_actions) + ".", applied=True),
+            )
+        if definition.id == "vault.configs" and check_actions:
+            # Merge, never replace: when the probe is still BROKEN (a
+            # parse failure, or a symlink/foreign-owner .env finding),
+            # its verdict and actionable heal must survive — the applied
+            # env repair is only appended as extra detail.
+            if result.verdict == "OK" and result.heal is None:
                 result = replace(
                     result,
-                    detail=f"{result.detail.rstrip('.')} after a safe Tier-1 reconciliation",
+                    detail=f"{result.detail.rstrip('.')} after a safe Tier-1 permission repair",
                     heal=Heal(tier=1, action="; ".join(check_actions) + ".", applied=True),
                 )
-            if definition.id == "config.claude_composition" and check_actions:
+            else:
                 result = replace(
                     result,
-                    detail=f"{result.detail.rstrip('.')} after a safe refresh",
-                    heal=Heal(tier=1, action="; ".join(check_actions) + ".", applied=True),
+                    detail=(
+                        f"{result.detail.rstrip('.')}; a safe Tier-1 repair separately "
+                        + "; ".join(check_actions)
+                    ),
                 )
-            results[definition.id] = result
-    finally:
-        _end_launch_agent_scan_scope(context)
+        if definition.id == "capabilities.rooms" and check_actions:
+            result = replace(
+                result,
+                detail=f"{result.detail.rstrip('.')} after a safe Tier-1 reconciliation",
+                heal=Heal(tier=1, action="; ".join(check_actions) + ".", applied=True),
+            )
+        if definition.id == "config.claude_composition" and check_actions:
+            result = replace(
+                result,
+                detail=f"{result.detail.rstrip('.')} after a safe refresh",
+                heal=Heal(tier=1, action="; ".join(check_actions) + ".", applied=True),
+            )
+        results[definition.id] = result
 
     if failed:
         failed_ids = ", ".join(failure["id"] for failure in failed)
@@ -1150,7 +1264,10 @@ def collect(
         )
     results["doctor.self"] = self_result
 
-    checks = [_result_json(definition, results[definition.id]) for definition in definitions]
+    checks = [
+        _result_json(definition, results[definition.id], durations[definition.id])
+        for definition in definitions
+    ]
     adoption = collect_adoption_report(context)
     report = {
         "generated_at": context.now.isoformat(),
@@ -1195,7 +1312,10 @@ def collect(
             "BROKEN",
             f"The doctor could not write System/.doctor-last-run.json: {error_text}",
         )
-        report["checks"] = [_result_json(definition, results[definition.id]) for definition in definitions]
+        report["checks"] = [
+            _result_json(definition, results[definition.id], durations[definition.id])
+            for definition in definitions
+        ]
         report["summary"] = _summary(report["checks"])
 
     return report
@@ -1219,19 +1339,25 @@ def collect_reporter(
     return from_doctor_report(report, refresh_id=refresh_id)
 
 
+# Probes run on several threads but share one process environment: whoever
+# rebinds VAULT_PATH/VAULT_ROOT holds this until the old values are restored.
+_environment_lock = threading.RLock()
+
+
 @contextmanager
 def _vault_environment(context: DoctorContext) -> Iterator[None]:
-    previous = {name: os.environ.get(name) for name in ("VAULT_PATH", "VAULT_ROOT")}
-    os.environ["VAULT_PATH"] = str(context.vault_root)
-    os.environ["VAULT_ROOT"] = str(context.vault_root)
-    try:
-        yield
-    finally:
-        for name, value in previous.items():
-            if value is None:
-                os.environ.pop(name, None)
-            else:
-                os.environ[name] = value
+    with _environment_lock:
+        previous = {name: os.environ.get(name) for name in ("VAULT_PATH", "VAULT_ROOT")}
+        os.environ["VAULT_PATH"] = str(context.vault_root)
+        os.environ["VAULT_ROOT"] = str(context.vault_root)
+        try:
+            yield
+        finally:
+            for name, value in previous.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
 
 
 def _probe_vault_structure(context: DoctorContext) -> ProbeResult:
@@ -3066,21 +3192,9 @@ def _acknowledge_resolved_preflight_errors(context: DoctorContext) -> int:
             return 0
         health = preflight.run_preflight()
         resolved = _resolved_preflight_error_ids(health, entries)
-        if not resolved:
-            return 0
-        acknowledged = 0
-        for entry in entries:
-            if (
-                isinstance(entry, dict)
-                and entry.get("id") in resolved
-                and not entry.get("acknowledged", False)
-            ):
-                entry["acknowledged"] = True
-                entry["acknowledgedAt"] = context.now.astimezone(timezone.utc).isoformat()
-                acknowledged += 1
-        if acknowledged:
-            dex_logger._write_queue(entries, now=context.now)
-        return acknowledged
+        # The queue may have gained entries while preflight ran, so the marks
+        # are applied to a fresh read under the logger's lock.
+        return dex_logger.acknowledge_errors(resolved, now=context.now)
 
 
 def _preflight_error_queue_status(context: DoctorContext) -> str:
@@ -4687,10 +4801,16 @@ def _granola_api_key(context: DoctorContext) -> str | None:
 
 
 def _granola_filtered_query(context: DoctorContext) -> list[dict[str, Any]]:
-    """Run the exact filtered-list path used by real Granola queries."""
+    """Run the exact filtered-list path used by real Granola queries.
+
+    Only the key is resolved against the vault's environment; the request
+    runs outside the environment lock with that key pinned.
+    """
     with _vault_environment(context):
-        from core.mcp.granola_server import _cutoff_iso, _list_notes
+        from core.mcp.granola_server import _cutoff_iso, _list_notes, get_api_key, pinned_api_key
 
+        api_key = get_api_key()
+    with pinned_api_key(api_key):
         return _list_notes(
             created_after=_cutoff_iso(7),
             max_notes=1,
@@ -4931,11 +5051,10 @@ def _probe_pipedrive_connection(context: DoctorContext) -> ProbeResult:
 
     # The server resolves vault-relative settings from the environment, exactly
     # as it does when launched as an MCP process. Point it at the vault under
-    # inspection and restore the caller's environment afterwards.
-    previous = os.environ.get("VAULT_ROOT")
-    os.environ["VAULT_ROOT"] = str(context.vault_root)
+    # inspection only while it resolves; the request itself needs no environment.
     try:
-        resolved = pipedrive_server._resolve()
+        with _vault_environment(context):
+            resolved = pipedrive_server._resolve()
         if not resolved.get("ok"):
             status = resolved.get("status") or {}
             state = str(status.get("feature_status") or status.get("status") or "unknown")
@@ -4958,11 +5077,6 @@ def _probe_pipedrive_connection(context: DoctorContext) -> ProbeResult:
         if _looks_like_sandbox_failure(detail):
             return ProbeResult("UNKNOWN", f"The sandbox blocked the Pipedrive check: {detail}")
         raise
-    finally:
-        if previous is None:
-            os.environ.pop("VAULT_ROOT", None)
-        else:
-            os.environ["VAULT_ROOT"] = previous
 
     if not result.get("ok"):
         detail = _one_line(result.get("error") or "Pipedrive returned no detail.")
@@ -5098,11 +5212,15 @@ def _calendar_permission_status(_context: DoctorContext) -> str:
 
 
 def _calendar_list_result(context: DoctorContext) -> dict[str, Any]:
-    """Call the exact helper behind calendar_list_calendars."""
+    """Call the exact helper behind calendar_list_calendars.
+
+    Only the import resolves vault paths; EventKit calendars belong to the
+    user, so the helper itself runs outside the environment lock.
+    """
     with _vault_environment(context):
         from core.mcp.calendar_server import _get_calendar_list_result
 
-        return _get_calendar_list_result()
+    return _get_calendar_list_result()
 
 
 def _configured_work_calendar(context: DoctorContext) -> str | None:
@@ -5268,7 +5386,28 @@ def _probe_qmd_live(context: DoctorContext) -> ProbeResult:
             f"qmd status failed: {detail}",
             Heal(tier=3, action="Run /enable-semantic-search to repair qmd.", applied=False),
         )
-    return ProbeResult("OK", f"qmd status completed successfully: {detail}")
+    return ProbeResult(
+        "OK",
+        f"qmd status completed successfully: {detail}{_qmd_reindex_detail(context)}",
+    )
+
+
+def _qmd_reindex_detail(context: DoctorContext) -> str:
+    """Summarise the MCP servers' last background reindex, when one ran."""
+    from core.utils.qmd_indexer import read_reindex_status
+
+    status = read_reindex_status(context.vault_root)
+    if not status or not status.get("lastStartedAt"):
+        return ""
+    detail = (
+        f"; last background reindex started {status['lastStartedAt']}"
+        f" and took {status.get('lastDurationSeconds')}s"
+        f" ({status.get('coalesced', 0)} request(s) coalesced,"
+        f" {status.get('pending', 0)} queued)"
+    )
+    if status.get("lastError"):
+        detail += f" but failed: {_one_line(status['lastError'])}"
+    return detail
 
 
 def _enabled_integrations(config: object) -> list[tuple[str, dict[str, Any]]]:
@@ -19,7 +19,7 @@ from typing import Callable, Literal
 
 from core.paths import HISTORY_BACKUPS_RELATIVE_PARTS
 from core.transaction.fsync import fsync_directory
-from core.utils.local_git import git_env, git_output
+from core.utils.local_git import GitObjectReader, git_env, git_object_headers, git_output
 
 try:
     import fcntl
@@ -893,10 +893,14 @@ def _verify_recovery_artifacts(transaction: Path, manifest: HistoryManifest) ->
 
 
 def _selected_history_blobs(root: Path, refs: tuple[str, ...]):
-    objects = sorted(set(line.split(b" ", 1)[0] for line in _git(root, "rev-list", "--objects", *refs).splitlines()))
-    for oid in objects:
-        if _git(root, "cat-file", "-t", oid.decode()).strip() == b"blob":
-            yield _git(root, "cat-file", "blob", oid.decode())
+    objects = sorted(
+        set(line.split(b" ", 1)[0].decode("ascii") for line in _git(root, "rev-list", "--objects", *refs).splitlines())
+    )
+    headers = git_object_headers(root, objects)
+    with GitObjectReader(root) as reader:
+        for oid in objects:
+            if headers[oid][0] == "blob":
+                yield reader.read(oid)
 
 
 def _occurrence_profile(blobs: tuple[bytes, ...], needle: bytes) -> list[list[int]]:
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 import shutil
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Literal
+from typing import Iterable, Literal
 
 GitProfile = Literal["read-only", "mutation"]
 DEFAULT_MAX_OUTPUT = 16 * 1024 * 1024
@@ -63,22 +66,12 @@ def git_env(*, index_path: Path | None = None) -> dict[str, str]:
     return env
 
 
-def git_result(
-    root: Path,
-    *args: str,
-    profile: GitProfile,
-    index_path: Path | None = None,
-    input_data: bytes | None = None,
-    pass_fds: tuple[int, ...] = (),
-    timeout: float = DEFAULT_TIMEOUT,
-    max_output: int = DEFAULT_MAX_OUTPUT,
-) -> subprocess.CompletedProcess[bytes]:
-    """Run local Git with disabled hooks/helpers/prompts and bounded output."""
+def _git_command(args: tuple[str, ...], profile: GitProfile) -> list[str]:
     if profile not in {"read-only", "mutation"}:
         raise ValueError("unknown local Git policy profile")
     if profile == "read-only" and args and args[0] in _MUTATING_COMMANDS:
         raise ValueError("read-only local Git policy refuses mutation commands")
-    command = [
+    return [
         str(trusted_git_binary()),
         "-c",
         "core.hooksPath=/dev/null",
@@ -94,8 +87,21 @@ def git_result(
         "core.fsmonitor=false",
         *args,
     ]
+
+
+def git_result(
+    root: Path,
+    *args: str,
+    profile: GitProfile,
+    index_path: Path | None = None,
+    input_data: bytes | None = None,
+    pass_fds: tuple[int, ...] = (),
+    timeout: float = DEFAULT_TIMEOUT,
+    max_output: int = DEFAULT_MAX_OUTPUT,
+) -> subprocess.CompletedProcess[bytes]:
+    """Run local Git with disabled hooks/helpers/prompts and bounded output."""
     result = subprocess.run(
-        command,
+        _git_command(args, profile),
         cwd=root,
         input=input_data,
         stdout=subprocess.PIPE,
@@ -134,3 +140,162 @@ def git_output(
     if result.returncode:
         raise RuntimeError("sanitized local Git operation failed")
     return result.stdout
+
+
+class GitObjectReader:
+    """Stream objects over one long-lived ``git cat-file --batch`` pipe.
+
+    Each :meth:`read` costs a round trip on the pipe instead of a process
+    spawn. The same sanitized command and environment apply, each object is
+    bounded by ``max_output``, and a read that stalls past ``timeout`` kills
+    the process. A single watchdog thread per reader enforces that deadline,
+    so a read arms a timestamp rather than starting a timer. Any protocol
+    failure closes the reader and raises the same redacted error as
+    :func:`git_output`.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *git_options: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_output: int = DEFAULT_MAX_OUTPUT,
+    ):
+        self.timeout = timeout
+        self.max_output = max_output
+        self._process: subprocess.Popen[bytes] | None = subprocess.Popen(
+            _git_command((*git_options, "cat-file", "--batch"), "read-only"),
+            cwd=root,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=git_env(),
+        )
+        self._deadline: float | None = None
+        self._watchdog = threading.Condition()
+        threading.Thread(
+            target=self._watch,
+            args=(self._process,),
+            name="git-object-reader-watchdog",
+            daemon=True,
+        ).start()
+
+    def _watch(self, process: subprocess.Popen[bytes]) -> None:
+        with self._watchdog:
+            while self._process is process:
+                if self._deadline is None:
+                    self._watchdog.wait()
+                    continue
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._watchdog.wait(remaining)
+                    continue
+                self._deadline = None
+                process.kill()
+
+    def _arm(self, deadline: float | None) -> None:
+        with self._watchdog:
+            self._deadline = deadline
+            self._watchdog.notify()
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def read(self, object_id: str, *, object_type: str = "blob") -> bytes:
+        """Return the contents of ``object_id``, which must be ``object_type``."""
+        process = self._process
+        if process is None:
+            raise RuntimeError("sanitized local Git object reader is closed")
+        if not object_id or any(character.isspace() for character in object_id):
+            raise ValueError("Git object id must be a single token")
+        self._arm(time.monotonic() + self.timeout)
+        try:
+            assert process.stdin is not None and process.stdout is not None
+            process.stdin.write(object_id.encode("ascii") + b"\n")
+            process.stdin.flush()
+            header = process.stdout.readline(1024).split()
+            if (
+                len(header) != 3
+                or header[0].decode("ascii") != object_id
+                or header[1].decode("ascii") != object_type
+            ):
+                raise RuntimeError("sanitized local Git operation failed")
+            size = int(header[2])
+            if size > self.max_output:
+                raise RuntimeError("sanitized local Git output exceeded its bound")
+            content = process.stdout.read(size + 1)
+            if len(content) != size + 1 or content[-1:] != b"\n":
+                raise RuntimeError("sanitized local Git operation failed")
+            return content[:-1]
+        except (OSError, UnicodeError, ValueError) as error:
+            self.close()
+            raise RuntimeError("sanitized local Git operation failed") from error
+        except RuntimeError:
+            self.close()
+            raise
+        finally:
+            self._arm(None)
+
+    def close(self) -> None:
+        with self._watchdog:
+            process, self._process = self._process, None
+            self._deadline = None
+            self._watchdog.notify()
+        if process is None:
+            return
+        try:
+            if process.stdin is not None:
+                process.stdin.close()
+            process.wait(timeout=self.timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            if process.stdout is not None:
+                process.stdout.close()
+
+
+def git_object_headers(
+    root: Path,
+    object_ids: Iterable[str],
+    *,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_output: int = DEFAULT_MAX_OUTPUT,
+) -> dict[str, tuple[str, int]]:
+    """Return ``{object_id: (type, size)}`` from one ``cat-file --batch-check``.
+
+    A missing or malformed object fails closed like any other Git error.
+    """
+    wanted = list(dict.fromkeys(object_ids))
+    if not wanted:
+        return {}
+    if any(not object_id or any(character.isspace() for character in object_id) for object_id in wanted):
+        raise ValueError("Git object id must be a single token")
+    output = git_output(
+        root,
+        "cat-file",
+        "--batch-check",
+        profile="read-only",
+        input_data="".join(f"{object_id}\n" for object_id in wanted).encode("ascii"),
+        timeout=timeout,
+        max_output=max_output,
+    )
+    headers: dict[str, tuple[str, int]] = {}
+    try:
+        for line in output.splitlines():
+            object_id, object_type, size = line.decode("ascii").split(" ")
+            headers[object_id] = (object_type, int(size))
+    except (UnicodeError, ValueError) as error:
+        raise RuntimeError("sanitized local Git operation failed") from error
+    if set(headers) != set(wanted):
+        raise RuntimeError("sanitized local Git operation failed")
+    return headers
+
+
+def git_blob_id(content: bytes, *, object_format: str = "sha1") -> str:
+    """Return the object id Git would assign ``content`` as a blob."""
+    header = b"blob %d\0" % len(content)
+    return hashlib.new(object_format, header + content).hexdigest()
@@ -18,9 +18,16 @@ import hashlib
 import importlib.util
 import json
 import os
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    from core.utils import dex_logger
+except ImportError:  # invoked by file path: put the repo root on sys.path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from core.utils import dex_logger
+
 
 def get_vault_path() -> str:
     return os.environ.get("VAULT_PATH", os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -118,15 +125,13 @@ def needs_recheck(health: dict) -> bool:
         return True
 
     # Check if any errors were queued since last check for any server
-    error_queue_path = get_error_queue_path()
-    if error_queue_path.exists():
-        try:
-            errors = json.loads(error_queue_path.read_text())
-            for err in errors:
-                if not err.get("acknowledged") and err.get("timestamp", "") > (last_check or ""):
-                    return True
-        except (json.JSONDecodeError, IOError):
-            pass
+    for err in dex_logger.read_error_queue():
+        if (
+            isinstance(err, dict)
+            and not err.get("acknowledged")
+            and err.get("timestamp", "") > (last_check or "")
+        ):
+            return True
 
     return False
 
@@ -258,16 +263,10 @@ def format_output(health: dict) -> str:
 
 def format_errors(max_errors: int = 3) -> str:
     """Format unacknowledged errors for session-start hook output."""
-    error_queue_path = get_error_queue_path()
-    if not error_queue_path.exists():
-        return ""
-
-    try:
-        errors = json.loads(error_queue_path.read_text())
-    except (json.JSONDecodeError, IOError):
-        return ""
-
-    unacked = [e for e in errors if not e.get("acknowledged", False)]
+    errors = dex_logger.read_error_queue()
+    unacked = [
+        e for e in errors if isinstance(e, dict) and not e.get("acknowledged", False)
+    ]
     if not unacked:
         return ""
 
@@ -12,15 +12,31 @@ Gracefully handles:
 Usage:
     from core.utils.qmd_indexer import refresh_search_index
     refresh_search_index()  # Fire-and-forget, non-blocking
+
+Requests are coalesced. A burst of writes is debounced into one
+`qmd update` + `qmd embed` run, at most one run is in flight per process
+(and, through a lock file, per vault), and writes that land while a run is
+in flight get exactly one trailing run. Each run records its timing in
+.logs/qmd-reindex.json for /dex-doctor.
 """
 
+import fcntl
+import json
 import logging
+import os
 import shutil
 import subprocess
+import tempfile
 import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
 
+DEBOUNCE_SECONDS = 2.0
+
 # Cache the QMD binary path (None = not checked, False = not found)
 _qmd_path = None
 
@@ -38,7 +54,6 @@ def _find_qmd() -> str | None:
         return path
 
     # Check common bun/npm global install locations
-    from pathlib import Path
     home = Path.home()
     candidates = [
         home / ".bun" / "bin" / "qmd",
@@ -55,11 +70,11 @@ def _find_qmd() -> str | None:
     return None
 
 
-def _run_reindex():
-    """Run qmd update + embed in background. Called from a thread."""
+def _run_reindex() -> str | None:
+    """Run qmd update + embed; return why it failed, or None. Called from a thread."""
     qmd = _find_qmd()
     if not qmd:
-        return
+        return None
 
     try:
         # Update FTS index (changed files only)
@@ -71,7 +86,7 @@ def _run_reindex():
         )
         if result.returncode != 0:
             logger.debug(f"qmd update returned {result.returncode}: {result.stderr.strip()}")
-            return
+            return f"qmd update returned {result.returncode}"
 
         # Update vector embeddings (changed chunks only)
         result = subprocess.run(
@@ -82,23 +97,178 @@ def _run_reindex():
         )
         if result.returncode != 0:
             logger.debug(f"qmd embed returned {result.returncode}: {result.stderr.strip()}")
+            return f"qmd embed returned {result.returncode}"
 
     except subprocess.TimeoutExpired:
         logger.warning("QMD re-index timed out")
+        return "qmd re-index timed out"
     except Exception as e:
         logger.debug(f"QMD re-index error: {e}")
+        return f"qmd re-index error: {e}"
+    return None
+
+
+def _get_vault_path() -> Path:
+    return Path(os.environ.get("VAULT_PATH", Path(__file__).resolve().parents[2]))
+
+
+def status_path(vault_root: str | Path | None = None) -> Path:
+    root = Path(vault_root) if vault_root is not None else _get_vault_path()
+    return root / ".logs" / "qmd-reindex.json"
+
+
+def read_reindex_status(vault_root: str | Path | None = None) -> dict[str, Any] | None:
+    """The last recorded reindex status for a vault, or None if there is none."""
+    try:
+        status = json.loads(status_path(vault_root).read_text())
+    except (OSError, ValueError):
+        return None
+    return status if isinstance(status, dict) else None
+
+
+class ReindexScheduler:
+    """Debounced, single-flight runner with one trailing rerun.
+
+    ``request`` only bumps a counter and, if no worker is alive, starts one.
+    The worker waits until requests have been quiet for the debounce
+    window, claims everything pending, and runs once; anything requested
+    during the run is picked up by the next loop iteration. ``run`` returns
+    a failure description, or None on success.
+    """
+
+    def __init__(
+        self,
+        run: Callable[[], str | None],
+        *,
+        debounce_seconds: float = DEBOUNCE_SECONDS,
+        status_file: Callable[[], Path] | None = None,
+    ):
+        self._run = run
+        self.debounce_seconds = debounce_seconds
+        self._status_file = status_file
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._pending = 0
+        self._last_request = 0.0
+        self._running = False
+        self._runs = 0
+        self._coalesced = 0
+        self._last_started_at: str | None = None
+        self._last_duration_seconds: float | None = None
+        self._last_error: str | None = None
+
+    def request(self) -> None:
+        with self._condition:
+            self._pending += 1
+            self._last_request = time.monotonic()
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._work, name="dex-qmd-reindex", daemon=True
+                )
+                self._worker.start()
+            self._condition.notify_all()
+
+    def status(self) -> dict[str, Any]:
+        with self._condition:
+            return {
+                "pending": self._pending,
+                "running": self._running,
+                "runs": self._runs,
+                "coalesced": self._coalesced,
+                "lastStartedAt": self._last_started_at,
+                "lastDurationSeconds": self._last_duration_seconds,
+                "lastError": self._last_error,
+            }
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until nothing is pending or running; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._worker is not None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    quiet_for = time.monotonic() - self._last_request
+                    if quiet_for >= self.debounce_seconds:
+                        break
+                    self._condition.wait(self.debounce_seconds - quiet_for)
+                if not self._pending:
+                    self._worker = None
+                    self._condition.notify_all()
+                    return
+                self._coalesced += self._pending - 1
+                self._pending = 0
+                self._running = True
+                self._last_started_at = (
+                    datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+                )
+            started = time.monotonic()
+            try:
+                error = self._run()
+            except Exception as exc:  # a failed run must not kill the worker
+                error = str(exc) or exc.__class__.__name__
+            with self._condition:
+                self._running = False
+                self._runs += 1
+                self._last_duration_seconds = round(time.monotonic() - started, 3)
+                self._last_error = error
+            self._record()
+
+    def _record(self) -> None:
+        if self._status_file is None:
+            return
+        try:
+            path = self._status_file()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(
+                prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+            )
+            with os.fdopen(descriptor, "w") as handle:
+                json.dump({**self.status(), "pid": os.getpid()}, handle, indent=2)
+            os.replace(temporary, path)
+        except OSError:
+            logger.debug("Could not record QMD reindex status", exc_info=True)
+
+
+def _run_reindex_exclusively() -> str | None:
+    """Run one reindex, queueing behind any other server's run on this vault."""
+    lock_path = status_path().with_suffix(".lock")
+    try:
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+    except OSError:
+        return _run_reindex()
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        return _run_reindex()
+    finally:
+        os.close(fd)
+
+
+_scheduler = ReindexScheduler(_run_reindex_exclusively, status_file=status_path)
+
+
+def reindex_status() -> dict[str, Any]:
+    """This process's queue depth and last-run timing."""
+    return _scheduler.status()
 
 
 def refresh_search_index():
     """
     Trigger an incremental re-index of the QMD search index.
 
-    Non-blocking: spawns a background thread so the caller returns immediately.
-    Safe to call frequently — only processes changed files.
+    Non-blocking: the request is queued and the caller returns immediately.
+    Safe to call on every write — a burst becomes one debounced run.
     Silently skips if QMD is not installed.
     """
     if _find_qmd() is None:
         return
 
-    thread = threading.Thread(target=_run_reindex, daemon=True)
-    thread.start()
+    _scheduler.request()
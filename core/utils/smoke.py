@@ -21,6 +21,7 @@ import tarfile
 import tempfile
 import time
 from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -53,6 +54,7 @@ HANDSHAKE_TIMEOUT_SECONDS = _mcp_handshake_timeout_seconds()
 MCP_STARTUP_HANDSHAKE_BUDGET_SECONDS = 40.0
 MCP_STARTUP_JOURNEY_TIMEOUT_SECONDS = 45.0
 GLOBAL_TIMEOUT_SECONDS = 60.0
+JOURNEY_WORKERS = 4
 VERDICTS = frozenset({"OK", "OFF", "BROKEN", "UNKNOWN"})
 VERDICT_PRIORITY = {"OFF": 0, "OK": 1, "UNKNOWN": 2, "BROKEN": 3}
 NOT_SET_UP_DETAIL = "not set up yet — complete onboarding first"
@@ -1137,7 +1139,8 @@ def _authorize_internal(vault: Path, marker: Path | None) -> None:
 
 
 def _internal_release_root(marker: Path, supplied: Path | None) -> Path:
-    expected = marker.parent / "release"
+    # Journey directories sit inside the run directory that owns the shared snapshot.
+    expected = marker.parent.parent / "release"
     candidate = supplied or expected
     if candidate.is_symlink() or candidate.resolve() != expected.resolve():
         raise PermissionError("internal smoke release root escaped the run directory")
@@ -1372,7 +1375,7 @@ def _harness_failure_run(
 ) -> SmokeRun:
     detail = f"smoke harness failed: {_one_line(error)}"
     journeys = [
-        {"id": definition.id, "verdict": "UNKNOWN", "detail": detail, "duration_ms": 0}
+        {"id": definition.id, "verdict": "UNKNOWN", "detail": detail, "queued_ms": 0, "duration_ms": 0}
         for definition in journey_definitions
     ]
     return SmokeRun(
@@ -1566,134 +1569,174 @@ def _consume_mcp_once_consent_token(name: str, token_path: Path | None) -> bool:
     )
 
 
-def _run_smoke_journeys(
+def _run_one_journey(
+    definition: JourneyDefinition,
     *,
     source: Path,
     repository: Path,
-    temporary_parent: Path,
+    run_root: Path,
     runner_root: Path,
-    journey_definitions: Sequence[JourneyDefinition],
+    release_root: Path | None,
+    release_ref: str | None,
     global_timeout_seconds: float,
     started: float,
-) -> tuple[list[dict[str, Any]], bool]:
-    results: list[dict[str, Any]] = []
-    harness_failed = False
+    queued: float,
+) -> tuple[dict[str, Any], bool]:
+    """Run one journey in its own vault and home and return its report row."""
+    journey_started = time.monotonic()
+    queued_ms = max(0, round((journey_started - queued) * 1000))
+    if global_timeout_seconds - (journey_started - started) <= 0:
+        return (
+            {
+                "id": definition.id,
+                "verdict": "UNKNOWN",
+                "detail": f"global {global_timeout_seconds:g}s smoke budget was exhausted",
+                "queued_ms": queued_ms,
+                "duration_ms": 0,
+            },
+            True,
+        )
 
-    for definition in journey_definitions:
-        journey_started = time.monotonic()
-        remaining = global_timeout_seconds - (journey_started - started)
-        if remaining <= 0:
-            results.append(
-                {
-                    "id": definition.id,
+    harness_failed = False
+    try:
+        with tempfile.TemporaryDirectory(
+            prefix=f"dex-smoke-{definition.id}-",
+            dir=run_root,
+        ) as temporary:
+            temporary_root = Path(temporary)
+            vault = temporary_root / "vault"
+            home = temporary_root / "home"
+            home.mkdir()
+            marker, run_token = _create_run_marker(temporary_root)
+            env = _clean_environment(
+                vault,
+                home,
+                runner_root,
+                temporary_root,
+                run_token,
+                source_root=source,
+            )
+            preparation_budget = min(
+                definition.timeout_seconds - (time.monotonic() - journey_started),
+                global_timeout_seconds - (time.monotonic() - started),
+            )
+            if preparation_budget <= 0:
+                result = {
                     "verdict": "UNKNOWN",
-                    "detail": "global 30s smoke budget was exhausted",
-                    "duration_ms": 0,
+                    "detail": "journey timed out during preparation",
                 }
-            )
-            harness_failed = True
-            continue
-
-        try:
-            with tempfile.TemporaryDirectory(
-                prefix=f"dex-smoke-{definition.id}-",
-                dir=temporary_parent,
-            ) as temporary:
-                temporary_root = Path(temporary)
-                vault = temporary_root / "vault"
-                home = temporary_root / "home"
-                home.mkdir()
-                marker, run_token = _create_run_marker(temporary_root)
-                release_destination = temporary_root / "release"
-                snapshot_budget = min(
-                    definition.timeout_seconds - (time.monotonic() - journey_started),
-                    global_timeout_seconds - (time.monotonic() - started),
-                )
-                release_ref, _release_reason = _materialize_release_core(
-                    repository,
-                    release_destination,
-                    timeout_seconds=max(0.05, snapshot_budget),
-                )
-                release_root = release_destination if release_ref is not None else None
-                if release_root is not None:
-                    _set_runtime_tree_writable(release_root, writable=False)
-                try:
-                    env = _clean_environment(
+                harness_failed = True
+            else:
+                prepared, preparation_failed = _run_json_process(
+                    _preparation_command(
+                        definition.id,
+                        source,
                         vault,
-                        home,
+                        repository,
                         runner_root,
-                        temporary_root,
-                        run_token,
-                        source_root=source,
-                    )
-                    preparation_budget = min(
+                        release_root,
+                        release_ref,
+                        marker,
+                    ),
+                    cwd=temporary_root,
+                    env=env,
+                    timeout_seconds=preparation_budget,
+                    label="journey preparation",
+                )
+                harness_failed = harness_failed or preparation_failed
+                if preparation_failed or prepared["verdict"] != "OK":
+                    result = prepared
+                else:
+                    process_budget = min(
                         definition.timeout_seconds - (time.monotonic() - journey_started),
                         global_timeout_seconds - (time.monotonic() - started),
                     )
-                    if preparation_budget <= 0:
+                    if process_budget <= 0:
                         result = {
                             "verdict": "UNKNOWN",
                             "detail": "journey timed out during preparation",
                         }
                         harness_failed = True
                     else:
-                        prepared, preparation_failed = _run_json_process(
-                            _preparation_command(
-                                definition.id,
-                                source,
-                                vault,
-                                repository,
-                                runner_root,
-                                release_root,
-                                release_ref,
-                                marker,
-                            ),
+                        result, failed = _run_journey_process(
+                            definition,
+                            runner_root=runner_root,
+                            release_root=release_root,
                             cwd=temporary_root,
+                            marker=marker,
                             env=env,
-                            timeout_seconds=preparation_budget,
-                            label="journey preparation",
+                            timeout_seconds=process_budget,
                         )
-                        harness_failed = harness_failed or preparation_failed
-                        if preparation_failed or prepared["verdict"] != "OK":
-                            result = prepared
-                        else:
-                            process_budget = min(
-                                definition.timeout_seconds - (time.monotonic() - journey_started),
-                                global_timeout_seconds - (time.monotonic() - started),
-                            )
-                            if process_budget <= 0:
-                                result = {
-                                    "verdict": "UNKNOWN",
-                                    "detail": "journey timed out during preparation",
-                                }
-                                harness_failed = True
-                            else:
-                                result, failed = _run_journey_process(
-                                    definition,
-                                    runner_root=runner_root,
-                                    release_root=release_root,
-                                    cwd=temporary_root,
-                                    marker=marker,
-                                    env=env,
-                                    timeout_seconds=process_budget,
-                                )
-                                harness_failed = harness_failed or failed
-                finally:
-                    if release_root is not None:
-                        _set_runtime_tree_writable(release_root, writable=True)
-        except Exception as exc:
-            result = {"verdict": "UNKNOWN", "detail": f"journey harness failed: {_one_line(exc)}"}
-            harness_failed = True
+                        harness_failed = harness_failed or failed
+    except Exception as exc:
+        result = {"verdict": "UNKNOWN", "detail": f"journey harness failed: {_one_line(exc)}"}
+        harness_failed = True
 
-        results.append(
-            {
-                "id": definition.id,
-                "verdict": result["verdict"],
-                "detail": result["detail"],
-                "duration_ms": max(0, round((time.monotonic() - journey_started) * 1000)),
-            }
-        )
-    return results, harness_failed
+    return (
+        {
+            "id": definition.id,
+            "verdict": result["verdict"],
+            "detail": result["detail"],
+            "queued_ms": queued_ms,
+            "duration_ms": max(0, round((time.monotonic() - journey_started) * 1000)),
+        },
+        harness_failed,
+    )
+
+
+def _run_smoke_journeys(
+    *,
+    source: Path,
+    repository: Path,
+    run_root: Path,
+    runner_root: Path,
+    journey_definitions: Sequence[JourneyDefinition],
+    global_timeout_seconds: float,
+    started: float,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Run the journeys in parallel against one shared release snapshot.
+
+    The installed release is extracted once into ``run_root/release`` and kept
+    read-only while journeys run. Each journey still gets its own temp
+    directory (vault, home, run marker) under ``run_root``. Rows keep the
+    order of ``journey_definitions``.
+    """
+    release_destination = run_root / "release"
+    release_ref, _release_reason = _materialize_release_core(
+        repository,
+        release_destination,
+        timeout_seconds=max(0.05, global_timeout_seconds - (time.monotonic() - started)),
+    )
+    release_root = release_destination if release_ref is not None else None
+    if release_root is not None:
+        _set_runtime_tree_writable(release_root, writable=False)
+    try:
+        queued = time.monotonic()
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(JOURNEY_WORKERS, len(journey_definitions))),
+            thread_name_prefix="dex-smoke-journey",
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _run_one_journey,
+                    definition,
+                    source=source,
+                    repository=repository,
+                    run_root=run_root,
+                    runner_root=runner_root,
+                    release_root=release_root,
+                    release_ref=release_ref,
+                    global_timeout_seconds=global_timeout_seconds,
+                    started=started,
+                    queued=queued,
+                )
+                for definition in journey_definitions
+            ]
+            outcomes = [future.result() for future in futures]
+    finally:
+        if release_root is not None:
+            _set_runtime_tree_writable(release_root, writable=True)
+    return [row for row, _failed in outcomes], any(failed for _row, failed in outcomes)
 
 
 def run_smoke(
@@ -1717,13 +1760,14 @@ def run_smoke(
             prefix="dex-smoke-runner-",
             dir=temporary_parent,
         ) as temporary:
-            runner_root = _materialize_runner(Path(temporary) / "runner")
+            run_root = Path(temporary)
+            runner_root = _materialize_runner(run_root / "runner")
             try:
                 _set_runtime_tree_writable(runner_root, writable=False)
                 results, harness_failed = _run_smoke_journeys(
                     source=source,
                     repository=repository,
-                    temporary_parent=temporary_parent,
+                    run_root=run_root,
                     runner_root=runner_root,
                     journey_definitions=journey_definitions,
                     global_timeout_seconds=global_timeout_seconds,
@@ -2599,7 +2643,7 @@ def _print_human(report: Mapping[str, object]) -> None:
     for journey in report["journeys"]:
         print(
             f"[{journey['verdict']}] {journey['id']} "
-            f"({journey['duration_ms']}ms) — {journey['detail']}"
+            f"({journey['duration_ms']}ms, queued {journey['queued_ms']}ms) — {journey['detail']}"
         )
 
 
@@ -0,0 +1,118 @@
+"""Once-per-file SQLite integrity verification for Dex's local databases.
+
+``PRAGMA quick_check`` reads every page, so running it on each open makes
+lookup latency grow with database size. These helpers remember which file
+(by device and inode) already passed in this process, so a check reruns only
+when the file is replaced or a periodic background check finds a problem.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECK_INTERVAL_SECONDS = 3600.0
+
+
+def file_identity(path: str | Path) -> tuple[int, int] | None:
+    """Return ``(st_dev, st_ino)``, or ``None`` when the file does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+def quick_check_passes(connection: sqlite3.Connection) -> bool:
+    return connection.execute("PRAGMA quick_check").fetchall() == [("ok",)]
+
+
+class VerifiedFiles:
+    """Thread-safe record of database files that passed ``quick_check``.
+
+    With ``max_age_seconds`` a pass is trusted only that long, so a
+    long-lived process without background checks still re-verifies.
+    """
+
+    def __init__(self, *, max_age_seconds: float | None = None) -> None:
+        self._lock = threading.Lock()
+        self._identities: dict[Path, tuple[tuple[int, int], float]] = {}
+        self._max_age_seconds = max_age_seconds
+
+    def needs_check(self, path: str | Path) -> bool:
+        identity = file_identity(path)
+        with self._lock:
+            entry = self._identities.get(_key(path))
+        if identity is None or entry is None or entry[0] != identity:
+            return True
+        return (
+            self._max_age_seconds is not None
+            and time.monotonic() - entry[1] >= self._max_age_seconds
+        )
+
+    def record(self, path: str | Path) -> None:
+        identity = file_identity(path)
+        if identity is None:
+            return
+        with self._lock:
+            self._identities[_key(path)] = (identity, time.monotonic())
+
+    def forget(self, path: str | Path | None = None) -> None:
+        with self._lock:
+            if path is None:
+                self._identities.clear()
+            else:
+                self._identities.pop(_key(path), None)
+
+
+def _key(path: str | Path) -> Path:
+    return Path(path).resolve()
+
+
+def start_background_checks(
+    verified: VerifiedFiles,
+    paths: Iterable[str | Path],
+    *,
+    interval_seconds: float = DEFAULT_CHECK_INTERVAL_SECONDS,
+) -> threading.Event:
+    """Re-run ``quick_check`` on ``paths`` every interval in a daemon thread.
+
+    A failing file is forgotten, so its next open re-verifies in the caller's
+    thread and takes that caller's normal corruption path. Set the returned
+    event to stop the thread.
+    """
+    watched = [Path(path) for path in paths]
+    stop = threading.Event()
+
+    def run() -> None:
+        while not stop.wait(interval_seconds):
+            for path in watched:
+                if not path.exists():
+                    continue
+                try:
+                    connection = sqlite3.connect(
+                        f"{path.resolve().as_uri()}?mode=ro", uri=True, timeout=5.0
+                    )
+                    try:
+                        healthy = quick_check_passes(connection)
+                    finally:
+                        connection.close()
+                except sqlite3.DatabaseError as error:
+                    healthy = "locked" in str(error) or "busy" in str(error)
+                if not healthy:
+                    logger.warning("SQLite quick_check failed for %s", path)
+                    verified.forget(path)
+
+    threading.Thread(
+        target=run,
+        name="dex-sqlite-integrity",
+        daemon=True,
+    ).start()
+    return stop
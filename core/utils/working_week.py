@@ -59,7 +59,7 @@ def normalize_working_days(configured_days: Any) -> list[str]:
 def _load_working_days() -> set[int]:
     """Load working days from user-profile.yaml, returning the safe default."""
     try:
-        import yaml
+        import yaml  # noqa: F401
     except ImportError:
         return set(DEFAULT_WORKING_DAYS)
 
@@ -67,8 +67,9 @@ def _load_working_days() -> set[int]:
     profile_path = vault_path / "System" / "user-profile.yaml"
 
     try:
-        with open(profile_path, "r", encoding="utf-8") as profile_file:
-            profile = yaml.safe_load(profile_file)
+        from core.utils import config_snapshot
+
+        profile = config_snapshot.load_yaml(profile_path)
         working_week = (profile or {}).get("working_week", {})
         configured_days = working_week.get("days", [])
         parsed_days = {
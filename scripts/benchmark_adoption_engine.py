@@ -27,6 +27,7 @@ from core.lifecycle.engine import (
     rewind_acknowledgement_token,
     rewind_adoption,
 )
+from core.lifecycle.filesystem import shared_walk_snapshots
 from core.lifecycle.inventory import build_inventory
 from core.lifecycle.model import ReleaseCatalog
 from core.lifecycle.plan import build_adoption_plan
@@ -146,70 +147,73 @@ def run_benchmark(file_count: int) -> dict[str, object]:
         vault.mkdir()
         catalog = create_synthetic_vault(vault, file_count)
 
-        inventory, inventory_seconds = _timed(
-            lambda: build_inventory(vault, catalog=catalog)
-        )
-        plan, plan_seconds = _timed(lambda: build_adoption_plan(catalog, inventory))
-        context = DoctorContext(
-            vault,
-            vault,
-            Path(temporary) / "home",
-            datetime(2026, 7, 21, tzinfo=timezone.utc),
-        )
-        adoption_report, doctor_seconds = _timed(
-            lambda: collect_adoption_report(context)
-        )
-        _, customization_assessment_seconds = _timed(lambda: assess(vault))
-
-        def adopt_and_rewind():
-            preview = build_adoption_preview(
-                catalog,
-                inventory,
-                plan,
-                (BENCHMARK_ITEM,),
-                lambda _path: BENCHMARK_PAYLOAD,
+        # One run-scoped walk serves inventory, the Doctor report and the
+        # customization assessment, as it does inside a Doctor run.
+        with shared_walk_snapshots():
+            inventory, inventory_seconds = _timed(
+                lambda: build_inventory(vault, catalog=catalog)
             )
-            receipt = execute_adoption(
+            plan, plan_seconds = _timed(lambda: build_adoption_plan(catalog, inventory))
+            context = DoctorContext(
                 vault,
-                preview,
-                preview.sha256,
-                lambda _path: BENCHMARK_PAYLOAD,
-            )
-            rewind = rewind_adoption(
                 vault,
-                receipt,
-                rewind_acknowledgement_token(receipt),
+                Path(temporary) / "home",
+                datetime(2026, 7, 21, tzinfo=timezone.utc),
+            )
+            adoption_report, doctor_seconds = _timed(
+                lambda: collect_adoption_report(context)
             )
-            return receipt, rewind
+            _, customization_assessment_seconds = _timed(lambda: assess(vault))
 
-        (receipt, rewind), cycle_seconds = _timed(adopt_and_rewind)
-        seconds = {
-            "adoption_and_rewind": cycle_seconds,
-            "build_adoption_plan": plan_seconds,
-            "build_inventory": inventory_seconds,
-            "collect_adoption_report": doctor_seconds,
-            "customization_assessment": customization_assessment_seconds,
-        }
-        rounded_seconds = {
-            key: round(value, 6)
-            for key, value in sorted(seconds.items())
-        }
-        rounded_seconds["total_measured"] = round(
-            sum(rounded_seconds.values()),
-            6,
-        )
-        return {
-            "counts": {
-                "adopted_files": len(receipt.files_written),
-                "catalog_items": len(catalog.items),
-                "doctor_groups": len(adoption_report.groups),
-                "inventory_entries": len(inventory.entries),
-                "rewound_files": len(rewind.files_restored),
-                "synthetic_files": file_count,
-            },
-            "peak_rss_bytes": _peak_rss_bytes(),
-            "seconds": rounded_seconds,
-        }
+            def adopt_and_rewind():
+                preview = build_adoption_preview(
+                    catalog,
+                    inventory,
+                    plan,
+                    (BENCHMARK_ITEM,),
+                    lambda _path: BENCHMARK_PAYLOAD,
+                )
+                receipt = execute_adoption(
+                    vault,
+                    preview,
+                    preview.sha256,
+                    lambda _path: BENCHMARK_PAYLOAD,
+                )
+                rewind = rewind_adoption(
+                    vault,
+                    receipt,
+                    rewind_acknowledgement_token(receipt),
+                )
+                return receipt, rewind
+
+            (receipt, rewind), cycle_seconds = _timed(adopt_and_rewind)
+            seconds = {
+                "adoption_and_rewind": cycle_seconds,
+                "build_adoption_plan": plan_seconds,
+                "build_inventory": inventory_seconds,
+                "collect_adoption_report": doctor_seconds,
+                "customization_assessment": customization_assessment_seconds,
+            }
+            rounded_seconds = {
+                key: round(value, 6)
+                for key, value in sorted(seconds.items())
+            }
+            rounded_seconds["total_measured"] = round(
+                sum(rounded_seconds.values()),
+                6,
+            )
+            return {
+                "counts": {
+                    "adopted_files": len(receipt.files_written),
+                    "catalog_items": len(catalog.items),
+                    "doctor_groups": len(adoption_report.groups),
+                    "inventory_entries": len(inventory.entries),
+                    "rewound_files": len(rewind.files_restored),
+                    "synthetic_files": file_count,
+                },
+                "peak_rss_bytes": _peak_rss_bytes(),
+                "seconds": rounded_seconds,
+            }
 
 
 def _budget_failures(result: dict[str, object], budgets: dict[str, object]) -> list[str]:
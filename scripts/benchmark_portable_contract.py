@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark portable-contract classification over a synthetic path set.
+
+Classifies every path with the compiled ``is_denied``/``resolve`` and with the
+original linear scans, checks that both give identical answers, and reports
+the time each took. ``--budget-seconds`` bounds the compiled pass.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import sys
+import time
+from pathlib import Path
+
+# Ensure `core` package is importable when executing from scripts/.
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from core import portable_contract  # noqa: E402
+
+_LEAF_NAMES = (
+    "README.md",
+    "notes.md",
+    "client.pem",
+    "Deploy.KEY",
+    "oauth-token.json",
+    ".env.local",
+    "config.yaml",
+    "index.ts",
+)
+
+
+def synthetic_paths(count: int) -> list[str]:
+    """Spread ``count`` paths across every rule, nested dirs and denied names."""
+    roots = sorted({rule.path for rule in portable_contract.RULES})
+    roots += ["unclassified-top", ".git", "System/credentials", ".env.d"]
+    paths: list[str] = []
+    index = 0
+    while len(paths) < count:
+        root = roots[index % len(roots)]
+        depth = index % 4
+        middle = "/".join(f"d{(index >> shift) % 7}" for shift in range(depth))
+        leaf = _LEAF_NAMES[index % len(_LEAF_NAMES)]
+        paths.append("/".join(part for part in (root, middle, f"{index}-{leaf}") if part))
+        if index % 11 == 0:
+            paths.append(root)
+        index += 1
+    return paths[:count]
+
+
+def reference_is_denied(path: str) -> bool:
+    """The pre-compilation deny check: every pattern against path and segments."""
+    candidate = portable_contract._normalize(path).lower()
+    segments = candidate.split("/")
+    for raw_pattern in portable_contract.HARD_DENY_PATTERNS:
+        pattern = raw_pattern.lower()
+        if fnmatch.fnmatch(candidate, pattern):
+            return True
+        if "/" not in pattern and any(
+            fnmatch.fnmatch(segment, pattern) for segment in segments
+        ):
+            return True
+    return False
+
+
+def reference_resolve(path: str) -> portable_contract.Resolution:
+    """The pre-compilation resolver: a linear scan over every rule."""
+    candidate = portable_contract._normalize(path)
+    denied = reference_is_denied(candidate)
+    best = None
+    best_specificity = -1
+    for rule in portable_contract.RULES:
+        if rule.kind == "file":
+            if candidate == rule.path:
+                return portable_contract.Resolution(
+                    candidate, rule.ownership, rule.rule_id, denied
+                )
+        elif candidate == rule.path or candidate.startswith(rule.path + "/"):
+            specificity = rule.path.count("/") + 1
+            if specificity > best_specificity:
+                best = rule
+                best_specificity = specificity
+    if best is None:
+        if denied:
+            return portable_contract.Resolution(
+                candidate, "vault", "hard-deny-default", True
+            )
+        raise portable_contract.ContractViolation(
+            f"no ownership rule classifies: {candidate}"
+        )
+    return portable_contract.Resolution(candidate, best.ownership, best.rule_id, denied)
+
+
+def classify(paths: list[str], is_denied, resolve) -> list[tuple[object, ...]]:
+    results: list[tuple[object, ...]] = []
+    for path in paths:
+        try:
+            resolution = resolve(path)
+        except portable_contract.ContractViolation as error:
+            results.append((is_denied(path), "violation", str(error)))
+        else:
+            results.append((is_denied(path), resolution))
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark portable-contract lookups")
+    parser.add_argument("--paths", type=int, default=100_000, help="Number of synthetic paths")
+    parser.add_argument("--budget-seconds", type=float, default=0.0, help="Fail if the compiled pass exceeds this (0 = no budget)")
+    args = parser.parse_args()
+
+    paths = synthetic_paths(args.paths)
+    portable_contract._COMPILED = None
+    start = time.perf_counter()
+    compiled = classify(paths, portable_contract.is_denied, portable_contract.resolve)
+    compiled_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    reference = classify(paths, reference_is_denied, reference_resolve)
+    reference_elapsed = time.perf_counter() - start
+
+    mismatches = sum(1 for left, right in zip(compiled, reference) if left != right)
+    print(
+        f"portable-contract benchmark: paths={len(paths)} "
+        f"compiled={compiled_elapsed:.3f}s linear={reference_elapsed:.3f}s "
+        f"speedup={reference_elapsed / max(compiled_elapsed, 1e-9):.1f}x mismatches={mismatches}"
+    )
+    if mismatches:
+        print("Compiled classifications differ from the linear reference.")
+        return 1
+    if args.budget_seconds and compiled_elapsed > args.budget_seconds:
+        print("Performance budget exceeded.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())